@@ -7,4 +7,5 @@ class AccountsConfig(AppConfig):
 
 
     def ready(self):
-        import accounts.signals.accounts_activity_logs_signal
\ No newline at end of file
+        import accounts.signals.accounts_activity_logs_signal
+        import accounts.signals.ledger_account_cache_signal
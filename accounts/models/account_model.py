@@ -1,7 +1,7 @@
 from django.db import models
 from config.models.create_update_base_model import CreateUpdateBaseModel
 from loguru import logger
-import uuid
+from core.services.document_numbering.document_number_service import DocumentNumberService
 
 
 
@@ -35,11 +35,9 @@ class Account(CreateUpdateBaseModel):
 
 
     def generate_account_number(self):
-        while True:
-            account_number = str(uuid.uuid4()).replace('-', '')[:12].upper()
-            if not Account.objects.filter(account_number=account_number).exists():
-                logger.info(f"Generated account number: {account_number} successfully.")
-                return account_number
+        account_number = DocumentNumberService.next_number('account', self)
+        logger.info(f"Generated account number: {account_number} successfully.")
+        return account_number
     
     def save(self, *args, **kwargs):
         if not self.account_number:
@@ -5,8 +5,10 @@ from accounts.models.bank_account_model import BankAccount
 from branch.models.branch_model import Branch
 from company.models.company_model import Company
 from config.utilities.get_company_or_user_company import get_expected_company
+from config.eager_loading.eager_loading import EagerLoadingSerializerMixin
 
-class BankAccountSerializer(serializers.ModelSerializer):
+class BankAccountSerializer(EagerLoadingSerializerMixin, serializers.ModelSerializer):
+    select_related_fields = ('account__company',)
     balance = serializers.DecimalField(max_digits=15, decimal_places=2, read_only=True)
     company_summary = serializers.SerializerMethodField(read_only = True)
     branch_summary = serializers.SerializerMethodField(read_only = True)
@@ -5,10 +5,12 @@ from accounts.models.branch_account_model import BranchAccount
 from company.models.company_model import Company
 from config.utilities.get_company_or_user_company import get_expected_company
 from branch.models.branch_model import Branch
+from config.eager_loading.eager_loading import EagerLoadingSerializerMixin
 
 
 
-class BranchAccountSerializer(serializers.ModelSerializer):
+class BranchAccountSerializer(EagerLoadingSerializerMixin, serializers.ModelSerializer):
+    select_related_fields = ('account__company',)
     company_summary = serializers.SerializerMethodField(read_only = True)
     branch_summary = serializers.SerializerMethodField(read_only = True)
     account = serializers.PrimaryKeyRelatedField(
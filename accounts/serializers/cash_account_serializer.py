@@ -5,9 +5,11 @@ from accounts.models.cash_account_model import CashAccount
 from company.models.company_model import Company
 from branch.models.branch_model import Branch
 from config.utilities.get_company_or_user_company import get_expected_company
+from config.eager_loading.eager_loading import EagerLoadingSerializerMixin
 
 
-class CashAccountSerializer(serializers.ModelSerializer):
+class CashAccountSerializer(EagerLoadingSerializerMixin, serializers.ModelSerializer):
+    select_related_fields = ('account__branch', 'account__company')
     balance = serializers.DecimalField(max_digits=15, decimal_places=2, read_only=True)
     company_summary = serializers.SerializerMethodField(read_only = True)
     branch_summary = serializers.SerializerMethodField(read_only = True)
@@ -6,8 +6,10 @@ from company.models.company_model import Company
 from config.utilities.get_company_or_user_company import get_expected_company
 from accounts.models.account_model import Account
 from customers.models.customer_model import Customer
+from config.eager_loading.eager_loading import EagerLoadingSerializerMixin
 
-class CustomerAccountSerializer(serializers.ModelSerializer):
+class CustomerAccountSerializer(EagerLoadingSerializerMixin, serializers.ModelSerializer):
+    select_related_fields = ('account__company',)
     company_summary = serializers.SerializerMethodField(read_only = True)
     branch_summary = serializers.SerializerMethodField(read_only = True)
     customer = serializers.PrimaryKeyRelatedField(
@@ -5,8 +5,10 @@ from branch.models.branch_model import Branch
 from payments.models.expense_model import Expense
 from users.models.user_model import User
 from config.utilities.get_company_or_user_company import get_expected_company
+from config.eager_loading.eager_loading import EagerLoadingSerializerMixin
 
-class ExpenseAccountSerializer(serializers.ModelSerializer):
+class ExpenseAccountSerializer(EagerLoadingSerializerMixin, serializers.ModelSerializer):
+    select_related_fields = ('account__company',)
     balance = serializers.DecimalField(max_digits=15, decimal_places=2, read_only=True)
     company_summary = serializers.SerializerMethodField(read_only = True)
     branch_summary = serializers.SerializerMethodField(read_only = True)
@@ -7,9 +7,11 @@ from company.models.company_model import Company
 from loans.models.loan_model import Loan
 from accounts.models.account_model import Account
 from config.utilities.get_company_or_user_company import get_expected_company
+from config.eager_loading.eager_loading import EagerLoadingSerializerMixin
 
 
-class LoanAccountSerializer(serializers.ModelSerializer):
+class LoanAccountSerializer(EagerLoadingSerializerMixin, serializers.ModelSerializer):
+    select_related_fields = ('account__company',)
     company_summary = serializers.SerializerMethodField(read_only = True)
     branch_summary = serializers.SerializerMethodField(read_only = True)
     loan = serializers.PrimaryKeyRelatedField(
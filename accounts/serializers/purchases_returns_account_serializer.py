@@ -6,8 +6,10 @@ from branch.models.branch_model import Branch
 from suppliers.models.supplier_model import Supplier
 from users.models.user_model import User
 from config.utilities.get_company_or_user_company import get_expected_company
+from config.eager_loading.eager_loading import EagerLoadingSerializerMixin
 
-class PurchasesReturnsAccountSerializer(serializers.ModelSerializer):
+class PurchasesReturnsAccountSerializer(EagerLoadingSerializerMixin, serializers.ModelSerializer):
+    select_related_fields = ('account__company',)
     balance = serializers.DecimalField(max_digits=15, decimal_places=2, read_only=True)
     company_summary = serializers.SerializerMethodField(read_only = True)
     branch_summary = serializers.SerializerMethodField(read_only = True)
@@ -6,10 +6,12 @@ from company.models.company_model import Company
 from config.utilities.get_company_or_user_company import get_expected_company
 from accounts.models.account_model import Account
 from suppliers.models.supplier_model import Supplier
+from config.eager_loading.eager_loading import EagerLoadingSerializerMixin
 
 
 
-class SupplierAccountSerializer(serializers.ModelSerializer):
+class SupplierAccountSerializer(EagerLoadingSerializerMixin, serializers.ModelSerializer):
+    select_related_fields = ('account__company',)
     company_summary = serializers.SerializerMethodField(read_only = True)
     branch_summary = serializers.SerializerMethodField(read_only = True)
     account = serializers.PrimaryKeyRelatedField(
@@ -5,6 +5,7 @@ from django.db.models import QuerySet
 from loguru import logger
 from branch.models import Branch
 from company.models import Company
+from accounts.services.ledger_account_resolver import LedgerAccountResolver
 
 
 
@@ -39,6 +40,16 @@ class BranchAccountService:
         company: Company,
         account: Account = None
     ) -> BranchAccount:
+        # Without an explicit account the branch's primary account is wanted; serve it from the ledger cache
+        if account is None:
+            branch_account = LedgerAccountResolver.resolve(
+                company=company,
+                branch=branch,
+                account_type='BRANCH'
+            )
+            if branch_account:
+                return branch_account
+
         branch_account, created = BranchAccount.objects.get_or_create(
             branch=branch,
             company=company,
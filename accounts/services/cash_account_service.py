@@ -6,6 +6,7 @@ from branch.models.branch_model import Branch
 from company.models.company_model import Company
 from accounts.models.cash_account_model import CashAccount
 from accounts.services.account_service import AccountsService
+from accounts.services.ledger_account_resolver import LedgerAccountResolver
 
 
 class CashAccountService:
@@ -44,12 +45,11 @@ class CashAccountService:
         Retrieve the cash account for a branch.
         Create it if it does not exist.
         """
-        cash_account = CashAccount.objects.select_related(
-            'account', 'account__company'
-        ).filter(
-            account__company=company,
-            branch=branch
-        ).first()
+        cash_account = LedgerAccountResolver.resolve(
+            company=company,
+            branch=branch,
+            account_type='CASH'
+        )
 
         if cash_account:
             return cash_account
@@ -0,0 +1,229 @@
+import threading
+import time
+from collections import OrderedDict
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from loguru import logger
+from accounts.models.account_model import Account
+from accounts.models.branch_account_model import BranchAccount
+from accounts.models.cash_account_model import CashAccount
+from accounts.models.sales_account_model import SalesAccount
+
+
+# Fields of Account kept in the cache. balance is deliberately left out: a resolved
+# account has it deferred, so reading it always goes to the database and the
+# select_for_update in TransactionService.apply_transaction_to_accounts stays authoritative.
+CACHED_ACCOUNT_FIELDS = [
+    field.attname for field in Account._meta.concrete_fields if field.name != 'balance'
+]
+
+
+def _cash_accounts(company_id, branch_id):
+    return CashAccount.objects.filter(account__company_id=company_id, branch_id=branch_id).order_by('-created_at')
+
+
+def _sales_accounts(company_id, branch_id):
+    return SalesAccount.objects.filter(account__company_id=company_id, branch_id=branch_id).order_by('-created_at')
+
+
+def _branch_accounts(company_id, branch_id):
+    return BranchAccount.objects.filter(company_id=company_id, branch_id=branch_id).order_by('-is_primary', '-created_at')
+
+
+# account_type -> (typed model, queryset factory)
+LEDGER_ACCOUNT_TYPES = {
+    'CASH': (CashAccount, _cash_accounts),
+    'SALES': (SalesAccount, _sales_accounts),
+    'BRANCH': (BranchAccount, _branch_accounts),
+}
+
+
+class _LocalLRU:
+    """
+    Small thread-safe LRU with a per-entry TTL, so entries invalidated in
+    another process go stale here within LOCAL_TTL seconds at most.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+class LedgerAccountResolver:
+    """
+    Resolves a branch's typed ledger account (cash, sales, branch) by
+    (company_id, branch_id, account_type) through an in-process LRU in front of
+    the Django cache, falling back to the database on a miss.
+    Invalidated by accounts.signals.ledger_account_cache_signal.
+    """
+
+    KEY_PREFIX = 'ledger_account:v1'
+    CACHE_TIMEOUT = 60 * 60
+    LOCAL_MAXSIZE = 512
+    LOCAL_TTL = 30
+
+    _local = _LocalLRU(LOCAL_MAXSIZE, LOCAL_TTL)
+    _metrics_lock = threading.Lock()
+    _metrics = {'local_hits': 0, 'shared_hits': 0, 'misses': 0, 'invalidations': 0}
+
+    # -------------------------
+    # KEYS
+    # -------------------------
+    @staticmethod
+    def cache_key(company_id, branch_id, account_type: str) -> str:
+        return f"{LedgerAccountResolver.KEY_PREFIX}:{company_id}:{branch_id}:{account_type}"
+
+    @staticmethod
+    def _account_index_key(account_id) -> str:
+        return f"{LedgerAccountResolver.KEY_PREFIX}:account:{account_id}"
+
+    # -------------------------
+    # RESOLVE
+    # -------------------------
+    @staticmethod
+    def resolve(*, company, branch, account_type: str):
+        """
+        Return the typed account for the branch with its Account attached
+        (balance deferred), or None if the branch has none yet.
+        """
+        if account_type not in LEDGER_ACCOUNT_TYPES:
+            raise ValueError(f"Unsupported ledger account type '{account_type}'.")
+
+        company_id = getattr(company, 'pk', company)
+        branch_id = getattr(branch, 'pk', branch)
+        key = LedgerAccountResolver.cache_key(company_id, branch_id, account_type)
+
+        payload = LedgerAccountResolver._local.get(key)
+        if payload is not None:
+            LedgerAccountResolver._count('local_hits')
+            return LedgerAccountResolver._hydrate(account_type, payload)
+
+        payload = cache.get(key)
+        if payload is not None:
+            LedgerAccountResolver._count('shared_hits')
+            LedgerAccountResolver._local.set(key, payload)
+            return LedgerAccountResolver._hydrate(account_type, payload)
+
+        LedgerAccountResolver._count('misses')
+        typed_model, queryset_factory = LEDGER_ACCOUNT_TYPES[account_type]
+        typed_account = (
+            queryset_factory(company_id, branch_id)
+            .select_related('account')
+            .defer('account__balance')
+            .first()
+        )
+        if typed_account is None:
+            return None
+
+        payload = LedgerAccountResolver._dehydrate(typed_account)
+        cache.set(key, payload, LedgerAccountResolver.CACHE_TIMEOUT)
+        LedgerAccountResolver._local.set(key, payload)
+        LedgerAccountResolver._index_key(typed_account.account_id, key)
+        return typed_account
+
+    @staticmethod
+    def _dehydrate(typed_account) -> dict:
+        account = typed_account.account
+        return {
+            'typed': [getattr(typed_account, field.attname) for field in typed_account._meta.concrete_fields],
+            'account': [getattr(account, attname) for attname in CACHED_ACCOUNT_FIELDS],
+        }
+
+    @staticmethod
+    def _hydrate(account_type: str, payload: dict):
+        typed_model, _ = LEDGER_ACCOUNT_TYPES[account_type]
+        typed_account = typed_model.from_db(
+            DEFAULT_DB_ALIAS,
+            [field.attname for field in typed_model._meta.concrete_fields],
+            payload['typed']
+        )
+        typed_account.account = Account.from_db(DEFAULT_DB_ALIAS, CACHED_ACCOUNT_FIELDS, payload['account'])
+        return typed_account
+
+    @staticmethod
+    def _index_key(account_id, key: str):
+        # remember which resolver keys hold an account so an Account change can evict them
+        index_key = LedgerAccountResolver._account_index_key(account_id)
+        keys = set(cache.get(index_key) or ())
+        keys.add(key)
+        cache.set(index_key, sorted(keys), LedgerAccountResolver.CACHE_TIMEOUT)
+
+    # -------------------------
+    # INVALIDATION
+    # -------------------------
+    @staticmethod
+    def invalidate(company_id, branch_id, account_type: str):
+        key = LedgerAccountResolver.cache_key(company_id, branch_id, account_type)
+        cache.delete(key)
+        LedgerAccountResolver._local.delete(key)
+        LedgerAccountResolver._count('invalidations')
+
+    @staticmethod
+    def invalidate_account(account_id):
+        """
+        Evict every resolver entry that holds the given Account.
+        """
+        index_key = LedgerAccountResolver._account_index_key(account_id)
+        keys = cache.get(index_key) or ()
+        for key in keys:
+            cache.delete(key)
+            LedgerAccountResolver._local.delete(key)
+        cache.delete(index_key)
+        if keys:
+            LedgerAccountResolver._count('invalidations', len(keys))
+            logger.debug(f"Ledger account cache evicted {len(keys)} entries for account {account_id}")
+
+    @staticmethod
+    def clear_local():
+        LedgerAccountResolver._local.clear()
+
+    # -------------------------
+    # METRICS
+    # -------------------------
+    @staticmethod
+    def _count(name: str, amount: int = 1):
+        with LedgerAccountResolver._metrics_lock:
+            LedgerAccountResolver._metrics[name] += amount
+
+    @staticmethod
+    def get_metrics() -> dict:
+        with LedgerAccountResolver._metrics_lock:
+            metrics = dict(LedgerAccountResolver._metrics)
+        lookups = metrics['local_hits'] + metrics['shared_hits'] + metrics['misses']
+        metrics['hit_rate'] = (metrics['local_hits'] + metrics['shared_hits']) / lookups if lookups else 0.0
+        return metrics
+
+    @staticmethod
+    def reset_metrics():
+        with LedgerAccountResolver._metrics_lock:
+            for name in LedgerAccountResolver._metrics:
+                LedgerAccountResolver._metrics[name] = 0
@@ -7,6 +7,7 @@ from django.db.models import Q
 from branch.models.branch_model import Branch
 from company.models.company_model import Company
 from accounts.services.account_service import AccountsService
+from accounts.services.ledger_account_resolver import LedgerAccountResolver
 
 
 
@@ -45,12 +46,11 @@ class SalesAccountService:
         Retrieve the sales account for a branch and customer name.
         Create it if it does not exist.
         """
-        sales_account = SalesAccount.objects.select_related(
-            'account', 'account__company'
-        ).filter(
-            account__company=company,
+        sales_account = LedgerAccountResolver.resolve(
+            company=company,
             branch=branch,
-        ).first()
+            account_type='SALES'
+        )
 
         if sales_account:
             return sales_account
@@ -0,0 +1,42 @@
+# accounts/signals/ledger_account_cache_signal.py
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from accounts.models.account_model import Account
+from accounts.models.branch_account_model import BranchAccount
+from accounts.models.cash_account_model import CashAccount
+from accounts.models.sales_account_model import SalesAccount
+from accounts.services.ledger_account_resolver import LedgerAccountResolver
+
+
+# Balance-only writes (apply_transaction_to_accounts, reversals) do not touch cached fields
+BALANCE_ONLY_FIELDS = {'balance', 'updated_at'}
+
+
+@receiver(post_save, sender=Account, dispatch_uid='ledger_account_cache_account_saved')
+def account_saved(sender, instance, created, update_fields=None, **kwargs):
+    if created:
+        return
+    if update_fields and set(update_fields) <= BALANCE_ONLY_FIELDS:
+        return
+    LedgerAccountResolver.invalidate_account(instance.pk)
+
+
+@receiver(post_delete, sender=Account, dispatch_uid='ledger_account_cache_account_deleted')
+def account_deleted(sender, instance, **kwargs):
+    LedgerAccountResolver.invalidate_account(instance.pk)
+
+
+def _typed_account_changed(account_type):
+    def handler(sender, instance, **kwargs):
+        company_id = getattr(instance, 'company_id', None)
+        if company_id is None:
+            company_id = Account.objects.filter(pk=instance.account_id).values_list('company_id', flat=True).first()
+        LedgerAccountResolver.invalidate(company_id, instance.branch_id, account_type)
+        LedgerAccountResolver.invalidate_account(instance.account_id)
+    return handler
+
+
+for typed_model, account_type in ((CashAccount, 'CASH'), (SalesAccount, 'SALES'), (BranchAccount, 'BRANCH')):
+    handler = _typed_account_changed(account_type)
+    post_save.connect(handler, sender=typed_model, weak=False, dispatch_uid=f'ledger_account_cache_{account_type.lower()}_saved')
+    post_delete.connect(handler, sender=typed_model, weak=False, dispatch_uid=f'ledger_account_cache_{account_type.lower()}_deleted')
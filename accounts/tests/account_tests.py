@@ -510,4 +510,41 @@ def test_trading_account_endpoints(client, test_user_token, test_account_fixture
             HTTP_AUTHORIZATION=f'Bearer {test_user_token}'
         )
         logger.info(response.json())
-        assert response.status_code == 201
\ No newline at end of file
+        assert response.status_code == 201
+
+@pytest.mark.django_db
+def test_ledger_account_resolver_caches_and_invalidates(test_company_fixture, create_branch, test_currency_fixture):
+    """
+    Test that the ledger account resolver serves repeat lookups without queries,
+    never caches the balance, and is invalidated by account changes.
+    """
+    from decimal import Decimal
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    from accounts.services.cash_account_service import CashAccountService
+    from accounts.services.ledger_account_resolver import LedgerAccountResolver
+
+    account = Account.objects.create(company=test_company_fixture, branch=create_branch, name='Till', account_type='CASH')
+    CashAccount.objects.create(account=account, branch=create_branch)
+    LedgerAccountResolver.reset_metrics()
+
+    first = CashAccountService.get_or_create_cash_account(company=test_company_fixture, branch=create_branch)
+    with CaptureQueriesContext(connection) as queries:
+        second = CashAccountService.get_or_create_cash_account(company=test_company_fixture, branch=create_branch)
+    assert [q for q in queries.captured_queries if 'SAVEPOINT' not in q['sql']] == []
+    assert second.pk == first.pk and second.account.name == 'Till'
+
+    metrics = LedgerAccountResolver.get_metrics()
+    assert metrics['misses'] == 1
+    assert metrics['local_hits'] == 1
+
+    # balance is always read from the database
+    Account.objects.filter(pk=account.pk).update(balance=Decimal('25.00'))
+    cached = CashAccountService.get_or_create_cash_account(company=test_company_fixture, branch=create_branch)
+    assert cached.account.balance == Decimal('25.00')
+
+    account.name = 'Front Till'
+    account.save()
+    renamed = CashAccountService.get_or_create_cash_account(company=test_company_fixture, branch=create_branch)
+    assert renamed.account.name == 'Front Till'
+    assert LedgerAccountResolver.get_metrics()['misses'] == 2
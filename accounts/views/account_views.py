@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
@@ -18,7 +19,7 @@ from company.models.company_model import Company
 from loguru import logger
 
 
-class AccountViewSet(ModelViewSet):
+class AccountViewSet(EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for managing Accounts within a company.
     Provides CRUD operations with appropriate permissions and filtering.
@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from accounts.models.bank_account_model import BankAccount
 from accounts.serializers.bank_account_serializer import BankAccountSerializer
 from rest_framework.permissions import IsAuthenticated
@@ -13,7 +14,7 @@ from rest_framework.response import Response
 from rest_framework import status
 from loguru import logger
 
-class BankAccountViewSet(ModelViewSet):
+class BankAccountViewSet(EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for managing Bank Accounts within a company.
     Provides CRUD operations with appropriate permissions and filtering.
@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from accounts.models.branch_account_model import BranchAccount
 from accounts.serializers.branch_account_serializer import BranchAccountSerializer
 from rest_framework.viewsets import ModelViewSet
@@ -21,7 +22,7 @@ from company.models.company_model import Company
 from django.core.exceptions import ObjectDoesNotExist
 from loguru import logger
 
-class BranchAccountViewSet(ModelViewSet):
+class BranchAccountViewSet(EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for managing Branch Accounts within a company.
     Provides CRUD operations with appropriate permissions and filtering.
@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from accounts.models.cash_account_model import CashAccount
 from accounts.serializers.cash_account_serializer import CashAccountSerializer
 from rest_framework.permissions import IsAuthenticated
@@ -11,7 +12,7 @@ from accounts.permissions.account_permission import AccountPermissionAccess
 from company.models.company_model import Company
 from loguru import logger
 
-class CashAccountViewSet(ModelViewSet):
+class CashAccountViewSet(EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for managing Cash Accounts within a company.
     Provides CRUD operations with appropriate permissions and filtering.
@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from accounts.models.customer_account_model import CustomerAccount
 from customers.models.customer_model import Customer
 from accounts.serializers.customer_account_serializer import CustomerAccountSerializer
@@ -23,7 +24,7 @@ from django.core.exceptions import ObjectDoesNotExist
 from loguru import logger
 
 
-class CustomerAccountViewSet(ModelViewSet):
+class CustomerAccountViewSet(EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for managing Customer Accounts within a company.
     Provides CRUD operations with appropriate permissions and filtering.
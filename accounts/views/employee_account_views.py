@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from accounts.models import customer_account_model
 from accounts.models.employee_account_model import EmployeeAccount
 from accounts.serializers.employee_account_serializer import EmployeeAccountSerializer
@@ -24,7 +25,7 @@ from django.core.exceptions import ObjectDoesNotExist
 from loguru import logger
 
 
-class EmployeeAccountViewSet(ModelViewSet):
+class EmployeeAccountViewSet(EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for managing Employee Accounts within a company.
     Provides CRUD operations with appropriate permissions and filtering.
@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from accounts.models.loan_account_model import LoanAccount
 from accounts.models.supplier_account_model import SupplierAccount
 from loans.permissions.loan_permissions import LoanPermissions
@@ -24,7 +25,7 @@ from django.core.exceptions import ObjectDoesNotExist
 from loguru import logger
 
 
-class LoanAccountViewSet(ModelViewSet):
+class LoanAccountViewSet(EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for managing Loan Accounts within a company.
     Provides CRUD operations with appropriate permissions and filtering.
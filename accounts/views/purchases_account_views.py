@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from accounts.models.purchases_account_model import PurchasesAccount
 from accounts.serializers.purchases_account_serializer import PurchasesAccountSerializer
 from rest_framework.permissions import IsAuthenticated
@@ -11,7 +12,7 @@ from accounts.permissions.account_permission import AccountPermissionAccess
 from company.models.company_model import Company
 from loguru import logger
 
-class PurchasesAccountViewSet(ModelViewSet):
+class PurchasesAccountViewSet(EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for managing Purchases Accounts within a company.
     Provides CRUD operations with appropriate permissions and filtering.
@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from accounts.models.supplier_account_model import SupplierAccount
 from accounts.serializers.supplier_account_serializer import SupplierAccountSerializer
 from suppliers.models.supplier_model import Supplier
@@ -23,7 +24,7 @@ from django.core.exceptions import ObjectDoesNotExist
 from loguru import logger
 
 
-class SupplierAccountViewSet(ModelViewSet):
+class SupplierAccountViewSet(EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for managing Supplier Accounts within a company.
     Provides CRUD operations with appropriate permissions and filtering.
@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from rest_framework.filters import SearchFilter, OrderingFilter
 from rest_framework.permissions import IsAuthenticated
 from rest_framework_simplejwt.authentication import JWTAuthentication
@@ -13,7 +14,7 @@ from accounts.serializers.writeoff_account_serializer import WriteOffAccountSeri
 
 
 
-class WriteOffAccountViewSet(ModelViewSet):
+class WriteOffAccountViewSet(EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for managing Write-Off Accounts within a company.
     Provides CRUD operations with appropriate permissions and filtering.
@@ -80,6 +80,10 @@ class ActivityLog(CreateUpdateBaseModel):
         indexes = [
             models.Index(fields=['user', 'action', 'created_at']),
             models.Index(fields=['content_type', 'object_id']),
+            # tenant listings: filtered by company (+ branch / user), newest first
+            models.Index(fields=['company', '-created_at'], name='actlog_co_created_idx'),
+            models.Index(fields=['company', 'branch', '-created_at'], name='actlog_co_br_created_idx'),
+            models.Index(fields=['company', 'user', '-created_at'], name='actlog_co_user_created_idx'),
         ]
 
     def __str__(self):
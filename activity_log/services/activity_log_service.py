@@ -55,6 +55,24 @@ class ActivityLogService:
         )
 
         return activity_log
+
+    @staticmethod
+    def bulk_create_activity_logs(rows: list[dict], batch_size: int = 500) -> list[ActivityLog]:
+        """
+        Write a batch of buffered activity log rows (dicts of field values using *_id keys)
+        with a single bulk_create. Used by the activity log pipeline.
+        """
+        if not rows:
+            return []
+
+        activity_logs = ActivityLog.objects.bulk_create(
+            [ActivityLog(**row) for row in rows],
+            batch_size=batch_size
+        )
+
+        logger.info("Activity logs created in bulk | count={}", len(activity_logs))
+
+        return activity_logs
     
 
 
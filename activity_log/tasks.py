@@ -0,0 +1,10 @@
+from celery import shared_task
+from activity_log.services.activity_log_service import ActivityLogService
+
+
+@shared_task(ignore_result=True)
+def write_activity_logs_task(rows):
+    """
+    Write a batch of activity log rows handed off by the activity log pipeline ("celery" mode).
+    """
+    ActivityLogService.bulk_create_activity_logs(rows)
@@ -56,4 +56,69 @@ from fixture_tests import *
 #     # Detail
 #     url_detail = reverse('activity-log-detail', kwargs={'pk': 1})
 #     response = client.get(url_detail, HTTP_AUTHORIZATION=f'Bearer {test_user_token}')
-#     assert response.status_code == 200
\ No newline at end of file
+#     assert response.status_code == 200
+
+# ==========================================
+# ACTIVITY LOG PIPELINE
+# ==========================================
+
+@pytest.mark.django_db
+def test_activity_log_pipeline_writes_one_batch_per_transaction(test_company_fixture, create_branch, django_capture_on_commit_callbacks):
+    """
+    Test that CRUD signals inside a transaction are written with one bulk insert on commit,
+    and that entries from a rolled back savepoint are never written.
+    """
+    from django.db import connection, transaction
+    from django.test.utils import CaptureQueriesContext
+    from config.activity_log.activity_log_pipeline import get_pipeline_stats
+    from customers.models.customer_model import Customer
+
+    before = get_pipeline_stats()
+    with CaptureQueriesContext(connection) as queries:
+        with django_capture_on_commit_callbacks(execute=True):
+            with transaction.atomic():
+                for name in ('Magiv', 'Tawa', 'Edward'):
+                    Customer.objects.create(company=test_company_fixture, branch=create_branch, first_name=name, last_name='Test', email=f'{name.lower()}@test.com')
+                try:
+                    with transaction.atomic():
+                        Customer.objects.create(company=test_company_fixture, branch=create_branch, first_name='Ghost', last_name='Test', email='ghost@test.com')
+                        raise ValueError("roll back")
+                except ValueError:
+                    pass
+    after = get_pipeline_stats()
+
+    inserts = [q for q in queries.captured_queries if q['sql'].startswith('INSERT INTO "activity_log_activitylog"')]
+    assert len(inserts) == 1
+    assert after['flushed'] - before['flushed'] == 3
+    assert after['batches'] - before['batches'] == 1
+    assert ActivityLog.objects.filter(action='customer_created').count() == 3
+
+
+@pytest.mark.django_db
+def test_activity_log_pipeline_overflow_policies(settings, tmp_path, test_company_fixture, create_branch, django_capture_on_commit_callbacks):
+    """
+    Test the drop and spill back-pressure policies and replaying the spill file.
+    """
+    from django.core.management import call_command
+    from config.activity_log.activity_log_pipeline import activity_log_scope, get_pipeline_stats
+    from customers.models.customer_model import Customer
+
+    spill_path = tmp_path / 'spill.jsonl'
+    settings.ACTIVITY_LOG_PIPELINE = {'MAX_BUFFERED': 1, 'OVERFLOW_POLICY': 'drop', 'SPILL_PATH': str(spill_path)}
+    before = get_pipeline_stats()
+    with activity_log_scope(), django_capture_on_commit_callbacks(execute=True):
+        Customer.objects.create(company=test_company_fixture, branch=create_branch, first_name='Magiv', last_name='Test', email='magiv@test.com')
+        Customer.objects.create(company=test_company_fixture, branch=create_branch, first_name='Tawa', last_name='Test', email='tawa@test.com')
+    assert get_pipeline_stats()['dropped'] - before['dropped'] == 1
+    assert ActivityLog.objects.filter(action='customer_created').count() == 1
+
+    settings.ACTIVITY_LOG_PIPELINE = {'MAX_BUFFERED': 1, 'OVERFLOW_POLICY': 'spill', 'SPILL_PATH': str(spill_path)}
+    with activity_log_scope(), django_capture_on_commit_callbacks(execute=True):
+        Customer.objects.create(company=test_company_fixture, branch=create_branch, first_name='Edward', last_name='Test', email='edward@test.com')
+        Customer.objects.create(company=test_company_fixture, branch=create_branch, first_name='Ghost', last_name='Test', email='ghost@test.com')
+    assert get_pipeline_stats()['spilled'] - before['spilled'] == 1
+    assert ActivityLog.objects.filter(action='customer_created').count() == 2
+
+    call_command('replay_activity_log_spill', path=str(spill_path))
+    assert ActivityLog.objects.filter(action='customer_created').count() == 3
+    assert not spill_path.exists()
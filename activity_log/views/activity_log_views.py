@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ReadOnlyModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from rest_framework.filters import SearchFilter, OrderingFilter
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from config.auth.jwt_token_authentication import (
@@ -9,21 +10,24 @@ from config.pagination.pagination import StandardResultsSetPagination
 from config.utilities.get_queryset import get_company_queryset
 from config.utilities.get_logged_in_company import get_logged_in_company
 from loguru import logger
+from config.pagination.keyset_pagination import KeysetOrPageNumberPagination
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from activity_log.services.activity_log_service import ActivityLogService
 from activity_log.models.activity_log_model import ActivityLog
 from activity_log.serializers.activity_log_serializer import ActivityLogSerializer
 from activity_log.permissions.activity_log_permissions import ActivityLogPermission
+from config.export.export_mixin import StreamingExportMixin
 
 
-class ActivityLogViewSet(ReadOnlyModelViewSet):
+class ActivityLogViewSet(StreamingExportMixin, EagerLoadingMixin, ReadOnlyModelViewSet):
     """
     ViewSet for viewing Activity Logs.
     -------------------
     - Read-only (list & retrieve)
     - No create, update, or delete
     - Used for auditing & monitoring
+    - export/ streams the filtered logs as CSV or NDJSON
     -------------------
     """
 
@@ -53,7 +57,18 @@ class ActivityLogViewSet(ReadOnlyModelViewSet):
     ]
 
     ordering = ['-created_at']
-    pagination_class = StandardResultsSetPagination
+    pagination_class = KeysetOrPageNumberPagination
+    export_columns = (
+        ('created_at', 'created_at'),
+        ('branch', 'branch__name'),
+        ('user', 'user__username'),
+        ('action', 'action'),
+        ('object_type', 'content_type__model'),
+        ('object_id', 'object_id'),
+        ('description', 'description'),
+        ('metadata', 'metadata'),
+    )
+    export_filename = 'activity_logs'
 
     def get_queryset(self):
         """
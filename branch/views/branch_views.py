@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ReadOnlyModelViewSet, ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from branch.models.branch_model import Branch
 from branch.serializers.branch_serializer import BranchSerializer
 from branch.permissions.branch_permissions import BranchPermissions
@@ -15,7 +16,7 @@ from django.db import transaction
 from rest_framework.exceptions import ValidationError
 
 
-class BranchViewSet(ModelViewSet):
+class BranchViewSet(EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for viewing Branches.
     - ReadOnlyModelViewSet: allows only GET requests.
@@ -6,4 +6,5 @@ class CompanyConfig(AppConfig):
     name = 'company'
 
     def ready(self):
-        import company.signals.company_activity_logs_signal
\ No newline at end of file
+        import company.signals.company_activity_logs_signal
+        import company.signals.company_principal_cache_signal
@@ -0,0 +1,13 @@
+# company/signals/company_principal_cache_signal.py
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from config.auth.principal_cache import PrincipalCache
+from company.models.company_model import Company
+
+
+@receiver(post_save, sender=Company, dispatch_uid='principal_cache_company_saved')
+@receiver(post_delete, sender=Company, dispatch_uid='principal_cache_company_deleted')
+def company_changed(sender, instance, **kwargs):
+    # cached users carry their company too (e.g. a deactivated company)
+    PrincipalCache.invalidate(Company, instance.pk)
+    PrincipalCache.invalidate_where(lambda principal: getattr(principal, 'company_id', None) == instance.pk)
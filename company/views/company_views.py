@@ -4,6 +4,7 @@ from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 from rest_framework.views import APIView
 from rest_framework.viewsets import ReadOnlyModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from rest_framework.filters import SearchFilter, OrderingFilter
 from django.contrib.auth import authenticate
 from rest_framework_simplejwt.tokens import RefreshToken
@@ -25,7 +26,7 @@ from drf_yasg.utils import swagger_auto_schema
 
 
 # Only list and retrieve companies via this ViewSet
-class CompanyViewSet(ReadOnlyModelViewSet):
+class CompanyViewSet(EagerLoadingMixin, ReadOnlyModelViewSet):
     queryset = Company.objects.all()
     serializer_class = CompanySerializer
     pagination_class = StandardResultsSetPagination
@@ -0,0 +1,243 @@
+import json
+import os
+import threading
+from contextlib import contextmanager
+from functools import partial
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, transaction
+from loguru import logger
+
+
+# ==========================================================
+# SETTINGS
+# ==========================================================
+PIPELINE_DEFAULTS = {
+    # "sync": write each entry immediately (legacy behaviour)
+    # "buffered": bulk_create committed entries in batches
+    # "celery": hand committed batches to write_activity_logs_task
+    "MODE": "buffered",
+    "BATCH_SIZE": 500,
+    # back-pressure: once this many committed entries are waiting, OVERFLOW_POLICY applies
+    "MAX_BUFFERED": 5000,
+    # "flush": write now on the caller's thread, "drop": discard new entries, "spill": append to SPILL_PATH
+    "OVERFLOW_POLICY": "flush",
+    "SPILL_PATH": os.path.join(settings.BASE_DIR, "var", "activity_log_spill.jsonl"),
+}
+
+MODES = {"sync", "buffered", "celery"}
+OVERFLOW_POLICIES = {"flush", "drop", "spill"}
+
+
+def get_pipeline_settings() -> dict:
+    config = {**PIPELINE_DEFAULTS, **getattr(settings, "ACTIVITY_LOG_PIPELINE", {})}
+    if config["MODE"] not in MODES:
+        raise ValueError(f"Invalid ACTIVITY_LOG_PIPELINE MODE '{config['MODE']}'.")
+    if config["OVERFLOW_POLICY"] not in OVERFLOW_POLICIES:
+        raise ValueError(f"Invalid ACTIVITY_LOG_PIPELINE OVERFLOW_POLICY '{config['OVERFLOW_POLICY']}'.")
+    return config
+
+
+# ==========================================================
+# COUNTERS
+# ==========================================================
+class PipelineStats:
+    """
+    Process-wide counters for the activity log pipeline.
+    """
+
+    FIELDS = ("buffered", "flushed", "batches", "dropped", "spilled", "failed")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def incr(self, name: str, amount: int = 1):
+        with self._lock:
+            self._counts[name] += amount
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return dict(self._counts)
+
+    def reset(self):
+        with self._lock:
+            self._counts = {name: 0 for name in self.FIELDS}
+
+
+stats = PipelineStats()
+
+
+def get_pipeline_stats() -> dict:
+    return stats.snapshot()
+
+
+# ==========================================================
+# BUFFER
+# ==========================================================
+class _FlushMarker:
+    """
+    One flush callback registered with transaction.on_commit.
+    A marker is superseded when a later marker is registered with a subset of its
+    savepoint ids: that later marker is guaranteed to run whenever this one does,
+    so only the last one flushes and a transaction writes a single batch.
+    """
+
+    __slots__ = ("sids", "superseded")
+
+    def __init__(self, sids):
+        self.sids = sids
+        self.superseded = False
+
+
+_MAX_TRACKED_MARKERS = 32
+_local = threading.local()
+
+
+def _staged() -> list:
+    if not hasattr(_local, "staged"):
+        _local.staged = []
+    return _local.staged
+
+
+def _markers() -> list:
+    if not hasattr(_local, "markers"):
+        _local.markers = []
+    return _local.markers
+
+
+def _in_scope() -> bool:
+    return getattr(_local, "scope_depth", 0) > 0
+
+
+def enqueue(row: dict):
+    """
+    Queue one ActivityLog row (a dict of model field values).
+    Inside a transaction the row is only staged once that transaction (and every
+    savepoint around it) commits, so rolled back work leaves no audit trail.
+    """
+    config = get_pipeline_settings()
+    if config["MODE"] == "sync":
+        _write_rows([row])
+        return
+
+    stats.incr("buffered")
+    if connection.in_atomic_block:
+        transaction.on_commit(partial(_stage, row))
+        _register_flush(set(connection.savepoint_ids))
+        return
+
+    _stage(row)
+    if not _in_scope():
+        flush()
+
+
+def _register_flush(sids):
+    markers = _markers()
+    for marker in markers:
+        if not marker.superseded and sids <= marker.sids:
+            marker.superseded = True
+
+    marker = _FlushMarker(sids)
+    markers.append(marker)
+    del markers[:-_MAX_TRACKED_MARKERS]
+    transaction.on_commit(partial(_flush_marker, marker))
+
+
+def _flush_marker(marker):
+    if marker.superseded:
+        return
+    if _in_scope():
+        # the enclosing request scope writes everything on exit
+        return
+    flush()
+
+
+def _stage(row: dict):
+    staged = _staged()
+    config = get_pipeline_settings()
+    if len(staged) < config["MAX_BUFFERED"]:
+        staged.append(row)
+        return
+
+    policy = config["OVERFLOW_POLICY"]
+    if policy == "drop":
+        stats.incr("dropped")
+        logger.warning("Activity log buffer full ({}); dropped entry | action={}", len(staged), row.get("action"))
+    elif policy == "spill":
+        spill_rows([row], config["SPILL_PATH"])
+    else:
+        flush()
+        _staged().append(row)
+
+
+def flush() -> int:
+    """
+    Write every staged row for this thread. Returns the number of rows handed off.
+    """
+    staged = _staged()
+    if not staged:
+        return 0
+    rows = list(staged)
+    staged.clear()
+
+    config = get_pipeline_settings()
+    batch_size = config["BATCH_SIZE"]
+    for start in range(0, len(rows), batch_size):
+        _dispatch(rows[start:start + batch_size], config)
+    return len(rows)
+
+
+def _dispatch(rows: list, config: dict):
+    try:
+        if config["MODE"] == "celery":
+            from activity_log.tasks import write_activity_logs_task
+            write_activity_logs_task.delay(json.loads(json.dumps(rows, cls=DjangoJSONEncoder)))
+        else:
+            _write_rows(rows)
+    except Exception as e:
+        stats.incr("failed", len(rows))
+        logger.error(f"Activity log batch of {len(rows)} could not be written, spilling to disk: {e}")
+        spill_rows(rows, config["SPILL_PATH"])
+        return
+
+    stats.incr("flushed", len(rows))
+    stats.incr("batches")
+
+
+def _write_rows(rows: list):
+    from activity_log.services.activity_log_service import ActivityLogService
+    ActivityLogService.bulk_create_activity_logs(rows)
+
+
+_spill_lock = threading.Lock()
+
+
+def spill_rows(rows: list, path: str):
+    """
+    Append rows to the spill file as JSON lines; replay with the replay_activity_log_spill command.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with _spill_lock, open(path, "a", encoding="utf-8") as spill_file:
+        for row in rows:
+            spill_file.write(json.dumps(row, cls=DjangoJSONEncoder) + "\n")
+    stats.incr("spilled", len(rows))
+    logger.warning(f"Spilled {len(rows)} activity log entries to {path}")
+
+
+# ==========================================================
+# REQUEST SCOPE
+# ==========================================================
+@contextmanager
+def activity_log_scope():
+    """
+    Hold committed entries until the outermost scope exits and write them as one batch.
+    Used per request by ActivityLogBufferMiddleware; also usable around scripts and tasks.
+    """
+    _local.scope_depth = getattr(_local, "scope_depth", 0) + 1
+    try:
+        yield
+    finally:
+        _local.scope_depth -= 1
+        if _local.scope_depth == 0:
+            flush()
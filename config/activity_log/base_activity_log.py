@@ -1,21 +1,45 @@
 from activity_log.services.activity_log_service import ActivityLogService
 from django.contrib.contenttypes.models import ContentType
+from config.activity_log.activity_log_pipeline import enqueue, get_pipeline_settings
 from config.middleware.get_current_user_middleware import get_current_user
 from users.models.user_model import User
+from company.models.company_model import Company
+from branch.models.branch_model import Branch
 
 def log_activity(*, company, branch, instance, action: str, user=None, metadata=None, description=None):
     """
-    Centralized function to create an activity log entry
+    Centralized function to create an activity log entry.
+    Outside "sync" mode the entry is buffered and written in bulk once the
+    surrounding transaction commits (see activity_log_pipeline).
+    company and branch may be model instances or primary keys.
     """
+    # get_for_model is served from ContentType's per-process cache after the first lookup
+    content_type = ContentType.objects.get_for_model(instance) if instance else None
 
-    
-    ActivityLogService.create_activity_log(
-        company=company,
-        branch=branch,
-        user_id=getattr(user, "id", None),
-        action=action,
-        content_type=ContentType.objects.get_for_model(instance) if instance else None,
-        object_id=instance.id if instance else None,
-        metadata=metadata or {},
-        description=description or f"{action} on {instance}"
-    )
\ No newline at end of file
+    if get_pipeline_settings()["MODE"] == "sync":
+        if company is not None and not isinstance(company, Company):
+            company = Company.objects.filter(pk=company).first()
+        if branch is not None and not isinstance(branch, Branch):
+            branch = Branch.objects.filter(pk=branch).first()
+        ActivityLogService.create_activity_log(
+            company=company,
+            branch=branch,
+            user_id=getattr(user, "id", None),
+            action=action,
+            content_type=content_type,
+            object_id=instance.id if instance else None,
+            metadata=metadata or {},
+            description=description or f"{action} on {instance}"
+        )
+        return
+
+    enqueue({
+        "company_id": getattr(company, "pk", None),
+        "branch_id": getattr(branch, "pk", None),
+        "user_id": getattr(user, "id", None),
+        "action": action,
+        "content_type_id": content_type.pk if content_type else None,
+        "object_id": instance.id if instance else None,
+        "metadata": metadata or {},
+        "description": description or f"{action} on {instance}",
+    })
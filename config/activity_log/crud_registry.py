@@ -6,14 +6,28 @@ from transfers.models.product_transfer_item_model import ProductTransferItem
 from users.models.user_model import User
 
 
+def _related_pk(instance, name):
+    """
+    Primary key of a related company/branch without loading the row:
+    read the FK column when there is one, otherwise fall back to the attribute.
+    """
+    related_id = getattr(instance, f'{name}_id', None)
+    if related_id is not None:
+        return related_id
+    return getattr(getattr(instance, name, None), 'pk', None)
+
+
 def register_crud_signals(model, actions, get_description=None, get_metadata=None):
-    @receiver(post_save, sender=model)
+    # the handlers are closures, so they must be held strongly or they get garbage collected
+    dispatch_uid = f"activity_log_{model._meta.label_lower}"
+
+    @receiver(post_save, sender=model, weak=False, dispatch_uid=f"{dispatch_uid}_save")
     def log_save(sender, instance, created, **kwargs):
         action = actions['create'] if created else actions['update']
         description = get_description(instance, created) if get_description else None
         metadata = get_metadata(instance, created) if get_metadata else None
-        company = getattr(instance, 'company', None)
-        branch = getattr(instance, 'branch', None)
+        company = _related_pk(instance, 'company')
+        branch = _related_pk(instance, 'branch')
 
         current_user = get_current_user()
         if isinstance(current_user, User):
@@ -30,12 +44,12 @@ def register_crud_signals(model, actions, get_description=None, get_metadata=Non
             metadata=metadata
         )
 
-    @receiver(pre_delete, sender=model)
+    @receiver(pre_delete, sender=model, weak=False, dispatch_uid=f"{dispatch_uid}_delete")
     def log_delete(sender, instance, **kwargs):
         description = get_description(instance, deleted=True) if get_description else None
         metadata = get_metadata(instance, deleted=True) if get_metadata else None
-        company = getattr(instance, 'company', None)
-        branch = getattr(instance, 'branch', None)
+        company = _related_pk(instance, 'company')
+        branch = _related_pk(instance, 'branch')
 
         current_user = get_current_user()
         if isinstance(current_user, User):
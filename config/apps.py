@@ -1,6 +1,12 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class ConfigConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'config'
+
+    def ready(self):
+        if getattr(settings, 'LOGURU', {}).get('MODE'):
+            from config.utilities.logger import setup_loguru
+            setup_loguru()
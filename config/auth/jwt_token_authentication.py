@@ -4,6 +4,9 @@ from rest_framework_simplejwt.exceptions import TokenError
 from rest_framework_simplejwt.tokens import RefreshToken
 from loguru import logger
 from django.conf import settings
+from company.models.company_model import Company
+from config.auth.principal_cache import PrincipalCache
+from config.auth.tenant import set_request_tenant
 
 
 class BaseCookieJWTAuthentication(JWTAuthentication):
@@ -19,23 +22,38 @@ class BaseCookieJWTAuthentication(JWTAuthentication):
 
     def authenticate(self, request):
         raw_token = request.COOKIES.get(self.access_cookie_name)
-        logger.info(f"[CookieJWT] Raw token from cookie '{self.access_cookie_name}': {raw_token}")
-
         if not raw_token:
-            logger.info(f"[CookieJWT] No {self.access_cookie_name} found in cookies.")
+            logger.debug("[CookieJWT] No {} found in cookies.", self.access_cookie_name)
             return None
 
+        # request-scoped: a token is validated and its principal loaded at most once per request
+        http_request = getattr(request, '_request', request)
+        results = http_request.__dict__.setdefault('_cookie_jwt_results', {})
+        key = (self.access_cookie_name, raw_token)
+        if key not in results:
+            results[key] = self._authenticate_token(raw_token)
+        result = results[key]
+        if result is not None:
+            user = result[0]
+            if isinstance(user, Company):
+                set_request_tenant(request, user, None)
+            else:
+                set_request_tenant(request, user.company, user.branch)
+        return result
+
+    def _authenticate_token(self, raw_token):
         try:
             validated_token = self.get_validated_token(raw_token)
-            user = self.get_user(validated_token)
-            if user is None:
-                logger.warning(f"[CookieJWT] Token validated but no user found for ID: {validated_token.get('user_id')}")
-                return None
-            logger.info(f"[CookieJWT] Token validated successfully for user ID: {user.id}")
-            return user, validated_token
         except TokenError as e:
-            logger.warning(f"[CookieJWT] Invalid access token in cookie: {e}")
+            logger.warning(f"[CookieJWT] Invalid access token in cookie '{self.access_cookie_name}': {e}")
+            return None
+        user = self.get_user(validated_token)
+        company = user if isinstance(user, Company) else getattr(user, 'company', None)
+        if user is None or not user.is_active or (company is not None and not company.is_active):
+            logger.warning(f"[CookieJWT] Token validated but no active principal for ID: {validated_token.get('user_id')}")
             return None
+        logger.debug("[CookieJWT] Token validated for {} ID: {}", type(user).__name__, user.id)
+        return user, validated_token
 
     def authenticate_header(self, request):
         return 'Bearer'
@@ -46,16 +64,17 @@ class BaseCookieJWTAuthentication(JWTAuthentication):
         Returns new access token string if successful, else None.
         """
         refresh_token = request.COOKIES.get(self.refresh_cookie_name)
-        logger.info(f"[CookieJWT] Raw refresh token from cookie '{self.refresh_cookie_name}': {refresh_token}")
-
         if not refresh_token:
-            logger.info(f"[CookieJWT] No {self.refresh_cookie_name} found in cookies.")
+            logger.info("[CookieJWT] No {} found in cookies.", self.refresh_cookie_name)
             return None
 
         try:
             refresh = RefreshToken(refresh_token)
             new_access = str(refresh.access_token)
-            logger.info(f"[CookieJWT] Refresh token validated. New access token generated:{new_access}.")
+            logger.info(
+                "[CookieJWT] Refresh token validated. New access token generated from '{}'.",
+                self.refresh_cookie_name,
+            )
             return new_access
         except TokenError as e:
             logger.warning(f"[CookieJWT] Invalid refresh token in cookie: {e}")
@@ -69,15 +88,19 @@ class UserCookieJWTAuthentication(BaseCookieJWTAuthentication):
     access_cookie_name = "user_access_token"
     refresh_cookie_name = "user_refresh_token"
 
-    def get_user(self, validated_token):
+    @staticmethod
+    def _load_user(user_id):
         from users.models.user_model import User
         try:
-            user_id = validated_token["user_id"]
-            return User.objects.get(pk=user_id)
+            return User.objects.select_related('company', 'branch').get(pk=user_id)
         except User.DoesNotExist:
-            logger.warning(f"[UserCookieJWT] No User found with ID: {validated_token.get('user_id')}")
+            logger.warning(f"[UserCookieJWT] No User found with ID: {user_id}")
             return None
 
+    def get_user(self, validated_token):
+        from users.models.user_model import User
+        return PrincipalCache.get(User, validated_token["user_id"], self._load_user)
+
 
 
 
@@ -88,11 +111,13 @@ class CompanyCookieJWTAuthentication(BaseCookieJWTAuthentication):
     access_cookie_name = "company_access_token"
     refresh_cookie_name = "company_refresh_token"
 
-    def get_user(self, validated_token):
-        from company.models.company_model import Company
+    @staticmethod
+    def _load_company(company_id):
         try:
-            user_id = validated_token["user_id"]
-            return Company.objects.get(pk=user_id)
+            return Company.objects.get(pk=company_id)
         except Company.DoesNotExist:
-            logger.warning(f"[CompanyCookieJWT] No Company found with ID: {validated_token.get('user_id')}")
+            logger.warning(f"[CompanyCookieJWT] No Company found with ID: {company_id}")
             return None
+
+    def get_user(self, validated_token):
+        return PrincipalCache.get(Company, validated_token["user_id"], self._load_company)
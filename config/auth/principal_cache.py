@@ -0,0 +1,69 @@
+import copy
+import threading
+import time
+from django.conf import settings
+from loguru import logger
+
+
+class PrincipalCache:
+    """
+    Short-lived, process-local cache of authenticated principals (User or Company) by primary key,
+    so the cookie JWT classes do not load the same principal on every request.
+    Users are cached with their company and branch joined in, which is what tenant resolution reads.
+    Entries expire after AUTH_PRINCIPAL_CACHE["TTL_SECONDS"]; saving or deleting a User or Company
+    drops its entry in this process at once (see company/signals/company_principal_cache_signal.py
+    and users/signals/user_principal_cache_signal.py), so a deactivation reaches other processes
+    within the TTL.
+    Callers get a copy: a view mutating request.user never touches the cached instance.
+    """
+    _entries = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _config() -> dict:
+        return getattr(settings, 'AUTH_PRINCIPAL_CACHE', {})
+
+    @classmethod
+    def get(cls, model, pk, loader):
+        """
+        The principal of model with pk, from the cache or loader(pk) (None when it does not exist).
+        """
+        ttl = cls._config().get('TTL_SECONDS', 30)
+        key = (model._meta.label_lower, str(pk))
+        entry = cls._entries.get(key)
+        now = time.monotonic()
+        if entry is not None and entry[0] > now:
+            return copy.deepcopy(entry[1])
+
+        principal = loader(pk)
+        if principal is not None and ttl > 0:
+            with cls._lock:
+                if len(cls._entries) >= cls._config().get('MAX_ENTRIES', 10000):
+                    cls._evict(now)
+                cls._entries[key] = (now + ttl, principal)
+            principal = copy.deepcopy(principal)
+        return principal
+
+    @classmethod
+    def _evict(cls, now):
+        expired = [key for key, (expires_at, _) in cls._entries.items() if expires_at <= now]
+        for key in expired:
+            cls._entries.pop(key, None)
+        if len(cls._entries) >= cls._config().get('MAX_ENTRIES', 10000):
+            cls._entries.clear()
+            logger.debug("Principal cache full; cleared")
+
+    @classmethod
+    def invalidate(cls, model, pk):
+        cls._entries.pop((model._meta.label_lower, str(pk)), None)
+
+    @classmethod
+    def invalidate_where(cls, predicate):
+        with cls._lock:
+            for key in [key for key, (_, principal) in cls._entries.items() if predicate(principal)]:
+                cls._entries.pop(key, None)
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._entries.clear()
@@ -0,0 +1,28 @@
+from company.models.company_model import Company
+
+
+def set_request_tenant(request, company, branch):
+    # DRF's Request proxies attribute reads to the HttpRequest, so set them there once
+    http_request = getattr(request, '_request', request)
+    http_request.company = company
+    http_request.branch = branch
+    return company, branch
+
+
+def resolve_tenant(request):
+    """
+    (company, branch) of the authenticated principal, resolved once per request and kept
+    on request.company / request.branch. A Company principal has no branch.
+    The cookie JWT classes set these at authentication; other authentication (header JWT,
+    force_authenticate in tests) is resolved here on first use.
+    """
+    http_request = getattr(request, '_request', request)
+    if hasattr(http_request, 'company'):
+        return http_request.company, getattr(http_request, 'branch', None)
+
+    user = getattr(request, 'user', None)
+    if user is None or not user.is_authenticated:
+        return None, None
+    if isinstance(user, Company):
+        return set_request_tenant(request, user, None)
+    return set_request_tenant(request, getattr(user, 'company', None), getattr(user, 'branch', None))
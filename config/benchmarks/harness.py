@@ -0,0 +1,181 @@
+import json
+import os
+import platform
+import time
+import tracemalloc
+from dataclasses import dataclass, asdict
+from django.db import connections, transaction as db_transaction, DEFAULT_DB_ALIAS
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from loguru import logger
+
+
+@dataclass
+class ScenarioRun:
+    """
+    What a scenario hands to the harness: run() is timed, prepare() (if given)
+    builds its input before each iteration outside the timed section, and
+    teardown() (if given) runs once after the scenario, even when it failed.
+    """
+    run: callable
+    prepare: callable = None
+    teardown: callable = None
+
+
+@dataclass
+class ScenarioResult:
+    name: str
+    iterations: int = 0
+    p50_ms: float = 0.0
+    p90_ms: float = 0.0
+    p95_ms: float = 0.0
+    p99_ms: float = 0.0
+    mean_ms: float = 0.0
+    max_ms: float = 0.0
+    sql_statements: int = 0
+    peak_memory_kb: float = 0.0
+    error: str | None = None
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+def percentile(values: list, pct: float) -> float:
+    """
+    Linear-interpolated percentile (pct in 0..100) of an unsorted list.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def _statement_count(queries) -> int:
+    return len([q for q in queries.captured_queries if 'SAVEPOINT' not in q['sql']])
+
+
+def _call(scenario_run: ScenarioRun):
+    argument = scenario_run.prepare() if scenario_run.prepare else None
+    return (lambda: scenario_run.run(argument)) if scenario_run.prepare else scenario_run.run
+
+
+def measure(name: str, scenario_run: ScenarioRun, *, iterations: int = 20, warmup: int = 2,
+            using: str = DEFAULT_DB_ALIAS) -> ScenarioResult:
+    """
+    Time iterations of a scenario. Latency and SQL statement counts come from a plain pass;
+    peak memory from one extra iteration under tracemalloc, so tracing does not skew latency.
+    """
+    connection = connections[using]
+    for _ in range(warmup):
+        _call(scenario_run)()
+
+    latencies, statements = [], []
+    for _ in range(iterations):
+        call = _call(scenario_run)
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            call()
+            latencies.append((time.perf_counter() - started) * 1000)
+        statements.append(_statement_count(queries))
+
+    call = _call(scenario_run)
+    tracemalloc.start()
+    try:
+        call()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return ScenarioResult(
+        name=name,
+        iterations=iterations,
+        p50_ms=round(percentile(latencies, 50), 3),
+        p90_ms=round(percentile(latencies, 90), 3),
+        p95_ms=round(percentile(latencies, 95), 3),
+        p99_ms=round(percentile(latencies, 99), 3),
+        mean_ms=round(sum(latencies) / len(latencies), 3) if latencies else 0.0,
+        max_ms=round(max(latencies), 3) if latencies else 0.0,
+        sql_statements=max(statements) if statements else 0,
+        peak_memory_kb=round(peak / 1024, 1),
+    )
+
+
+def run_scenarios(scenarios: dict, context, *, iterations: int = 20, warmup: int = 2,
+                  using: str = DEFAULT_DB_ALIAS) -> list[ScenarioResult]:
+    """
+    Run each scenario inside a transaction that is rolled back afterwards,
+    so benchmarks never change the seeded data they run against.
+    """
+    results = []
+    for name, setup in scenarios.items():
+        try:
+            with db_transaction.atomic(using=using):
+                scenario_run = setup(context)
+                if scenario_run is None:
+                    logger.info(f"Benchmark '{name}' skipped: not applicable to this dataset")
+                    continue
+                try:
+                    result = measure(name, scenario_run, iterations=iterations, warmup=warmup, using=using)
+                finally:
+                    if scenario_run.teardown:
+                        scenario_run.teardown()
+                db_transaction.set_rollback(True, using=using)
+        except Exception as e:
+            logger.error(f"Benchmark '{name}' failed: {e}")
+            result = ScenarioResult(name=name, error=f"{type(e).__name__}: {e}")
+        logger.info(f"Benchmark {name}: {result.as_dict()}")
+        results.append(result)
+    return results
+
+
+# ==========================================================
+# BASELINES
+# ==========================================================
+def save_baseline(results: list[ScenarioResult], path: str, using: str = DEFAULT_DB_ALIAS) -> dict:
+    baseline = {
+        'created_at': timezone.now().isoformat(),
+        'database': connections[using].vendor,
+        'python': platform.python_version(),
+        'scenarios': {result.name: result.as_dict() for result in results if not result.error},
+    }
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as baseline_file:
+        json.dump(baseline, baseline_file, indent=2, sort_keys=True)
+    return baseline
+
+
+def load_baseline(path: str) -> dict:
+    with open(path, encoding='utf-8') as baseline_file:
+        return json.load(baseline_file)
+
+
+def compare_to_baseline(results: list[ScenarioResult], baseline: dict, tolerance: float = 0.25) -> list[str]:
+    """
+    Regressions against a stored baseline: any growth in SQL statements, or p95 latency /
+    peak memory above the baseline by more than tolerance (a fraction, 0.25 = 25%).
+    """
+    regressions = []
+    stored = baseline.get('scenarios', {})
+    for result in results:
+        previous = stored.get(result.name)
+        if result.error:
+            regressions.append(f"{result.name}: failed ({result.error})")
+            continue
+        if previous is None:
+            continue
+        if result.sql_statements > previous['sql_statements']:
+            regressions.append(
+                f"{result.name}: SQL statements {previous['sql_statements']} -> {result.sql_statements}"
+            )
+        if result.p95_ms > previous['p95_ms'] * (1 + tolerance):
+            regressions.append(f"{result.name}: p95 {previous['p95_ms']}ms -> {result.p95_ms}ms")
+        if result.peak_memory_kb > previous['peak_memory_kb'] * (1 + tolerance):
+            regressions.append(
+                f"{result.name}: peak memory {previous['peak_memory_kb']}KB -> {result.peak_memory_kb}KB"
+            )
+    return regressions
@@ -0,0 +1,301 @@
+import itertools
+import shutil
+import tempfile
+from dataclasses import dataclass
+from datetime import timedelta
+from decimal import Decimal
+from io import BytesIO
+from django.utils import timezone
+from branch.models.branch_model import Branch
+from company.models.company_model import Company
+from customers.models.customer_model import Customer
+from inventory.models.product_model import Product
+from inventory.models.stock_movement_model import StockMovement
+from inventory.models.stock_take_model import StockTake
+from inventory.models.stock_take_item_model import StockTakeItem
+from inventory.services.product.product_service import ProductService
+from inventory.services.product_stock.product_stock_service import ProductStockService, StockPostingLine
+from inventory.services.stock_take.stock_take_reconciliation_service import StockTakeReconcialiationService
+from payments.models.payment_method_model import PaymentMethod
+from sales.models.sales_order_model import SalesOrder
+from sales.models.sales_order_item_model import SalesOrderItem
+from sales.services.checkout.pos_fast_checkout_service import PosFastCheckOutService
+from transactions.services.transaction_query_service import TransactionQueryService
+from transfers.models.product_transfer_item_model import ProductTransferItem
+from transfers.models.product_transfer_model import ProductTransfer
+from transfers.models.transfer_model import Transfer
+from config.benchmarks.harness import ScenarioRun
+from config.auth.jwt_token_authentication import CompanyCookieJWTAuthentication, UserCookieJWTAuthentication
+from config.utilities.get_queryset import get_company_queryset
+from config.utilities.logger import restore_loguru, setup_loguru
+from django.test import RequestFactory
+from rest_framework.request import Request
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.tokens import AccessToken
+from users.models.user_model import User
+
+
+# name -> setup(context) returning a ScenarioRun (or None when the dataset cannot support it)
+SCENARIOS = {}
+
+BASKET_SIZE = 5
+PAGE_SIZE = 50
+
+
+def benchmark_scenario(name: str):
+    def decorator(setup):
+        SCENARIOS[name] = setup
+        return setup
+    return decorator
+
+
+@dataclass
+class BenchmarkContext:
+    company: Company
+    branch: Branch
+    other_branch: Branch | None
+    products: list
+    customer: Customer
+
+    @classmethod
+    def for_company(cls, company: Company, product_limit: int = 50) -> "BenchmarkContext":
+        branches = list(Branch.objects.filter(company=company).order_by('pk')[:2])
+        if not branches:
+            raise ValueError(f"Company {company.pk} has no branches to benchmark.")
+        branch = branches[0]
+        products = list(
+            Product.objects.filter(company=company, branch=branch, stocks__branch=branch, stocks__quantity__gt=100)
+            .order_by('pk')[:product_limit]
+        )
+        customer = Customer.objects.filter(company=company, branch=branch).order_by('pk').first()
+        return cls(
+            company=company,
+            branch=branch,
+            other_branch=branches[1] if len(branches) > 1 else None,
+            products=products,
+            customer=customer,
+        )
+
+
+def _rotating_baskets(products, size):
+    """
+    Endless baskets walking through the product list, so iterations touch different rows.
+    """
+    cycle = itertools.cycle(products)
+    while True:
+        yield [next(cycle) for _ in range(min(size, len(products)))]
+
+
+# -------------------------
+# SALES
+# -------------------------
+@benchmark_scenario('checkout')
+def checkout(context: BenchmarkContext):
+    if not context.products or context.customer is None:
+        return None
+    payment_method = PaymentMethod.objects.filter(
+        company=context.company, payment_method_name='cash', is_active=True
+    ).first()
+    if payment_method is None:
+        return None
+    baskets = _rotating_baskets(context.products, BASKET_SIZE)
+
+    def prepare():
+        order = SalesOrder.objects.create(
+            company=context.company, branch=context.branch, customer=context.customer,
+            customer_name=context.customer.first_name
+        )
+        SalesOrderItem.objects.bulk_create([
+            SalesOrderItem(
+                sales_order=order, product=product, product_name=product.name,
+                quantity=1, unit_price=product.unit_price, tax_rate=Decimal('0')
+            )
+            for product in next(baskets)
+        ])
+        return order
+
+    def run(order):
+        PosFastCheckOutService.process_checkout(
+            company=context.company,
+            branch=context.branch,
+            customer=context.customer,
+            payment_method=payment_method,
+            sales_order=order,
+            received_by=None,
+        )
+
+    return ScenarioRun(run=run, prepare=prepare)
+
+
+def _checkout_with_logging(context: BenchmarkContext, mode: str):
+    """
+    The checkout scenario with file logging set up in mode (into a scratch directory);
+    compared with 'checkout' it gives the logging overhead per checkout.
+    """
+    scenario_run = checkout(context)
+    if scenario_run is None:
+        return None
+    log_dir = tempfile.mkdtemp(prefix=f'posflow-bench-{mode}-')
+    setup_loguru(mode=mode, log_dir=log_dir)
+
+    def teardown():
+        restore_loguru()
+        shutil.rmtree(log_dir, ignore_errors=True)
+
+    return ScenarioRun(run=scenario_run.run, prepare=scenario_run.prepare, teardown=teardown)
+
+
+@benchmark_scenario('checkout_logging_per_app')
+def checkout_logging_per_app(context: BenchmarkContext):
+    # before: a synchronous, filtered file sink per app
+    return _checkout_with_logging(context, 'per_app')
+
+
+@benchmark_scenario('checkout_logging_production')
+def checkout_logging_production(context: BenchmarkContext):
+    # after: one enqueued routing sink with sampling
+    return _checkout_with_logging(context, 'production')
+
+
+# -------------------------
+# INVENTORY
+# -------------------------
+@benchmark_scenario('stock_posting')
+def stock_posting(context: BenchmarkContext):
+    if not context.products:
+        return None
+    baskets = _rotating_baskets(context.products, BASKET_SIZE)
+
+    def run():
+        ProductStockService._post_stock_lines(
+            company=context.company,
+            lines=[
+                StockPostingLine(
+                    product=product,
+                    branch=context.branch,
+                    quantity_change=-1,
+                    movement_type=StockMovement.MovementType.SALE,
+                    reason='BENCHMARK',
+                )
+                for product in next(baskets)
+            ]
+        )
+
+    return ScenarioRun(run=run)
+
+
+@benchmark_scenario('product_transfer')
+def product_transfer(context: BenchmarkContext):
+    if not context.products or context.other_branch is None:
+        return None
+    baskets = _rotating_baskets(context.products, BASKET_SIZE)
+
+    def prepare():
+        transfer = Transfer.objects.create(
+            company=context.company,
+            source_branch=context.branch,
+            destination_branch=context.other_branch,
+            type='product',
+        )
+        product_transfer = ProductTransfer.objects.create(transfer=transfer, company=context.company)
+        ProductTransferItem.objects.bulk_create([
+            ProductTransferItem(
+                transfer=transfer, product_transfer=product_transfer, company=context.company,
+                branch=context.branch, product=product, quantity=1, unit_price=product.unit_price
+            )
+            for product in next(baskets)
+        ])
+        return transfer
+
+    def run(transfer):
+        ProductStockService.decrease_stock_for_transfer(transfer)
+        ProductStockService.increase_stock_for_transfer(transfer)
+
+    return ScenarioRun(run=run, prepare=prepare)
+
+
+@benchmark_scenario('stock_take_reconciliation')
+def stock_take_reconciliation(context: BenchmarkContext):
+    if not context.products:
+        return None
+    stock_take = StockTake.objects.create(
+        company=context.company,
+        branch=context.branch,
+        status='open',
+        started_at=timezone.now() - timedelta(days=7),
+    )
+    items = StockTakeItem.objects.bulk_create([
+        StockTakeItem(stock_take=stock_take, product=product, expected_quantity=100, counted_quantity=100)
+        for product in context.products
+    ])
+
+    def run():
+        for item in items:
+            StockTakeReconcialiationService.track_stocktake_item_for_movements(stock_take, item)
+
+    return ScenarioRun(run=run)
+
+
+# -------------------------
+# LISTINGS & FILES
+# -------------------------
+@benchmark_scenario('transaction_listing')
+def transaction_listing(context: BenchmarkContext):
+    def run():
+        queryset = TransactionQueryService.get_transaction_by_branch(context.company, context.branch)
+        list(queryset.select_related('debit_account', 'credit_account', 'customer')[:PAGE_SIZE])
+
+    return ScenarioRun(run=run)
+
+
+@benchmark_scenario('authenticated_listing')
+def authenticated_listing(context: BenchmarkContext):
+    """
+    One cookie-authenticated API request: authentication, tenant resolution and a company-scoped page.
+    """
+    user = User.objects.create_user(
+        username='benchmark-cashier', email='benchmark-cashier@example.com', password='benchmark',
+        company=context.company, branch=context.branch, role='Sales', first_name='Benchmark'
+    )
+    token = str(AccessToken.for_user(user))
+    factory = RequestFactory()
+
+    def run():
+        http_request = factory.get('/api/v1/inventory/stock-movements/')
+        http_request.COOKIES['user_access_token'] = token
+        request = Request(http_request, authenticators=[
+            CompanyCookieJWTAuthentication(), UserCookieJWTAuthentication(), JWTAuthentication()
+        ])
+        if not request.user.is_authenticated:
+            raise RuntimeError("Benchmark request did not authenticate")
+        list(get_company_queryset(request, StockMovement).order_by('-created_at')[:PAGE_SIZE])
+
+    return ScenarioRun(run=run)
+
+
+@benchmark_scenario('product_csv_export')
+def product_csv_export(context: BenchmarkContext):
+    def run():
+        for _ in ProductService.bulk_export_products(context.company, context.branch):
+            pass
+
+    return ScenarioRun(run=run)
+
+
+@benchmark_scenario('product_csv_import')
+def product_csv_import(context: BenchmarkContext):
+    batch = itertools.count()
+
+    def prepare():
+        number = next(batch)
+        rows = ['name,description,price,sku,product_category_id,stock_quantity']
+        rows += [
+            f'Imported {number}-{index},Benchmark import,{index % 50 + 1}.99,IMP-{number}-{index:05d},,10'
+            for index in range(200)
+        ]
+        return BytesIO('\n'.join(rows).encode('utf-8'))
+
+    def run(csv_file):
+        ProductService.bulk_import_products(context.company, csv_file, context.branch)
+
+    return ScenarioRun(run=run, prepare=prepare)
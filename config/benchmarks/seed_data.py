@@ -0,0 +1,245 @@
+import random
+from dataclasses import dataclass, field
+from datetime import timedelta
+from decimal import Decimal, ROUND_HALF_UP
+from django.db import transaction as db_transaction
+from django.utils import timezone
+from loguru import logger
+from accounts.models.account_model import Account
+from accounts.models.cash_account_model import CashAccount
+from accounts.models.sales_account_model import SalesAccount
+from branch.models.branch_model import Branch
+from company.models.company_model import Company
+from currency.models import Currency
+from customers.models.customer_model import Customer
+from inventory.models.product_category_model import ProductCategory
+from inventory.models.product_model import Product
+from inventory.models.product_stock_model import ProductStock
+from inventory.models.stock_movement_model import StockMovement
+from payments.models.payment_method_model import PaymentMethod
+from sales.models.sale_model import Sale
+from transactions.models.journal_entry_model import JournalEntry
+from transactions.models.transaction_model import Transaction
+from transactions.services.journal_service import JournalService
+
+
+BENCHMARK_EMAIL_DOMAIN = 'bench.posflow.local'
+
+CATEGORY_NAMES = [
+    'Bakery', 'Dairy', 'Beverages', 'Airtime', 'Groceries', 'Household', 'Toiletries', 'Snacks',
+]
+
+_TWO_PLACES = Decimal('0.01')
+
+
+@dataclass
+class SeedSummary:
+    companies: int = 0
+    branches: int = 0
+    products: int = 0
+    customers: int = 0
+    sales: int = 0
+    stock_movements: int = 0
+    journal_entries: int = 0
+    company_ids: list = field(default_factory=list)
+
+
+class BenchmarkSeeder:
+    """
+    Generates N companies x M branches x P products with a sales history
+    (sales, completed transactions, stock movements and journal legs) for load tests.
+    Everything is bulk inserted and deterministic for a given seed.
+    """
+
+    def __init__(self, *, companies=1, branches=2, products=200, customers=50,
+                 days=30, sales_per_day=20, max_lines=5, prefix='bench', seed=42):
+        self.companies = companies
+        self.branches = branches
+        self.products = products
+        self.customers = customers
+        self.days = days
+        self.sales_per_day = sales_per_day
+        self.max_lines = max_lines
+        self.prefix = prefix
+        self.random = random.Random(seed)
+        self.summary = SeedSummary()
+
+    # -------------------------
+    # HOUSEKEEPING
+    # -------------------------
+    @staticmethod
+    def benchmark_companies(prefix='bench'):
+        return Company.objects.filter(email__endswith=f'@{BENCHMARK_EMAIL_DOMAIN}', email__startswith=f'{prefix}-')
+
+    @staticmethod
+    @db_transaction.atomic
+    def flush(prefix='bench') -> int:
+        companies = BenchmarkSeeder.benchmark_companies(prefix)
+        company_ids = list(companies.values_list('pk', flat=True))
+        # journal legs protect their accounts; remove them before the cascade
+        JournalEntry.objects.filter(company_id__in=company_ids).delete()
+        Transaction.objects.filter(company_id__in=company_ids).delete()
+        deleted = len(company_ids)
+        companies.delete()
+        logger.info(f"Removed {deleted} benchmark companies (prefix={prefix})")
+        return deleted
+
+    # -------------------------
+    # SEED
+    # -------------------------
+    @db_transaction.atomic
+    def run(self) -> SeedSummary:
+        currency = Currency.objects.filter(pk=1).first() or Currency.objects.create(
+            id=1, code='USD', name='US Dollar', symbol='$', is_base_currency=True, exchange_rate_to_base=1
+        )
+
+        for company_index in range(self.companies):
+            company = Company.objects.create(
+                name=f'{self.prefix.title()} Company {company_index}',
+                email=f'{self.prefix}-{company_index}@{BENCHMARK_EMAIL_DOMAIN}',
+                address=f'{company_index} Benchmark Avenue',
+                phone_number='+263700000000',
+            )
+            self.summary.companies += 1
+            self.summary.company_ids.append(company.pk)
+            for branch_index in range(self.branches):
+                self._seed_branch(company, company_index, branch_index, currency)
+
+            JournalService.rebuild_balances(company=company)
+
+        logger.info(f"Benchmark data seeded | {self.summary}")
+        return self.summary
+
+    def _seed_branch(self, company, company_index, branch_index, currency):
+        branch = Branch.objects.create(
+            company=company,
+            name=f'Branch {company_index}-{branch_index}',
+            code=f'{self.prefix.upper()[:6]}-{company_index}-{branch_index}',
+            address=f'{branch_index} Benchmark Street',
+        )
+        self.summary.branches += 1
+
+        categories = ProductCategory.objects.bulk_create([
+            ProductCategory(company=company, branch=branch, name=name) for name in CATEGORY_NAMES
+        ])
+
+        products = Product.objects.bulk_create([
+            Product(
+                company=company,
+                branch=branch,
+                name=f'Product {index:05d}',
+                description=f'Benchmark product {index}',
+                unit_price=Decimal(self.random.randint(50, 5000)) / 100,
+                currency=currency,
+                product_category=self.random.choice(categories),
+                sku=f'BEN-{company_index}-{branch_index}-{index:06d}',
+            )
+            for index in range(self.products)
+        ], batch_size=1000)
+        self.summary.products += len(products)
+
+        customers = Customer.objects.bulk_create([
+            Customer(
+                company=company,
+                branch=branch,
+                first_name='Customer',
+                last_name=f'{index:05d}',
+                email=f'{self.prefix}-c{company_index}-{branch_index}-{index}@{BENCHMARK_EMAIL_DOMAIN}',
+                phone_number='+263700000001',
+            )
+            for index in range(max(self.customers, 1))
+        ], batch_size=1000)
+        self.summary.customers += len(customers)
+
+        cash = Account.objects.create(company=company, branch=branch, name=f'Cash {branch.code}', account_type='CASH')
+        sales = Account.objects.create(company=company, branch=branch, name=f'Sales {branch.code}', account_type='SALE')
+        CashAccount.objects.create(account=cash, branch=branch)
+        SalesAccount.objects.create(account=sales, company=company, branch=branch)
+        if not PaymentMethod.objects.filter(payment_method_code='CA').exists():
+            # payment_method_code is unique across the table, so only one cash method can exist
+            PaymentMethod.objects.create(company=company, branch=branch, payment_method_name='cash')
+
+        self._seed_history(company, branch, products, customers, cash, sales)
+
+        # stock on hand after the history above
+        ProductStock.objects.bulk_create([
+            ProductStock(company=company, branch=branch, product=product, quantity=self.random.randint(500, 5000))
+            for product in products
+        ], batch_size=1000)
+
+    def _seed_history(self, company, branch, products, customers, cash, sales):
+        """
+        One bulk insert per branch-day for sales, transactions, stock movements and journal legs,
+        then the auto_now_add dates are moved back to that day.
+        """
+        today = timezone.now().replace(hour=12, minute=0, second=0, microsecond=0)
+        for day in range(self.days, 0, -1):
+            day_start = today - timedelta(days=day)
+            sale_rows, transaction_rows, movement_rows, leg_rows = [], [], [], []
+
+            for sale_index in range(self.sales_per_day):
+                posted_at = day_start + timedelta(minutes=sale_index)
+                lines = self.random.sample(products, k=min(len(products), self.random.randint(1, self.max_lines)))
+                total = Decimal('0.00')
+                for product in lines:
+                    quantity = self.random.randint(1, 3)
+                    total += (product.unit_price * quantity).quantize(_TWO_PLACES, rounding=ROUND_HALF_UP)
+                    movement_rows.append(StockMovement(
+                        company=company,
+                        branch=branch,
+                        product=product,
+                        movement_type=StockMovement.MovementType.SALE,
+                        quantity=quantity,
+                        movement_date=posted_at,
+                        reason='SALES',
+                        reference_number=f'BSM-{branch.pk}-{day}-{sale_index}-{product.pk}',
+                    ))
+
+                number = f'{branch.pk}-{day:03d}{sale_index:04d}'
+                sale_rows.append(Sale(
+                    company=company,
+                    branch=branch,
+                    customer=self.random.choice(customers),
+                    total_amount=total,
+                    payment_status='FULLY_PAID',
+                    sale_number=f'BS-{number}',
+                ))
+                transaction = Transaction(
+                    company=company,
+                    branch=branch,
+                    debit_account=cash,
+                    credit_account=sales,
+                    transaction_type='CASH',
+                    transaction_direction='INCOMING',
+                    transaction_category='CASH SALE',
+                    transaction_number=f'BT-{number}',
+                    status='COMPLETED',
+                    reference_model='Sale',
+                    total_amount=total,
+                )
+                transaction_rows.append(transaction)
+                for account, delta in ((cash, total), (sales, -total)):
+                    leg_rows.append(JournalEntry(
+                        company=company,
+                        branch=branch,
+                        account=account,
+                        transaction=transaction,
+                        entry_type='DEBIT' if delta > 0 else 'CREDIT',
+                        reason='TRANSACTION',
+                        amount=abs(delta),
+                        balance_delta=delta,
+                        posted_at=posted_at,
+                        reference=transaction.transaction_number,
+                    ))
+
+            Sale.objects.bulk_create(sale_rows, batch_size=1000)
+            Transaction.objects.bulk_create(transaction_rows, batch_size=1000)
+            StockMovement.objects.bulk_create(movement_rows, batch_size=1000)
+            JournalEntry.objects.bulk_create(leg_rows, batch_size=1000)
+
+            Sale.objects.filter(pk__in=[row.pk for row in sale_rows]).update(sale_date=day_start)
+            Transaction.objects.filter(pk__in=[row.pk for row in transaction_rows]).update(transaction_date=day_start)
+
+            self.summary.sales += len(sale_rows)
+            self.summary.stock_movements += len(movement_rows)
+            self.summary.journal_entries += len(leg_rows)
@@ -0,0 +1,164 @@
+from django.contrib.contenttypes.fields import GenericForeignKey
+from django.db.models import QuerySet
+from django.db.models.fields.related import ForeignObjectRel
+from loguru import logger
+from rest_framework import serializers
+
+
+# how deep nested serializers are followed when building select_related paths
+MAX_DEPTH = 3
+
+# serializer class -> (select_related, prefetch_related)
+_RELATIONS_CACHE = {}
+
+
+class EagerLoadingSerializerMixin:
+    """
+    Declares the relations a serializer reads beyond what can be inferred from its fields,
+    e.g. a SerializerMethodField that walks obj.stock_take.branch.
+    Relations touched through *_summary method fields, nested serializers and dotted sources
+    are found automatically; see related_fields_for().
+    """
+    select_related_fields = ()
+    prefetch_related_fields = ()
+
+
+def _relation(model, name):
+    """
+    The model field for a relation name, or None when name is not a relation on model.
+    """
+    try:
+        field = model._meta.get_field(name)
+    except Exception:
+        return None
+    return field if field.is_relation else None
+
+
+def _is_single_valued(field) -> bool:
+    # forward FK / one-to-one, or the reverse side of a one-to-one;
+    # generic foreign keys cannot be joined and are prefetched instead
+    if isinstance(field, GenericForeignKey):
+        return False
+    if isinstance(field, ForeignObjectRel):
+        return field.one_to_one
+    return field.many_to_one or field.one_to_one
+
+
+def _is_valid_path(model, path, single_valued) -> bool:
+    for name in path.split('__'):
+        relation = _relation(model, name)
+        if relation is None or (single_valued and not _is_single_valued(relation)):
+            return False
+        model = relation.related_model
+    return True
+
+
+def _join(prefix, name):
+    return f"{prefix}__{name}" if prefix else name
+
+
+def _collect(serializer_class, model, prefix, select, prefetch, depth):
+    select.update(_join(prefix, name) for name in getattr(serializer_class, 'select_related_fields', ()))
+    prefetch.update(_join(prefix, name) for name in getattr(serializer_class, 'prefetch_related_fields', ()))
+
+    # declared fields are always available; the generated model fields only if the serializer builds
+    fields = dict(getattr(serializer_class, '_declared_fields', {}))
+    try:
+        fields.update(serializer_class().fields)
+    except Exception as e:
+        logger.debug(f"Could not build {serializer_class.__name__} fields for eager loading: {e}")
+
+    for field_name, field in fields.items():
+        if getattr(field, 'write_only', False):
+            continue
+
+        if isinstance(field, serializers.SerializerMethodField):
+            # get_company_summary / get_branch_summary read obj.company / obj.branch
+            if field_name.endswith('_summary'):
+                relation_name = field_name[:-len('_summary')]
+                relation = _relation(model, relation_name)
+                if relation is not None:
+                    target = select if _is_single_valued(relation) else prefetch
+                    target.add(_join(prefix, relation_name))
+            continue
+
+        source = getattr(field, 'source', None) or field_name
+        if source == '*':
+            continue
+        head = source.split('.')[0]
+        relation = _relation(model, head)
+        if relation is None:
+            continue
+
+        if isinstance(field, serializers.ListSerializer) or not _is_single_valued(relation):
+            prefetch.add(_join(prefix, head))
+            continue
+
+        # primary keys are read from the <relation>_id column, no join needed
+        if isinstance(field, serializers.PrimaryKeyRelatedField) and '.' not in source:
+            continue
+
+        select.add(_join(prefix, head))
+        if isinstance(field, serializers.ModelSerializer) and depth < MAX_DEPTH:
+            _collect(type(field), relation.related_model, _join(prefix, head), select, prefetch, depth + 1)
+
+
+def related_fields_for(serializer_class, model=None) -> tuple[tuple, tuple]:
+    """
+    The (select_related, prefetch_related) paths a serializer needs to render model rows
+    without a query per row. Cached per serializer class.
+    """
+    model = model or getattr(getattr(serializer_class, 'Meta', None), 'model', None)
+    if model is None:
+        return (), ()
+    key = (serializer_class, model)
+    if key not in _RELATIONS_CACHE:
+        select, prefetch = set(), set()
+        _collect(serializer_class, model, '', select, prefetch, 1)
+        invalid = {path for path in select if not _is_valid_path(model, path, True)}
+        invalid |= {path for path in prefetch if not _is_valid_path(model, path, False)}
+        if invalid:
+            logger.warning(f"{serializer_class.__name__}: ignoring unknown relations {sorted(invalid)} on {model.__name__}")
+        _RELATIONS_CACHE[key] = (
+            tuple(sorted(select - invalid)),
+            tuple(sorted(prefetch - invalid)),
+        )
+    return _RELATIONS_CACHE[key]
+
+
+def eager_load(queryset, serializer_class):
+    """
+    Apply the select_related / prefetch_related a serializer needs to a queryset.
+    Anything that is not a plain model queryset of the serializer's model is returned unchanged.
+    """
+    if not isinstance(queryset, QuerySet) or serializer_class is None:
+        return queryset
+    meta_model = getattr(getattr(serializer_class, 'Meta', None), 'model', None)
+    if meta_model is None or not issubclass(queryset.model, meta_model):
+        return queryset
+    # .values() rows and deferred relations cannot be traversed by select_related
+    if queryset._fields is not None or queryset.query.deferred_loading[0]:
+        return queryset
+
+    select, prefetch = related_fields_for(serializer_class, queryset.model)
+    if select:
+        queryset = queryset.select_related(*select)
+    if prefetch:
+        queryset = queryset.prefetch_related(*prefetch)
+    return queryset
+
+
+class EagerLoadingMixin:
+    """
+    ViewSet mixin: the queryset list() and get_object() work on is eager-loaded for the serializer
+    the current action uses, so list pages cost the same number of queries at any page size.
+    Hooked on filter_queryset() because most viewsets here override get_queryset() without super().
+    """
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        try:
+            return eager_load(queryset, self.get_serializer_class())
+        except Exception as e:
+            logger.warning(f"Eager loading skipped for {self.__class__.__name__}: {e}")
+            return queryset
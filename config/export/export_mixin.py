@@ -0,0 +1,26 @@
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from config.export.streaming_export import EXPORT_FORMATS, StreamingExport
+
+
+class StreamingExportMixin:
+    """
+    Adds GET <list>/export/?export_format=csv|ndjson to a viewset.
+    The export covers the same company-scoped queryset as the list, after search and ordering
+    filters, but is streamed instead of paginated. Set export_columns to (header, lookup) pairs.
+    ('format' is reserved by DRF for renderer selection, hence export_format.)
+    """
+    export_columns = ()
+    export_filename = 'export'
+
+    @action(detail=False, methods=['get'], url_path='export')
+    def export(self, request):
+        export_format = request.query_params.get('export_format', 'csv')
+        if export_format not in EXPORT_FORMATS:
+            return Response(
+                {"error": f"export_format must be one of: {', '.join(EXPORT_FORMATS)}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        queryset = self.filter_queryset(self.get_queryset())
+        return StreamingExport.response(request, queryset, self.export_columns, self.export_filename, export_format)
@@ -0,0 +1,223 @@
+import re
+from dataclasses import dataclass, field
+from django.db import connections, DEFAULT_DB_ALIAS
+from django.db.models.expressions import Col
+from django.db.models.lookups import Lookup
+from django.db.models.sql.where import WhereNode, AND
+from loguru import logger
+
+
+# name -> builder(context) returning the QuerySet a service would run (or None to skip)
+QUERY_REGISTRY = {}
+
+_EQUALITY_LOOKUPS = {'exact', 'in', 'isnull'}
+
+
+def register_query(name: str):
+    """
+    Register a representative service query for the index advisor.
+    The builder receives a context dict (company, branch, user) and returns an unevaluated QuerySet.
+    """
+    def decorator(builder):
+        QUERY_REGISTRY[name] = builder
+        return builder
+    return decorator
+
+
+def get_registered_queries() -> dict:
+    # the registrations live next to the services they mirror
+    import config.index_advisor.registered_queries  # noqa: F401
+    return dict(QUERY_REGISTRY)
+
+
+@dataclass
+class QueryShape:
+    table: str
+    equality_columns: list = field(default_factory=list)
+    range_columns: list = field(default_factory=list)
+    order_columns: list = field(default_factory=list)
+    has_or: bool = False
+
+    def suggested_columns(self) -> list:
+        """
+        Equality columns first, then the ordering (or failing that the range column),
+        so one B-tree walk both filters and returns rows already sorted.
+        """
+        columns = list(self.equality_columns)
+        if self.order_columns:
+            columns += [c for c in self.order_columns if c.lstrip('-') not in columns]
+        elif self.range_columns:
+            columns.append(self.range_columns[0])
+        return columns
+
+
+@dataclass
+class AdvisorFinding:
+    name: str
+    table: str
+    sequential_scans: list
+    sorts_in_memory: bool
+    covering_index: str | None
+    suggested_columns: list
+    plan: str
+
+    @property
+    def needs_attention(self) -> bool:
+        return bool(self.sequential_scans) or self.covering_index is None
+
+    def as_dict(self) -> dict:
+        return {
+            'name': self.name,
+            'table': self.table,
+            'sequential_scans': self.sequential_scans,
+            'sorts_in_memory': self.sorts_in_memory,
+            'covering_index': self.covering_index,
+            'suggested_index': None if self.covering_index else self.suggested_columns,
+            'plan': self.plan,
+        }
+
+
+# ==========================================================
+# QUERY SHAPE
+# ==========================================================
+def describe_queryset(queryset) -> QueryShape:
+    """
+    Pull the base-table equality/range columns and the ordering out of a QuerySet.
+    """
+    query = queryset.query
+    opts = queryset.model._meta
+    shape = QueryShape(table=opts.db_table)
+    base_alias = query.get_initial_alias()
+    _walk_where(query.where, base_alias, shape)
+
+    ordering = query.order_by or (opts.ordering if query.default_ordering else ())
+    for name in ordering:
+        if not isinstance(name, str) or name == '?':
+            continue
+        descending = name.startswith('-')
+        try:
+            column = opts.get_field(name.lstrip('-')).column
+        except Exception:
+            continue
+        shape.order_columns.append(f"-{column}" if descending else column)
+    return shape
+
+
+def _walk_where(node, base_alias, shape: QueryShape):
+    if isinstance(node, WhereNode):
+        if node.connector != AND or node.negated:
+            shape.has_or = True
+            return
+        for child in node.children:
+            _walk_where(child, base_alias, shape)
+        return
+    if not isinstance(node, Lookup) or not isinstance(node.lhs, Col) or node.lhs.alias != base_alias:
+        return
+    column = node.lhs.target.column
+    if node.lookup_name in _EQUALITY_LOOKUPS:
+        if column not in shape.equality_columns:
+            shape.equality_columns.append(column)
+    elif column not in shape.range_columns:
+        shape.range_columns.append(column)
+
+
+# ==========================================================
+# INDEXES
+# ==========================================================
+def model_indexes(model) -> dict:
+    """
+    Every index Django creates for the model: name -> ordered columns (with '-' for DESC).
+    """
+    opts = model._meta
+    indexes = {}
+    for index in opts.indexes:
+        indexes[index.name] = [
+            f"-{opts.get_field(name.lstrip('-')).column}" if name.startswith('-') else opts.get_field(name).column
+            for name in index.fields
+        ]
+    for constraint in opts.constraints:
+        fields = getattr(constraint, 'fields', None)
+        if fields:
+            indexes[constraint.name] = [opts.get_field(name).column for name in fields]
+    for model_field in opts.concrete_fields:
+        if model_field.primary_key or model_field.unique or model_field.db_index:
+            indexes.setdefault(f"{opts.db_table}_{model_field.column}", [model_field.column])
+    for fields in opts.unique_together:
+        indexes.setdefault(f"{opts.db_table}_{'_'.join(fields)}_uniq", [opts.get_field(name).column for name in fields])
+    return indexes
+
+
+def find_covering_index(model, shape: QueryShape) -> str | None:
+    """
+    Name of an index whose leading columns are the equality columns (any order)
+    followed by the ordering columns, or None if no index serves the query.
+    """
+    equality = set(shape.equality_columns)
+    order = [column.lstrip('-') for column in shape.order_columns]
+    for name, columns in model_indexes(model).items():
+        plain = [column.lstrip('-') for column in columns]
+        if set(plain[:len(equality)]) != equality:
+            continue
+        tail = plain[len(equality):]
+        if order and tail[:len(order)] != order:
+            continue
+        if not equality and not order:
+            continue
+        return name
+    return None
+
+
+# ==========================================================
+# EXPLAIN
+# ==========================================================
+_POSTGRES_SEQ_SCAN = re.compile(r'Seq Scan on (\w+)')
+_SQLITE_SCAN = re.compile(r'\bSCAN (?:TABLE )?(\w+)(?! USING)')
+
+
+def parse_plan(plan: str, vendor: str) -> tuple[list, bool]:
+    """
+    Return (tables read with a full scan, whether rows are sorted after fetching).
+    """
+    if vendor == 'postgresql':
+        scans = _POSTGRES_SEQ_SCAN.findall(plan)
+        sorts = bool(re.search(r'(^|\s)Sort\b', plan))
+    else:
+        scans = [
+            match.group(1) for line in plan.splitlines()
+            if (match := _SQLITE_SCAN.search(line)) and 'USING' not in line
+        ]
+        sorts = 'USE TEMP B-TREE FOR ORDER BY' in plan
+    return sorted(set(scans)), sorts
+
+
+def analyse_query(name: str, queryset, using: str = DEFAULT_DB_ALIAS) -> AdvisorFinding:
+    shape = describe_queryset(queryset)
+    vendor = connections[using].vendor
+    plan = queryset.using(using).explain()
+    scans, sorts = parse_plan(plan, vendor)
+    covering = None if shape.has_or else find_covering_index(queryset.model, shape)
+    return AdvisorFinding(
+        name=name,
+        table=shape.table,
+        sequential_scans=scans,
+        sorts_in_memory=sorts,
+        covering_index=covering,
+        suggested_columns=shape.suggested_columns(),
+        plan=plan,
+    )
+
+
+def run_advisor(context: dict, names=None, using: str = DEFAULT_DB_ALIAS) -> list[AdvisorFinding]:
+    """
+    EXPLAIN every registered query (or the named ones) against the current database.
+    """
+    findings = []
+    for name, builder in sorted(get_registered_queries().items()):
+        if names and name not in names:
+            continue
+        queryset = builder(context)
+        if queryset is None:
+            logger.debug(f"Index advisor skipped '{name}': nothing to bind it to")
+            continue
+        findings.append(analyse_query(name, queryset, using))
+    return findings
@@ -0,0 +1,119 @@
+from config.index_advisor.index_advisor import register_query
+from activity_log.models.activity_log_model import ActivityLog
+from inventory.services.stock_movement.stock_movement_service import StockMovementService
+from notifications.services.notification_service import NotificationService
+from payments.models.payment_model import Payment
+from sales.models.sale_model import Sale
+from sales.models.sales_receipt_model import SalesReceipt
+from transactions.models.transaction_model import Transaction
+from transactions.services.transaction_query_service import TransactionQueryService
+
+
+# Representative tenant queries, built the way the services and viewsets build them.
+# Each builder gets {'company', 'branch', 'user'} and returns an unevaluated QuerySet.
+
+
+# -------------------------
+# TRANSACTIONS
+# -------------------------
+@register_query('transactions.by_company')
+def transactions_by_company(context):
+    return TransactionQueryService.get_transactions_by_company(context['company'])
+
+
+@register_query('transactions.by_branch')
+def transactions_by_branch(context):
+    if context['branch'] is None:
+        return None
+    return TransactionQueryService.get_transaction_by_branch(context['company'], context['branch'])
+
+
+@register_query('transactions.by_type')
+def transactions_by_type(context):
+    if context['branch'] is None:
+        return None
+    return TransactionQueryService.get_transactions_by_type('CASH', context['company'], context['branch'])
+
+
+@register_query('transactions.by_category')
+def transactions_by_category(context):
+    if context['branch'] is None:
+        return None
+    return TransactionQueryService.get_transactions_by_category('CASH SALE', context['company'], context['branch'])
+
+
+@register_query('transactions.by_debit_account')
+def transactions_by_debit_account(context):
+    account_id = Transaction.objects.filter(company=context['company']).values_list('debit_account_id', flat=True).first()
+    if account_id is None:
+        return None
+    return Transaction.objects.filter(debit_account_id=account_id).order_by('-transaction_date')
+
+
+# -------------------------
+# STOCK MOVEMENTS
+# -------------------------
+@register_query('stock_movements.by_branch')
+def stock_movements_by_branch(context):
+    return StockMovementService.get_stock_movements(company=context['company'], branch=context['branch'])
+
+
+@register_query('stock_movements.by_type')
+def stock_movements_by_type(context):
+    return StockMovementService.get_stock_movements(company=context['company'], movement_type='SALE')
+
+
+# -------------------------
+# ACTIVITY LOG
+# -------------------------
+@register_query('activity_log.by_company')
+def activity_log_by_company(context):
+    # ActivityLogViewSet.get_queryset
+    return ActivityLog.objects.filter(company=context['company']).select_related('user', 'content_type')
+
+
+@register_query('activity_log.by_company_user')
+def activity_log_by_company_user(context):
+    if context['user'] is None:
+        return None
+    return ActivityLog.objects.filter(company=context['company'], user=context['user']).order_by('-created_at')
+
+
+# -------------------------
+# NOTIFICATIONS
+# -------------------------
+@register_query('notifications.inbox')
+def notifications_inbox(context):
+    if context['user'] is None:
+        return None
+    return NotificationService.get_notifications_for_user(context['user'].pk)
+
+
+@register_query('notifications.unread')
+def notifications_unread(context):
+    if context['user'] is None:
+        return None
+    return NotificationService.get_unread_notifications_for_user(context['user'].pk)
+
+
+# -------------------------
+# SALES & PAYMENTS
+# -------------------------
+@register_query('sales.by_branch')
+def sales_by_branch(context):
+    return Sale.objects.filter(company=context['company'], branch=context['branch']).order_by('-sale_date')
+
+
+@register_query('sales_receipts.by_branch')
+def sales_receipts_by_branch(context):
+    return SalesReceipt.objects.filter(company=context['company'], branch=context['branch']).order_by('-receipt_date')
+
+
+@register_query('payments.by_company')
+def payments_by_company(context):
+    return Payment.objects.filter(company=context['company'])
+
+
+@register_query('payments.by_status')
+def payments_by_status(context):
+    return Payment.objects.filter(company=context['company'], status='completed')
@@ -0,0 +1,15 @@
+from config.activity_log.activity_log_pipeline import activity_log_scope
+
+
+class ActivityLogBufferMiddleware:
+    """
+    Buffer the activity log entries committed during a request and write them
+    as one batch when the response is ready.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with activity_log_scope():
+            return self.get_response(request)
@@ -0,0 +1,222 @@
+import base64
+import json
+from collections import OrderedDict
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import Q
+from loguru import logger
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+from config.pagination.pagination import StandardResultsSetPagination
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (cursor) pagination.
+    - ordering: a unique, indexed sort key, e.g. ('-created_at', '-id')
+    - cursor: opaque token in ?cursor= pointing at the last (or first) row already seen
+    - no OFFSET and, by default, no COUNT(*): each page is one indexed range scan
+    - ?count=exact runs COUNT(*); ?count=estimate uses planner statistics on PostgreSQL
+      (and an exact count elsewhere)
+    Client-chosen ordering (OrderingFilter) does not apply; the keyset defines the order.
+    """
+    ordering = ('-created_at', '-id')
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 500
+    cursor_query_param = 'cursor'
+    count_query_param = 'count'
+    default_count_mode = None
+    invalid_cursor_message = 'Invalid cursor'
+
+    # -------------------------
+    # CURSOR
+    # -------------------------
+    @staticmethod
+    def encode_cursor(position, reverse=False) -> str:
+        # isoformat keeps microseconds (DjangoJSONEncoder truncates them), which the keyset comparison needs
+        payload = json.dumps(
+            {'p': [value.isoformat() if hasattr(value, 'isoformat') else value for value in position], 'r': int(reverse)},
+            cls=DjangoJSONEncoder,
+            separators=(',', ':'),
+        )
+        return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded + '=' * (-len(encoded) % 4)))
+            position, reverse = payload['p'], bool(payload.get('r'))
+            if not isinstance(position, list) or len(position) != len(self.ordering):
+                raise ValueError('cursor does not match ordering')
+        except (TypeError, ValueError, KeyError) as e:
+            logger.warning(f"Rejected pagination cursor: {e}")
+            raise NotFound(self.invalid_cursor_message)
+        return position, reverse
+
+    def _fields(self):
+        return [(name.lstrip('-'), name.startswith('-')) for name in self.ordering]
+
+    def _position(self, instance):
+        return [getattr(instance, name) for name, _ in self._fields()]
+
+    def _keyset_filter(self, model, position, reverse) -> Q:
+        """
+        Rows strictly after position in the keyset order (before it when reverse):
+        (a > x) OR (a = x AND b > y) ... with > flipped to < for descending fields.
+        """
+        fields = self._fields()
+        values = [model._meta.get_field(name).to_python(value) for (name, _), value in zip(fields, position)]
+        condition = Q()
+        for index, (name, descending) in enumerate(fields):
+            lookup = 'lt' if descending != reverse else 'gt'
+            clause = Q(**{f'{name}__{lookup}': values[index]})
+            for previous_index, (previous_name, _) in enumerate(fields[:index]):
+                clause &= Q(**{previous_name: values[previous_index]})
+            condition |= clause
+        return condition
+
+    # -------------------------
+    # COUNT
+    # -------------------------
+    def get_count_mode(self, request):
+        mode = request.query_params.get(self.count_query_param, self.default_count_mode)
+        return mode if mode in ('exact', 'estimate') else None
+
+    @staticmethod
+    def estimate_count(queryset) -> int:
+        """
+        Planner row estimate for the queryset (PostgreSQL); exact count on other backends.
+        """
+        connection = connections[queryset.db]
+        if connection.vendor != 'postgresql':
+            return queryset.count()
+        sql, params = queryset.order_by().values('pk').query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]['Plan']['Plan Rows'])
+
+    # -------------------------
+    # PAGINATION
+    # -------------------------
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params.get(self.page_size_query_param, self.page_size))
+        except (TypeError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        cursor = self.decode_cursor(request)
+
+        self.count_mode = self.get_count_mode(request)
+        self.count = None
+        if self.count_mode == 'exact':
+            self.count = queryset.count()
+        elif self.count_mode == 'estimate':
+            self.count = self.estimate_count(queryset)
+
+        reverse = False
+        if cursor is not None:
+            position, reverse = cursor
+            queryset = queryset.filter(self._keyset_filter(queryset.model, position, reverse))
+
+        ordering = [
+            (f'-{name}' if descending != reverse else name) for name, descending in self._fields()
+        ]
+        rows = list(queryset.order_by(*ordering)[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if reverse:
+            rows.reverse()
+
+        self.has_next = has_more if not reverse else True
+        self.has_previous = (cursor is not None) if not reverse else has_more
+        self.page = rows
+        return rows
+
+    def _link(self, position, reverse):
+        url = self.request.build_absolute_uri()
+        if position is None:
+            return None
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(position, reverse))
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self._link(self._position(self.page[-1]), False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.request.build_absolute_uri(), self.cursor_query_param)
+        return self._link(self._position(self.page[0]), True)
+
+    def get_paginated_response(self, data):
+        body = OrderedDict([
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('count', self.count),
+        ])
+        if self.count is not None:
+            body['count_estimated'] = self.count_mode == 'estimate'
+        body['results'] = data
+        return Response(body)
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'count': {'type': 'integer', 'nullable': True},
+                'count_estimated': {'type': 'boolean'},
+                'results': schema,
+            },
+        }
+
+
+class TransactionKeysetPagination(KeysetPagination):
+    ordering = ('-transaction_date', '-id')
+
+
+def uses_keyset(request) -> bool:
+    """
+    Clients opt into keyset pages with ?pagination=keyset (first page) or by following a ?cursor= link.
+    """
+    params = request.query_params
+    return params.get('pagination') == 'keyset' or KeysetPagination.cursor_query_param in params
+
+
+class KeysetOrPageNumberPagination(BasePagination):
+    """
+    Page-number pagination by default, keyset pagination when the client opts in,
+    so existing clients keep working on endpoints that adopt keyset pages.
+    """
+    keyset_class = KeysetPagination
+    page_number_class = StandardResultsSetPagination
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.paginator = self.keyset_class() if uses_keyset(request) else self.page_number_class()
+        return self.paginator.paginate_queryset(queryset, request, view=view)
+
+    def get_paginated_response(self, data):
+        return self.paginator.get_paginated_response(data)
+
+    def get_paginated_response_schema(self, schema):
+        return self.page_number_class().get_paginated_response_schema(schema)
+
+
+class TransactionPagination(KeysetOrPageNumberPagination):
+    keyset_class = TransactionKeysetPagination
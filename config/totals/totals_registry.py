@@ -0,0 +1,237 @@
+from decimal import Decimal, ROUND_HALF_UP
+from django.db.models import F, Sum, Value, DecimalField, ExpressionWrapper, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_init, post_save, post_delete
+from loguru import logger
+
+
+# line model -> registration, document model -> registration
+_LINE_REGISTRY = {}
+_DOCUMENT_REGISTRY = {}
+
+_SNAPSHOT_ATTR = '_document_totals_snapshot'
+_TWO_PLACES = Decimal('0.01')
+
+
+class DocumentTotalsRegistration:
+    """
+    Describes how a line model contributes to its document's total_amount.
+    A line total is either a stored field (total_field) or
+    quantity * price, optionally grossed up by a tax rate percentage.
+    """
+
+    def __init__(self, *, line_model, document_field, quantity_field=None, price_field=None,
+                 tax_rate_field=None, total_field=None, document_total_field='total_amount'):
+        if not total_field and not (quantity_field and price_field):
+            raise ValueError("Either total_field or quantity_field and price_field are required.")
+
+        self.line_model = line_model
+        self.document_field = document_field
+        self.document_attname = line_model._meta.get_field(document_field).attname
+        self.document_model = line_model._meta.get_field(document_field).related_model
+        self.related_query_name = line_model._meta.get_field(document_field).related_query_name()
+        self.quantity_field = quantity_field
+        self.price_field = price_field
+        self.tax_rate_field = tax_rate_field
+        self.total_field = total_field
+        self.document_total_field = document_total_field
+
+    @property
+    def value_fields(self):
+        if self.total_field:
+            return [self.total_field]
+        return [f for f in (self.quantity_field, self.price_field, self.tax_rate_field) if f]
+
+    def line_total(self, instance) -> Decimal:
+        """
+        Python side of the line total; must agree with line_total_expression().
+        """
+        if self.total_field:
+            total = Decimal(getattr(instance, self.total_field) or 0)
+        else:
+            total = Decimal(getattr(instance, self.quantity_field) or 0) * Decimal(getattr(instance, self.price_field) or 0)
+            if self.tax_rate_field:
+                total = total * (1 + Decimal(getattr(instance, self.tax_rate_field) or 0) / 100)
+        return total.quantize(_TWO_PLACES, rounding=ROUND_HALF_UP)
+
+    def line_total_expression(self, prefix=''):
+        """
+        Database side of the line total, usable in aggregates.
+        """
+        output_field = DecimalField(max_digits=15, decimal_places=2)
+        if self.total_field:
+            return F(f'{prefix}{self.total_field}')
+        expression = F(f'{prefix}{self.quantity_field}') * F(f'{prefix}{self.price_field}')
+        if self.tax_rate_field:
+            expression = expression * (Value(1) + F(f'{prefix}{self.tax_rate_field}') / Value(100))
+        return ExpressionWrapper(expression, output_field=output_field)
+
+
+def register_document_totals(line_model, **kwargs):
+    """
+    Keep document.total_amount in step with its lines using atomic F() deltas
+    instead of re-reading every line on each save.
+    Writes that bypass signals (bulk_create, queryset.update) must call
+    recompute_totals() or rely on the find_drifted_totals repair command.
+    """
+    registration = DocumentTotalsRegistration(line_model=line_model, **kwargs)
+    _LINE_REGISTRY[line_model] = registration
+    _DOCUMENT_REGISTRY[registration.document_model] = registration
+
+    dispatch_uid = f'document_totals_{line_model._meta.label_lower}'
+    post_init.connect(_snapshot_line, sender=line_model, dispatch_uid=f'{dispatch_uid}_init')
+    post_save.connect(_line_saved, sender=line_model, dispatch_uid=f'{dispatch_uid}_save')
+    post_delete.connect(_line_deleted, sender=line_model, dispatch_uid=f'{dispatch_uid}_delete')
+    return registration
+
+
+def get_registrations():
+    return list(_DOCUMENT_REGISTRY.values())
+
+
+def get_registration_for_document(document_model):
+    registration = _DOCUMENT_REGISTRY.get(document_model)
+    if registration is None:
+        raise ValueError(f"No totals registration for document model '{document_model.__name__}'.")
+    return registration
+
+
+# ==========================================================
+# DELTAS
+# ==========================================================
+def _take_snapshot(registration, instance):
+    instance.__dict__[_SNAPSHOT_ATTR] = (
+        getattr(instance, registration.document_attname),
+        registration.line_total(instance),
+    )
+
+
+def _snapshot_line(sender, instance, **kwargs):
+    """
+    Remember the loaded document id and line total so later saves only apply the difference.
+    Unsaved or partially loaded lines get no snapshot and fall back to a recompute.
+    """
+    registration = _LINE_REGISTRY[sender]
+    if instance.pk is None:
+        return
+    deferred = instance.get_deferred_fields()
+    if registration.document_attname in deferred or deferred.intersection(registration.value_fields):
+        return
+    try:
+        _take_snapshot(registration, instance)
+    except (TypeError, ArithmeticError):
+        return
+
+
+def _apply_delta(registration, instance, document_id, delta: Decimal):
+    if document_id is None or not delta:
+        return
+    total_field = registration.document_total_field
+    registration.document_model.objects.filter(pk=document_id).update(
+        **{total_field: F(total_field) + delta}
+    )
+
+    # keep an already loaded parent in step with the row we just updated
+    field = registration.line_model._meta.get_field(registration.document_field)
+    if field.is_cached(instance):
+        document = field.get_cached_value(instance)
+        if document is not None and document.pk == document_id:
+            setattr(document, total_field, Decimal(getattr(document, total_field) or 0) + delta)
+
+
+def _line_saved(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    registration = _LINE_REGISTRY[sender]
+    new_document_id = getattr(instance, registration.document_attname)
+    new_total = registration.line_total(instance)
+
+    if created:
+        old_document_id, old_total = new_document_id, Decimal('0.00')
+    else:
+        snapshot = instance.__dict__.get(_SNAPSHOT_ATTR)
+        if snapshot is None:
+            if new_document_id is not None:
+                recompute_totals(registration.document_model(pk=new_document_id))
+            _take_snapshot(registration, instance)
+            return
+        old_document_id, old_total = snapshot
+
+    if old_document_id == new_document_id:
+        _apply_delta(registration, instance, new_document_id, new_total - old_total)
+    else:
+        _apply_delta(registration, instance, old_document_id, -old_total)
+        _apply_delta(registration, instance, new_document_id, new_total)
+
+    _take_snapshot(registration, instance)
+
+
+def _line_deleted(sender, instance, origin=None, **kwargs):
+    registration = _LINE_REGISTRY[sender]
+    # the whole document is being deleted; nothing left to keep in step
+    if isinstance(origin, registration.document_model):
+        return
+    snapshot = instance.__dict__.get(_SNAPSHOT_ATTR)
+    if snapshot is None:
+        snapshot = (getattr(instance, registration.document_attname), registration.line_total(instance))
+    document_id, line_total = snapshot
+    _apply_delta(registration, instance, document_id, -line_total)
+    instance.__dict__.pop(_SNAPSHOT_ATTR, None)
+
+
+# ==========================================================
+# REPAIR
+# ==========================================================
+def recompute_totals(document) -> Decimal:
+    """
+    Repair path: recompute a document's total from its lines with one aggregate
+    and one UPDATE, then refresh the in-memory value.
+    """
+    registration = get_registration_for_document(type(document))
+    total = registration.line_model.objects.filter(
+        **{registration.document_attname: document.pk}
+    ).aggregate(
+        total=Sum(registration.line_total_expression())
+    )['total'] or Decimal('0.00')
+    total = Decimal(total).quantize(_TWO_PLACES, rounding=ROUND_HALF_UP)
+
+    registration.document_model.objects.filter(pk=document.pk).update(
+        **{registration.document_total_field: total}
+    )
+    setattr(document, registration.document_total_field, total)
+    logger.info(f"Recomputed {registration.document_model.__name__} {document.pk} total: {total}")
+    return total
+
+
+def annotate_line_totals(registration, queryset=None):
+    """
+    Annotate every document with the sum of its lines (computed_total) in a single query.
+    """
+    queryset = queryset if queryset is not None else registration.document_model.objects.all()
+    line_totals = (
+        registration.line_model.objects
+        .filter(**{registration.document_attname: OuterRef('pk')})
+        .order_by()
+        .values(registration.document_attname)
+        .annotate(total=Sum(registration.line_total_expression()))
+        .values('total')
+    )
+    output_field = DecimalField(max_digits=15, decimal_places=2)
+    return queryset.annotate(
+        computed_total=Coalesce(Subquery(line_totals, output_field=output_field), Value(Decimal('0.00')), output_field=output_field)
+    )
+
+
+def find_drifted_documents(registration, tolerance=Decimal('0.01'), queryset=None):
+    """
+    Yield (document_id, stored_total, computed_total) for documents whose stored
+    total differs from the sum of their lines by more than tolerance.
+    """
+    rows = annotate_line_totals(registration, queryset).values_list(
+        'pk', registration.document_total_field, 'computed_total'
+    )
+    for document_id, stored_total, computed_total in rows.iterator(chunk_size=2000):
+        stored_total = Decimal(stored_total or 0).quantize(_TWO_PLACES, rounding=ROUND_HALF_UP)
+        computed_total = Decimal(computed_total or 0).quantize(_TWO_PLACES, rounding=ROUND_HALF_UP)
+        if abs(stored_total - computed_total) > tolerance:
+            yield document_id, stored_total, computed_total
@@ -2,7 +2,7 @@
 from loguru import logger
 from rest_framework.response import Response
 from rest_framework import status
-from company.models.company_model import Company
+from config.auth.tenant import resolve_tenant
 
 
 def get_company_queryset(request, model):
@@ -12,14 +12,13 @@ def get_company_queryset(request, model):
     """
 
     user = request.user
-    logger.info(user)
     #  Handle unauthenticated access
     if not user.is_authenticated:
         logger.warning("Unauthenticated access attempt.")
         return Response({'error': 'Authentication required.'}, status=status.HTTP_401_UNAUTHORIZED)
 
-    # Determine if user is a company or belongs to a company
-    company_or_user = getattr(user, 'company', None) or (user if isinstance(user, Company) else None)
+    # Determine if user is a company or belongs to a company (resolved once per request)
+    company_or_user, _ = resolve_tenant(request)
     identifier = getattr(company_or_user, 'name', None) or getattr(company_or_user, 'username', None) or 'Unknown'
 
     #  Handle missing company association
@@ -33,10 +32,7 @@ def get_company_queryset(request, model):
     except Exception as e:
         return f"Error occured in getting queryset: {e}"
 
-    #  Log existence check (lightweight)
-    exists = queryset.exists()
-    logger.bind(user=identifier).info(f"{model.__name__} records exist: {exists} for '{identifier}'")
-    # logger.info(queryset)
+    logger.bind(user=identifier).debug(f"{model.__name__} queryset scoped to '{identifier}'")
     return queryset
 
 
@@ -47,14 +43,13 @@ def get_account_company_queryset(request, model):
     """
 
     user = request.user
-    logger.info(user)
     #  Handle unauthenticated access
     if not user.is_authenticated:
         logger.warning("Unauthenticated access attempt.")
         return Response({'error': 'Authentication required.'}, status=status.HTTP_401_UNAUTHORIZED)
 
-    # Determine if user is a company or belongs to a company
-    company_or_user = getattr(user, 'company', None) or (user if isinstance(user, Company) else None)
+    # Determine if user is a company or belongs to a company (resolved once per request)
+    company_or_user, _ = resolve_tenant(request)
     identifier = getattr(company_or_user, 'name', None) or getattr(company_or_user, 'username', None) or 'Unknown'
 
     #  Handle missing company association
@@ -68,8 +63,5 @@ def get_account_company_queryset(request, model):
     except Exception as e:
         return f"Error occured in getting queryset: {e}"
 
-    #  Log existence check (lightweight)
-    exists = queryset.exists()
-    logger.bind(user=identifier).info(f"{model.__name__} records exist: {exists} for '{identifier}'")
-    # logger.info(queryset)
+    logger.bind(user=identifier).debug(f"{model.__name__} queryset scoped to '{identifier}'")
     return queryset
\ No newline at end of file
@@ -1,27 +1,149 @@
 # config/logging_config.py
-from loguru import logger
+import itertools
+import logging
 import os
+import sys
+from logging.handlers import RotatingFileHandler
+from loguru import logger
 from django.conf import settings
 
-def setup_loguru():
+
+LOG_FORMAT = "{time:YYYY-MM-DD HH:mm:ss} | {level} | {name}:{function}:{line} - {message}"
+# settings.LOGURU["MODE"], see setup_loguru
+LOG_MODES = ("per_app", "production")
+
+
+class LogSampler:
     """
-    Dynamically sets up Loguru to create a separate log file per app
-    inside the /logs directory.
+    Loguru filter keeping one in N records below WARNING from the modules in sample_every
+    ({"inventory.services.product_stock": 10}); warnings and errors are always kept.
+    The matching prefix is looked up once per module, so each record costs a dict lookup.
     """
-    log_dir = os.path.join(settings.BASE_DIR, "logs")
+
+    def __init__(self, sample_every: dict):
+        self.sample_every = {prefix: every for prefix, every in (sample_every or {}).items() if every and every > 1}
+        self._counters = {prefix: itertools.count() for prefix in self.sample_every}
+        self._routes = {}
+
+    def _route(self, name: str):
+        route = self._routes.get(name)
+        if route is None:
+            prefixes = [prefix for prefix in self.sample_every if name == prefix or name.startswith(prefix + '.')]
+            if prefixes:
+                prefix = max(prefixes, key=len)
+                route = (self.sample_every[prefix], self._counters[prefix])
+            else:
+                route = False
+            self._routes[name] = route
+        return route
+
+    def __call__(self, record) -> bool:
+        if record["level"].no >= logging.WARNING or not self.sample_every:
+            return True
+        route = self._route(record["name"])
+        if not route:
+            return True
+        every, counter = route
+        return next(counter) % every == 0
+
+
+class AppRoutingSink:
+    """
+    One loguru sink writing each record to posflow.log and to the log file of the app that
+    emitted it (the top-level package of the record's module), replacing a filtered sink per app.
+    Files rotate at max_bytes, keeping backup_count old files.
+    """
+
+    def __init__(self, log_dir: str, apps, max_bytes: int, backup_count: int):
+        self.log_dir = log_dir
+        self.apps = {app.split(".")[-1] for app in apps}
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._general = self._open("posflow")
+        self._files = {}
+
+    def _open(self, name: str) -> RotatingFileHandler:
+        handler = RotatingFileHandler(
+            os.path.join(self.log_dir, f"{name}.log"),
+            maxBytes=self.max_bytes,
+            backupCount=self.backup_count,
+            encoding="utf-8",
+            delay=True,
+        )
+        # loguru messages already end with a newline
+        handler.terminator = ""
+        return handler
+
+    def _file_for(self, module_name: str):
+        app = module_name.partition(".")[0]
+        if app not in self.apps:
+            return None
+        handler = self._files.get(app)
+        if handler is None:
+            handler = self._files[app] = self._open(app)
+        return handler
+
+    def write(self, message):
+        record = logging.makeLogRecord({"msg": str(message)})
+        self._general.emit(record)
+        handler = self._file_for(message.record["name"] or "")
+        if handler is not None:
+            handler.emit(record)
+
+    def stop(self):
+        for handler in [self._general, *self._files.values()]:
+            handler.close()
+
+
+def setup_loguru(mode: str | None = None, log_dir: str | None = None):
+    """
+    Sets up Loguru file logging inside the /logs directory (settings.LOGURU).
+
+    per_app: posflow.log plus a separate, synchronously written file sink per app.
+    production: a single enqueued sink (written from a background thread) routing records to
+    posflow.log and their app's file, with INFO from the SAMPLE_EVERY modules sampled and no
+    variable values in tracebacks.
+    """
+    config = getattr(settings, "LOGURU", {})
+    mode = mode or config.get("MODE") or "per_app"
+    if mode not in LOG_MODES:
+        # checked before the handlers are removed, so a typo never leaves the process without logs
+        raise ValueError(f"Unknown Loguru mode '{mode}'. Use one of: {', '.join(LOG_MODES)}")
+    log_dir = log_dir or os.path.join(settings.BASE_DIR, "logs")
     os.makedirs(log_dir, exist_ok=True)
+    level = config.get("LEVEL", "INFO")
 
     # Remove any default Loguru handlers to avoid duplication
     logger.remove()
 
+    if mode == "production":
+        logger.add(
+            AppRoutingSink(
+                log_dir,
+                settings.LOCAL_APPS,
+                max_bytes=config.get("MAX_BYTES", 10 * 1024 * 1024),
+                backup_count=config.get("BACKUP_COUNT", 10),
+            ),
+            format=LOG_FORMAT,
+            level=level,
+            filter=LogSampler(config.get("SAMPLE_EVERY", {})),
+            enqueue=config.get("ENQUEUE", True),
+            backtrace=False,
+            diagnose=False,
+        )
+        logger.info(
+            "Loguru production logging initialized | level={} | sampled={}", level, sorted(config.get("SAMPLE_EVERY", {}))
+        )
+        return logger
+
     # General project-level log file
     logger.add(
         os.path.join(log_dir, "posflow.log"),
         rotation="10 MB",
         retention="21 days",
         compression="zip",
-        format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {name}:{function}:{line} - {message}",
-        level="INFO",
+        format=LOG_FORMAT,
+        level=level,
     )
 
     # App-specific log files
@@ -32,10 +154,22 @@ def setup_loguru():
             rotation="5 MB",
             retention="21 days",
             compression="zip",
-            format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {name}:{function}:{line} - {message}",
-            level="INFO",
+            format=LOG_FORMAT,
+            level=level,
             filter=lambda record, app_name=app_name: app_name in record["name"],  # only logs for that app
         )
 
     logger.info("Loguru logging initialized for all apps.")
     return logger
+
+
+def restore_loguru():
+    """
+    Back to the configured logging: settings.LOGURU["MODE"], or loguru's default stderr sink.
+    Removing the handlers first flushes any enqueued sink.
+    """
+    logger.remove()
+    if getattr(settings, "LOGURU", {}).get("MODE"):
+        return setup_loguru()
+    logger.add(sys.stderr)
+    return logger
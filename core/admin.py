@@ -1,3 +1,9 @@
 from django.contrib import admin
+from core.models import DocumentSequence
 
-# Register your models here.
+
+@admin.register(DocumentSequence)
+class DocumentSequenceAdmin(admin.ModelAdmin):
+    list_display = ('document_type', 'company', 'next_value', 'updated_at')
+    list_filter = ('document_type',)
+    search_fields = ('document_type', 'company__name')
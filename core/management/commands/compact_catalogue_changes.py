@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand, CommandError
+from company.models.company_model import Company
+from inventory.services.catalogue.catalogue_service import CatalogueService
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete till catalogue change rows superseded by a later change to the same object "
+        "(deltas stay correct from any version)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--company",
+            type=int,
+            help="Only compact this company's change feed.",
+        )
+
+    def handle(self, *args, **options):
+        company = None
+        if options["company"] is not None:
+            company = Company.objects.filter(pk=options["company"]).first()
+            if company is None:
+                raise CommandError(f"Company {options['company']} does not exist.")
+        deleted = CatalogueService.compact(company)
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} superseded catalogue changes."))
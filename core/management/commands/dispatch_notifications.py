@@ -0,0 +1,51 @@
+import time
+from django.core.management.base import BaseCommand
+from notifications.services.dispatch.notification_dispatch_service import (
+    NotificationDispatchMetrics,
+    NotificationDispatchService,
+)
+
+
+class Command(BaseCommand):
+    help = "Send pending notifications through their channels and report throughput and queue metrics"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            help="Notifications claimed per batch (default NOTIFICATION_DISPATCH['BATCH_SIZE']).",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep polling every NOTIFICATION_DISPATCH['POLL_SECONDS'] instead of draining the queue once.",
+        )
+        parser.add_argument(
+            "--stats",
+            action="store_true",
+            help="Only print the queue metrics.",
+        )
+
+    def _write_stats(self):
+        stats = NotificationDispatchService.queue_stats()
+        self.stdout.write(
+            "Queue: " + " ".join(f"{key}={value}" for key, value in stats.items())
+        )
+
+    def handle(self, *args, **options):
+        if options["stats"]:
+            self._write_stats()
+            return
+
+        poll_seconds = NotificationDispatchService._config().get('POLL_SECONDS', 10)
+        while True:
+            report = NotificationDispatchService.run(batch_size=options["batch_size"])
+            self.stdout.write(
+                f"Dispatched: sent={report.sent} retried={report.retried} failed={report.failed} "
+                f"by_channel={report.sent_by_channel} notifications_per_second={report.notifications_per_second}"
+            )
+            self._write_stats()
+            if not options["loop"]:
+                break
+            self.stdout.write(f"Process totals: {NotificationDispatchMetrics.snapshot()}")
+            time.sleep(poll_seconds)
@@ -0,0 +1,68 @@
+from decimal import Decimal
+from django.core.management.base import BaseCommand
+from django.db import transaction as db_transaction
+from config.totals.totals_registry import get_registrations, find_drifted_documents
+
+
+class Command(BaseCommand):
+    help = "Find documents whose total_amount has drifted from the sum of their lines (and optionally repair them)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model",
+            action="append",
+            dest="models",
+            help="Only check this document model (e.g. SalesOrder). Can be repeated.",
+        )
+        parser.add_argument(
+            "--company",
+            type=int,
+            help="Only check documents belonging to this company id.",
+        )
+        parser.add_argument(
+            "--tolerance",
+            type=Decimal,
+            default=Decimal("0.01"),
+            help="Maximum allowed difference before a total is reported (default 0.01).",
+        )
+        parser.add_argument(
+            "--fix",
+            action="store_true",
+            help="Overwrite drifted totals with the recomputed value.",
+        )
+
+    def handle(self, *args, **options):
+        wanted = {name.lower() for name in options["models"] or []}
+        total_drifted = 0
+
+        for registration in get_registrations():
+            document_model = registration.document_model
+            if wanted and document_model.__name__.lower() not in wanted:
+                continue
+
+            queryset = document_model.objects.all()
+            if options["company"] is not None:
+                queryset = queryset.filter(company_id=options["company"])
+
+            drifted = list(find_drifted_documents(registration, options["tolerance"], queryset))
+            total_drifted += len(drifted)
+
+            for document_id, stored_total, computed_total in drifted:
+                self.stdout.write(
+                    f"{document_model.__name__} {document_id}: stored={stored_total} computed={computed_total}"
+                )
+
+            if options["fix"] and drifted:
+                with db_transaction.atomic():
+                    for document_id, _, computed_total in drifted:
+                        document_model.objects.filter(pk=document_id).update(
+                            **{registration.document_total_field: computed_total}
+                        )
+                self.stdout.write(self.style.SUCCESS(
+                    f"Repaired {len(drifted)} {document_model.__name__} totals."
+                ))
+
+        if total_drifted:
+            self.stdout.write(self.style.WARNING(f"{total_drifted} drifted document totals found."))
+        else:
+            self.stdout.write(self.style.SUCCESS("No drifted document totals found."))
@@ -0,0 +1,90 @@
+import json
+from django.core.management.base import BaseCommand, CommandError
+from branch.models.branch_model import Branch
+from company.models.company_model import Company
+from users.models.user_model import User
+from config.index_advisor.index_advisor import run_advisor
+
+
+class Command(BaseCommand):
+    help = (
+        "EXPLAIN the registered tenant queries against the current (seeded) database and "
+        "report sequential scans, in-memory sorts and queries without a covering index"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--company",
+            type=int,
+            help="Bind the queries to this company id (default: the first company).",
+        )
+        parser.add_argument(
+            "--branch",
+            type=int,
+            help="Bind the queries to this branch id (default: the company's first branch).",
+        )
+        parser.add_argument(
+            "--query",
+            action="append",
+            dest="queries",
+            help="Only analyse this registered query (e.g. transactions.by_type). Can be repeated.",
+        )
+        parser.add_argument(
+            "--json",
+            action="store_true",
+            help="Print the findings as JSON.",
+        )
+        parser.add_argument(
+            "--show-plans",
+            action="store_true",
+            help="Include the raw EXPLAIN output in the text report.",
+        )
+
+    def handle(self, *args, **options):
+        company = (
+            Company.objects.filter(pk=options["company"]).first()
+            if options["company"] is not None
+            else Company.objects.order_by("pk").first()
+        )
+        if company is None:
+            raise CommandError("No company found; seed the database first.")
+
+        branches = Branch.objects.filter(company=company)
+        branch = (
+            branches.filter(pk=options["branch"]).first()
+            if options["branch"] is not None
+            else branches.order_by("pk").first()
+        )
+        user = User.objects.filter(company=company).order_by("pk").first()
+
+        findings = run_advisor(
+            {"company": company, "branch": branch, "user": user},
+            names=set(options["queries"] or []),
+        )
+
+        if options["json"]:
+            self.stdout.write(json.dumps([finding.as_dict() for finding in findings], indent=2))
+            return
+
+        flagged = 0
+        for finding in findings:
+            if finding.needs_attention:
+                flagged += 1
+                style = self.style.WARNING
+            else:
+                style = self.style.SUCCESS
+            self.stdout.write(style(f"{finding.name} ({finding.table})"))
+            if finding.sequential_scans:
+                self.stdout.write(f"  sequential scan: {', '.join(finding.sequential_scans)}")
+            if finding.sorts_in_memory:
+                self.stdout.write("  rows sorted after fetching")
+            if finding.covering_index:
+                self.stdout.write(f"  covered by: {finding.covering_index}")
+            else:
+                self.stdout.write(f"  missing index, suggested: Index(fields={finding.suggested_columns})")
+            if options["show_plans"]:
+                for line in finding.plan.splitlines():
+                    self.stdout.write(f"    {line}")
+
+        summary = f"{len(findings)} queries analysed, {flagged} need attention."
+        self.stdout.write(self.style.WARNING(summary) if flagged else self.style.SUCCESS(summary))
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+from inventory.services.product_search.product_search_service import ProductSearchService, POSTGRES_SEARCH_INDEXES
+
+
+class Command(BaseCommand):
+    help = (
+        "Enable pg_trgm and create the GIN tsvector/trigram product search indexes "
+        "(PostgreSQL only; existing indexes are left alone)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--database",
+            default="default",
+            help="Database alias to install the indexes on.",
+        )
+        parser.add_argument(
+            "--no-concurrently",
+            action="store_true",
+            help="Build the indexes inside a transaction instead of CONCURRENTLY (locks writes to products).",
+        )
+
+    def handle(self, *args, **options):
+        created = ProductSearchService.install_postgres_indexes(
+            using=options["database"],
+            concurrently=not options["no_concurrently"],
+        )
+        if not created:
+            self.stdout.write(f"Nothing to do ({len(POSTGRES_SEARCH_INDEXES)} search indexes already present or not PostgreSQL).")
+            return
+        self.stdout.write(self.style.SUCCESS(f"Created {', '.join(created)}."))
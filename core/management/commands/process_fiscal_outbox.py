@@ -0,0 +1,49 @@
+import time
+from django.core.management.base import BaseCommand
+from taxes.services.fiscalisation.fiscalisation_outbox_service import FiscalisationMetrics, FiscalisationOutboxService
+
+
+class Command(BaseCommand):
+    help = "Submit pending fiscal invoices from the outbox and report throughput and queue metrics"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            help="Invoices per API batch (default FISCALISATION['BATCH_SIZE']).",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep polling the outbox every FISCALISATION['POLL_SECONDS'] instead of draining it once.",
+        )
+        parser.add_argument(
+            "--stats",
+            action="store_true",
+            help="Only print the queue metrics.",
+        )
+
+    def _write_stats(self):
+        stats = FiscalisationOutboxService.queue_stats()
+        self.stdout.write(
+            f"Queue: pending={stats['pending']} due={stats['due']} failed={stats['failed']} "
+            f"oldest_pending_age_seconds={stats['oldest_pending_age_seconds']}"
+        )
+
+    def handle(self, *args, **options):
+        if options["stats"]:
+            self._write_stats()
+            return
+
+        poll_seconds = FiscalisationOutboxService._config().get('POLL_SECONDS', 15)
+        while True:
+            report = FiscalisationOutboxService.run(batch_size=options["batch_size"])
+            self.stdout.write(
+                f"Submitted: fiscalised={report.fiscalised} rejected={report.rejected} retried={report.retried} "
+                f"failed={report.failed} invoices_per_second={report.invoices_per_second}"
+            )
+            self._write_stats()
+            if not options["loop"]:
+                break
+            self.stdout.write(f"Process totals: {FiscalisationMetrics.snapshot()}")
+            time.sleep(poll_seconds)
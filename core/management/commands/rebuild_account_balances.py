@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand
+from transactions.services.journal_service import JournalService
+
+
+class Command(BaseCommand):
+    help = "Report (and optionally repair) account balances that differ from the sum of their journal entries"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--company",
+            type=int,
+            help="Only check accounts belonging to this company id.",
+        )
+        parser.add_argument(
+            "--seed-opening",
+            action="store_true",
+            help="First post an OPENING journal entry for accounts with a balance but no journal history.",
+        )
+        parser.add_argument(
+            "--apply",
+            action="store_true",
+            help="Overwrite drifted balances with the journal balance (default is a dry run).",
+        )
+
+    def handle(self, *args, **options):
+        company = options["company"]
+
+        if options["seed_opening"]:
+            seeded = JournalService.seed_opening_entries(company=company)
+            self.stdout.write(f"Seeded {seeded} opening journal entries.")
+
+        drifted = list(JournalService.find_balance_drift(company=company))
+        for account_id, balance, journal_balance in drifted:
+            self.stdout.write(f"Account {account_id}: stored={balance} journal={journal_balance}")
+
+        if not drifted:
+            self.stdout.write(self.style.SUCCESS("No drifted account balances found."))
+            return
+
+        if options["apply"]:
+            JournalService.rebuild_balances(account_ids=[account_id for account_id, _, _ in drifted])
+            self.stdout.write(self.style.SUCCESS(f"Rebuilt {len(drifted)} account balances from the journal."))
+        else:
+            self.stdout.write(self.style.WARNING(f"{len(drifted)} drifted account balances found (dry run)."))
@@ -0,0 +1,48 @@
+from datetime import date
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from company.models.company_model import Company
+from reports.services.rollup.report_rollup_service import ReportRollupService
+
+
+class Command(BaseCommand):
+    help = (
+        "Refresh the daily report rollups: without --from, rebuild the days touched since the last run; "
+        "with --from, backfill every day in the range"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--from",
+            dest="date_from",
+            type=date.fromisoformat,
+            help="Backfill from this day (YYYY-MM-DD).",
+        )
+        parser.add_argument(
+            "--to",
+            dest="date_to",
+            type=date.fromisoformat,
+            help="Backfill up to and including this day (YYYY-MM-DD). Defaults to today.",
+        )
+        parser.add_argument(
+            "--company",
+            type=int,
+            help="Only backfill this company id.",
+        )
+
+    def handle(self, *args, **options):
+        if options["date_from"] is None:
+            days = ReportRollupService.refresh_changed()
+            self.stdout.write(self.style.SUCCESS(f"Refreshed {days} changed company days."))
+            return
+
+        company = None
+        if options["company"] is not None:
+            company = Company.objects.filter(pk=options["company"]).first()
+            if company is None:
+                raise CommandError(f"Company {options['company']} does not exist.")
+        date_to = options["date_to"] or timezone.localdate()
+        if options["date_from"] > date_to:
+            raise CommandError("--from must be on or before --to.")
+        days = ReportRollupService.refresh_range(options["date_from"], date_to, company=company)
+        self.stdout.write(self.style.SUCCESS(f"Backfilled {days} company days."))
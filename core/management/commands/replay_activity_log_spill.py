@@ -0,0 +1,49 @@
+import json
+import os
+from django.core.management.base import BaseCommand
+from activity_log.services.activity_log_service import ActivityLogService
+from config.activity_log.activity_log_pipeline import get_pipeline_settings
+
+
+class Command(BaseCommand):
+    help = "Write activity log entries spilled to disk by the activity log pipeline back to the database"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--path",
+            help="Spill file to replay (defaults to ACTIVITY_LOG_PIPELINE['SPILL_PATH']).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Rows per bulk insert (default 1000).",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"] or get_pipeline_settings()["SPILL_PATH"]
+        if not os.path.exists(path):
+            self.stdout.write(self.style.SUCCESS(f"No spill file at {path}."))
+            return
+
+        # move the file aside first so entries spilled while replaying are not lost
+        replay_path = f"{path}.replaying"
+        os.replace(path, replay_path)
+
+        written = 0
+        batch = []
+        with open(replay_path, encoding="utf-8") as spill_file:
+            for line in spill_file:
+                if not line.strip():
+                    continue
+                batch.append(json.loads(line))
+                if len(batch) >= options["batch_size"]:
+                    ActivityLogService.bulk_create_activity_logs(batch, batch_size=options["batch_size"])
+                    written += len(batch)
+                    batch = []
+        if batch:
+            ActivityLogService.bulk_create_activity_logs(batch, batch_size=options["batch_size"])
+            written += len(batch)
+
+        os.remove(replay_path)
+        self.stdout.write(self.style.SUCCESS(f"Replayed {written} activity log entries from {path}."))
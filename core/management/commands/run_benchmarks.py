@@ -0,0 +1,83 @@
+import json
+from django.core.management.base import BaseCommand, CommandError
+from company.models.company_model import Company
+from config.benchmarks.harness import run_scenarios, save_baseline, load_baseline, compare_to_baseline
+from config.benchmarks.scenarios import SCENARIOS, BenchmarkContext
+from config.benchmarks.seed_data import BenchmarkSeeder
+
+
+class Command(BaseCommand):
+    help = (
+        "Run the POS hot-path benchmarks against seeded data (see seed_benchmark_data) and report "
+        "latency percentiles, SQL statements and peak memory; optionally store or compare a JSON baseline"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--company",
+            type=int,
+            help="Company id to run against (default: the first benchmark company, else the first company).",
+        )
+        parser.add_argument(
+            "--scenario",
+            action="append",
+            dest="scenarios",
+            choices=sorted(SCENARIOS),
+            help="Only run this scenario. Can be repeated.",
+        )
+        parser.add_argument("--iterations", type=int, default=20, help="Timed iterations per scenario (default 20).")
+        parser.add_argument("--warmup", type=int, default=2, help="Untimed warm-up iterations (default 2).")
+        parser.add_argument("--save-baseline", metavar="PATH", help="Write the results to this JSON baseline.")
+        parser.add_argument("--baseline", metavar="PATH", help="Compare the results with this JSON baseline.")
+        parser.add_argument(
+            "--tolerance",
+            type=float,
+            default=0.25,
+            help="Allowed p95 latency / peak memory growth over the baseline, as a fraction (default 0.25).",
+        )
+        parser.add_argument("--json", action="store_true", help="Print the results as JSON.")
+
+    def handle(self, *args, **options):
+        if options["company"] is not None:
+            company = Company.objects.filter(pk=options["company"]).first()
+        else:
+            company = (
+                BenchmarkSeeder.benchmark_companies().order_by("pk").first()
+                or Company.objects.order_by("pk").first()
+            )
+        if company is None:
+            raise CommandError("No company to benchmark; run seed_benchmark_data first.")
+
+        wanted = options["scenarios"] or sorted(SCENARIOS)
+        results = run_scenarios(
+            {name: SCENARIOS[name] for name in wanted},
+            BenchmarkContext.for_company(company),
+            iterations=options["iterations"],
+            warmup=options["warmup"],
+        )
+
+        if options["json"]:
+            self.stdout.write(json.dumps([result.as_dict() for result in results], indent=2))
+        else:
+            header = f"{'scenario':<28}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'SQL':>6}{'peak KB':>10}"
+            self.stdout.write(header)
+            for result in results:
+                if result.error:
+                    self.stdout.write(self.style.ERROR(f"{result.name:<28}failed: {result.error}"))
+                    continue
+                self.stdout.write(
+                    f"{result.name:<28}{result.p50_ms:>10.2f}{result.p95_ms:>10.2f}{result.p99_ms:>10.2f}"
+                    f"{result.sql_statements:>6}{result.peak_memory_kb:>10.1f}"
+                )
+
+        if options["save_baseline"]:
+            save_baseline(results, options["save_baseline"])
+            self.stdout.write(self.style.SUCCESS(f"Baseline written to {options['save_baseline']}"))
+
+        if options["baseline"]:
+            regressions = compare_to_baseline(results, load_baseline(options["baseline"]), options["tolerance"])
+            if regressions:
+                for regression in regressions:
+                    self.stdout.write(self.style.ERROR(regression))
+                raise CommandError(f"{len(regressions)} benchmark regressions against {options['baseline']}")
+            self.stdout.write(self.style.SUCCESS("No regressions against the baseline."))
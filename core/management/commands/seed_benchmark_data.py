@@ -0,0 +1,52 @@
+from django.core.management.base import BaseCommand, CommandError
+from config.benchmarks.seed_data import BenchmarkSeeder
+
+
+class Command(BaseCommand):
+    help = "Generate companies x branches x products with a sales history for benchmarks and load tests"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--companies", type=int, default=1, help="Number of companies (default 1).")
+        parser.add_argument("--branches", type=int, default=2, help="Branches per company (default 2).")
+        parser.add_argument("--products", type=int, default=200, help="Products per branch (default 200).")
+        parser.add_argument("--customers", type=int, default=50, help="Customers per branch (default 50).")
+        parser.add_argument("--days", type=int, default=30, help="Days of sales history (default 30).")
+        parser.add_argument("--sales-per-day", type=int, default=20, help="Sales per branch per day (default 20).")
+        parser.add_argument("--max-lines", type=int, default=5, help="Maximum lines per sale (default 5).")
+        parser.add_argument("--seed", type=int, default=42, help="Random seed, for repeatable datasets.")
+        parser.add_argument(
+            "--prefix",
+            default="bench",
+            help="Name prefix of the generated companies; lets several datasets coexist.",
+        )
+        parser.add_argument(
+            "--flush",
+            action="store_true",
+            help="Delete the existing benchmark companies with this prefix first.",
+        )
+
+    def handle(self, *args, **options):
+        prefix = options["prefix"]
+        if options["flush"]:
+            removed = BenchmarkSeeder.flush(prefix)
+            self.stdout.write(f"Removed {removed} existing benchmark companies.")
+        elif BenchmarkSeeder.benchmark_companies(prefix).exists():
+            raise CommandError(f"Benchmark data with prefix '{prefix}' already exists; pass --flush to replace it.")
+
+        summary = BenchmarkSeeder(
+            companies=options["companies"],
+            branches=options["branches"],
+            products=options["products"],
+            customers=options["customers"],
+            days=options["days"],
+            sales_per_day=options["sales_per_day"],
+            max_lines=options["max_lines"],
+            prefix=prefix,
+            seed=options["seed"],
+        ).run()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Seeded {summary.companies} companies, {summary.branches} branches, {summary.products} products, "
+            f"{summary.customers} customers, {summary.sales} sales, {summary.stock_movements} stock movements "
+            f"and {summary.journal_entries} journal entries (company ids: {summary.company_ids})."
+        ))
@@ -0,0 +1,23 @@
+from datetime import date
+from django.core.management.base import BaseCommand
+from transactions.services.journal_service import JournalService
+
+
+class Command(BaseCommand):
+    help = "Snapshot every account balance from the journal (run daily, e.g. shortly after midnight)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--date",
+            type=date.fromisoformat,
+            help="Snapshot balances as of the start of this day (YYYY-MM-DD). Defaults to today.",
+        )
+        parser.add_argument(
+            "--company",
+            type=int,
+            help="Only snapshot accounts belonging to this company id.",
+        )
+
+    def handle(self, *args, **options):
+        count = JournalService.take_snapshots(as_of=options["date"], company=options["company"])
+        self.stdout.write(self.style.SUCCESS(f"Snapshotted {count} account balances."))
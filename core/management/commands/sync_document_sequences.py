@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand, CommandError
+from core.services.document_numbering.document_number_service import DOCUMENT_TYPES, DocumentNumberService
+
+
+class Command(BaseCommand):
+    help = (
+        "Move document number sequences past the numbers already issued (run after restoring or importing "
+        "documents); older random numbers are kept and cannot collide with sequence numbers"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--type",
+            action="append",
+            dest="document_types",
+            help=f"Only sync this document type (repeatable): {', '.join(DOCUMENT_TYPES)}.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report the sequences that would move without changing them.",
+        )
+
+    def handle(self, *args, **options):
+        document_types = options["document_types"]
+        unknown = [name for name in document_types or [] if name not in DOCUMENT_TYPES]
+        if unknown:
+            raise CommandError(f"Unknown document types: {', '.join(unknown)}.")
+
+        changes = DocumentNumberService.sync_sequences(document_types, apply=not options["dry_run"])
+        for change in changes:
+            self.stdout.write(
+                f"{change['document_type']} company={change['company_id'] or 'global'}: "
+                f"{change['next_value']} -> {change['new_next_value']}"
+            )
+        if options["dry_run"]:
+            self.stdout.write(self.style.WARNING(f"{len(changes)} sequences would move (dry run)."))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"Moved {len(changes)} sequences."))
@@ -0,0 +1 @@
+from .document_sequence_model import DocumentSequence
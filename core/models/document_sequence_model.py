@@ -0,0 +1,25 @@
+from django.db import models
+from config.models.create_update_base_model import CreateUpdateBaseModel
+
+
+class DocumentSequence(CreateUpdateBaseModel):
+    # Next number to hand out for a document type (see DocumentNumberService); company is null for global sequences
+    company = models.ForeignKey(
+        'company.Company', on_delete=models.CASCADE, null=True, blank=True, related_name='document_sequences'
+    )
+    document_type = models.CharField(max_length=50)
+    next_value = models.PositiveBigIntegerField(default=1)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['company', 'document_type'], name='docseq_company_type_uniq'),
+            # NULLs never conflict in the constraint above
+            models.UniqueConstraint(
+                fields=['document_type'], condition=models.Q(company__isnull=True), name='docseq_global_type_uniq'
+            ),
+        ]
+        verbose_name = "Document Sequence"
+        verbose_name_plural = "Document Sequences"
+
+    def __str__(self):
+        return f"{self.document_type} ({self.company_id or 'global'}): next {self.next_value}"
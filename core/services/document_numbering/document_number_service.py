@@ -0,0 +1,258 @@
+import re
+import threading
+from django.apps import apps
+from django.conf import settings
+from django.db import connection, models, transaction as db_transaction
+from django.db.models import F
+from django.utils import timezone
+from loguru import logger
+from core.models.document_sequence_model import DocumentSequence
+
+
+# document type -> (model, number field, prefix)
+DOCUMENT_TYPES = {
+    'product': ('inventory.Product', 'sku', 'PROD'),
+    'sales_order': ('sales.SalesOrder', 'order_number', 'SO'),
+    'account': ('accounts.Account', 'account_number', 'ACC'),
+    'sale': ('sales.Sale', 'sale_number', 'SALE'),
+    'sales_receipt': ('sales.SalesReceipt', 'receipt_number', 'RECEIPT'),
+    'transaction': ('transactions.Transaction', 'transaction_number', 'TRX'),
+    'stock_movement': ('inventory.StockMovement', 'reference_number', 'SM'),
+    'purchase_invoice': ('suppliers.PurchaseInvoice', 'invoice_number', 'PurInv'),
+}
+
+
+def format_number(prefix: str, company_id, number: int) -> str:
+    """
+    SO-12-000042: prefix, company (0 for global sequences), sequence number.
+    The company segment keeps numbers unique across tenants, and apart from the
+    older random numbers (PREFIX-<hex>), which have no second dash.
+    """
+    return f"{prefix}-{company_id or 0}-{number:06d}"
+
+
+def number_pattern(prefix: str):
+    return re.compile(rf'^{re.escape(prefix)}-(\d+)-(\d+)$')
+
+
+class _Block:
+    __slots__ = ('next', 'end')
+
+    def __init__(self, start: int, end: int):
+        self.next = start
+        self.end = end
+
+    def remaining(self) -> int:
+        return self.end - self.next
+
+    def take(self, count: int):
+        if self.remaining() < count:
+            return None
+        start = self.next
+        self.next += count
+        return range(start, start + count)
+
+
+class DocumentNumberBlocks:
+    """
+    Process-local pool of reserved number blocks by (company id, document type).
+    A block reserved inside a transaction serves that transaction straight away but only joins the
+    shared pool once it commits: if the transaction rolls back, so does the reservation, and another
+    process may be handed the same range.
+    """
+    _blocks = {}
+    _lock = threading.Lock()
+    _local = threading.local()
+
+    @classmethod
+    def _pending(cls) -> dict:
+        if not hasattr(cls._local, 'pending'):
+            cls._local.pending = {}
+        return cls._local.pending
+
+    @classmethod
+    def take(cls, key, count: int):
+        with cls._lock:
+            block = cls._blocks.get(key)
+            numbers = block.take(count) if block is not None else None
+        if numbers is not None:
+            return numbers
+        pending = cls._pending().get(key)
+        # run_on_commit is replaced on commit, rollback and savepoint rollback, which all end the block's
+        # private use: afterwards it is either in the pool or rolled back
+        if pending is not None and connection.in_atomic_block and pending[0] is connection.run_on_commit:
+            return pending[1].take(count)
+        return None
+
+    @classmethod
+    def add(cls, key, block: _Block):
+        if connection.in_atomic_block:
+            cls._pending()[key] = (connection.run_on_commit, block)
+        db_transaction.on_commit(lambda: cls._publish(key, block))
+
+    @classmethod
+    def _publish(cls, key, block: _Block):
+        with cls._lock:
+            current = cls._blocks.get(key)
+            # the smaller leftover is dropped: monotonic sequences may skip numbers
+            if current is None or current.remaining() < block.remaining():
+                cls._blocks[key] = block
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._blocks.clear()
+        cls._pending().clear()
+
+
+class DocumentNumberService:
+    """
+    Document numbers from per-(company, document type) sequences (core.DocumentSequence), replacing
+    random numbers checked with exists() queries.
+
+    Monotonic (default): each process reserves DOCUMENT_NUMBERING["BLOCK_SIZE"] numbers in one UPDATE and
+    hands them out from memory. Numbers are unique and increase within a process, but processes interleave
+    and unused numbers are skipped when a process exits.
+    Gapless (document types listed in DOCUMENT_NUMBERING["GAPLESS"]): one UPDATE per document, in the
+    caller's transaction, so a rolled-back document gives its number back. The sequence row stays locked
+    until that transaction ends, which serialises the company's documents of that type; take the number
+    inside the transaction that saves the document.
+    """
+
+    @staticmethod
+    def _config() -> dict:
+        return getattr(settings, 'DOCUMENT_NUMBERING', {})
+
+    @staticmethod
+    def is_gapless(document_type: str) -> bool:
+        return document_type in DocumentNumberService._config().get('GAPLESS', ())
+
+    @staticmethod
+    def _increment(company_id, document_type: str, size: int, now):
+        """
+        Advance a sequence by size; the first number of the reserved range, or None when there is no sequence row.
+        """
+        if connection.features.can_return_columns_from_insert:
+            table = connection.ops.quote_name(DocumentSequence._meta.db_table)
+            company_clause = "company_id IS NULL" if company_id is None else "company_id = %s"
+            params = [size, now, document_type] + ([] if company_id is None else [company_id])
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"UPDATE {table} SET next_value = next_value + %s, updated_at = %s "
+                    f"WHERE document_type = %s AND {company_clause} RETURNING next_value",
+                    params,
+                )
+                row = cursor.fetchone()
+            return row[0] - size if row else None
+
+        with db_transaction.atomic():
+            sequence = DocumentSequence.objects.select_for_update().filter(company_id=company_id, document_type=document_type)
+            start = sequence.values_list('next_value', flat=True).first()
+            if start is None:
+                return None
+            sequence.update(next_value=F('next_value') + size, updated_at=now)
+            return start
+
+    @staticmethod
+    def _reserve(company_id, document_type: str, size: int) -> int:
+        now = timezone.now()
+        start = DocumentNumberService._increment(company_id, document_type, size, now)
+        if start is None:
+            DocumentSequence.objects.bulk_create(
+                [DocumentSequence(company_id=company_id, document_type=document_type)], ignore_conflicts=True
+            )
+            start = DocumentNumberService._increment(company_id, document_type, size, now)
+        logger.debug(f"Document numbers reserved | type={document_type} | company={company_id} | from={start} | count={size}")
+        return start
+
+    @staticmethod
+    def allocate(document_type: str, company_id=None, count: int = 1) -> list[int]:
+        """
+        count consecutive sequence numbers for a document type (company_id None: the global sequence).
+        """
+        if document_type not in DOCUMENT_TYPES:
+            raise ValueError(f"Unknown document type '{document_type}'.")
+        if DocumentNumberService.is_gapless(document_type):
+            start = DocumentNumberService._reserve(company_id, document_type, count)
+            return list(range(start, start + count))
+
+        key = (company_id, document_type)
+        numbers = DocumentNumberBlocks.take(key, count)
+        if numbers is None:
+            size = max(count, DocumentNumberService._config().get('BLOCK_SIZE', 50))
+            start = DocumentNumberService._reserve(company_id, document_type, size)
+            numbers = range(start, start + count)
+            DocumentNumberBlocks.add(key, _Block(start + count, start + size))
+        return list(numbers)
+
+    @staticmethod
+    def next_numbers(document_type: str, company_id=None, count: int = 1) -> list[str]:
+        """
+        Formatted numbers, checked against the number field's max_length so an overlong number fails
+        here with a clear error rather than as a database error when the document is saved.
+        """
+        numbers = DocumentNumberService.allocate(document_type, company_id, count)
+        label, field, prefix = DOCUMENT_TYPES[document_type]
+        formatted = [format_number(prefix, company_id, number) for number in numbers]
+        max_length = apps.get_model(label)._meta.get_field(field).max_length
+        # numbers increase, so the last one is the longest
+        if formatted and len(formatted[-1]) > max_length:
+            raise ValueError(
+                f"Document number '{formatted[-1]}' is longer than {label}.{field} allows ({max_length} characters)."
+            )
+        return formatted
+
+    @staticmethod
+    def next_number(document_type: str, owner=None) -> str:
+        """
+        The next formatted number for a document. owner is the document (its company_id picks the sequence);
+        anything else, e.g. a model class, uses the global sequence.
+        """
+        company_id = owner.company_id if isinstance(owner, models.Model) else None
+        return DocumentNumberService.next_numbers(document_type, company_id)[0]
+
+    @staticmethod
+    def sync_sequences(document_types=None, apply: bool = True) -> list[dict]:
+        """
+        Move sequences past the numbers already issued in the PREFIX-<company>-<n> format
+        (restored backups, imports, rows written before a sequence row existed). Sequences are only raised.
+        Older random numbers are left as they are: they cannot collide with sequence numbers.
+        Returns the changes, applied unless apply=False.
+        """
+        changes = []
+        for document_type in document_types or DOCUMENT_TYPES:
+            label, field, prefix = DOCUMENT_TYPES[document_type]
+            pattern = number_pattern(prefix)
+            highest = {}
+            issued = (
+                apps.get_model(label).objects.filter(**{f'{field}__startswith': f'{prefix}-'})
+                .values_list(field, flat=True).iterator(chunk_size=5000)
+            )
+            for value in issued:
+                match = pattern.match(value)
+                if match:
+                    company_id = int(match.group(1)) or None
+                    highest[company_id] = max(highest.get(company_id, 0), int(match.group(2)))
+
+            current = dict(
+                DocumentSequence.objects.filter(document_type=document_type).values_list('company_id', 'next_value')
+            )
+            for company_id, number in highest.items():
+                if current.get(company_id, 1) > number:
+                    continue
+                changes.append({
+                    'document_type': document_type,
+                    'company_id': company_id,
+                    'next_value': current.get(company_id, 1),
+                    'new_next_value': number + 1,
+                })
+                if apply:
+                    DocumentSequence.objects.bulk_create(
+                        [DocumentSequence(company_id=company_id, document_type=document_type)], ignore_conflicts=True
+                    )
+                    DocumentSequence.objects.filter(
+                        company_id=company_id, document_type=document_type, next_value__lte=number
+                    ).update(next_value=number + 1, updated_at=timezone.now())
+
+        logger.info(f"Document sequences synced | changes={len(changes)} | applied={apply}")
+        return changes
@@ -1,5 +1,6 @@
 from django.contrib import admin
 from currency.models.currency_model import Currency
+from currency.models.exchange_rate_model import ExchangeRate
 
 class CurrencyAdmin(admin.ModelAdmin):
     model = Currency
@@ -16,4 +17,18 @@ class CurrencyAdmin(admin.ModelAdmin):
     list_filter = [
         'code'
     ]
-admin.site.register(Currency, CurrencyAdmin)
\ No newline at end of file
+admin.site.register(Currency, CurrencyAdmin)
+
+class ExchangeRateAdmin(admin.ModelAdmin):
+    model = ExchangeRate
+
+    list_display = [
+        'currency',
+        'rate_to_base',
+        'effective_date'
+    ]
+
+    list_filter = [
+        'currency'
+    ]
+admin.site.register(ExchangeRate, ExchangeRateAdmin)
@@ -1 +1,2 @@
-from .currency_model import Currency
\ No newline at end of file
+from .currency_model import Currency
+from .exchange_rate_model import ExchangeRate
@@ -0,0 +1,18 @@
+from django.db import models
+from config.models.create_update_base_model import CreateUpdateBaseModel
+
+
+class ExchangeRate(CreateUpdateBaseModel):
+    # Dated history of Currency.exchange_rate_to_base: the rate in force from effective_date until the next row
+    currency = models.ForeignKey('currency.Currency', on_delete=models.CASCADE, related_name='exchange_rates')
+    rate_to_base = models.DecimalField(max_digits=15, decimal_places=6, help_text="Base currency units per unit of this currency")
+    effective_date = models.DateField(help_text="First day this rate applies")
+
+    class Meta:
+        ordering = ['currency', 'effective_date']
+        unique_together = ('currency', 'effective_date')
+        verbose_name = "Exchange Rate"
+        verbose_name_plural = "Exchange Rates"
+
+    def __str__(self):
+        return f"{self.currency.code} {self.rate_to_base} from {self.effective_date}"
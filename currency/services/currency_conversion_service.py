@@ -0,0 +1,199 @@
+import copy
+import threading
+import time
+from bisect import bisect_right
+from collections import defaultdict
+from datetime import date, datetime
+from decimal import Decimal, ROUND_HALF_UP
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+from loguru import logger
+from currency.models.currency_model import Currency
+from currency.models.exchange_rate_model import ExchangeRate
+
+
+_CENT = Decimal('0.01')
+# shared across processes; bumped whenever a currency or a dated rate changes
+VERSION_CACHE_KEY = 'currency_rates:version'
+
+
+def _as_date(value):
+    if value is None or isinstance(value, date) and not isinstance(value, datetime):
+        return value
+    if timezone.is_aware(value):
+        value = timezone.localtime(value)
+    return value.date()
+
+
+class RateTable:
+    """
+    Immutable snapshot of every currency and its dated rates, as loaded for one version.
+    A rate is the number of base currency units per unit of the currency (Currency.exchange_rate_to_base).
+    """
+
+    def __init__(self, version, currencies, history):
+        self.version = version
+        self.currencies = {currency.code: currency for currency in currencies}
+        self.current = {currency.code: currency.exchange_rate_to_base for currency in currencies}
+        self.base_code = next((currency.code for currency in currencies if currency.is_base_currency), None)
+        # code -> (sorted effective dates, rates)
+        self.history = history
+        self.loaded_at = time.monotonic()
+
+    def rate(self, code: str, on=None) -> Decimal:
+        """
+        Rate of a currency to base, on a date (the rate in force that day) or now.
+        Dates before the first recorded rate use the earliest one known.
+        """
+        if code not in self.current:
+            raise ValueError(f"Unknown currency '{code}'.")
+        on = _as_date(on)
+        dates, rates = self.history.get(code, ((), ()))
+        if on is None or not dates:
+            return self.current[code]
+        return rates[max(bisect_right(dates, on) - 1, 0)]
+
+    def factor(self, from_code: str, to_code: str, on=None) -> Decimal:
+        if from_code == to_code:
+            return Decimal(1)
+        return self.rate(from_code, on) / self.rate(to_code, on)
+
+
+class CurrencyRateCache:
+    """
+    Process-local RateTable, loaded on first use (two queries) and reused for every conversion.
+    Saving a Currency or ExchangeRate bumps a shared version (see currency/signals/currency_rate_signal.py);
+    other processes notice within CURRENCY_RATES["CHECK_SECONDS"] and reload.
+    """
+    _table = None
+    _checked_at = 0.0
+    _lock = threading.RLock()
+
+    @classmethod
+    def _shared_version(cls) -> int:
+        return cache.get_or_set(VERSION_CACHE_KEY, 1, None)
+
+    @classmethod
+    def table(cls) -> RateTable:
+        check_seconds = getattr(settings, 'CURRENCY_RATES', {}).get('CHECK_SECONDS', 5)
+        table = cls._table
+        if table is not None and time.monotonic() - cls._checked_at < check_seconds:
+            return table
+        with cls._lock:
+            version = cls._shared_version()
+            if cls._table is None or cls._table.version != version:
+                cls._table = cls._load(version)
+            cls._checked_at = time.monotonic()
+            return cls._table
+
+    @classmethod
+    def _load(cls, version) -> RateTable:
+        currencies = list(Currency.objects.all())
+        history = defaultdict(lambda: ([], []))
+        rows = ExchangeRate.objects.order_by('currency_id', 'effective_date').values_list(
+            'currency__code', 'effective_date', 'rate_to_base'
+        )
+        for code, effective_date, rate in rows:
+            history[code][0].append(effective_date)
+            history[code][1].append(rate)
+        logger.info(f"Loaded currency rate table | version={version} | currencies={len(currencies)}")
+        return RateTable(version, currencies, dict(history))
+
+    @classmethod
+    def invalidate(cls):
+        with cls._lock:
+            cls._table = None
+            try:
+                cache.incr(VERSION_CACHE_KEY)
+            except ValueError:
+                cache.set(VERSION_CACHE_KEY, 2, None)
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._table = None
+
+
+class CurrencyConversionService:
+    """
+    Currency conversion against the cached rate table. Nothing here queries the database
+    once the table is loaded, so converting a report's rows costs no extra queries.
+    """
+
+    @staticmethod
+    def get_currency(code: str) -> Currency | None:
+        """
+        A copy of the cached Currency for a code, or None.
+        """
+        currency = CurrencyRateCache.table().currencies.get(code)
+        return copy.copy(currency) if currency is not None else None
+
+    @staticmethod
+    def base_code() -> str | None:
+        return CurrencyRateCache.table().base_code
+
+    @staticmethod
+    def rate(from_code: str, to_code: str, on=None) -> Decimal:
+        return CurrencyRateCache.table().factor(from_code, to_code, on)
+
+    @staticmethod
+    def convert(amount, from_code: str, to_code: str, on=None) -> Decimal:
+        """
+        Convert one amount, rounded to cents. on= uses the rates in force that day.
+        """
+        factor = CurrencyRateCache.table().factor(from_code, to_code, on)
+        return (Decimal(amount) * factor).quantize(_CENT, rounding=ROUND_HALF_UP)
+
+    @staticmethod
+    def convert_many(amounts, from_codes, to_code: str, dates=None) -> list[Decimal]:
+        """
+        Convert many amounts in one pass, e.g. the rows of a grouped report query.
+        from_codes and dates (optional) are either sequences aligned with amounts or a single value for all.
+        Each (currency, day) factor is computed once.
+        """
+        table = CurrencyRateCache.table()
+        amounts = list(amounts)
+        codes = [from_codes] * len(amounts) if isinstance(from_codes, str) else list(from_codes)
+        days = list(dates) if isinstance(dates, (list, tuple)) else [dates] * len(amounts)
+        if not len(codes) == len(days) == len(amounts):
+            raise ValueError("amounts, from_codes and dates must be the same length.")
+
+        factors = {}
+        converted = []
+        for amount, code, day in zip(amounts, codes, days):
+            key = (code, _as_date(day))
+            if key not in factors:
+                factors[key] = table.factor(code, to_code, key[1])
+            converted.append((Decimal(amount or 0) * factors[key]).quantize(_CENT, rounding=ROUND_HALF_UP))
+        return converted
+
+    @staticmethod
+    def grouped_totals(queryset, amount_field: str, group_fields, to_code: str | None = None,
+                       currency_field: str = 'currency__code', date_field: str | None = None) -> dict:
+        """
+        {group key: total in to_code} from one aggregate grouped by group fields and currency
+        (and day, when date_field is given so each day converts at its own rate).
+        to_code defaults to the base currency.
+        """
+        to_code = to_code or CurrencyConversionService.base_code()
+        group_fields = [group_fields] if isinstance(group_fields, str) else list(group_fields)
+        values = group_fields + [currency_field]
+        if date_field:
+            queryset = queryset.annotate(_conversion_day=TruncDate(date_field))
+            values.append('_conversion_day')
+        rows = list(queryset.values(*values).annotate(_conversion_total=Sum(amount_field)).order_by())
+
+        converted = CurrencyConversionService.convert_many(
+            [row['_conversion_total'] for row in rows],
+            [row[currency_field] for row in rows],
+            to_code,
+            [row['_conversion_day'] for row in rows] if date_field else None,
+        )
+        totals = defaultdict(lambda: Decimal('0.00'))
+        for row, amount in zip(rows, converted):
+            key = tuple(row[field] for field in group_fields)
+            totals[key[0] if len(key) == 1 else key] += amount
+        return dict(totals)
@@ -1,5 +1,6 @@
 from django.db import transaction as db_transaction
 from currency.models.currency_model import Currency
+from currency.services.currency_conversion_service import CurrencyConversionService
 from loguru import logger
 
 
@@ -26,6 +27,7 @@ class CurrencyService:
                 code=code,
                 symbol=symbol,
                 is_base_currency=is_base_currency,
+                exchange_rate_to_base=exchange_rate_to_base,
                 is_active=is_active,
             )
             logger.info(f"Currency created: {currency}")
@@ -88,14 +90,15 @@ class CurrencyService:
     def get_currency_by_code(*, code: str) -> Currency:
         """
         Service method to retrieve a currency by its code.
+        Served from the cached rate table (see CurrencyConversionService), not the database.
         """
         try:
-            currency = Currency.objects.get(code=code)
-            logger.info(f"Currency retrieved: {currency}")
+            currency = CurrencyConversionService.get_currency(code)
+            if currency is None:
+                logger.warning(f"Currency with code {code} does not exist")
+                return None
+            logger.debug(f"Currency retrieved: {currency}")
             return currency
-        except Currency.DoesNotExist:
-            logger.warning(f"Currency with code {code} does not exist")
-            return None
         except Exception as e:
             logger.exception("Error retrieving currency")
             raise
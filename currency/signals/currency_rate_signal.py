@@ -0,0 +1,32 @@
+# currency/signals/currency_rate_signal.py
+from django.db import transaction as db_transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from django.utils import timezone
+from currency.models.currency_model import Currency
+from currency.models.exchange_rate_model import ExchangeRate
+from currency.services.currency_conversion_service import CurrencyRateCache
+
+
+@receiver(post_save, sender=Currency, dispatch_uid='currency_rate_currency_saved')
+def currency_saved(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    # keep the dated history in step with the current rate; ExchangeRate's own signal invalidates
+    latest = instance.exchange_rates.order_by('-effective_date').values_list('rate_to_base', flat=True).first()
+    if latest is None or latest != instance.exchange_rate_to_base:
+        ExchangeRate.objects.update_or_create(
+            currency=instance,
+            effective_date=timezone.localdate(),
+            defaults={'rate_to_base': instance.exchange_rate_to_base},
+        )
+    else:
+        db_transaction.on_commit(CurrencyRateCache.invalidate)
+
+
+@receiver(post_delete, sender=Currency, dispatch_uid='currency_rate_currency_deleted')
+@receiver(post_save, sender=ExchangeRate, dispatch_uid='currency_rate_exchange_rate_saved')
+@receiver(post_delete, sender=ExchangeRate, dispatch_uid='currency_rate_exchange_rate_deleted')
+def rates_changed(sender, raw=False, **kwargs):
+    if not raw:
+        db_transaction.on_commit(CurrencyRateCache.invalidate)
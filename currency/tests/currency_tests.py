@@ -0,0 +1,58 @@
+from fixture_tests import *
+
+
+@pytest.mark.django_db
+def test_currency_conversion_uses_cached_versioned_dated_rates(django_capture_on_commit_callbacks, test_company_fixture, create_branch, test_currency_fixture, test_dc_fixture):
+    """
+    Test conversions are served from the in-memory rate table without queries, dated
+    conversions use the rate in force that day, saving a currency invalidates the table,
+    and multi-currency branch totals come from one grouped query.
+    """
+    from datetime import date
+    from decimal import Decimal
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    from django.utils import timezone
+    from currency.models import Currency, ExchangeRate
+    from currency.services.currency_conversion_service import CurrencyConversionService
+    from currency.services.currency_service import CurrencyService
+    from transactions.services.transaction_query_service import TransactionQueryService
+
+    with django_capture_on_commit_callbacks(execute=True):
+        zwg = Currency.objects.create(code='ZWG', name='Zimbabwe Gold', symbol='ZiG', exchange_rate_to_base=Decimal('0.04'))
+        ExchangeRate.objects.create(currency=zwg, effective_date=date(2020, 1, 1), rate_to_base=Decimal('0.05'))
+    assert ExchangeRate.objects.filter(currency=zwg, effective_date=timezone.localdate()).exists()
+
+    assert CurrencyConversionService.convert(100, 'ZWG', 'USD') == Decimal('4.00')
+    with CaptureQueriesContext(connection) as queries:
+        converted = CurrencyConversionService.convert_many(
+            [Decimal('100'), Decimal('100'), Decimal('10')], ['ZWG', 'ZWG', 'USD'], 'USD',
+            [date(2021, 6, 1), timezone.localdate(), date(2021, 6, 1)],
+        )
+        assert CurrencyConversionService.convert(Decimal('1.00'), 'USD', 'ZWG') == Decimal('25.00')
+        assert CurrencyService.get_currency_by_code(code='ZWG').symbol == 'ZiG'
+    assert converted == [Decimal('5.00'), Decimal('4.00'), Decimal('10.00')]
+    assert len(queries.captured_queries) == 0
+
+    with django_capture_on_commit_callbacks(execute=True):
+        zwg.exchange_rate_to_base = Decimal('0.02')
+        zwg.save()
+    assert CurrencyConversionService.convert(100, 'ZWG', 'USD') == Decimal('2.00')
+    assert CurrencyConversionService.convert(100, 'ZWG', 'USD', on=date(2021, 6, 1)) == Decimal('5.00')
+
+    for amount, currency in ((Decimal('10.00'), test_currency_fixture), (Decimal('100.00'), zwg)):
+        Transaction.objects.create(
+            company=test_company_fixture,
+            branch=create_branch,
+            debit_account=test_dc_fixture['debit'],
+            credit_account=test_dc_fixture['credit'],
+            transaction_type='CASH',
+            transaction_direction='INCOMING',
+            transaction_category='CASH SALE',
+            currency=currency,
+            total_amount=amount,
+        )
+    with CaptureQueriesContext(connection) as queries:
+        totals = TransactionQueryService.get_branch_totals(test_company_fixture, status=None)
+    assert totals == {create_branch.id: Decimal('12.00')}
+    assert len(queries.captured_queries) == 1
@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework import status
@@ -10,7 +11,7 @@ from rest_framework_simplejwt.authentication import JWTAuthentication
 from loguru import logger
 
 
-class CurrencyViewSet(ModelViewSet):
+class CurrencyViewSet(EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for managing currencies.
     All operations are routed through CurrencyService.
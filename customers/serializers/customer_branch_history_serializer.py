@@ -5,9 +5,11 @@ from loguru import logger
 from branch.models.branch_model import Branch
 from customers.models.customer_model import Customer
 from customers.models.customer_branch_history_model import CustomerBranchHistory
+from config.eager_loading.eager_loading import EagerLoadingSerializerMixin
 
 
-class CustomerBranchHistorySerializer(CompanyValidationMixin, serializers.ModelSerializer):
+class CustomerBranchHistorySerializer(EagerLoadingSerializerMixin, CompanyValidationMixin, serializers.ModelSerializer):
+    select_related_fields = ('branch__company',)
     company_summary = serializers.SerializerMethodField(read_only=True)
     branch_summary = serializers.SerializerMethodField(read_only=True)
     customer_summary = serializers.SerializerMethodField(read_only=True)
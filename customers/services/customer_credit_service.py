@@ -196,14 +196,16 @@ class CustomerCreditService:
     def get_customer_statement(customer, start_date, end_date):
         """
         Retrieve all transactions for a customer within a date range.
+        Either bound may be None, leaving that side of the range open.
         """
         try:
-            transactions = Transaction.objects.filter(
-                customer=customer,
-                transaction_date__range=(start_date, end_date)
-            ).order_by('-transaction_date')
+            transactions = Transaction.objects.filter(customer=customer, company=customer.company)
+            if start_date:
+                transactions = transactions.filter(transaction_date__date__gte=start_date)
+            if end_date:
+                transactions = transactions.filter(transaction_date__date__lte=end_date)
 
-            return transactions
+            return transactions.order_by('-transaction_date')
 
         except Exception as e:
             logger.exception(
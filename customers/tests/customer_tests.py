@@ -180,3 +180,53 @@ def test_customer_action_endpoints(client, test_user_token, test_customer_fixtur
     )
     logger.info(response.json())
     assert response.status_code == 500 # Problem
+
+
+@pytest.mark.django_db
+def test_customer_statement_export_is_scoped_to_the_callers_company(
+    test_company_fixture, create_branch, test_currency_fixture, test_dc_fixture, test_customer_fixture
+):
+    """
+    Test a statement export streams the customer's transactions without dates given, and a user
+    of another company gets a 404 for the same customer id.
+    """
+    import csv
+    import io
+    from decimal import Decimal
+    from rest_framework.test import APIClient
+
+    Transaction.objects.create(
+        company=test_company_fixture,
+        branch=create_branch,
+        customer=test_customer_fixture,
+        debit_account=test_dc_fixture['debit'],
+        credit_account=test_dc_fixture['credit'],
+        transaction_type='CASH',
+        transaction_direction='INCOMING',
+        transaction_category='CASH SALE',
+        total_amount=Decimal('25.00'),
+    )
+    url = reverse('customer-statement', kwargs={'customer_id': test_customer_fixture.id})
+
+    owner = User.objects.create_user(
+        username='statement', email='statement@example.com', password='statement', company=test_company_fixture,
+        branch=create_branch, role='Manager', first_name='Statement'
+    )
+    api_client = APIClient()
+    api_client.force_authenticate(user=owner)
+    response = api_client.get(url, {'export_format': 'csv'})
+    assert response.status_code == 200
+    rows = list(csv.DictReader(io.StringIO(b''.join(response.streaming_content).decode('utf-8'))))
+    assert [row['total_amount'] for row in rows] == ['25.00']
+
+    other_company = Company.objects.create(
+        name='Other Company', email='other@example.com', address='1 Other Road', phone_number='+263700000001'
+    )
+    other_branch = Branch.objects.create(name='Other Branch', company=other_company, code='OTH-001')
+    outsider = User.objects.create_user(
+        username='outsider', email='outsider@example.com', password='outsider', company=other_company,
+        branch=other_branch, role='Manager', first_name='Outsider'
+    )
+    api_client.force_authenticate(user=outsider)
+    assert api_client.get(url, {'export_format': 'csv'}).status_code == 404
+    assert api_client.get(url).status_code == 404
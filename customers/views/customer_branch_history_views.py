@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from rest_framework.filters import SearchFilter, OrderingFilter
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework.response import Response
@@ -14,7 +15,7 @@ from config.pagination.pagination import StandardResultsSetPagination
 from config.utilities.get_queryset import get_company_queryset
 from loguru import logger
 
-class CustomerBranchHistoryViewSet(ModelViewSet):
+class CustomerBranchHistoryViewSet(EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for managing CustomerBranchHistory.
     Supports listing, retrieving, creating, updating, and deleting.
@@ -8,6 +8,9 @@ from datetime import datetime
 from customers.services.customer_credit_service import CustomerCreditService
 from customers.models.customer_model import Customer
 from customers.permissions.manage_customers_permission import ManageCustomersPermission
+from config.utilities.get_company_or_user_company import get_expected_company
+from config.export.streaming_export import EXPORT_FORMATS, StreamingExport
+from transactions.services.transaction_query_service import TRANSACTION_EXPORT_COLUMNS
 from config.auth.jwt_token_authentication import (
     CompanyCookieJWTAuthentication,
     UserCookieJWTAuthentication,
@@ -25,10 +28,12 @@ class CustomerStatementView(APIView):
     def get(self, request, customer_id, *args, **kwargs):
         """
         Retrieve the statement for a given customer within an optional date range.
-        Query params: start_date, end_date (YYYY-MM-DD)
+        Query params: start_date, end_date (YYYY-MM-DD),
+        export_format (csv | ndjson) to download the statement as a streamed file
         """
         try:
-            customer = Customer.objects.get(id=customer_id)
+            # APIView: has_object_permission never runs, so scope the lookup to the caller's company
+            customer = Customer.objects.get(id=customer_id, company=get_expected_company(request))
         except Customer.DoesNotExist:
             return Response(
                 {"error": "Customer not found."},
@@ -52,6 +57,16 @@ class CustomerStatementView(APIView):
 
         try:
             statement = CustomerCreditService.get_customer_statement(customer, start_date, end_date)
+            export_format = request.query_params.get("export_format")
+            if export_format:
+                if export_format not in EXPORT_FORMATS:
+                    return Response(
+                        {"error": f"export_format must be one of: {', '.join(EXPORT_FORMATS)}"},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+                return StreamingExport.response(
+                    request, statement, TRANSACTION_EXPORT_COLUMNS, f"statement_{customer_id}", export_format
+                )
             return Response(
                 {"customer_id": customer_id, "statement": statement},
                 status=status.HTTP_200_OK,
@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
@@ -11,7 +12,7 @@ from rest_framework.filters import SearchFilter, OrderingFilter
 from users.models.user_model import User
 from company.models.company_model import Company
 
-class CustomerViewSet(ModelViewSet):
+class CustomerViewSet(EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for viewing customers.
     Supports listing and retrieving customer details.
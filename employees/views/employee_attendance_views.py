@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework import status
@@ -13,7 +14,7 @@ from loguru import logger
 from company.models.company_model import Company
 
 
-class EmployeeAttendanceViewSet(ModelViewSet):
+class EmployeeAttendanceViewSet(EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for viewing and managing employee attendance.
     Supports listing, retrieving, creating, updating, and deleting attendance records.
@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework import status
@@ -15,7 +16,7 @@ from company.models.company_model import Company
 
 
 
-class EmployeeBudgetViewSet(ModelViewSet):
+class EmployeeBudgetViewSet(EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for viewing and managing employee budgets.
     Supports listing, retrieving, creating, updating, and deleting budgets.
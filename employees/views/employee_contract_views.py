@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from employees.models.employee_contract_model import EmployeeContract
 from employees.serializers.employee_contract_serializer import EmployeeContractSerializer
 from config.auth.jwt_token_authentication import CompanyCookieJWTAuthentication, UserCookieJWTAuthentication
@@ -11,7 +12,7 @@ from loguru import logger
 from django.db.models import Q
 
 
-class EmployeeContractViewSet(ModelViewSet):
+class EmployeeContractViewSet(EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for viewing and managing employee contracts.
     Supports listing, retrieving, creating, updating, and deleting contracts.
@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.parsers import MultiPartParser, FormParser
@@ -12,7 +13,7 @@ from company.models.company_model import Company
 from loguru import logger
 
 
-class EmployeeDocumentViewSet(ModelViewSet):
+class EmployeeDocumentViewSet(EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for viewing and managing employee documents.
     Supports listing, retrieving, creating (single/multiple), updating, and deleting documents.
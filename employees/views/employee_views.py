@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from employees.models.employee_model import Employee
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -15,7 +16,7 @@ from loguru import logger
 from django.db.models import Q
 
 
-class EmployeeViewSet(ModelViewSet):
+class EmployeeViewSet(EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for viewing and managing employees.
     Supports listing, retrieving, creating, updating, and deleting employees.
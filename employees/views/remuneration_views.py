@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from rest_framework.filters import SearchFilter, OrderingFilter
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from employees.models.employee_remuneration_model import Remuneration
@@ -11,7 +12,7 @@ from loguru import logger
 from django.db.models import Q
 
 
-class RemunerationViewSet(ModelViewSet):
+class RemunerationViewSet(EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for viewing and managing remunerations.
     Supports listing, retrieving, creating, updating, and deleting remunerations.
@@ -862,4 +862,112 @@ def test_expense_fixture(test_company_fixture, create_branch, create_user):
         category = "TRAVEL",
         amount = 10000.00,
         incurred_by = create_user
-    )
\ No newline at end of file
+    )
+
+#=========================================
+# Currency Fixture
+#=========================================
+@pytest.fixture()
+def test_currency_fixture():
+    """
+    Creates and returns the base Currency (id=1, the default on most models).
+    """
+    from currency.models import Currency
+    return Currency.objects.create(
+        id = 1,
+        code = 'USD',
+        name = 'US Dollar',
+        symbol = '$',
+        is_base_currency = True,
+        exchange_rate_to_base = 1
+    )
+
+
+#=========================================
+# Stocked Products Fixture
+#=========================================
+@pytest.fixture()
+def test_stocked_products_fixture(test_company_fixture, create_branch, test_product_category_fixture, test_currency_fixture):
+    """
+    Creates and returns three Products each holding 10 units of stock in the branch.
+    """
+    products = []
+    for name in ['Bread', 'Milk', 'Airtime']:
+        product = Product.objects.create(
+            company = test_company_fixture,
+            branch = create_branch,
+            name = name,
+            description = f'{name} for testing',
+            unit_price = 2,
+            product_category = test_product_category_fixture
+        )
+        ProductStock.objects.create(
+            company = test_company_fixture,
+            branch = create_branch,
+            product = product,
+            quantity = 10
+        )
+        products.append(product)
+    return products
+
+
+#===========================================
+# PROCESS CACHES Fixture
+#===========================================
+@pytest.fixture(autouse=True)
+def reset_process_caches():
+    """
+    Test databases are rolled back without delete signals, so the Django cache and every
+    in-process cache or registry (ledger accounts, search indexes, rates, principals, number
+    blocks, signing keys, dispatch counters, channel connections) are reset between tests.
+    """
+    from django.core.cache import cache
+    from accounts.services.ledger_account_resolver import LedgerAccountResolver
+    from inventory.services.product_search.product_search_index import ProductSearchIndex
+    from currency.services.currency_conversion_service import CurrencyRateCache
+    from config.auth.principal_cache import PrincipalCache
+    from core.services.document_numbering.document_number_service import DocumentNumberBlocks
+    from taxes.services.fiscalisation.fiscal_signing_service import FiscalSigningKeyCache
+    from taxes.services.fiscalisation.fiscalisation_outbox_service import FiscalisationMetrics
+    from notifications.services.dispatch.rate_limiter import RateLimiter
+    from notifications.services.dispatch.notification_dispatch_service import NotificationDispatchMetrics
+    from notifications.services.dispatch.channels import EmailChannel, WhatsAppChannel
+    cache.clear()
+    LedgerAccountResolver.clear_local()
+    ProductSearchIndex.clear()
+    CurrencyRateCache.clear()
+    PrincipalCache.clear()
+    DocumentNumberBlocks.clear()
+    FiscalSigningKeyCache.clear()
+    FiscalisationMetrics.clear()
+    RateLimiter.clear()
+    NotificationDispatchMetrics.clear()
+    EmailChannel.reset()
+    WhatsAppChannel.reset()
+    yield
+
+
+#===========================================
+# QUERY COUNT Helpers
+#===========================================
+def assert_list_queries_constant(api_client, url, small=1, large=10, **params):
+    """
+    Fail when a list endpoint's query count grows with its page size (an N+1 in the serializer).
+    Requests the endpoint at page_size=small and page_size=large and compares the SQL statements issued.
+    """
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    counts = {}
+    for page_size in (small, large):
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(url, {**params, 'page_size': page_size})
+        assert response.status_code == 200, response.content
+        rows = response.data.get('results', response.data) if isinstance(response.data, dict) else response.data
+        assert len(rows) == page_size, f"need at least {large} rows to compare page sizes, got {len(rows)}"
+        counts[page_size] = len([q for q in queries.captured_queries if 'SAVEPOINT' not in q['sql']])
+
+    assert counts[small] == counts[large], (
+        f"{url}: {counts[small]} queries for {small} row(s) but {counts[large]} for {large}"
+    )
+    return counts
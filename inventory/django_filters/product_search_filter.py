@@ -0,0 +1,20 @@
+from rest_framework.filters import SearchFilter
+from company.models.company_model import Company
+from inventory.services.product_search.product_search_service import ProductSearchService
+
+
+class ProductSearchFilter(SearchFilter):
+    """
+    ?search= for products through ProductSearchService (indexed, ranked)
+    instead of SearchFilter's icontains over search_fields.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        term = request.query_params.get(self.search_param, '').strip()
+        if not term:
+            return queryset
+        user = request.user
+        company = getattr(user, 'company', None) or (user if isinstance(user, Company) else None)
+        if company is None:
+            return queryset.none()
+        return ProductSearchService.filter_queryset(queryset, company, term)
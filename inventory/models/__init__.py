@@ -7,4 +7,6 @@ from .stock_take_approval_model import StockTakeApproval
 from .stock_take_item_model import StockTakeItem
 from .stock_take_model import StockTake
 from .stock_writeoff_item_model import StockWriteOffItem
-from .stock_writeoff_model import StockWriteOff
\ No newline at end of file
+from .stock_writeoff_model import StockWriteOff
+from .product_import_job_model import ProductImportJob
+from .catalogue_change_model import CatalogueChange
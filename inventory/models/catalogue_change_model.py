@@ -0,0 +1,33 @@
+from django.db import models
+
+
+class CatalogueChange(models.Model):
+    """
+    Append-only change feed for the till catalogue.
+    The auto-increment id is the catalogue's monotonic change sequence: a terminal holding
+    version N asks for the changes with id > N. Stock rows are keyed by product id.
+    """
+
+    class Kind(models.TextChoices):
+        PRODUCT = 'product', 'Product'
+        CATEGORY = 'category', 'Category'
+        STOCK = 'stock', 'Stock'
+
+    id = models.BigAutoField(primary_key=True)
+    company = models.ForeignKey('company.Company', on_delete=models.CASCADE, related_name='catalogue_changes')
+    # null for company-wide categories, which every branch's catalogue includes
+    branch = models.ForeignKey('branch.Branch', on_delete=models.CASCADE, null=True, blank=True, related_name='catalogue_changes')
+    kind = models.CharField(max_length=10, choices=Kind.choices)
+    object_id = models.BigIntegerField()
+    deleted = models.BooleanField(default=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['id']
+        indexes = [
+            models.Index(fields=['company', 'id'], name='catalogue_change_seq_idx'),
+            models.Index(fields=['company', 'branch', 'kind', 'object_id'], name='catalogue_change_obj_idx'),
+        ]
+
+    def __str__(self):
+        return f"CatalogueChange {self.id} ({self.kind} {self.object_id}{' deleted' if self.deleted else ''})"
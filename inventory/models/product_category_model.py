@@ -35,6 +35,14 @@ class ProductCategory(CreateUpdateBaseModel):
             models.Index(fields=['company', 'branch', 'name']),
         ]
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # branch as loaded, so the catalogue feed can tell the old branch's terminals when it moves
+        if 'branch_id' in instance.__dict__:
+            instance._loaded_branch_id = instance.branch_id
+        return instance
+
     def __str__(self):
         if self.branch:
             return f"{self.name} ({self.branch.name})"
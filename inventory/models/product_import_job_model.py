@@ -0,0 +1,40 @@
+from django.db import models
+from config.models.create_update_base_model import CreateUpdateBaseModel
+
+
+class ProductImportJob(CreateUpdateBaseModel):
+    """
+    A product CSV import run in the background.
+    Progress counters are updated after every chunk so clients can poll it.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = 'PENDING', 'Pending'
+        RUNNING = 'RUNNING', 'Running'
+        COMPLETED = 'COMPLETED', 'Completed'
+        FAILED = 'FAILED', 'Failed'
+
+    company = models.ForeignKey('company.Company', on_delete=models.CASCADE, related_name='product_import_jobs')
+    branch = models.ForeignKey('branch.Branch', on_delete=models.CASCADE, related_name='product_import_jobs')
+    requested_by = models.ForeignKey('users.User', on_delete=models.SET_NULL, null=True, blank=True, related_name='product_import_jobs')
+    file = models.FileField(upload_to='product_imports/%Y/%m/%d/')
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.PENDING)
+    chunk_size = models.PositiveIntegerField(default=1000)
+    create_missing_categories = models.BooleanField(default=False)
+    rows_processed = models.PositiveIntegerField(default=0)
+    created_count = models.PositiveIntegerField(default=0)
+    updated_count = models.PositiveIntegerField(default=0)
+    failed_count = models.PositiveIntegerField(default=0)
+    failures = models.JSONField(default=list, blank=True, help_text="Sample of failed rows (row number, sku, error)")
+    error = models.TextField(blank=True, null=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['company', '-created_at']),
+        ]
+
+    def __str__(self):
+        return f"ProductImportJob {self.id} ({self.status})"
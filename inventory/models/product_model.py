@@ -1,6 +1,6 @@
 from django.db import models
 from config.models.create_update_base_model import CreateUpdateBaseModel
-import uuid
+from core.services.document_numbering.document_number_service import DocumentNumberService
 
 
 
@@ -25,13 +25,22 @@ class Product(CreateUpdateBaseModel):
     class Meta:
         unique_together = ('company', 'branch', 'sku')  # SKU unique per company
         ordering = ['name']
+        indexes = [
+            # barcode / SKU scans at the till search the whole company
+            models.Index(fields=['company', 'sku'], name='product_co_sku_idx'),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # branch as loaded, so the catalogue feed can tell the old branch's terminals when it moves
+        if 'branch_id' in instance.__dict__:
+            instance._loaded_branch_id = instance.branch_id
+        return instance
 
     def generate_sku(self):
-        while True:
-            sku_candidate = f"{self.PREFIX}-{str(uuid.uuid4()).split('-')[0].upper()}"
-            if not Product.objects.filter(company=self.company, sku=sku_candidate).exists():
-                self.sku = sku_candidate
-                break
+        self.sku = DocumentNumberService.next_number('product', self)
+        return self.sku
     
     def update_stock_take_item_status(self):
         """
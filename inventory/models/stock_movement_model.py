@@ -1,7 +1,8 @@
 from django.db import models
+from django.utils import timezone
 from config.models.create_update_base_model import CreateUpdateBaseModel
 from loguru import logger
-import uuid
+from core.services.document_numbering.document_number_service import DocumentNumberService
 
 
 class StockMovement(CreateUpdateBaseModel):
@@ -10,6 +11,7 @@ class StockMovement(CreateUpdateBaseModel):
     class MovementType(models.TextChoices):
         PURCHASE = "PURCHASE", "Purchase"
         SALE = "SALE", "Sale"
+        VOIDED_SALE = "VOIDED_SALE", "Voided Sale"
 
         TRANSFER_IN = "TRANSFER_IN", "Transfer In"
         TRANSFER_OUT = "TRANSFER_OUT", "Transfer Out"
@@ -44,11 +46,12 @@ class StockMovement(CreateUpdateBaseModel):
         help_text="Type of stock movement"
     )
     quantity = models.IntegerField()  # Positive for stock in, negative for stock out
+    movement_date = models.DateTimeField(default=timezone.now)
     reason = models.TextField(blank=True, null=True, help_text="Reason for the stock movement, if applicable")
     reference_number = models.CharField(max_length=100, editable=False, unique=True)
 
     def generate_reference_number(self):
-        reference_number = f'{self.PREFIX}-{str(uuid.uuid4()).split("-")[0].upper()}'
+        reference_number = DocumentNumberService.next_number('stock_movement', self)
         logger.info(f"Generated reference number successfully: {reference_number}")
         return reference_number
     
@@ -74,4 +77,8 @@ class StockMovement(CreateUpdateBaseModel):
         indexes = [
             models.Index(fields=['product']),
             models.Index(fields=['movement_type']),
+            # tenant listings: filtered by company (+ branch / product / type), newest first
+            models.Index(fields=['company', 'branch', '-movement_date'], name='stockmove_co_br_date_idx'),
+            models.Index(fields=['company', 'product', '-movement_date'], name='stockmove_co_prod_date_idx'),
+            models.Index(fields=['company', 'movement_type', '-movement_date'], name='stockmove_co_type_date_idx'),
         ]
\ No newline at end of file
@@ -28,4 +28,4 @@ class CategoryField(serializers.Field):
     def to_representation(self, value):
         if not value:
             return None
-        return {id: value.id, 'name': value.name}
\ No newline at end of file
+        return {'id': value.id, 'name': value.name}
\ No newline at end of file
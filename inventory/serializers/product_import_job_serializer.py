@@ -0,0 +1,23 @@
+from rest_framework import serializers
+from inventory.models.product_import_job_model import ProductImportJob
+
+
+class ProductImportJobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ProductImportJob
+        fields = [
+            'id',
+            'branch',
+            'status',
+            'rows_processed',
+            'created_count',
+            'updated_count',
+            'failed_count',
+            'failures',
+            'error',
+            'started_at',
+            'finished_at',
+            'created_at',
+            'updated_at',
+        ]
+        read_only_fields = fields
@@ -6,7 +6,7 @@ from inventory.serializers.category_field import CategoryField
 class ProductSerializer(serializers.ModelSerializer):
     company_summary = serializers.SerializerMethodField(read_only = True)
     branch_summary = serializers.SerializerMethodField(read_only = True)
-    category = CategoryField(required=False, allow_null=True)
+    category = CategoryField(source='product_category', required=False, allow_null=True)
 
     class Meta:
         model = Product
@@ -17,7 +17,7 @@ class ProductSerializer(serializers.ModelSerializer):
             'name',
             'description',
             'sku',
-            'price',
+            'unit_price',
             'stock',
             'is_stock_take_item',
             'category',
@@ -38,7 +38,7 @@ class ProductSerializer(serializers.ModelSerializer):
             'name': obj.branch.name
         }
 
-    def validate_price(self, value):
+    def validate_unit_price(self, value):
         if value < 0:
             raise serializers.ValidationError("Price must be a positive value")
         return value
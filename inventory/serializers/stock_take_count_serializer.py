@@ -0,0 +1,13 @@
+from rest_framework import serializers
+
+
+class StockTakeCountLineSerializer(serializers.Serializer):
+    product_id = serializers.IntegerField()
+    counted_quantity = serializers.IntegerField(min_value=0)
+    expected_quantity = serializers.IntegerField(min_value=0, required=False, allow_null=True)
+
+
+class StockTakeCountSerializer(serializers.Serializer):
+    lines = StockTakeCountLineSerializer(many=True, allow_empty=False)
+    confirm = serializers.BooleanField(default=False, help_text="Confirm the lines written by this request")
+    reconcile = serializers.BooleanField(default=True, help_text="Adjust counts for stock moved during the count")
@@ -1,8 +1,10 @@
 from rest_framework import serializers
 from inventory.models.stock_take_item_model import StockTakeItem
+from config.eager_loading.eager_loading import EagerLoadingSerializerMixin
 
 
-class StockTakeItemSerializer(serializers.ModelSerializer):
+class StockTakeItemSerializer(EagerLoadingSerializerMixin, serializers.ModelSerializer):
+    select_related_fields = ('stock_take__company',)
     company_summary = serializers.SerializerMethodField(read_only = True)
     product_name = serializers.CharField(source='product.name', read_only=True)
     discrepancy = serializers.IntegerField(read_only=True)
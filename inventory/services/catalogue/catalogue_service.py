@@ -0,0 +1,213 @@
+import gzip
+import json
+from datetime import timedelta
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Exists, OuterRef, Q
+from django.utils import timezone
+from loguru import logger
+from inventory.models.catalogue_change_model import CatalogueChange
+from inventory.models.product_category_model import ProductCategory
+from inventory.models.product_model import Product
+from inventory.models.product_stock_model import ProductStock
+
+
+# compact column layout shared by snapshots and deltas: {"fields": [...], "rows": [[...], ...]}
+PRODUCT_FIELDS = ('id', 'sku', 'name', 'description', 'unit_price', 'currency_id', 'product_category_id', 'updated_at')
+CATEGORY_FIELDS = ('id', 'name', 'branch_id', 'updated_at')
+STOCK_FIELDS = ('product_id', 'quantity', 'reorder_level', 'updated_at')
+
+
+class CatalogueService:
+    """
+    Branch catalogue for POS terminals.
+    - snapshot: every product, category and stock level of a branch as one gzip-compressed,
+      versioned JSON bundle (cached per version)
+    - delta: only the rows changed since a version, read from the CatalogueChange feed
+    A version is a CatalogueChange id. Changes newer than CATALOGUE_SYNC["SETTLE_SECONDS"] are sent
+    but not counted in the returned version, so a write whose transaction committed late
+    (with a lower id) is still picked up by the next delta. Re-sent rows are idempotent upserts.
+    """
+
+    @staticmethod
+    def _config() -> dict:
+        return getattr(settings, 'CATALOGUE_SYNC', {})
+
+    # -------------------------
+    # CHANGE FEED
+    # -------------------------
+    @staticmethod
+    def record(company_id, kind: str, keys, deleted: bool = False) -> int:
+        """
+        Append changes for (branch_id, object_id) keys, e.g. after a bulk write that bypasses the save signals.
+        Runs in the caller's transaction so a rolled back write leaves no change behind.
+        """
+        changes = [
+            CatalogueChange(company_id=company_id, branch_id=branch_id, kind=kind, object_id=object_id, deleted=deleted)
+            for branch_id, object_id in set(keys)
+        ]
+        if changes:
+            CatalogueChange.objects.bulk_create(changes)
+        return len(changes)
+
+    @staticmethod
+    def current_version(company) -> int:
+        """
+        The newest change id that has settled: every change up to it is committed or abandoned.
+        """
+        cutoff = timezone.now() - timedelta(seconds=CatalogueService._config().get('SETTLE_SECONDS', 2))
+        recent = (
+            CatalogueChange.objects.filter(company=company)
+            .order_by('-id')
+            .values_list('id', 'created_at')
+            .iterator(chunk_size=200)
+        )
+        version = 0
+        for change_id, created_at in recent:
+            version = change_id - 1
+            if created_at <= cutoff:
+                return change_id
+        return version
+
+    @staticmethod
+    def compact(company=None) -> int:
+        """
+        Delete change rows superseded by a later change to the same object.
+        Deltas stay correct from any version, since only the newest change per object matters.
+        """
+        later = CatalogueChange.objects.filter(
+            company=OuterRef('company'),
+            branch=OuterRef('branch'),
+            kind=OuterRef('kind'),
+            object_id=OuterRef('object_id'),
+            id__gt=OuterRef('id'),
+        )
+        queryset = CatalogueChange.objects.filter(Exists(later))
+        if company is not None:
+            queryset = queryset.filter(company=company)
+        deleted, _ = queryset.delete()
+        logger.info(f"Compacted catalogue changes | company={getattr(company, 'id', 'all')} | deleted={deleted}")
+        return deleted
+
+    # -------------------------
+    # ROWS
+    # -------------------------
+    @staticmethod
+    def _table(queryset, fields) -> dict:
+        return {
+            'fields': list(fields),
+            'rows': [list(row) for row in queryset.values_list(*fields).iterator(chunk_size=2000)],
+        }
+
+    @staticmethod
+    def _products(company, branch):
+        return Product.objects.filter(company=company, branch=branch).order_by('id')
+
+    @staticmethod
+    def _categories(company, branch):
+        return ProductCategory.objects.filter(Q(branch=branch) | Q(branch__isnull=True), company=company).order_by('id')
+
+    @staticmethod
+    def _stock(company, branch):
+        return ProductStock.objects.filter(company=company, branch=branch).order_by('product_id')
+
+    @staticmethod
+    def encode(payload: dict) -> bytes:
+        return gzip.compress(
+            json.dumps(payload, cls=DjangoJSONEncoder, separators=(',', ':')).encode('utf-8'),
+            compresslevel=6,
+        )
+
+    # -------------------------
+    # SNAPSHOT
+    # -------------------------
+    @staticmethod
+    def build_snapshot(company, branch, version: int | None = None) -> dict:
+        # the version is read before the rows: anything written meanwhile is replayed by the next delta
+        if version is None:
+            version = CatalogueService.current_version(company)
+        return {
+            'version': version,
+            'generated_at': timezone.now(),
+            'company': company.id,
+            'branch': branch.id,
+            'categories': CatalogueService._table(CatalogueService._categories(company, branch), CATEGORY_FIELDS),
+            'products': CatalogueService._table(CatalogueService._products(company, branch), PRODUCT_FIELDS),
+            'stock': CatalogueService._table(CatalogueService._stock(company, branch), STOCK_FIELDS),
+        }
+
+    @staticmethod
+    def snapshot(company, branch) -> tuple[int, bytes]:
+        """
+        (version, gzip-compressed JSON snapshot) for a branch. Terminals asking for the same
+        version share one cached bundle; any catalogue write moves the version on.
+        """
+        version = CatalogueService.current_version(company)
+        key = f'catalogue_snapshot:{company.id}:{branch.id}:{version}'
+        body = cache.get(key)
+        if body is None:
+            payload = CatalogueService.build_snapshot(company, branch, version)
+            body = CatalogueService.encode(payload)
+            cache.set(key, body, CatalogueService._config().get('SNAPSHOT_CACHE_SECONDS', 300))
+            logger.info(
+                f"Built catalogue snapshot | company={company.id} | branch={branch.id} | version={payload['version']} "
+                f"| products={len(payload['products']['rows'])} | bytes={len(body)}"
+            )
+        return version, body
+
+    # -------------------------
+    # DELTA
+    # -------------------------
+    @staticmethod
+    def changes_since(company, branch, since: int) -> dict:
+        """
+        Rows changed in a branch catalogue since a version, plus the ids deleted since then.
+        reset=True tells the terminal to take a fresh snapshot instead (too many changes,
+        or a version this feed never issued).
+        """
+        max_changes = CatalogueService._config().get('MAX_DELTA_CHANGES', 5000)
+        cutoff = timezone.now() - timedelta(seconds=CatalogueService._config().get('SETTLE_SECONDS', 2))
+        changes = list(
+            CatalogueChange.objects
+            .filter(Q(branch=branch) | Q(branch__isnull=True), company=company, id__gt=since)
+            .order_by('id')
+            .values_list('id', 'kind', 'object_id', 'deleted', 'created_at')[:max_changes + 1]
+        )
+        payload = {'since': since, 'version': since, 'reset': False}
+        never_issued = not changes and since > 0 and not CatalogueChange.objects.filter(company=company, id__gte=since).exists()
+        if len(changes) > max_changes or never_issued:
+            payload.update(reset=True, version=CatalogueService.current_version(company))
+            return payload
+
+        # latest change per object wins; the version stops before the first unsettled change
+        latest = {}
+        settled = True
+        for change_id, kind, object_id, deleted, created_at in changes:
+            latest[(kind, object_id)] = deleted
+            settled = settled and created_at <= cutoff
+            if settled:
+                payload['version'] = change_id
+
+        def touched(kind):
+            return {object_id for (change_kind, object_id), deleted in latest.items() if change_kind == kind and not deleted}
+
+        def removed(kind):
+            return {object_id for (change_kind, object_id), deleted in latest.items() if change_kind == kind and deleted}
+
+        sections = (
+            ('categories', CatalogueChange.Kind.CATEGORY, CatalogueService._categories(company, branch), 'id', CATEGORY_FIELDS),
+            ('products', CatalogueChange.Kind.PRODUCT, CatalogueService._products(company, branch), 'id', PRODUCT_FIELDS),
+            ('stock', CatalogueChange.Kind.STOCK, CatalogueService._stock(company, branch), 'product_id', STOCK_FIELDS),
+        )
+        payload['deleted'] = {}
+        for name, kind, queryset, key_field, fields in sections:
+            ids = touched(kind)
+            table = CatalogueService._table(queryset.filter(**{f'{key_field}__in': ids}), fields) if ids else {
+                'fields': list(fields), 'rows': []
+            }
+            payload[name] = table
+            # a row that is gone (or left this branch) counts as deleted for the terminal
+            found = {row[0] for row in table['rows']}
+            payload['deleted'][name] = sorted(removed(kind) | (ids - found))
+        return payload
@@ -0,0 +1,97 @@
+from django.conf import settings
+from django.db import transaction as db_transaction
+from django.utils import timezone
+from loguru import logger
+from inventory.models.product_import_job_model import ProductImportJob
+from inventory.services.product.product_import_service import ProductImportService, DEFAULT_CHUNK_SIZE
+
+
+class ProductImportJobService:
+    """
+    Queue, run and report product CSV import jobs.
+    In "celery" mode the request only stores the upload and returns the job;
+    run_product_import_task does the work and the client polls the job for progress.
+    """
+
+    @staticmethod
+    def _config() -> dict:
+        return getattr(settings, 'PRODUCT_IMPORT', {})
+
+    @staticmethod
+    def runs_in_background() -> bool:
+        return ProductImportJobService._config().get('MODE', 'celery') == 'celery'
+
+    @staticmethod
+    def create_job(*, company, branch, csv_file, requested_by=None, create_missing_categories=False) -> ProductImportJob:
+        job = ProductImportJob.objects.create(
+            company=company,
+            branch=branch,
+            requested_by=requested_by,
+            file=csv_file,
+            chunk_size=ProductImportJobService._config().get('CHUNK_SIZE', DEFAULT_CHUNK_SIZE),
+            create_missing_categories=create_missing_categories,
+        )
+        logger.info(f"Product import job {job.id} queued for company {company.id}, branch {branch.id}")
+        return job
+
+    @staticmethod
+    def dispatch(job: ProductImportJob):
+        """
+        Run the job now ("sync") or queue it once the job row is committed ("celery").
+        """
+        if not ProductImportJobService.runs_in_background():
+            return ProductImportJobService.run_job(job.id)
+
+        from inventory.tasks import run_product_import_task
+        db_transaction.on_commit(lambda: run_product_import_task.delay(job.id))
+        return job
+
+    @staticmethod
+    def run_job(job_id: int) -> ProductImportJob:
+        job = ProductImportJob.objects.select_related('company', 'branch').get(pk=job_id)
+        if job.status not in (ProductImportJob.Status.PENDING, ProductImportJob.Status.FAILED):
+            logger.warning(f"Product import job {job.id} is already {job.status}; skipping")
+            return job
+
+        job.status = ProductImportJob.Status.RUNNING
+        job.started_at = timezone.now()
+        job.save(update_fields=['status', 'started_at', 'updated_at'])
+
+        def progress(report):
+            ProductImportJobService._store_report(job, report)
+            job.save(update_fields=[
+                'rows_processed', 'created_count', 'updated_count', 'failed_count', 'failures', 'updated_at'
+            ])
+
+        try:
+            with job.file.open('rb') as csv_file:
+                report = ProductImportService.import_products(
+                    company=job.company,
+                    branch=job.branch,
+                    csv_file=csv_file,
+                    chunk_size=job.chunk_size,
+                    create_missing_categories=job.create_missing_categories,
+                    progress=progress,
+                )
+        except Exception as e:
+            logger.exception(f"Product import job {job.id} failed: {e}")
+            job.status = ProductImportJob.Status.FAILED
+            job.error = str(e)
+            job.finished_at = timezone.now()
+            job.save(update_fields=['status', 'error', 'finished_at', 'updated_at'])
+            return job
+
+        ProductImportJobService._store_report(job, report)
+        job.status = ProductImportJob.Status.COMPLETED
+        job.error = None
+        job.finished_at = timezone.now()
+        job.save()
+        return job
+
+    @staticmethod
+    def _store_report(job: ProductImportJob, report):
+        job.rows_processed = report.rows_processed
+        job.created_count = report.created
+        job.updated_count = report.updated
+        job.failed_count = report.failed
+        job.failures = report.failures
@@ -0,0 +1,288 @@
+import codecs
+import csv
+from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation
+from django.db import transaction as db_transaction
+from django.db.models.functions import Lower
+from loguru import logger
+from company.models.company_model import Company
+from branch.models.branch_model import Branch
+from inventory.models.product_model import Product
+from inventory.models.product_category_model import ProductCategory
+from inventory.models.catalogue_change_model import CatalogueChange
+from inventory.services.product_search.product_search_index import ProductSearchIndex
+from inventory.services.catalogue.catalogue_service import CatalogueService
+
+
+READ_CHUNK_BYTES = 64 * 1024
+DEFAULT_CHUNK_SIZE = 1000
+# failures beyond this are counted but not kept, so a bad file cannot exhaust memory
+MAX_REPORTED_FAILURES = 1000
+
+UPSERT_FIELDS = ['name', 'description', 'unit_price', 'product_category', 'stock', 'updated_at']
+
+
+@dataclass
+class ImportReport:
+    rows_processed: int = 0
+    created: int = 0
+    updated: int = 0
+    failed: int = 0
+    failures: list = field(default_factory=list)
+
+    def add_failure(self, row_number: int, row: dict, error: str):
+        self.failed += 1
+        if len(self.failures) < MAX_REPORTED_FAILURES:
+            self.failures.append({'row': row_number, 'sku': (row or {}).get('sku'), 'error': error})
+
+    def as_dict(self) -> dict:
+        return {
+            'rows_processed': self.rows_processed,
+            'created': self.created,
+            'updated': self.updated,
+            'failed': self.failed,
+            'failures': self.failures,
+        }
+
+
+class ProductImportService:
+    """
+    Streaming product CSV import.
+    The upload is decoded incrementally and processed in fixed-size chunks; each chunk
+    resolves its categories in one query and upserts on (company, branch, sku) in one statement,
+    so memory stays bounded by the chunk size rather than the file size.
+
+    Columns: name, sku, price (or unit_price), description, stock_quantity (or stock),
+    and either category (name) or product_category_id.
+    """
+
+    # -------------------------
+    # READING
+    # -------------------------
+    @staticmethod
+    def _iter_chunks(csv_file):
+        if hasattr(csv_file, 'chunks'):
+            yield from csv_file.chunks(READ_CHUNK_BYTES)
+            return
+        while True:
+            data = csv_file.read(READ_CHUNK_BYTES)
+            if not data:
+                return
+            yield data
+
+    @staticmethod
+    def iter_lines(csv_file):
+        """
+        Decode the upload incrementally (UTF-8, optional BOM) and yield text lines.
+        """
+        decoder = codecs.getincrementaldecoder('utf-8-sig')()
+        pending = ''
+        for data in ProductImportService._iter_chunks(csv_file):
+            pending += decoder.decode(data) if isinstance(data, bytes) else data
+            lines = pending.splitlines(keepends=True)
+            pending = lines.pop() if lines and not lines[-1].endswith(('\n', '\r')) else ''
+            yield from lines
+        pending += decoder.decode(b'', final=True)
+        if pending:
+            yield pending
+
+    @staticmethod
+    def iter_row_chunks(csv_file, chunk_size: int):
+        """
+        Yield lists of (row_number, row) of at most chunk_size rows.
+        """
+        reader = csv.DictReader(ProductImportService.iter_lines(csv_file))
+        chunk = []
+        for row in reader:
+            # row_number accounts for the header line
+            chunk.append((reader.line_num, row))
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    # -------------------------
+    # IMPORT
+    # -------------------------
+    @staticmethod
+    def import_products(*,
+                        company: Company,
+                        branch: Branch,
+                        csv_file,
+                        chunk_size: int = DEFAULT_CHUNK_SIZE,
+                        create_missing_categories: bool = False,
+                        progress=None,
+                        ) -> ImportReport:
+        """
+        Import (create or update) products from a CSV upload.
+        progress, if given, is called with the running ImportReport after each chunk.
+        Each chunk commits on its own, so a failure part way keeps the chunks already written.
+        """
+        report = ImportReport()
+        for chunk in ProductImportService.iter_row_chunks(csv_file, chunk_size):
+            ProductImportService._import_chunk(
+                company=company,
+                branch=branch,
+                chunk=chunk,
+                report=report,
+                create_missing_categories=create_missing_categories,
+            )
+            if progress is not None:
+                progress(report)
+
+        # bulk upserts bypass the save signals that keep the in-process search index current
+        ProductSearchIndex.invalidate(company.id)
+        logger.info(
+            f"Product import finished | company={company.id} | branch={branch.id} | rows={report.rows_processed} "
+            f"| created={report.created} | updated={report.updated} | failed={report.failed}"
+        )
+        return report
+
+    @staticmethod
+    @db_transaction.atomic
+    def _import_chunk(*, company, branch, chunk, report: ImportReport, create_missing_categories: bool):
+        parsed = []
+        for row_number, row in chunk:
+            report.rows_processed += 1
+            try:
+                parsed.append((row_number, row, ProductImportService._parse_row(row)))
+            except ValueError as e:
+                report.add_failure(row_number, row, str(e))
+
+        categories_by_name, categories_by_id = ProductImportService._resolve_categories(
+            company=company,
+            branch=branch,
+            rows=[values for _, _, values in parsed],
+            create_missing=create_missing_categories,
+        )
+
+        # last row wins for a SKU repeated inside the chunk (one upsert may not touch a row twice)
+        products = {}
+        for row_number, row, values in parsed:
+            try:
+                category = None
+                if values['category_id'] is not None:
+                    category = categories_by_id.get(values['category_id'])
+                    if category is None:
+                        raise ValueError(f"Unknown product_category_id '{values['category_id']}'")
+                elif values['category_name']:
+                    category = categories_by_name.get(values['category_name'].lower())
+                    if category is None:
+                        raise ValueError(f"Unknown category '{values['category_name']}'")
+            except ValueError as e:
+                report.add_failure(row_number, row, str(e))
+                continue
+
+            products[values['sku']] = Product(
+                company=company,
+                branch=branch,
+                sku=values['sku'],
+                name=values['name'],
+                description=values['description'],
+                unit_price=values['unit_price'],
+                product_category=category,
+                stock=values['stock'],
+            )
+
+        if not products:
+            return
+
+        existing = set(
+            Product.objects.filter(company=company, branch=branch, sku__in=list(products)).values_list('sku', flat=True)
+        )
+        Product.objects.bulk_create(
+            list(products.values()),
+            update_conflicts=True,
+            unique_fields=['company', 'branch', 'sku'],
+            update_fields=UPSERT_FIELDS,
+        )
+        report.updated += len(existing)
+        report.created += len(products) - len(existing)
+
+        # bulk upserts skip the save signals that feed the till catalogue deltas;
+        # PostgreSQL and SQLite return the upserted ids, other backends need a lookup
+        product_ids = [product.pk for product in products.values()]
+        if None in product_ids:
+            product_ids = Product.objects.filter(company=company, branch=branch, sku__in=list(products)).values_list('id', flat=True)
+        CatalogueService.record(company.id, CatalogueChange.Kind.PRODUCT, [(branch.id, product_id) for product_id in product_ids])
+
+    @staticmethod
+    def _parse_row(row: dict) -> dict:
+        if None in row:
+            raise ValueError("Row has more columns than the header")
+        name = (row.get('name') or '').strip()
+        sku = (row.get('sku') or '').strip()
+        price = (row.get('price') or row.get('unit_price') or '').strip()
+        if not (name and sku and price):
+            raise ValueError("Missing required field(s): name, sku and price are required")
+        try:
+            unit_price = Decimal(price)
+        except InvalidOperation:
+            raise ValueError(f"Invalid price '{price}'")
+        if unit_price < 0:
+            raise ValueError(f"Invalid price '{price}'")
+
+        stock = (row.get('stock_quantity') or row.get('stock') or '0').strip()
+        try:
+            stock = int(stock)
+        except ValueError:
+            raise ValueError(f"Invalid stock quantity '{stock}'")
+
+        category_id = (row.get('product_category_id') or '').strip()
+        if category_id and not category_id.isdigit():
+            raise ValueError(f"Invalid product_category_id '{category_id}'")
+
+        return {
+            'name': name,
+            'sku': sku,
+            'description': (row.get('description') or '').strip(),
+            'unit_price': unit_price,
+            'stock': stock,
+            'category_id': int(category_id) if category_id else None,
+            'category_name': (row.get('category') or '').strip(),
+        }
+
+    @staticmethod
+    def _resolve_categories(*, company, branch, rows: list, create_missing: bool) -> tuple[dict, dict]:
+        """
+        Resolve every category referenced by a chunk in one query per key type.
+        Names match case-insensitively within the branch; ids must belong to the company.
+        """
+        names = {values['category_name'] for values in rows if values['category_id'] is None and values['category_name']}
+        ids = {values['category_id'] for values in rows if values['category_id'] is not None}
+
+        by_name = {}
+        if names:
+            keys = {name.lower() for name in names}
+            by_name = ProductImportService._categories_by_key(company, branch, keys)
+            missing = {name for name in names if name.lower() not in by_name}
+            if missing and create_missing:
+                ProductCategory.objects.bulk_create(
+                    [ProductCategory(company=company, branch=branch, name=name) for name in sorted(missing)],
+                    ignore_conflicts=True,
+                )
+                created = ProductImportService._categories_by_key(company, branch, {name.lower() for name in missing})
+                by_name.update(created)
+                CatalogueService.record(
+                    company.id, CatalogueChange.Kind.CATEGORY, [(branch.id, category.id) for category in created.values()]
+                )
+
+        by_id = {}
+        if ids:
+            by_id = {category.id: category for category in ProductCategory.objects.filter(company=company, id__in=ids)}
+        return by_name, by_id
+
+    @staticmethod
+    def _categories_by_key(company, branch, keys: set) -> dict:
+        queryset = (
+            ProductCategory.objects
+            .filter(company=company, branch=branch)
+            .annotate(name_key=Lower('name'))
+            .filter(name_key__in=keys)
+            .order_by('pk')
+        )
+        categories = {}
+        for category in queryset:
+            categories.setdefault(category.name_key, category)
+        return categories
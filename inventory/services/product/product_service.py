@@ -3,10 +3,28 @@ from inventory.models.product_category_model import ProductCategory
 from inventory.models.product_stock_model import ProductStock
 from inventory.models.stock_take_item_model import StockTakeItem
 from django.db import transaction as db_transaction
-import csv
-from io import StringIO
 from django.db.models import Q
 from loguru import logger
+from inventory.services.product.product_import_service import ProductImportService, DEFAULT_CHUNK_SIZE
+from inventory.services.product_search.product_search_service import ProductSearchService
+from inventory.models.catalogue_change_model import CatalogueChange
+from inventory.services.catalogue.catalogue_service import CatalogueService
+from config.export.streaming_export import StreamingExport
+
+
+# (header, lookup) columns of a product export
+PRODUCT_EXPORT_COLUMNS = (
+    ('id', 'id'),
+    ('name', 'name'),
+    ('description', 'description'),
+    ('price', 'unit_price'),
+    ('sku', 'sku'),
+    ('product_category_id', 'product_category_id'),
+    ('product_category', 'product_category__name'),
+    ('stock_quantity', 'stock'),
+    ('created_at', 'created_at'),
+    ('updated_at', 'updated_at'),
+)
 
 
 #removed duplicate class 
@@ -123,18 +141,12 @@ class ProductService:
             raise e
         
     @staticmethod
-    @db_transaction.atomic
-    def search_products(company, query):
+    def search_products(company, query, branch=None, limit=20):
         """
-        Search products by name or description in a specific company.
+        Search products by barcode/SKU, name or description in a specific company, best match first.
         """
         try:
-            products = Product.objects.filter(
-                company=company
-            ).filter(
-                Q(name__icontains=query) | Q(description__icontains=query)
-            )
-            return products
+            return ProductSearchService.search(company, query, branch=branch, limit=limit)
         except Exception as e:
             logger.exception(f"Error searching products in Company {company.id} with query '{query}': {e}")
             raise e
@@ -148,7 +160,11 @@ class ProductService:
         """
         try:
             products = [Product(company=company, **data) for data in product_data_list]
-            Product.objects.bulk_create(products, batch_size=1000, returning=True)
+            # primary keys are set on the instances by backends that return rows from bulk inserts
+            Product.objects.bulk_create(products, batch_size=1000)
+            CatalogueService.record(
+                company.id, CatalogueChange.Kind.PRODUCT, [(product.branch_id, product.id) for product in products if product.id]
+            )
             logger.info(f"Bulk created {len(products)} products for Company {company.id}")
             return products
         except Exception as e:
@@ -165,6 +181,12 @@ class ProductService:
         """
         try:
             Product.objects.bulk_update(products, update_fields, batch_size=1000)
+            for company_id in {product.company_id for product in products}:
+                CatalogueService.record(
+                    company_id,
+                    CatalogueChange.Kind.PRODUCT,
+                    [(product.branch_id, product.id) for product in products if product.company_id == company_id],
+                )
             logger.info(f"Bulk updated {len(products)} products")
             return products
         except Exception as e:
@@ -172,123 +194,49 @@ class ProductService:
             raise e
     
     @staticmethod
-    @db_transaction.atomic
-    def bulk_import_products(company, csv_file):
+    def bulk_import_products(company, csv_file, branch, create_missing_categories=False, chunk_size=DEFAULT_CHUNK_SIZE):
         """
-        Bulk import products from a CSV file.
-        The CSV should have columns: name, description, price, sku, product_category_id, stock_quantity
-        Skips invalid rows but logs them.
+        Bulk import (create or update by SKU) products from a CSV file into a branch.
+        The CSV should have columns: name, description, price, sku, product_category_id or category, stock_quantity
+        Invalid rows are skipped and reported. See ProductImportService for the chunked upsert.
         """
         try:
-            decoded_file = csv_file.read().decode('utf-8')
-            io_string = StringIO(decoded_file)
-            reader = csv.DictReader(io_string)
-
-            products = []
-            failed_rows = []
-
-            existing_skus = set(
-                Product.objects.filter(company=company).values_list('sku', flat=True)
+            report = ProductImportService.import_products(
+                company=company,
+                branch=branch,
+                csv_file=csv_file,
+                chunk_size=chunk_size,
+                create_missing_categories=create_missing_categories,
             )
-
-            for row_number, row in enumerate(reader, start=2):  # start=2 to account for header row
-                try:
-                    # Required fields
-                    name = row.get('name')
-                    sku = row.get('sku')
-                    price = row.get('price')
-                    stock_quantity = row.get('stock_quantity')
-
-                    if not (name and sku and price and stock_quantity):
-                        raise ValueError("Missing required field(s)")
-
-                    # Check SKU uniqueness
-                    if sku in existing_skus:
-                        raise ValueError(f"SKU '{sku}' already exists")
-
-                    # Convert numeric fields
-                    price = float(price)
-                    stock_quantity = int(stock_quantity)
-
-                    # Category (optional)
-                    product_category = None
-                    category_id = row.get('product_category_id')
-                    if category_id:
-                        product_category = ProductCategory.objects.get(
-                            id=category_id,
-                            company=company
-                        )
-
-                    # Create product instance
-                    product = Product(
-                        company=company,
-                        name=name,
-                        sku=sku,
-                        description=row.get('description', ''),
-                        price=price,
-                        product_category=product_category,
-                        stock_quantity=stock_quantity
-                    )
-                    products.append(product)
-                    existing_skus.add(sku)  # mark SKU as used
-
-                except Exception as e:
-                    logger.warning(f"Skipping row {row_number}: {e}")
-                    failed_rows.append((row_number, row, str(e)))
-
-            # Bulk create valid products
-            Product.objects.bulk_create(products, batch_size=1000, returning=True)
-            logger.info(f"Bulk imported {len(products)} products for Company {company.id}")
-            if failed_rows:
-                logger.info(f"Skipped {len(failed_rows)} invalid rows")
-
-            return products, failed_rows
+            if report.failed:
+                logger.info(f"Skipped {report.failed} invalid rows")
+            return report
 
         except Exception as e:
             logger.exception(f"Error bulk importing products for Company {company.id}: {e}")
             raise e
 
 
-
+    @staticmethod
+    def export_queryset(company, branch=None):
+        """
+        Products included in an export: the company's, optionally limited to one branch.
+        """
+        queryset = Product.objects.filter(company=company)
+        if branch:
+            queryset = queryset.filter(branch=branch)
+        return queryset.order_by('id')
 
     @staticmethod
-    def bulk_export_products(company, branch):
+    def bulk_export_products(company, branch, export_format='csv'):
         """
-        Prepare product data as CSV rows (generator).
+        Product data as encoded CSV (or NDJSON) chunks (generator), read with a single projection.
         Does NOT deal with HTTP response.
         """
         try:
-            def csv_generator():
-                output = StringIO()
-                writer = csv.writer(output)
-
-                # Header
-                writer.writerow([
-                    'id', 'name', 'description', 'price', 'sku',
-                    'product_category_id', 'stock_quantity', 'created_at', 'updated_at'
-                ])
-                yield output.getvalue()
-                output.seek(0)
-                output.truncate(0)
-
-                # Product rows
-                for product in Product.objects.filter(company=company, branch=branch).iterator():
-                    writer.writerow([
-                        product.id,
-                        product.name,
-                        product.description,
-                        product.price,
-                        product.sku,
-                        product.product_category.id if product.product_category else '',
-                        product.stock_quantity,
-                        product.created_at.strftime('%Y-%m-%d %H:%M:%S'),
-                        product.updated_at.strftime('%Y-%m-%d %H:%M:%S'),
-                    ])
-                    yield output.getvalue()
-                    output.seek(0)
-                    output.truncate(0)
-
-            return csv_generator()
+            return StreamingExport.chunks(
+                ProductService.export_queryset(company, branch), PRODUCT_EXPORT_COLUMNS, export_format
+            )
 
         except Exception as e:
             logger.exception(f"Error generating CSV for Company {company.id}: {e}")
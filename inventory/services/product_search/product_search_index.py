@@ -0,0 +1,327 @@
+import re
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from loguru import logger
+from inventory.models.product_model import Product
+
+
+_TOKEN_RE = re.compile(r'[0-9a-z]+')
+
+# weight of a token match by the field it came from
+FIELD_WEIGHTS = {'sku': 4, 'name': 3, 'category': 1, 'description': 1}
+EXACT_CODE_SCORE = 1000.0
+# minimum trigram similarity for a fuzzy (typo-tolerant) match
+TRIGRAM_THRESHOLD = 0.3
+# a company index older than this is rebuilt, so changes made by other processes show up
+MAX_AGE_SECONDS = 300
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN_RE.findall((text or '').lower())
+
+
+def trigrams(text: str) -> set[str]:
+    """
+    pg_trgm style trigrams: each word padded with two leading blanks and one trailing blank.
+    """
+    grams = set()
+    for word in tokenize(text):
+        padded = f'  {word} '
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+@dataclass
+class ProductDoc:
+    id: int
+    branch_id: int
+    name: str
+    sku: str
+    grams: frozenset
+    words: frozenset
+
+
+class _TrieNode:
+    __slots__ = ('children', 'postings')
+
+    def __init__(self):
+        self.children = {}
+        # product id -> best field weight for the word ending at this node
+        self.postings = None
+
+
+class CompanySearchIndex:
+    """
+    Prefix trie over name/SKU/category/description words plus a trigram index over names
+    for one company. Not thread-safe on its own; ProductSearchIndex serialises writers.
+    """
+
+    def __init__(self):
+        self.docs = {}
+        self.codes = defaultdict(set)
+        self.grams = defaultdict(set)
+        self.root = _TrieNode()
+        self.built_at = time.monotonic()
+
+    # -------------------------
+    # WRITES
+    # -------------------------
+    def add(self, product_id, branch_id, name, sku, description, category=''):
+        if product_id in self.docs:
+            self.remove(product_id)
+        name, sku = name or '', sku or ''
+        weighted = []
+        for field, text in (('description', description), ('category', category), ('name', name), ('sku', sku)):
+            words = tokenize(text)
+            if field == 'sku' and sku:
+                words.append(sku.lower())
+            weighted.extend((word, FIELD_WEIGHTS[field]) for word in words)
+        doc = ProductDoc(
+            id=product_id, branch_id=branch_id, name=name, sku=sku,
+            grams=frozenset(trigrams(name)), words=frozenset(word for word, _ in weighted),
+        )
+        self.docs[product_id] = doc
+        if sku:
+            self.codes[sku.lower()].add(product_id)
+        for gram in doc.grams:
+            self.grams[gram].add(product_id)
+        for word, weight in weighted:
+            self._insert(word, product_id, weight)
+
+    def _insert(self, word, product_id, weight):
+        node = self.root
+        for char in word:
+            node = node.children.setdefault(char, _TrieNode())
+        if node.postings is None:
+            node.postings = {}
+        node.postings[product_id] = max(weight, node.postings.get(product_id, 0))
+
+    def remove(self, product_id):
+        doc = self.docs.pop(product_id, None)
+        if doc is None:
+            return
+        if doc.sku:
+            self.codes[doc.sku.lower()].discard(product_id)
+        for gram in doc.grams:
+            self.grams[gram].discard(product_id)
+        for word in doc.words:
+            node = self.root
+            for char in word:
+                node = node.children.get(char)
+                if node is None:
+                    break
+            if node is not None and node.postings:
+                node.postings.pop(product_id, None)
+
+    # -------------------------
+    # READS
+    # -------------------------
+    def _prefix_matches(self, prefix, deadline, cap):
+        """
+        {product_id: weight} for words starting with prefix (doubled for whole-word matches).
+        """
+        node = self.root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return {}
+        matches = {}
+        stack = [(node, True)]
+        while stack and len(matches) < cap:
+            if time.perf_counter() > deadline:
+                break
+            current, exact = stack.pop()
+            if current.postings:
+                for product_id, weight in current.postings.items():
+                    if product_id in self.docs:
+                        score = weight * (2 if exact else 1)
+                        matches[product_id] = max(score, matches.get(product_id, 0))
+            stack.extend((child, False) for child in current.children.values())
+        return matches
+
+    def _trigram_matches(self, term, deadline):
+        query_grams = trigrams(term)
+        if not query_grams:
+            return {}
+        shared = defaultdict(int)
+        for gram in query_grams:
+            if time.perf_counter() > deadline:
+                break
+            for product_id in self.grams.get(gram, ()):
+                shared[product_id] += 1
+        matches = {}
+        for product_id, common in shared.items():
+            doc = self.docs.get(product_id)
+            if doc is None:
+                continue
+            similarity = common / (len(query_grams) + len(doc.grams) - common)
+            if similarity >= TRIGRAM_THRESHOLD:
+                matches[product_id] = similarity
+        return matches
+
+    def search(self, term, *, branch_id=None, limit=20, budget_ms=20.0):
+        """
+        Ranked product ids for term: exact SKU first, then products matching every word
+        by prefix, then (if nothing matched) fuzzy trigram matches.
+        Stops refining once budget_ms is spent and ranks what it has.
+        """
+        deadline = time.perf_counter() + budget_ms / 1000
+        cap = max(limit * 50, 500)
+        scores = {}
+
+        for product_id in self.codes.get((term or '').strip().lower(), ()):
+            scores[product_id] = EXACT_CODE_SCORE
+
+        words = tokenize(term)
+        if words:
+            combined = None
+            for word in words:
+                matches = self._prefix_matches(word, deadline, cap)
+                if combined is None:
+                    combined = matches
+                else:
+                    combined = {pid: combined[pid] + score for pid, score in matches.items() if pid in combined}
+                if not combined:
+                    break
+            for product_id, score in (combined or {}).items():
+                scores[product_id] = max(scores.get(product_id, 0), score)
+
+        if not scores and time.perf_counter() < deadline:
+            scores = self._trigram_matches(term, deadline)
+
+        if time.perf_counter() > deadline:
+            logger.debug(f"Product search for '{term}' hit its {budget_ms}ms budget; ranking partial results")
+
+        ranked = []
+        for product_id, score in scores.items():
+            doc = self.docs.get(product_id)
+            if doc is None or (branch_id is not None and doc.branch_id != branch_id):
+                continue
+            ranked.append((-score, len(doc.name), doc.name.lower(), product_id))
+        ranked.sort()
+        return [(product_id, -negative) for negative, _, _, product_id in ranked[:limit]]
+
+
+class ProductSearchIndex:
+    """
+    Process-local registry of CompanySearchIndex objects, built lazily on first search
+    and kept current by the product save/delete signals (inventory/signals/product_search_index_signal.py).
+    A category save or delete invalidates the company, since its name is indexed on every product in it.
+    Bulk writes bypass signals; callers of bulk_create/update must invalidate the company.
+
+    Each company has its own lock, so one company's searches and rebuilds never wait on another's.
+    A rebuild runs outside that lock: searches keep using the old index until the new one is swapped
+    in, and signal updates made meanwhile are replayed onto it.
+    """
+    _indexes = {}
+    # company_id -> RLock guarding that company's index (searches and signal updates)
+    _locks = {}
+    # company_id -> Lock held by the one thread rebuilding that company's index
+    _build_locks = {}
+    # company_id -> updates to replay onto the index being rebuilt (None: invalidated meanwhile)
+    _pending = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def _company_locks(cls, company_id) -> tuple:
+        locks = cls._locks.get(company_id), cls._build_locks.get(company_id)
+        if None in locks:
+            with cls._lock:
+                locks = (
+                    cls._locks.setdefault(company_id, threading.RLock()),
+                    cls._build_locks.setdefault(company_id, threading.Lock()),
+                )
+        return locks
+
+    @staticmethod
+    def _is_fresh(index) -> bool:
+        return index is not None and time.monotonic() - index.built_at < MAX_AGE_SECONDS
+
+    @classmethod
+    def for_company(cls, company_id) -> CompanySearchIndex:
+        index = cls._indexes.get(company_id)
+        if cls._is_fresh(index):
+            return index
+        lock, build_lock = cls._company_locks(company_id)
+        # with a stale index to serve, don't queue behind a rebuild already under way
+        if not build_lock.acquire(blocking=index is None):
+            return index
+        try:
+            index = cls._indexes.get(company_id)
+            if cls._is_fresh(index):
+                return index
+            with lock:
+                cls._pending[company_id] = []
+            built = cls._build(company_id)
+            with lock:
+                pending = cls._pending.pop(company_id, None)
+                if pending is not None:
+                    for update in pending:
+                        update(built)
+                    cls._indexes[company_id] = built
+            return built
+        finally:
+            build_lock.release()
+
+    @classmethod
+    def _build(cls, company_id) -> CompanySearchIndex:
+        started = time.perf_counter()
+        index = CompanySearchIndex()
+        rows = (
+            Product.objects.filter(company_id=company_id)
+            .values_list('id', 'branch_id', 'name', 'sku', 'description', 'product_category__name')
+            .iterator(chunk_size=2000)
+        )
+        for product_id, branch_id, name, sku, description, category in rows:
+            index.add(product_id, branch_id, name, sku, description, category)
+        logger.info(
+            f"Built product search index for company {company_id}: {len(index.docs)} products "
+            f"in {(time.perf_counter() - started) * 1000:.1f}ms"
+        )
+        return index
+
+    @classmethod
+    def search(cls, company_id, term, **kwargs) -> list[tuple[int, float]]:
+        index = cls.for_company(company_id)
+        # searches hold the company lock too: signal handlers mutate the same dicts and sets
+        with cls._company_locks(company_id)[0]:
+            return index.search(term, **kwargs)
+
+    @classmethod
+    def _apply(cls, company_id, update):
+        with cls._company_locks(company_id)[0]:
+            index = cls._indexes.get(company_id)
+            if index is not None:
+                update(index)
+            pending = cls._pending.get(company_id)
+            if pending is not None:
+                pending.append(update)
+
+    @classmethod
+    def update_product(cls, product: Product):
+        # read before taking the lock; usually cached on the instance by the serializer
+        category = product.product_category.name if product.product_category_id else ''
+        cls._apply(
+            product.company_id,
+            lambda index: index.add(product.id, product.branch_id, product.name, product.sku, product.description, category),
+        )
+
+    @classmethod
+    def remove_product(cls, product: Product):
+        cls._apply(product.company_id, lambda index: index.remove(product.id))
+
+    @classmethod
+    def invalidate(cls, company_id):
+        with cls._company_locks(company_id)[0]:
+            cls._indexes.pop(company_id, None)
+            if company_id in cls._pending:
+                # a rebuild under way may have missed the bulk write: don't install it
+                cls._pending[company_id] = None
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._indexes.clear()
+            cls._pending.clear()
@@ -0,0 +1,175 @@
+import re
+from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector, TrigramSimilarity
+from django.db import connections
+from django.db.models import Case, F, FloatField, IntegerField, Q, Value, When
+from loguru import logger
+from inventory.models.product_model import Product
+from inventory.services.product_search.product_search_index import ProductSearchIndex, tokenize
+
+
+# the expression the tsvector index is built on; queries must use the same one to hit it
+PRODUCT_SEARCH_VECTOR = SearchVector('name', 'sku', 'description', config='simple')
+
+# PostgreSQL-only indexes (GIN cannot be declared on the model while tests run on SQLite);
+# created by `manage.py install_product_search_indexes`
+POSTGRES_SEARCH_INDEXES = [
+    GinIndex(PRODUCT_SEARCH_VECTOR, name='product_search_vector_gin'),
+    GinIndex(OpClass('name', name='gin_trgm_ops'), name='product_name_trgm_gin'),
+    GinIndex(OpClass('sku', name='gin_trgm_ops'), name='product_sku_trgm_gin'),
+    GinIndex(OpClass('description', name='gin_trgm_ops'), name='product_description_trgm_gin'),
+]
+
+# scanned barcodes and typed SKUs: one token, no spaces
+_CODE_RE = re.compile(r'^[A-Za-z0-9][A-Za-z0-9\-_.]{2,}$')
+
+
+class ProductSearchService:
+    """
+    Till product lookup.
+    - exact barcode/SKU: one indexed equality lookup on (company, sku)
+    - PostgreSQL: tsvector prefix search ranked with trigram similarity on name (GIN indexes)
+    - elsewhere (SQLite, tests): the in-process trie/n-gram ProductSearchIndex
+    PRODUCT_SEARCH["BACKEND"] forces "postgres" or "memory"; the default picks by database vendor.
+    """
+
+    @staticmethod
+    def _config() -> dict:
+        return getattr(settings, 'PRODUCT_SEARCH', {})
+
+    @staticmethod
+    def backend(using='default') -> str:
+        configured = ProductSearchService._config().get('BACKEND')
+        if configured in ('postgres', 'memory'):
+            return configured
+        return 'postgres' if connections[using].vendor == 'postgresql' else 'memory'
+
+    @staticmethod
+    def looks_like_code(term: str) -> bool:
+        return bool(_CODE_RE.match(term or '')) and any(char.isdigit() for char in term)
+
+    # -------------------------
+    # EXACT
+    # -------------------------
+    @staticmethod
+    def lookup_code(company, code: str, branch=None):
+        """
+        Product with exactly this barcode/SKU, preferring the given branch.
+        """
+        code = (code or '').strip()
+        if not code:
+            return None
+        queryset = Product.objects.filter(company=company, sku=code)
+        if branch is not None:
+            queryset = queryset.filter(branch=branch)
+        return queryset.select_related('product_category').first()
+
+    # -------------------------
+    # RANKED
+    # -------------------------
+    @staticmethod
+    def search(company, term: str, branch=None, limit: int = 20) -> list:
+        """
+        Ranked products for a till search box: an exact code match short-circuits,
+        otherwise prefix/fuzzy matching on name, SKU and description.
+        """
+        term = (term or '').strip()
+        if not term:
+            return []
+        if ProductSearchService.looks_like_code(term):
+            product = ProductSearchService.lookup_code(company, term, branch)
+            if product is not None:
+                return [product]
+        return list(ProductSearchService.filter_queryset(
+            Product.objects.filter(company=company), company, term, branch=branch, limit=limit
+        ))
+
+    @staticmethod
+    def filter_queryset(queryset, company, term: str, branch=None, limit: int | None = None):
+        """
+        Narrow a product queryset to the matches for term, best first.
+        """
+        term = (term or '').strip()
+        if not term:
+            return queryset
+        if branch is not None:
+            queryset = queryset.filter(branch=branch)
+
+        if ProductSearchService.backend(queryset.db) == 'postgres':
+            return ProductSearchService._postgres_filter(queryset, term, limit)
+
+        budget_ms = ProductSearchService._config().get('BUDGET_MS', 20)
+        ranked = ProductSearchIndex.search(
+            company.id,
+            term,
+            branch_id=getattr(branch, 'id', None),
+            limit=limit or ProductSearchService._config().get('MAX_RESULTS', 200),
+            budget_ms=budget_ms,
+        )
+        ids = [product_id for product_id, _ in ranked]
+        position = Case(
+            *[When(pk=product_id, then=Value(index)) for index, product_id in enumerate(ids)],
+            output_field=IntegerField(),
+        ) if ids else Value(0)
+        return queryset.filter(pk__in=ids).annotate(search_position=position).order_by('search_position')
+
+    @staticmethod
+    def _postgres_filter(queryset, term, limit):
+        words = tokenize(term)
+        if not words:
+            return queryset.none()
+        # every word as a prefix: "coca col" -> coca:* & col:*
+        query = SearchQuery(' & '.join(f'{word}:*' for word in words), search_type='raw', config='simple')
+        queryset = (
+            queryset
+            .annotate(search_document=PRODUCT_SEARCH_VECTOR)
+            .filter(
+                Q(search_document=query)
+                | Q(name__trigram_similar=term)
+                | Q(sku__istartswith=term)
+            )
+            .annotate(
+                search_rank=SearchRank(F('search_document'), query),
+                name_similarity=TrigramSimilarity('name', term),
+            )
+            .annotate(
+                search_score=Case(
+                    When(sku__iexact=term, then=Value(1000.0)),
+                    default=F('search_rank') + F('name_similarity'),
+                    output_field=FloatField(),
+                )
+            )
+            .order_by('-search_score', 'name')
+        )
+        if limit:
+            queryset = queryset[:limit]
+        return queryset
+
+    # -------------------------
+    # INDEXES
+    # -------------------------
+    @staticmethod
+    def install_postgres_indexes(using='default', concurrently=True) -> list[str]:
+        """
+        Create the pg_trgm extension and the GIN search indexes that do not exist yet.
+        Returns the names of the indexes created.
+        """
+        connection = connections[using]
+        if connection.vendor != 'postgresql':
+            logger.info("Product search indexes are PostgreSQL-only; nothing to install.")
+            return []
+
+        with connection.cursor() as cursor:
+            cursor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+            existing = set(connection.introspection.get_constraints(cursor, Product._meta.db_table))
+
+        created = []
+        with connection.schema_editor(atomic=not concurrently) as schema_editor:
+            for index in POSTGRES_SEARCH_INDEXES:
+                if index.name in existing:
+                    continue
+                schema_editor.execute(index.create_sql(Product, schema_editor, concurrently=concurrently))
+                created.append(index.name)
+                logger.info(f"Created product search index {index.name}")
+        return created
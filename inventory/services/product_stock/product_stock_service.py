@@ -1,9 +1,15 @@
 from typing import Union
-from django.db import transaction as db_transaction
-from django.db.models import Sum
+from dataclasses import dataclass
+from django.conf import settings
+from django.db import connection, transaction as db_transaction
+from django.db.models import Sum, Q
+from django.utils import timezone
 from loguru import logger
 from inventory.models.product_model import Product
 from inventory.models.product_stock_model import ProductStock
+from inventory.models.catalogue_change_model import CatalogueChange
+from inventory.services.catalogue.catalogue_service import CatalogueService
+from core.services.document_numbering.document_number_service import DocumentNumberService
 from inventory.services.stock_movement.stock_movement_service import StockMovementService
 from inventory.models.stock_movement_model import StockMovement
 from sales.models.sales_invoice_item_model import SalesInvoiceItem
@@ -21,6 +27,33 @@ from django.db.models import Sum, F, FloatField
 from inventory.models.stock_movement_model import StockMovement
 
 
+@dataclass
+class StockPostingLine:
+    """
+    A single stock change requested by a document line.
+    Positive quantity_change = increase stock
+    Negative quantity_change = decrease stock
+    """
+    product: Product
+    branch: object
+    quantity_change: int
+    movement_type: str
+    reason: str | None = None
+    unit_cost: object = None
+    sales_order: object = None
+    sales_invoice: object = None
+    sales_return: object = None
+    purchase_order: object = None
+    purchase_invoice: object = None
+    purchase_return: object = None
+
+
+# settings.STOCK_POSTING["MODE"]:
+# "locking": lock the rows (SELECT ... FOR UPDATE), compute the new quantities in Python, write them back
+# "delta": one conditional UPDATE per row (quantity = quantity + delta WHERE quantity + delta >= 0)
+STOCK_POSTING_MODES = ('locking', 'delta')
+
+
 class ProductStockService:
     """
     Owns all product stock mutations.
@@ -28,8 +61,76 @@ class ProductStockService:
     No stock movement service or audit logging is done here.
     """
 
+    @staticmethod
+    def _posting_mode(mode: str | None = None) -> str:
+        mode = mode or getattr(settings, 'STOCK_POSTING', {}).get('MODE', 'locking')
+        if mode not in STOCK_POSTING_MODES:
+            raise ValueError(f"Unknown stock posting mode '{mode}'. Use one of: {', '.join(STOCK_POSTING_MODES)}.")
+        return mode
+
+    @staticmethod
+    def _apply_stock_delta(*, product_id, branch_id, quantity_change) -> int | None:
+        """
+        Apply a quantity change in a single statement, guarded against going negative:
+        UPDATE ... SET quantity = quantity + %s WHERE product_id = %s AND branch_id = %s
+        AND quantity + %s >= 0 RETURNING quantity
+        Returns the new quantity, or None when no row matched (missing row or insufficient stock).
+        The row stays locked by the UPDATE until the surrounding transaction ends, but there is
+        no read-modify-write round trip while holding it.
+        """
+        now = timezone.now()
+        # RETURNING on UPDATE goes with RETURNING on INSERT (PostgreSQL, SQLite 3.35+)
+        if connection.features.can_return_columns_from_insert:
+            table = connection.ops.quote_name(ProductStock._meta.db_table)
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"UPDATE {table} SET quantity = quantity + %s, updated_at = %s "
+                    f"WHERE product_id = %s AND branch_id = %s AND quantity + %s >= 0 "
+                    f"RETURNING quantity",
+                    [quantity_change, now, product_id, branch_id, quantity_change],
+                )
+                row = cursor.fetchone()
+            return row[0] if row else None
+
+        matched = ProductStock.objects.filter(
+            product_id=product_id, branch_id=branch_id, quantity__gte=-quantity_change
+        ).update(quantity=F('quantity') + quantity_change, updated_at=now)
+        if not matched:
+            return None
+        # our UPDATE holds the row lock, so this read sees our own write
+        return ProductStock.objects.filter(product_id=product_id, branch_id=branch_id).values_list('quantity', flat=True).get()
+
+    @staticmethod
+    def _apply_stock_delta_or_raise(*, company, product_id, branch_id, quantity_change) -> int:
+        """
+        _apply_stock_delta, creating a missing stock row for increases
+        and raising ValueError when a decrease would go below zero.
+        """
+        quantity_after = ProductStockService._apply_stock_delta(
+            product_id=product_id, branch_id=branch_id, quantity_change=quantity_change
+        )
+        if quantity_after is not None:
+            return quantity_after
+
+        available = ProductStock.objects.filter(product_id=product_id, branch_id=branch_id).values_list('quantity', flat=True).first()
+        if available is None and quantity_change >= 0:
+            ProductStock.objects.bulk_create(
+                [ProductStock(company=company, product_id=product_id, branch_id=branch_id, quantity=0)],
+                ignore_conflicts=True,
+            )
+            quantity_after = ProductStockService._apply_stock_delta(
+                product_id=product_id, branch_id=branch_id, quantity_change=quantity_change
+            )
+            if quantity_after is not None:
+                return quantity_after
+        raise ValueError(
+            f"Insufficient stock | product={product_id} | "
+            f"available={available or 0} | requested={quantity_change}"
+        )
+
     # ==========================================================
-    # INTERNAL CORE (NEVER CALLED FROM OTHER SERVICES)
+    # INTERNAL CORE (ALSO CALLED BY THE POS FAST CHECKOUT,
+    # WHICH POSTS STOCK INSIDE ITS OWN TRANSACTION)
     # ==========================================================
     @staticmethod
     @db_transaction.atomic
@@ -44,7 +145,19 @@ class ProductStockService:
         Core stock mutation with row-level locking.
         Positive quantity_change = increase stock
         Negative quantity_change = decrease stock
+        In "delta" posting mode the change is one conditional UPDATE instead.
         """
+        if ProductStockService._posting_mode() == 'delta':
+            new_quantity = ProductStockService._apply_stock_delta_or_raise(
+                company=company, product_id=product.id, branch_id=branch.id, quantity_change=quantity_change
+            )
+            # the raw UPDATE skips the save signal that feeds the till catalogue deltas
+            CatalogueService.record(company.id, CatalogueChange.Kind.STOCK, [(branch.id, product.id)])
+            logger.info(
+                "Stock adjusted | product={} | branch={} | change={} | new_quantity={}",
+                product.id, branch.id, quantity_change, new_quantity,
+            )
+            return ProductStock.objects.get(product=product, branch=branch)
 
         product_stock, _ = ProductStock.objects.select_for_update().get_or_create(
             product=product,
@@ -65,12 +178,139 @@ class ProductStockService:
         product_stock.save(update_fields=["quantity"])
 
         logger.info(
-            f"Stock adjusted | product={product.id} | branch={branch.id} "
-            f"| change={quantity_change} | new_quantity={new_quantity}"
+            "Stock adjusted | product={} | branch={} | change={} | new_quantity={}",
+            product.id, branch.id, quantity_change, new_quantity,
         )
 
         return product_stock
 
+    @staticmethod
+    def _lock_stock_rows(*, company, keys: list[tuple[int, int]]) -> dict:
+        """
+        Lock every ProductStock row for the given (product_id, branch_id) keys
+        in a single query, ordered by (product_id, branch_id) so concurrent
+        postings always acquire locks in the same order.
+        Missing rows are created with zero quantity and then locked.
+        """
+        products_per_branch = {}
+        for product_id, branch_id in keys:
+            products_per_branch.setdefault(branch_id, []).append(product_id)
+
+        key_filter = Q()
+        for branch_id, product_ids in products_per_branch.items():
+            key_filter |= Q(branch_id=branch_id, product_id__in=product_ids)
+
+        queryset = (
+            ProductStock.objects.select_for_update()
+            .filter(key_filter)
+            .order_by("product_id", "branch_id")
+        )
+        stocks = {(stock.product_id, stock.branch_id): stock for stock in queryset}
+
+        missing = [key for key in keys if key not in stocks]
+        if missing:
+            ProductStock.objects.bulk_create(
+                [
+                    ProductStock(company=company, product_id=product_id, branch_id=branch_id, quantity=0)
+                    for product_id, branch_id in missing
+                ],
+                ignore_conflicts=True
+            )
+            stocks = {(stock.product_id, stock.branch_id): stock for stock in queryset.all()}
+
+        return stocks
+
+    @staticmethod
+    @db_transaction.atomic
+    def _post_stock_lines(*, company, lines: list[StockPostingLine], mode: str | None = None) -> list[StockMovement]:
+        """
+        Batched stock posting engine used by every document-level operation.
+        1. Lock all affected ProductStock rows in one query (deterministic order)
+        2. Validate every quantity change in memory
+        3. Apply the new quantities with a single bulk UPDATE
+        4. Bulk insert the matching StockMovement rows with quantity_before/quantity_after
+        In "delta" mode (settings.STOCK_POSTING or mode=) steps 1 and 3 become one conditional
+        UPDATE per row with the net change, in the same deterministic order; quantity_before is
+        derived from the returned quantity. Any failed check rolls the whole posting back.
+        """
+        if not lines:
+            return []
+
+        mode = ProductStockService._posting_mode(mode)
+        keys = sorted({(line.product.id, line.branch.id) for line in lines})
+        if mode == 'delta':
+            net_changes = {key: 0 for key in keys}
+            for line in lines:
+                net_changes[(line.product.id, line.branch.id)] += line.quantity_change
+            starting = {}
+            for product_id, branch_id in keys:
+                quantity_after = ProductStockService._apply_stock_delta_or_raise(
+                    company=company, product_id=product_id, branch_id=branch_id,
+                    quantity_change=net_changes[(product_id, branch_id)],
+                )
+                starting[(product_id, branch_id)] = quantity_after - net_changes[(product_id, branch_id)]
+        else:
+            stocks = ProductStockService._lock_stock_rows(company=company, keys=keys)
+            starting = {key: stocks[key].quantity for key in keys}
+
+        running = dict(starting)
+        movements = []
+        reference_numbers = iter(DocumentNumberService.next_numbers('stock_movement', company.id, len(lines)))
+        for line in lines:
+            key = (line.product.id, line.branch.id)
+            quantity_before = running[key]
+            quantity_after = quantity_before + line.quantity_change
+
+            if quantity_after < 0:
+                raise ValueError(
+                    f"Insufficient stock | product={line.product.id} | "
+                    f"available={quantity_before} | requested={line.quantity_change}"
+                )
+
+            running[key] = quantity_after
+            movement = StockMovement(
+                company=company,
+                branch=line.branch,
+                product=line.product,
+                quantity=abs(line.quantity_change),
+                movement_type=line.movement_type,
+                quantity_before=quantity_before,
+                quantity_after=quantity_after,
+                unit_cost=line.unit_cost,
+                sales_order=line.sales_order,
+                sales_invoice=line.sales_invoice,
+                sales_return=line.sales_return,
+                purchase_order=line.purchase_order,
+                purchase_invoice=line.purchase_invoice,
+                purchase_return=line.purchase_return,
+                reason=line.reason,
+            )
+            # bulk_create bypasses save(), so apply its defaults here
+            movement.reference_number = next(reference_numbers)
+            movement.calculate_total_cost()
+            movements.append(movement)
+
+        changed = [key for key in keys if running[key] != starting[key]]
+        if changed and mode == 'locking':
+            now = timezone.now()
+            for key in changed:
+                stocks[key].quantity = running[key]
+                stocks[key].updated_at = now
+            ProductStock.objects.bulk_update([stocks[key] for key in changed], ["quantity", "updated_at"])
+        if changed:
+            # bulk and raw updates skip the save signals that feed the till catalogue deltas
+            CatalogueService.record(
+                company.id, CatalogueChange.Kind.STOCK, [(branch_id, product_id) for product_id, branch_id in changed]
+            )
+        StockMovement.objects.bulk_create(movements)
+
+        logger.info(
+            "Stock posted | company={} | lines={} | stock_rows={} | mode={}",
+            company.id, len(lines), len(keys), mode,
+        )
+
+        return movements
+
     # ==========================================================
     # SALES (DECREASE STOCK)
     # ==========================================================
@@ -84,31 +324,28 @@ class ProductStockService:
         if receipt.is_stock_posted:
             raise ValueError("Stock already deducted for this sales receipt.")
 
-        for item in receipt.items.all().select_related("product"):
-            ProductStockService._adjust_stock(
-                product=item.product,
-                company=receipt.company,
-                branch=receipt.branch,
-                quantity_change=-item.quantity
-            )
-            # Record the stock movement of every product on the receipt
-            StockMovementService.create_stock_movement(
-                company = receipt.company,
-                branch = receipt.branch,
-                product = item.product,
-                quantity = item.quantity,
-                movement_type= StockMovement.MovementType.SALE,
-                sales_order=item.sales_order,
-                sales_invoice=item.sales_invoice,
-                reason='SALES'
-
-            )
+        # Record the stock movement of every product on the receipt
+        ProductStockService._post_stock_lines(
+            company=receipt.company,
+            lines=[
+                StockPostingLine(
+                    product=item.product,
+                    branch=receipt.branch,
+                    quantity_change=-item.quantity,
+                    movement_type=StockMovement.MovementType.SALE,
+                    sales_order=item.sales_order,
+                    sales_invoice=getattr(item, "sales_invoice", None),
+                    reason='SALES'
+                )
+                for item in receipt.items.all().select_related("product")
+            ]
+        )
         receipt.is_stock_posted = True
         receipt.save(update_fields=["is_stock_posted"])
 
         
 
-        logger.info(f"Stock decreased for sales receipt | receipt={receipt.id}")
+        logger.info("Stock decreased for sales receipt | receipt={}", receipt.id)
 
     # ==========================================================
     # PURCHASES (INCREASE STOCK)
@@ -123,29 +360,26 @@ class ProductStockService:
         if getattr(purchase_order, "is_stock_posted", False):
             raise ValueError("Stock already increased for this purchase order.")
 
-        for item in purchase_order.items.all().select_related("product"):
-            ProductStockService._adjust_stock(
-                product=item.product,
-                company=purchase_order.company,
-                branch=purchase_order.branch,
-                quantity_change=item.quantity
-            )
-
-            StockMovementService.create_stock_movement(
-                company = purchase_order.company,
-                branch = purchase_order.branch,
-                product = item.product,
-                quantity = item.quantity,
-                movement_type= StockMovement.MovementType.PURCHASE,
-                purchase_order=item.purchase_order,
-                purchase_invoice=item.purchase_invoice,
-                reason='PURCHASE'
-            )
+        ProductStockService._post_stock_lines(
+            company=purchase_order.company,
+            lines=[
+                StockPostingLine(
+                    product=item.product,
+                    branch=purchase_order.branch,
+                    quantity_change=item.quantity,
+                    movement_type=StockMovement.MovementType.PURCHASE,
+                    purchase_order=item.purchase_order,
+                    purchase_invoice=getattr(item, "purchase_invoice", None),
+                    reason='PURCHASE'
+                )
+                for item in purchase_order.items.all().select_related("product")
+            ]
+        )
 
         purchase_order.is_stock_posted = True
         purchase_order.save(update_fields=["is_stock_posted"])
 
-        logger.info(f"Stock increased for purchase order | order={purchase_order.id}")
+        logger.info("Stock increased for purchase order | order={}", purchase_order.id)
 
     @staticmethod
     @db_transaction.atomic
@@ -157,29 +391,26 @@ class ProductStockService:
         if getattr(purchase_invoice, "is_stock_posted", False):
             raise ValueError("Stock already increased for this purchase invoice.")
 
-        for item in purchase_invoice.items.all().select_related("product"):
-            ProductStockService._adjust_stock(
-                product=item.product,
-                company=purchase_invoice.company,
-                branch=purchase_invoice.branch,
-                quantity_change=item.quantity
-            )
-
-            StockMovementService.create_stock_movement(
-                company = purchase_invoice.company,
-                branch = purchase_invoice.branch,
-                product = item.product,
-                quantity = item.quantity,
-                movement_type= StockMovement.MovementType.PURCHASE,
-                purchase_order=item.purchase_order,
-                purchase_invoice=item.purchase_invoice,
-                reason='PURCHASE'
-            )
+        ProductStockService._post_stock_lines(
+            company=purchase_invoice.company,
+            lines=[
+                StockPostingLine(
+                    product=item.product,
+                    branch=purchase_invoice.branch,
+                    quantity_change=item.quantity,
+                    movement_type=StockMovement.MovementType.PURCHASE,
+                    purchase_order=getattr(item, "purchase_order", None),
+                    purchase_invoice=item.purchase_invoice,
+                    reason='PURCHASE'
+                )
+                for item in purchase_invoice.items.all().select_related("product")
+            ]
+        )
 
         purchase_invoice.is_stock_posted = True
         purchase_invoice.save(update_fields=["is_stock_posted"])
 
-        logger.info(f"Stock increased for purchase invoice | invoice={purchase_invoice.id}")
+        logger.info("Stock increased for purchase invoice | invoice={}", purchase_invoice.id)
     
     @staticmethod
     @db_transaction.atomic
@@ -190,27 +421,25 @@ class ProductStockService:
         if getattr(purchase_return, "is_stock_posted", False):
             raise ValueError("Stock already decreased for this purchase return.")
 
-        for item in purchase_return.items.all().select_related("product"):
-            ProductStockService._adjust_stock(
-                product=item.product,
-                company=purchase_return.company,
-                branch=purchase_return.branch,
-                quantity_change=-item.quantity
-            )
-
-            StockMovementService.create_stock_movement(
-                company=purchase_return.company,
-                branch=purchase_return.branch,
-                product=item.product,
-                quantity=item.quantity,
-                movement_type=StockMovement.MovementType.PURCHASE_RETURN,
-                reason='PURCHASE_RETURN'
-            )
+        ProductStockService._post_stock_lines(
+            company=purchase_return.company,
+            lines=[
+                StockPostingLine(
+                    product=item.product,
+                    branch=purchase_return.branch,
+                    quantity_change=-item.quantity,
+                    movement_type=StockMovement.MovementType.PURCHASE_RETURN,
+                    purchase_return=purchase_return,
+                    reason='PURCHASE_RETURN'
+                )
+                for item in purchase_return.items.all().select_related("product")
+            ]
+        )
 
         purchase_return.is_stock_posted = True
         purchase_return.save(update_fields=["is_stock_posted"])
 
-        logger.info(f"Stock decreased for purchase return | return={purchase_return.id}")
+        logger.info("Stock decreased for purchase return | return={}", purchase_return.id)
 
 
     
@@ -223,26 +452,25 @@ class ProductStockService:
         if getattr(sales_return, "is_stock_posted", False):
             raise ValueError("Stock already increased for this sales return.")
 
-        for item in sales_return.items.all().select_related("product"):
-            ProductStockService._adjust_stock(
-                product=item.product,
-                company=sales_return.company,
-                branch=sales_return.branch,
-                quantity_change=item.quantity
-            )
-            StockMovementService.create_stock_movement(
-                company=sales_return.company,
-                branch=sales_return.branch,
-                product=item.product,
-                quantity=item.quantity,
-                movement_type=StockMovement.MovementType.SALE_RETURN,
-                unit_cost=item.unit_price,
-                reason='SALE_RETURN'
-            )
+        ProductStockService._post_stock_lines(
+            company=sales_return.company,
+            lines=[
+                StockPostingLine(
+                    product=item.product,
+                    branch=sales_return.branch,
+                    quantity_change=item.quantity,
+                    movement_type=StockMovement.MovementType.SALE_RETURN,
+                    unit_cost=item.unit_price,
+                    sales_return=sales_return,
+                    reason='SALE_RETURN'
+                )
+                for item in sales_return.items.all().select_related("product")
+            ]
+        )
         sales_return.is_stock_posted = True
         sales_return.save(update_fields=["is_stock_posted"])
 
-        logger.info(f"Stock increased for sales return | return={sales_return.id}")
+        logger.info("Stock increased for sales return | return={}", sales_return.id)
 
 
 
@@ -292,7 +520,7 @@ class ProductStockService:
             reason='SALES'
         )
 
-        logger.info(f"Stock decreased for sales item | item={item.id}, quantity={item.quantity}")
+        logger.info("Stock decreased for sales item | item={}, quantity={}", item.id, item.quantity)
 
 
     # ==========================================================
@@ -322,7 +550,7 @@ class ProductStockService:
             reason='PURCHASE'
         )
 
-        logger.info(f"Stock increased for purchase item | item={item.id}, quantity={item.quantity}")
+        logger.info("Stock increased for purchase item | item={}, quantity={}", item.id, item.quantity)
 
 
     # ==========================================================
@@ -350,7 +578,7 @@ class ProductStockService:
             reason='PURCHASE_RETURN'
         )
 
-        logger.info(f"Stock decreased for purchase return item | item={item.id}, quantity={item.quantity}")
+        logger.info("Stock decreased for purchase return item | item={}, quantity={}", item.id, item.quantity)
 
 
     # ==========================================================
@@ -380,7 +608,7 @@ class ProductStockService:
             sales_return=item.sales_return
         )
 
-        logger.info(f"Stock increased for sales return item | item={item.id}, quantity={item.quantity}")
+        logger.info("Stock increased for sales return item | item={}, quantity={}", item.id, item.quantity)
 
 
 
@@ -441,23 +669,20 @@ class ProductStockService:
         if sales_receipt.is_stock_reversed:
             raise ValueError("Stock already reversed for this receipt.")
 
-        for item in sales_receipt.items.all().select_related("product"):
-            ProductStockService._adjust_stock(
-                product=item.product,
-                company=sales_receipt.company,
-                branch=sales_receipt.branch,
-                quantity_change=item.quantity
-            )
-
-            StockMovementService.create_stock_movement(
-                company = sales_receipt.company,
-                branch = sales_receipt.branch,
-                product = item.product,
-                quantity = item.quantity,
-                movement_type= StockMovement.MovementType.VOIDED_SALE,
-                sales_receipt=sales_receipt,
-                reason=reason
-            )
+        ProductStockService._post_stock_lines(
+            company=sales_receipt.company,
+            lines=[
+                StockPostingLine(
+                    product=item.product,
+                    branch=sales_receipt.branch,
+                    quantity_change=item.quantity,
+                    movement_type=StockMovement.MovementType.VOIDED_SALE,
+                    sales_order=item.sales_order,
+                    reason=reason
+                )
+                for item in sales_receipt.items.all().select_related("product")
+            ]
+        )
 
         sales_receipt.is_stock_reversed = True
         sales_receipt.save(update_fields=["is_stock_reversed"])
@@ -510,8 +735,8 @@ class ProductStockService:
         )
 
         logger.info(
-            f"Manual stock adjustment | product={product.id} | branch={branch.id} "
-            f"| change={quantity_change} | reason={reason} | performed_by={performed_by.id}"
+            "Manual stock adjustment | product={} | branch={} | change={} | reason={} | performed_by={}",
+            product.id, branch.id, quantity_change, reason, performed_by.id,
         )
 
         return stock
@@ -661,24 +886,22 @@ class ProductStockService:
         Decrease stock from the source branch for all items in a transfer.
         """
         source_branch = transfer.source_branch
-        for item in transfer.items.select_related("product"):
-            ProductStockService._adjust_stock(
-                product=item.product,
-                company=transfer.company,
-                branch=source_branch,
-                quantity_change=-(item.quantity)
-            )
-
-            StockMovementService.create_stock_movement(
-                company=transfer.company,
-                branch=source_branch,
-                product=item.product,
-                quantity=item.quantity,
-                movement_type=StockMovement.MovementType.TRANSFER_OUT,
-                reason=f"Transfer {transfer.reference_number} from {source_branch.id} to {transfer.destination_branch.id}"
-            )
+        reason = f"Transfer {transfer.reference_number} from {source_branch.id} to {transfer.destination_branch_id}"
+        ProductStockService._post_stock_lines(
+            company=transfer.company,
+            lines=[
+                StockPostingLine(
+                    product=item.product,
+                    branch=source_branch,
+                    quantity_change=-(item.quantity),
+                    movement_type=StockMovement.MovementType.TRANSFER_OUT,
+                    reason=reason
+                )
+                for item in transfer.items.select_related("product")
+            ]
+        )
 
-        logger.info(f"Stock decreased for transfer | branch={source_branch.id} | transfer={transfer.id}")
+        logger.info("Stock decreased for transfer | branch={} | transfer={}", source_branch.id, transfer.id)
 
 
 
@@ -689,23 +912,22 @@ class ProductStockService:
         Increase stock in the destination branch for all items in a transfer.
         """
         dest_branch = transfer.destination_branch
-        for item in transfer.items.select_related("product"):
-            ProductStockService._adjust_stock(
-                product=item.product,
-                company=transfer.company,
-                branch=dest_branch,
-                quantity_change=item.quantity
-            )
-            StockMovementService.create_stock_movement(
-                company=transfer.company,
-                branch=dest_branch,
-                product=item.product,
-                quantity=item.quantity,
-                movement_type=StockMovement.MovementType.TRANSFER_IN,
-                reason=f"Transfer {transfer.reference_number} from {transfer.source_branch.id} to {dest_branch.id}"
-            )
+        reason = f"Transfer {transfer.reference_number} from {transfer.source_branch_id} to {dest_branch.id}"
+        ProductStockService._post_stock_lines(
+            company=transfer.company,
+            lines=[
+                StockPostingLine(
+                    product=item.product,
+                    branch=dest_branch,
+                    quantity_change=item.quantity,
+                    movement_type=StockMovement.MovementType.TRANSFER_IN,
+                    reason=reason
+                )
+                for item in transfer.items.select_related("product")
+            ]
+        )
 
-        logger.info(f"Stock increased for transfer | branch={dest_branch.id} | transfer={transfer.id}")
+        logger.info("Stock increased for transfer | branch={} | transfer={}", dest_branch.id, transfer.id)
 
         
     @staticmethod
@@ -52,8 +52,8 @@ class StockMovementService:
                 reason=reason,
             )
             logger.info(
-                f"Stock movement created | Product={product.name} | "
-                f"Branch={branch.name} | Type={movement_type} | Qty={quantity}"
+                "Stock movement created | Product={} | Branch={} | Type={} | Qty={}",
+                product.id, branch.id, movement_type, quantity,
             )
             return stock_movement
         except Exception as e:
@@ -76,7 +76,7 @@ class StockMovementService:
             if field in ALLOWED_UPDATE_FIELDS:
                 setattr(stock_movement, field, value)
         stock_movement.save()
-        logger.info(f"Stock movement updated | id={stock_movement.id}")
+        logger.info("Stock movement updated | id={}", stock_movement.id)
         return stock_movement
 
     @staticmethod
@@ -120,7 +120,8 @@ class StockMovementService:
             else:
                 qs = qs.order_by("movement_date")
 
-            logger.info(f"Retrieved {qs.count()} stock movements with filters: {filters}")
+            # lazy: the COUNT only runs when DEBUG is logged
+            logger.opt(lazy=True).debug("Retrieved {} stock movements with filters: {}", qs.count, lambda: filters)
             return qs
 
         except Exception as e:
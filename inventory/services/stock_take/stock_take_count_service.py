@@ -0,0 +1,169 @@
+from dataclasses import dataclass, field
+from django.db import transaction as db_transaction
+from django.utils import timezone
+from loguru import logger
+from inventory.models.product_model import Product
+from inventory.models.product_stock_model import ProductStock
+from inventory.models.stock_take_item_model import StockTakeItem
+from inventory.models.stock_take_model import StockTake
+from inventory.services.stock_take.stock_take_reconciliation_service import StockTakeReconcialiationService
+
+
+DEFAULT_BATCH_SIZE = 1000
+# failures beyond this are counted but not kept
+MAX_REPORTED_FAILURES = 1000
+# stock takes that still accept counts
+COUNTABLE_STATUSES = ('open', 'pending')
+
+UPSERT_FIELDS = ['expected_quantity', 'counted_quantity', 'adjusted_quantity', 'confirmed', 'updated_at']
+
+
+@dataclass
+class CountReport:
+    received: int = 0
+    created: int = 0
+    updated: int = 0
+    skipped_confirmed: int = 0
+    failed: int = 0
+    reconciled: int = 0
+    failures: list = field(default_factory=list)
+
+    def add_failure(self, line: dict, error: str):
+        self.failed += 1
+        if len(self.failures) < MAX_REPORTED_FAILURES:
+            self.failures.append({'product_id': line.get('product_id'), 'error': error})
+
+    def as_dict(self) -> dict:
+        return {
+            'received': self.received,
+            'created': self.created,
+            'updated': self.updated,
+            'skipped_confirmed': self.skipped_confirmed,
+            'failed': self.failed,
+            'reconciled': self.reconciled,
+            'failures': self.failures,
+        }
+
+
+class StockTakeCountService:
+    """
+    Bulk stock take counting.
+    Counted lines are upserted on (stock_take, product) in batches: per batch one product lookup,
+    one ProductStock lookup for missing expected quantities, one lookup of existing lines and one upsert.
+    Stock take totals are computed once and in-flight movements reconciled with a single grouped
+    aggregate (see StockTakeReconcialiationService.reconcile_stock_take), instead of per line.
+    """
+
+    @staticmethod
+    def _merge_lines(lines: list[dict], report: CountReport) -> dict:
+        """
+        {product_id: line}; a product counted twice (two shelves) adds up.
+        """
+        merged = {}
+        for line in lines:
+            report.received += 1
+            product_id = line.get('product_id')
+            counted = line.get('counted_quantity')
+            if product_id is None or counted is None or counted < 0:
+                report.add_failure(line, "product_id and a non-negative counted_quantity are required")
+                continue
+            if product_id in merged:
+                merged[product_id]['counted_quantity'] += counted
+                if line.get('expected_quantity') is not None:
+                    merged[product_id]['expected_quantity'] = line['expected_quantity']
+            else:
+                merged[product_id] = {
+                    'product_id': product_id,
+                    'counted_quantity': counted,
+                    'expected_quantity': line.get('expected_quantity'),
+                }
+        return merged
+
+    @staticmethod
+    def _ingest_batch(stock_take: StockTake, batch: list[dict], confirm: bool, report: CountReport) -> list[int]:
+        product_ids = [line['product_id'] for line in batch]
+        known = set(
+            Product.objects.filter(company=stock_take.company, branch=stock_take.branch, id__in=product_ids)
+            .values_list('id', flat=True)
+        )
+        existing = dict(
+            StockTakeItem.objects.filter(stock_take=stock_take, product_id__in=product_ids)
+            .values_list('product_id', 'confirmed')
+        )
+        missing_expected = [line['product_id'] for line in batch if line['expected_quantity'] is None]
+        on_hand = dict(
+            ProductStock.objects.filter(branch=stock_take.branch, product_id__in=missing_expected)
+            .values_list('product_id', 'quantity')
+        ) if missing_expected else {}
+
+        now = timezone.now()
+        items = []
+        for line in batch:
+            product_id = line['product_id']
+            if product_id not in known:
+                report.add_failure(line, "Product not found in this stock take's branch")
+                continue
+            if existing.get(product_id):
+                report.skipped_confirmed += 1
+                continue
+            expected = line['expected_quantity']
+            items.append(StockTakeItem(
+                stock_take=stock_take,
+                product_id=product_id,
+                expected_quantity=expected if expected is not None else on_hand.get(product_id, 0),
+                counted_quantity=line['counted_quantity'],
+                adjusted_quantity=line['counted_quantity'],
+                confirmed=confirm,
+                updated_at=now,
+            ))
+
+        if items:
+            # bulk_create skips StockTakeItem.save(), which would re-total the stock take per line
+            StockTakeItem.objects.bulk_create(
+                items,
+                update_conflicts=True,
+                unique_fields=['stock_take', 'product'],
+                update_fields=UPSERT_FIELDS,
+            )
+            updated = sum(1 for item in items if item.product_id in existing)
+            report.updated += updated
+            report.created += len(items) - updated
+        return [item.product_id for item in items]
+
+    @staticmethod
+    @db_transaction.atomic
+    def ingest_counts(*,
+                      stock_take: StockTake,
+                      lines: list[dict],
+                      confirm: bool = False,
+                      reconcile: bool = True,
+                      batch_size: int = DEFAULT_BATCH_SIZE,
+                      ) -> CountReport:
+        """
+        Record counted lines ({product_id, counted_quantity, expected_quantity?}) on a stock take.
+        Expected quantities default to the branch's current ProductStock level.
+        Lines already confirmed are left alone; confirm=True confirms the lines written now.
+        """
+        if stock_take.is_finalized or stock_take.status not in COUNTABLE_STATUSES:
+            raise ValueError(f"Stock take {stock_take.id} is not accepting counts (status '{stock_take.status}').")
+
+        report = CountReport()
+        merged = list(StockTakeCountService._merge_lines(lines, report).values())
+        counted_products = []
+        for start in range(0, len(merged), batch_size):
+            counted_products += StockTakeCountService._ingest_batch(
+                stock_take, merged[start:start + batch_size], confirm, report
+            )
+
+        if counted_products:
+            Product.objects.filter(id__in=counted_products, is_stock_take_item=False).update(is_stock_take_item=True)
+        stock_take.update_totals()
+        if reconcile:
+            report.reconciled = StockTakeReconcialiationService.reconcile_stock_take(stock_take, batch_size=batch_size)
+
+        logger.info(
+            f"Stock take counts ingested | stock_take={stock_take.id} | received={report.received} "
+            f"| created={report.created} | updated={report.updated} | skipped_confirmed={report.skipped_confirmed} "
+            f"| failed={report.failed}"
+        )
+        return report
@@ -3,9 +3,24 @@ from django.db import transaction as db_transaction
 from loguru import logger
 from inventory.models.stock_take_model import StockTake
 from inventory.models import StockMovement
+from django.db.models import Sum
 from django.utils import timezone
 
 
+# movement type -> (breakdown key, effect on the counted quantity)
+MOVEMENT_ADJUSTMENTS = {
+    "SALE": ("sold", -1),
+    "TRANSFER_OUT": ("transferred_out", -1),
+    "PURCHASE_RETURN": ("purchases_return", -1),
+    "DAMAGE": ("damaged", -1),
+    "WRITE_OFF": ("written_off", -1),
+    "MANUAL_DECREASE": ("manually_decreased", -1),
+    "PURCHASE": ("purchases", 1),
+    "TRANSFER_IN": ("transferred_in", 1),
+    "SALE_RETURN": ("sales_returns", 1),
+    "MANUAL_INCREASE": ("manually_increased", 1),
+}
+
 
 class StockTakeReconcialiationService:
 
@@ -16,18 +31,7 @@ class StockTakeReconcialiationService:
         Adjust a counted stocktake quantity based on stock movements that occurred after counting.
         Returns adjusted quantity and breakdown.
         """
-        type_map = {
-            "SALE": ("sold", -1),
-            "TRANSFER_OUT": ("transferred_out", -1),
-            "PURCHASE_RETURN": ("purchases_return", -1),
-            "DAMAGE": ("damaged", -1),
-            "WRITE_OFF": ("written_off", -1),
-            "MANUAL_DECREASE": ("manually_decreased", -1),
-            "PURCHASE": ("purchases", 1),
-            "TRANSFER_IN": ("transferred_in", 1),
-            "SALE_RETURN": ("sales_returns", 1),
-            "MANUAL_INCREASE": ("manually_increased", 1),
-        }
+        type_map = MOVEMENT_ADJUSTMENTS
 
         counters = {name: 0 for name, _ in type_map.values()}
         adjusted_quantity = counted_quantity or 0
@@ -85,3 +89,65 @@ class StockTakeReconcialiationService:
             branch=stock_take_item.stock_take.branch,
             movement_date__gte=movement_date_gte,
         )
+
+    @staticmethod
+    def movement_totals_during_stock_take(stock_take: StockTake) -> dict:
+        """
+        {product_id: {movement_type: quantity}} for every product on the stock take,
+        from one grouped aggregate over the branch's movements since the count started.
+        """
+        movement_date_gte = stock_take.started_at or timezone.now()
+        totals = (
+            StockMovement.objects.filter(
+                company=stock_take.company,
+                branch=stock_take.branch,
+                movement_date__gte=movement_date_gte,
+                product_id__in=StockTakeItem.objects.filter(stock_take=stock_take).values('product_id'),
+            )
+            .values('product_id', 'movement_type')
+            .annotate(quantity=Sum('quantity'))
+            .order_by()
+        )
+        by_product = {}
+        for row in totals:
+            by_product.setdefault(row['product_id'], {})[row['movement_type']] = row['quantity'] or 0
+        return by_product
+
+    @staticmethod
+    @db_transaction.atomic
+    def reconcile_stock_take(stock_take: StockTake, batch_size: int = 1000) -> int:
+        """
+        Set adjusted_quantity and movement_breakdown on every item of a stock take for the stock
+        that moved while it was being counted. One aggregate for all products, then batched UPDATEs.
+        Returns the number of items reconciled.
+        """
+        movements = StockTakeReconcialiationService.movement_totals_during_stock_take(stock_take)
+        now = timezone.now()
+        pending = []
+        reconciled = 0
+        # read up front: the rows are updated while we go
+        items = list(StockTakeItem.objects.filter(stock_take=stock_take).values_list('id', 'product_id', 'counted_quantity'))
+        for item_id, product_id, counted_quantity in items:
+            counters = {name: 0 for name, _ in MOVEMENT_ADJUSTMENTS.values()}
+            adjusted_quantity = counted_quantity or 0
+            for movement_type, quantity in movements.get(product_id, {}).items():
+                if movement_type in MOVEMENT_ADJUSTMENTS:
+                    key, direction = MOVEMENT_ADJUSTMENTS[movement_type]
+                    counters[key] += quantity
+                    adjusted_quantity += direction * quantity
+            pending.append(StockTakeItem(
+                id=item_id, adjusted_quantity=adjusted_quantity, movement_breakdown=counters, updated_at=now
+            ))
+            if len(pending) >= batch_size:
+                StockTakeItem.objects.bulk_update(pending, ['adjusted_quantity', 'movement_breakdown', 'updated_at'])
+                reconciled += len(pending)
+                pending = []
+        if pending:
+            StockTakeItem.objects.bulk_update(pending, ['adjusted_quantity', 'movement_breakdown', 'updated_at'])
+            reconciled += len(pending)
+
+        logger.info(
+            f"Stock take reconciled | stock_take={stock_take.id} | items={reconciled} "
+            f"| products_with_movements={len(movements)}"
+        )
+        return reconciled
@@ -0,0 +1,62 @@
+# inventory/signals/catalogue_change_signal.py
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from branch.models.branch_model import Branch
+from company.models.company_model import Company
+from inventory.models.catalogue_change_model import CatalogueChange
+from inventory.models.product_category_model import ProductCategory
+from inventory.models.product_model import Product
+from inventory.models.product_stock_model import ProductStock
+from inventory.services.catalogue.catalogue_service import CatalogueService
+
+
+def _tenant_deleted(origin) -> bool:
+    # deleting a company or branch cascades to its whole catalogue; nobody is left to sync it
+    model = getattr(origin, 'model', type(origin))
+    return issubclass(model, (Company, Branch))
+
+
+def _record_saved(instance, kind):
+    # a row moved to another branch is gone for the old branch's terminals; the deletion goes first
+    # so a terminal that sees both (a company-wide category) keeps the newer change
+    previous = getattr(instance, '_loaded_branch_id', instance.branch_id)
+    if previous != instance.branch_id:
+        CatalogueService.record(instance.company_id, kind, [(previous, instance.id)], deleted=True)
+    CatalogueService.record(instance.company_id, kind, [(instance.branch_id, instance.id)])
+    instance._loaded_branch_id = instance.branch_id
+
+
+@receiver(post_save, sender=Product, dispatch_uid='catalogue_change_product_saved')
+def product_saved(sender, instance, raw=False, **kwargs):
+    if not raw:
+        _record_saved(instance, CatalogueChange.Kind.PRODUCT)
+
+
+@receiver(post_delete, sender=Product, dispatch_uid='catalogue_change_product_deleted')
+def product_deleted(sender, instance, origin=None, **kwargs):
+    if not _tenant_deleted(origin):
+        CatalogueService.record(instance.company_id, CatalogueChange.Kind.PRODUCT, [(instance.branch_id, instance.id)], deleted=True)
+
+
+@receiver(post_save, sender=ProductCategory, dispatch_uid='catalogue_change_category_saved')
+def category_saved(sender, instance, raw=False, **kwargs):
+    if not raw:
+        _record_saved(instance, CatalogueChange.Kind.CATEGORY)
+
+
+@receiver(post_delete, sender=ProductCategory, dispatch_uid='catalogue_change_category_deleted')
+def category_deleted(sender, instance, origin=None, **kwargs):
+    if not _tenant_deleted(origin):
+        CatalogueService.record(instance.company_id, CatalogueChange.Kind.CATEGORY, [(instance.branch_id, instance.id)], deleted=True)
+
+
+@receiver(post_save, sender=ProductStock, dispatch_uid='catalogue_change_stock_saved')
+def stock_saved(sender, instance, raw=False, **kwargs):
+    if not raw:
+        CatalogueService.record(instance.company_id, CatalogueChange.Kind.STOCK, [(instance.branch_id, instance.product_id)])
+
+
+@receiver(post_delete, sender=ProductStock, dispatch_uid='catalogue_change_stock_deleted')
+def stock_deleted(sender, instance, origin=None, **kwargs):
+    if not _tenant_deleted(origin):
+        CatalogueService.record(instance.company_id, CatalogueChange.Kind.STOCK, [(instance.branch_id, instance.product_id)], deleted=True)
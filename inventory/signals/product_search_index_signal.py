@@ -0,0 +1,25 @@
+# inventory/signals/product_search_index_signal.py
+from django.db import transaction as db_transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from inventory.models.product_category_model import ProductCategory
+from inventory.models.product_model import Product
+from inventory.services.product_search.product_search_index import ProductSearchIndex
+
+
+# indexed after commit, so a rolled back save never shows up in till search
+@receiver(post_save, sender=Product, dispatch_uid='product_search_index_product_saved')
+def product_saved(sender, instance, **kwargs):
+    db_transaction.on_commit(lambda: ProductSearchIndex.update_product(instance))
+
+
+@receiver(post_delete, sender=Product, dispatch_uid='product_search_index_product_deleted')
+def product_deleted(sender, instance, **kwargs):
+    db_transaction.on_commit(lambda: ProductSearchIndex.remove_product(instance))
+
+
+# a renamed or deleted category changes the indexed words of all its products: rebuild lazily
+@receiver(post_save, sender=ProductCategory, dispatch_uid='product_search_index_category_saved')
+@receiver(post_delete, sender=ProductCategory, dispatch_uid='product_search_index_category_deleted')
+def category_changed(sender, instance, **kwargs):
+    db_transaction.on_commit(lambda: ProductSearchIndex.invalidate(instance.company_id))
@@ -0,0 +1,10 @@
+from celery import shared_task
+from inventory.services.product.product_import_job_service import ProductImportJobService
+
+
+@shared_task(ignore_result=True)
+def run_product_import_task(job_id):
+    """
+    Run a queued product CSV import job ("celery" import mode).
+    """
+    ProductImportJobService.run_job(job_id)
@@ -632,4 +632,620 @@ def test_product_bulk_operations(client, test_user_token):
 #         HTTP_AUTHORIZATION=f'Bearer {test_user_token}'
 #     )
 #     logger.info(response.json())
-#     assert response.status_code == 201
\ No newline at end of file
+#     assert response.status_code == 201
+
+# ==========================================
+# BATCHED STOCK POSTING
+# ==========================================
+
+@pytest.mark.django_db
+def test_post_stock_lines_batches_updates_and_movements(test_company_fixture, create_branch, test_stocked_products_fixture):
+    """
+    Test the batched posting engine locks, updates and records movements in a bounded number of queries.
+    """
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    from inventory.services.product_stock.product_stock_service import ProductStockService, StockPostingLine
+    from core.services.document_numbering.document_number_service import DocumentNumberService
+
+    bread, milk, airtime = test_stocked_products_fixture
+    lines = [
+        StockPostingLine(product=bread, branch=create_branch, quantity_change=-3, movement_type=StockMovement.MovementType.SALE),
+        StockPostingLine(product=milk, branch=create_branch, quantity_change=-1, movement_type=StockMovement.MovementType.SALE),
+        StockPostingLine(product=bread, branch=create_branch, quantity_change=-2, movement_type=StockMovement.MovementType.SALE),
+        StockPostingLine(product=airtime, branch=create_branch, quantity_change=5, movement_type=StockMovement.MovementType.PURCHASE),
+    ]
+    # steady state: this process already holds a block of movement reference numbers
+    DocumentNumberService.allocate('stock_movement', test_company_fixture.id)
+
+    with CaptureQueriesContext(connection) as queries:
+        movements = ProductStockService._post_stock_lines(company=test_company_fixture, lines=lines)
+
+    # lock + bulk update + catalogue change feed + bulk insert (plus savepoint bookkeeping)
+    assert len([q for q in queries.captured_queries if 'SAVEPOINT' not in q['sql']]) == 4
+
+    stock = {s.product_id: s.quantity for s in ProductStock.objects.all()}
+    assert stock == {bread.id: 5, milk.id: 9, airtime.id: 15}
+
+    assert [(m.quantity_before, m.quantity_after) for m in movements] == [(10, 7), (10, 9), (7, 5), (10, 15)]
+    assert StockMovement.objects.filter(movement_type=StockMovement.MovementType.SALE).count() == 3
+
+
+@pytest.mark.django_db
+def test_post_stock_lines_rejects_insufficient_stock(test_company_fixture, create_branch, test_stocked_products_fixture):
+    """
+    Test the batched posting engine validates every line before writing anything.
+    """
+    from inventory.services.product_stock.product_stock_service import ProductStockService, StockPostingLine
+
+    bread, milk, _ = test_stocked_products_fixture
+    lines = [
+        StockPostingLine(product=milk, branch=create_branch, quantity_change=-4, movement_type=StockMovement.MovementType.SALE),
+        StockPostingLine(product=bread, branch=create_branch, quantity_change=-11, movement_type=StockMovement.MovementType.SALE),
+    ]
+
+    with pytest.raises(ValueError):
+        ProductStockService._post_stock_lines(company=test_company_fixture, lines=lines)
+
+    assert set(ProductStock.objects.values_list('quantity', flat=True)) == {10}
+    assert StockMovement.objects.count() == 0
+
+
+# ==========================================
+# STREAMING PRODUCT IMPORT
+# ==========================================
+
+@pytest.mark.django_db
+def test_product_import_upserts_in_chunks_and_runs_as_job(settings, tmp_path, test_company_fixture, create_branch, test_stocked_products_fixture, test_product_category_fixture):
+    """
+    Test the chunked CSV import upserts by SKU, resolves categories by name per chunk,
+    reports failed rows, and runs as a pollable job.
+    """
+    from decimal import Decimal
+    from io import BytesIO
+    from django.core.files.uploadedfile import SimpleUploadedFile
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    from inventory.models.product_import_job_model import ProductImportJob
+    from inventory.services.product.product_import_service import ProductImportService
+    from inventory.services.product.product_import_job_service import ProductImportJobService
+
+    bread = test_stocked_products_fixture[0]
+    rows = [
+        'name,description,price,sku,category,stock_quantity',
+        f'Bread Loaf,Updated,3.50,{bread.sku},test category,40',
+        'Butter,,4.10,BUT-1,Test Category,12',
+        'Jam,,2.00,JAM-1,,5',
+        'Broken,,not-a-price,BRK-1,,1',
+        'Ghost,,1.00,GHO-1,Missing Category,1',
+        'Butter 500g,,4.20,BUT-1,Test Category,15',
+    ]
+    payload = '\ufeff' + '\n'.join(rows)
+
+    with CaptureQueriesContext(connection) as queries:
+        report = ProductImportService.import_products(
+            company=test_company_fixture,
+            branch=create_branch,
+            csv_file=BytesIO(payload.encode('utf-8')),
+            chunk_size=3,
+        )
+    statements = [q for q in queries.captured_queries if 'SAVEPOINT' not in q['sql']]
+    # two chunks, each: category lookup + existing SKUs + one upsert + catalogue change feed
+    # (BUT-1 is created, then updated)
+    assert len(statements) <= 8
+
+    assert (report.rows_processed, report.created, report.updated, report.failed) == (6, 2, 2, 2)
+    assert [failure['row'] for failure in report.failures] == [5, 6]
+
+    bread.refresh_from_db()
+    assert (bread.name, bread.unit_price, bread.stock) == ('Bread Loaf', Decimal('3.50'), 40)
+    butter = Product.objects.get(company=test_company_fixture, branch=create_branch, sku='BUT-1')
+    assert (butter.name, butter.product_category) == ('Butter 500g', test_product_category_fixture)
+
+    settings.MEDIA_ROOT = str(tmp_path)
+    settings.PRODUCT_IMPORT = {'MODE': 'sync', 'CHUNK_SIZE': 2}
+    job = ProductImportJobService.create_job(
+        company=test_company_fixture,
+        branch=create_branch,
+        csv_file=SimpleUploadedFile('products.csv', '\n'.join(rows[:3] + ['Cheese,,6.00,CHE-1,Dairy,2']).encode('utf-8')),
+        create_missing_categories=True,
+    )
+    job = ProductImportJobService.dispatch(job)
+    job.refresh_from_db()
+    assert job.status == ProductImportJob.Status.COMPLETED
+    assert (job.rows_processed, job.created_count, job.updated_count, job.failed_count) == (3, 1, 2, 0)
+    assert ProductCategory.objects.filter(company=test_company_fixture, branch=create_branch, name='Dairy').exists()
+
+
+# ==========================================
+# EAGER LOADING
+# ==========================================
+
+@pytest.mark.django_db
+def test_product_list_queries_do_not_grow_with_page_size(test_company_fixture, create_branch, test_product_category_fixture, test_currency_fixture):
+    """
+    Test the product list serializes company, branch and category summaries without a query per row.
+    """
+    from rest_framework.test import APIClient
+    from config.eager_loading.eager_loading import related_fields_for
+    from inventory.serializers.product_serializer import ProductSerializer
+
+    Product.objects.bulk_create([
+        Product(
+            company=test_company_fixture,
+            branch=create_branch,
+            name=f'Product {index}',
+            description='Eager loading',
+            unit_price=1,
+            product_category=test_product_category_fixture,
+            sku=f'EAGER-{index}',
+        )
+        for index in range(10)
+    ])
+    user = User.objects.create_user(
+        username='eager', email='eager@example.com', password='eager', company=test_company_fixture,
+        branch=create_branch, role='Manager', first_name='Eager'
+    )
+    api_client = APIClient()
+    api_client.force_authenticate(user=user)
+
+    select, _ = related_fields_for(ProductSerializer, Product)
+    assert {'company', 'branch', 'product_category'} <= set(select)
+    assert_list_queries_constant(api_client, reverse('product-list'), small=1, large=10)
+
+
+# ==========================================
+# PRODUCT SEARCH
+# ==========================================
+
+@pytest.mark.django_db
+def test_product_search_ranks_prefix_code_and_fuzzy_matches(django_capture_on_commit_callbacks, test_company_fixture, create_branch, test_product_category_fixture, test_currency_fixture):
+    """
+    Test the in-process search index: exact barcode/SKU, every-word prefix matches,
+    typo-tolerant trigram matches, category names, and updates through the product and category signals.
+    """
+    from rest_framework.test import APIClient
+    from inventory.services.product_search.product_search_service import ProductSearchService
+
+    def make(name, sku, description=''):
+        return Product.objects.create(
+            company=test_company_fixture, branch=create_branch, name=name, sku=sku,
+            description=description, unit_price=1, product_category=test_product_category_fixture
+        )
+
+    coke = make('Coca Cola 500ml', '5449000000996', 'Soft drink')
+    coke_zero = make('Coca Cola Zero', '5449000131805', 'Sugar free soft drink')
+    make('Cocoa Powder', 'COC-100')
+    sugar = make('Sugar', 'SUG-1', 'White sugar 2kg')
+
+    assert ProductSearchService.backend() == 'memory'
+    assert ProductSearchService.search(test_company_fixture, '5449000000996') == [coke]
+    assert ProductSearchService.search(test_company_fixture, 'coca') == [coke_zero, coke]
+    assert ProductSearchService.search(test_company_fixture, 'coca zer') == [coke_zero]
+    # description words match, names rank above descriptions
+    assert ProductSearchService.search(test_company_fixture, 'sugar') == [sugar, coke_zero]
+    assert ProductSearchService.search(test_company_fixture, 'suger') == [sugar]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        coke.name = 'Coke Classic 500ml'
+        coke.save()
+        coke_zero.delete()
+    assert ProductSearchService.search(test_company_fixture, 'coca') == []
+    assert ProductSearchService.search(test_company_fixture, 'classic') == [coke]
+
+    user = User.objects.create_user(
+        username='till', email='till@example.com', password='till', company=test_company_fixture,
+        branch=create_branch, role='Sales', first_name='Till'
+    )
+    api_client = APIClient()
+    api_client.force_authenticate(user=user)
+    response = api_client.get(reverse('product-search'), {'q': 'coke'})
+    assert [row['id'] for row in response.data] == [coke.id]
+    response = api_client.get(reverse('product-lookup', kwargs={'code': 'SUG-1'}))
+    assert response.data['id'] == sugar.id
+    response = api_client.get(reverse('product-list'), {'search': 'cocoa'})
+    assert [row['name'] for row in response.data['results']] == ['Cocoa Powder']
+
+    # category names are indexed too, and a rename reaches every product in the category
+    assert ProductSearchService.search(test_company_fixture, 'test categ') != []
+    with django_capture_on_commit_callbacks(execute=True):
+        test_product_category_fixture.name = 'Beverages'
+        test_product_category_fixture.save()
+    assert ProductSearchService.search(test_company_fixture, 'test categ') == []
+    response = api_client.get(reverse('product-list'), {'search': 'bever'})
+    assert sorted(row['name'] for row in response.data['results']) == ['Cocoa Powder', 'Coke Classic 500ml', 'Sugar']
+
+
+@pytest.mark.django_db
+def test_product_search_index_rebuild_does_not_block_searches(monkeypatch, test_company_fixture, create_branch, test_product_category_fixture, test_currency_fixture):
+    """
+    Test a rebuild runs outside the index locks: another company's searches and this company's searches
+    on its stale index carry on meanwhile, and updates made during the rebuild reach the new index.
+    """
+    import threading
+    from inventory.services.product_search.product_search_index import (
+        MAX_AGE_SECONDS, CompanySearchIndex, ProductSearchIndex,
+    )
+
+    bread = Product.objects.create(
+        company=test_company_fixture, branch=create_branch, name='Bread', sku='BRD-1',
+        unit_price=1, product_category=test_product_category_fixture
+    )
+    company_id, other_company_id = test_company_fixture.id, test_company_fixture.id + 1
+    other = CompanySearchIndex()
+    other.add(1, create_branch.id, 'Milk', 'MLK-1', '')
+    ProductSearchIndex._indexes[other_company_id] = other
+    ProductSearchIndex.for_company(company_id).built_at -= MAX_AGE_SECONDS
+
+    original_build = ProductSearchIndex._build.__func__
+    results = {}
+
+    def search(name, search_company_id, term):
+        results[name] = [product_id for product_id, _ in ProductSearchIndex.search(search_company_id, term)]
+
+    def slow_build(cls, build_company_id):
+        built = original_build(cls, build_company_id)
+        workers = [
+            threading.Thread(target=search, args=('other', other_company_id, 'milk')),
+            threading.Thread(target=search, args=('stale', company_id, 'bread')),
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=5)
+        bread.name = 'Brown Bread'
+        ProductSearchIndex.update_product(bread)
+        return built
+
+    monkeypatch.setattr(ProductSearchIndex, '_build', classmethod(slow_build))
+    assert [product_id for product_id, _ in ProductSearchIndex.search(company_id, 'brown')] == [bread.id]
+    assert results == {'other': [1], 'stale': [bread.id]}
+
+
+# ==========================================
+# TILL CATALOGUE SYNC
+# ==========================================
+
+@pytest.mark.django_db
+def test_catalogue_snapshot_and_delta_sync(settings, test_company_fixture, create_branch, test_stocked_products_fixture):
+    """
+    Test a terminal cold start from the gzip snapshot, the 304 on an unchanged version,
+    and a delta carrying only the changed, deleted and restocked rows.
+    """
+    import gzip
+    import json
+    from rest_framework.test import APIClient
+    from inventory.models.catalogue_change_model import CatalogueChange
+    from inventory.services.catalogue.catalogue_service import CatalogueService
+    from inventory.services.product_stock.product_stock_service import ProductStockService, StockPostingLine
+
+    settings.CATALOGUE_SYNC = {**settings.CATALOGUE_SYNC, 'SETTLE_SECONDS': 0}
+    bread, milk, airtime = test_stocked_products_fixture
+    user = User.objects.create_user(
+        username='till', email='till@example.com', password='till', company=test_company_fixture,
+        branch=create_branch, role='Sales', first_name='Till'
+    )
+    api_client = APIClient()
+    api_client.force_authenticate(user=user)
+
+    response = api_client.get(reverse('product-catalogue'), HTTP_ACCEPT_ENCODING='gzip')
+    assert response.status_code == 200
+    assert response['Content-Encoding'] == 'gzip'
+    snapshot = json.loads(gzip.decompress(response.content))
+    version = snapshot['version']
+    assert version > 0
+    assert sorted(row[2] for row in snapshot['products']['rows']) == ['Airtime', 'Bread', 'Milk']
+    assert [row[1] for row in snapshot['stock']['rows']] == [10, 10, 10]
+    assert snapshot['categories']['rows'][0][1] == 'Test Category'
+
+    response = api_client.get(reverse('product-catalogue'), HTTP_IF_NONE_MATCH=response['ETag'])
+    assert response.status_code == 304
+
+    bread.unit_price = 3
+    bread.save()
+    airtime_id = airtime.id
+    airtime.delete()
+    ProductStockService._post_stock_lines(company=test_company_fixture, lines=[
+        StockPostingLine(product=milk, branch=create_branch, quantity_change=-4, movement_type=StockMovement.MovementType.SALE)
+    ])
+
+    response = api_client.get(reverse('product-catalogue-changes'), {'since': version})
+    delta = json.loads(response.content)
+    assert delta['reset'] is False and delta['version'] > version
+    assert [(row[0], row[4]) for row in delta['products']['rows']] == [(bread.id, '3.00')]
+    assert delta['deleted']['products'] == [airtime_id]
+    assert delta['stock']['rows'] == [[milk.id, 6, 0, delta['stock']['rows'][0][3]]]
+    assert delta['deleted']['stock'] == [airtime_id]
+
+    response = api_client.get(reverse('product-catalogue-changes'), {'since': delta['version']})
+    assert json.loads(response.content)['products']['rows'] == []
+
+    CatalogueService.compact(test_company_fixture)
+    assert CatalogueChange.objects.filter(company=test_company_fixture, kind='product', object_id=bread.id).count() == 1
+    assert CatalogueService.changes_since(test_company_fixture, create_branch, version)['deleted']['products'] == [airtime_id]
+
+
+@pytest.mark.django_db
+def test_catalogue_delta_follows_a_product_moved_between_branches(settings, test_company_fixture, create_branch, test_stocked_products_fixture):
+    """
+    Test a product reassigned to another branch is deleted from the old branch's delta
+    and shows up in the new branch's, and a category made company-wide reaches every branch.
+    """
+    from inventory.models.product_model import Product
+    from inventory.services.catalogue.catalogue_service import CatalogueService
+
+    settings.CATALOGUE_SYNC = {**settings.CATALOGUE_SYNC, 'SETTLE_SECONDS': 0}
+    bread, milk, airtime = test_stocked_products_fixture
+    avondale = Branch.objects.create(name='Avondale', company=test_company_fixture, code='HRE-AVD', address='1 King George Rd')
+    version = CatalogueService.current_version(test_company_fixture)
+
+    moved = Product.objects.get(id=bread.id)
+    moved.branch = avondale
+    moved.save()
+    category = bread.product_category
+    category.refresh_from_db()
+    category.branch = None
+    category.save()
+
+    old_branch = CatalogueService.changes_since(test_company_fixture, create_branch, version)
+    assert old_branch['deleted']['products'] == [bread.id]
+    assert old_branch['products']['rows'] == []
+    new_branch = CatalogueService.changes_since(test_company_fixture, avondale, version)
+    assert [row[0] for row in new_branch['products']['rows']] == [bread.id]
+    assert new_branch['deleted']['products'] == []
+    for branch in (create_branch, avondale):
+        delta = CatalogueService.changes_since(test_company_fixture, branch, version)
+        assert [row[0] for row in delta['categories']['rows']] == [category.id]
+        assert delta['deleted']['categories'] == []
+
+    # saving again without a move records no further deletion
+    moved.unit_price = 4
+    moved.save()
+    assert CatalogueService.changes_since(test_company_fixture, avondale, new_branch['version'])['deleted']['products'] == []
+
+
+# ==========================================
+# BULK STOCK TAKE COUNTS
+# ==========================================
+
+@pytest.mark.django_db
+def test_stock_take_bulk_counts_upsert_and_reconcile(test_company_fixture, create_branch, test_stocked_products_fixture):
+    """
+    Test bulk count ingestion upserts lines, totals the stock take once, reconciles stock sold
+    during the count from one grouped aggregate, and runs in a bounded number of queries.
+    """
+    from datetime import timedelta
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    from django.utils import timezone
+    from rest_framework.test import APIClient
+    from inventory.models.stock_take_item_model import StockTakeItem
+    from inventory.models.stock_take_model import StockTake
+    from inventory.services.product_stock.product_stock_service import ProductStockService, StockPostingLine
+    from inventory.services.stock_take.stock_take_count_service import StockTakeCountService
+
+    bread, milk, airtime = test_stocked_products_fixture
+    stock_take = StockTake.objects.create(
+        company=test_company_fixture, branch=create_branch, status='open',
+        started_at=timezone.now() - timedelta(minutes=5),
+    )
+    ProductStockService._post_stock_lines(company=test_company_fixture, lines=[
+        StockPostingLine(product=bread, branch=create_branch, quantity_change=-3, movement_type=StockMovement.MovementType.SALE)
+    ])
+
+    with CaptureQueriesContext(connection) as queries:
+        report = StockTakeCountService.ingest_counts(stock_take=stock_take, lines=[
+            {'product_id': bread.id, 'counted_quantity': 6},
+            {'product_id': milk.id, 'counted_quantity': 9, 'expected_quantity': 10},
+            {'product_id': 999999, 'counted_quantity': 1},
+        ])
+    # products, existing lines, stock levels, upsert, flag products, totals (2), reconcile (3)
+    assert len([q for q in queries.captured_queries if 'SAVEPOINT' not in q['sql']]) <= 11
+    assert (report.received, report.created, report.updated, report.failed, report.reconciled) == (3, 2, 0, 1, 2)
+
+    items = {item.product_id: item for item in StockTakeItem.objects.filter(stock_take=stock_take)}
+    assert items[bread.id].expected_quantity == 7
+    assert items[bread.id].adjusted_quantity == 3
+    assert items[bread.id].movement_breakdown['sold'] == 3
+    assert items[milk.id].adjusted_quantity == 9
+    stock_take.refresh_from_db()
+    assert stock_take.total_counted_value == 30
+    assert stock_take.total_variance_value == -4
+
+    user = User.objects.create_user(
+        username='counter', email='counter@example.com', password='counter', company=test_company_fixture,
+        branch=create_branch, role='Manager', first_name='Counter'
+    )
+    api_client = APIClient()
+    api_client.force_authenticate(user=user)
+    response = api_client.post(
+        reverse('stock-take-counts', args=[stock_take.id]),
+        {'lines': [{'product_id': milk.id, 'counted_quantity': 8}, {'product_id': airtime.id, 'counted_quantity': 10}], 'confirm': True},
+        format='json',
+    )
+    assert response.status_code == 200
+    assert (response.data['created'], response.data['updated']) == (1, 1)
+    assert StockTakeItem.objects.get(stock_take=stock_take, product=milk).counted_quantity == 8
+
+    response = api_client.post(
+        reverse('stock-take-counts', args=[stock_take.id]),
+        {'lines': [{'product_id': milk.id, 'counted_quantity': 1}]},
+        format='json',
+    )
+    assert response.data['skipped_confirmed'] == 1
+    assert StockTakeItem.objects.get(stock_take=stock_take, product=milk).counted_quantity == 8
+
+
+# ==========================================
+# STREAMING EXPORTS
+# ==========================================
+
+@pytest.mark.django_db
+def test_stock_movement_and_product_exports_stream_csv_ndjson_and_gzip(test_company_fixture, create_branch, test_stocked_products_fixture):
+    """
+    Test exports stream CSV and NDJSON (gzip when accepted) from one projected query,
+    with related names joined in rather than loaded per row.
+    """
+    import csv
+    import gzip
+    import io
+    import json
+    from django.db import connection
+    from django.http import StreamingHttpResponse
+    from django.test.utils import CaptureQueriesContext
+    from rest_framework.test import APIClient
+    from inventory.services.product_stock.product_stock_service import ProductStockService, StockPostingLine
+
+    bread, milk, _ = test_stocked_products_fixture
+    ProductStockService._post_stock_lines(company=test_company_fixture, lines=[
+        StockPostingLine(product=bread, branch=create_branch, quantity_change=-3, movement_type=StockMovement.MovementType.SALE),
+        StockPostingLine(product=milk, branch=create_branch, quantity_change=-1, movement_type=StockMovement.MovementType.SALE),
+    ])
+    user = User.objects.create_user(
+        username='exporter', email='exporter@example.com', password='exporter', company=test_company_fixture,
+        branch=create_branch, role='Manager', first_name='Exporter'
+    )
+    api_client = APIClient()
+    api_client.force_authenticate(user=user)
+
+    response = api_client.get(reverse('stock-movement-export'))
+    assert isinstance(response, StreamingHttpResponse)
+    assert response['Content-Disposition'] == 'attachment; filename="stock_movements.csv"'
+    with CaptureQueriesContext(connection) as queries:
+        body = b''.join(response.streaming_content).decode('utf-8')
+    assert len(queries.captured_queries) == 1
+    rows = list(csv.DictReader(io.StringIO(body)))
+    assert sorted((row['product'], row['quantity']) for row in rows) == [('Bread', '3'), ('Milk', '1')]
+
+    response = api_client.get(reverse('stock-movement-export'), {'export_format': 'ndjson'}, HTTP_ACCEPT_ENCODING='gzip')
+    assert response['Content-Encoding'] == 'gzip'
+    lines = gzip.decompress(b''.join(response.streaming_content)).decode('utf-8').splitlines()
+    assert sorted(json.loads(line)['sku'] for line in lines) == sorted([bread.sku, milk.sku])
+
+    response = api_client.get(reverse('stock-movement-export'), {'export_format': 'xml'})
+    assert response.status_code == 400
+
+    response = api_client.get(reverse('product-bulk-export'))
+    rows = list(csv.DictReader(io.StringIO(b''.join(response.streaming_content).decode('utf-8'))))
+    assert sorted(row['name'] for row in rows) == ['Airtime', 'Bread', 'Milk']
+    assert {row['product_category'] for row in rows} == {'Test Category'}
+
+
+# ==========================================
+# CONDITIONAL UPDATE STOCK DELTAS
+# ==========================================
+
+@pytest.mark.django_db
+def test_post_stock_lines_delta_mode_guards_and_records_quantities(test_company_fixture, create_branch, test_stocked_products_fixture):
+    """
+    Test delta mode applies one conditional UPDATE per stock row, records quantity_before/after
+    from the returned quantity and rejects a sale that would go negative without writing anything.
+    """
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    from inventory.services.product_stock.product_stock_service import ProductStockService, StockPostingLine
+    from core.services.document_numbering.document_number_service import DocumentNumberService
+
+    bread, milk, _ = test_stocked_products_fixture
+    lines = [
+        StockPostingLine(product=bread, branch=create_branch, quantity_change=-3, movement_type=StockMovement.MovementType.SALE),
+        StockPostingLine(product=bread, branch=create_branch, quantity_change=-2, movement_type=StockMovement.MovementType.SALE),
+        StockPostingLine(product=milk, branch=create_branch, quantity_change=4, movement_type=StockMovement.MovementType.PURCHASE),
+    ]
+    DocumentNumberService.allocate('stock_movement', test_company_fixture.id)
+    with CaptureQueriesContext(connection) as queries:
+        movements = ProductStockService._post_stock_lines(company=test_company_fixture, lines=lines, mode='delta')
+
+    # one UPDATE per stock row + catalogue change feed + movement insert
+    assert len([q for q in queries.captured_queries if 'SAVEPOINT' not in q['sql']]) == 4
+    assert [(m.quantity_before, m.quantity_after) for m in movements] == [(10, 7), (7, 5), (10, 14)]
+
+    with pytest.raises(ValueError, match='Insufficient stock'):
+        ProductStockService._post_stock_lines(company=test_company_fixture, mode='delta', lines=[
+            StockPostingLine(product=milk, branch=create_branch, quantity_change=-1, movement_type=StockMovement.MovementType.SALE),
+            StockPostingLine(product=bread, branch=create_branch, quantity_change=-6, movement_type=StockMovement.MovementType.SALE),
+        ])
+    stock = {s.product_id: s.quantity for s in ProductStock.objects.all()}
+    assert (stock[bread.id], stock[milk.id]) == (5, 14)
+    assert StockMovement.objects.count() == 3
+
+
+@pytest.mark.django_db
+def test_adjust_stock_delta_mode_records_catalogue_changes(settings, test_company_fixture, create_branch, test_stocked_products_fixture):
+    """
+    Test item-level adjustments in delta mode (a raw UPDATE, no save signal) still reach the till catalogue feed.
+    """
+    from inventory.services.catalogue.catalogue_service import CatalogueService
+    from inventory.services.product_stock.product_stock_service import ProductStockService
+
+    settings.STOCK_POSTING = {**settings.STOCK_POSTING, 'MODE': 'delta'}
+    settings.CATALOGUE_SYNC = {**settings.CATALOGUE_SYNC, 'SETTLE_SECONDS': 0}
+    bread, milk, _ = test_stocked_products_fixture
+    user = User.objects.create_user(
+        username='adjuster', email='adjuster@example.com', password='adjuster', company=test_company_fixture,
+        branch=create_branch, role='Manager', first_name='Adjuster'
+    )
+    version = CatalogueService.current_version(test_company_fixture)
+
+    ProductStockService.adjust_stock_manually(
+        product=bread, company=test_company_fixture, branch=create_branch, quantity_change=-4,
+        reason='Damaged', performed_by=user,
+    )
+    ProductStockService.write_off_stock(
+        product=milk, company=test_company_fixture, branch=create_branch, quantity=1,
+        reason='Expired', performed_by=user,
+    )
+
+    delta = CatalogueService.changes_since(test_company_fixture, create_branch, version)
+    assert sorted((row[0], row[1]) for row in delta['stock']['rows']) == sorted([(bread.id, 6), (milk.id, 9)])
+
+
+@pytest.mark.django_db(transaction=True)
+def test_post_stock_lines_delta_mode_under_concurrent_sales(test_company_fixture, create_branch, test_stocked_products_fixture):
+    """
+    Stress test: many threads selling the same SKU at once never oversell, and every
+    successful sale records a distinct, gap-free quantity_before/quantity_after pair.
+    """
+    import threading
+    from django.db import OperationalError, connection, connections
+    from inventory.services.product_stock.product_stock_service import ProductStockService, StockPostingLine
+
+    bread, _, _ = test_stocked_products_fixture
+    threads_count, sales_per_thread = 8, 3
+    results = {'sold': 0, 'rejected': 0}
+    guard = threading.Lock()
+    start = threading.Barrier(threads_count)
+
+    def cashier():
+        try:
+            start.wait()
+            for _ in range(sales_per_thread):
+                while True:
+                    try:
+                        ProductStockService._post_stock_lines(company=test_company_fixture, mode='delta', lines=[
+                            StockPostingLine(product=bread, branch=create_branch, quantity_change=-1, movement_type=StockMovement.MovementType.SALE)
+                        ])
+                        outcome = 'sold'
+                    except ValueError:
+                        outcome = 'rejected'
+                    except OperationalError:
+                        # the in-memory test database is a shared-cache SQLite database, so every thread
+                        # sees the same rows; it has one writer at a time and reports the others as
+                        # locked, while PostgreSQL queues them
+                        continue
+                    break
+                with guard:
+                    results[outcome] += 1
+        finally:
+            connections.close_all()
+
+    workers = [threading.Thread(target=cashier) for _ in range(threads_count)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert results == {'sold': 10, 'rejected': threads_count * sales_per_thread - 10}
+    assert ProductStock.objects.get(product=bread).quantity == 0
+    pairs = sorted(StockMovement.objects.filter(product=bread).values_list('quantity_before', 'quantity_after'))
+    assert pairs == [(before, before - 1) for before in range(1, 11)]
@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
@@ -16,7 +17,7 @@ from rest_framework.decorators import action
 from loguru import logger
 
 
-class ProductCategoryViewSet(ModelViewSet):
+class ProductCategoryViewSet(EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for viewing and managing product categories.
     Includes detailed logging for all operations.
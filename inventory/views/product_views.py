@@ -1,10 +1,11 @@
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from inventory.models.product_model import Product
 from inventory.serializers.product_serializer import ProductSerializer
 from config.auth.jwt_token_authentication import CompanyCookieJWTAuthentication, UserCookieJWTAuthentication
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from inventory.permissions.inventory_permissions import InventoryPermission
-from rest_framework.filters import SearchFilter, OrderingFilter
+from rest_framework.filters import OrderingFilter
 from config.pagination.pagination import StandardResultsSetPagination
 from company.models.company_model import Company
 from loguru import logger
@@ -12,13 +13,23 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework import status
 from django.db.models import Q
-from inventory.services.product.product_service import ProductService
+from inventory.services.product.product_service import ProductService, PRODUCT_EXPORT_COLUMNS
 from inventory.models.product_category_model import ProductCategory
 from inventory.serializers.adjust_stock_serializer import AdjustStockSerializer
-from io import BytesIO
+from inventory.models.product_import_job_model import ProductImportJob
+from inventory.serializers.product_import_job_serializer import ProductImportJobSerializer
+from inventory.services.product.product_import_job_service import ProductImportJobService
+from branch.models.branch_model import Branch
+from users.models.user_model import User
+from inventory.django_filters.product_search_filter import ProductSearchFilter
+from inventory.services.product_search.product_search_service import ProductSearchService
+from inventory.services.catalogue.catalogue_service import CatalogueService
+from django.http import HttpResponse
+import gzip
+from config.export.streaming_export import EXPORT_FORMATS, StreamingExport
 
 
-class ProductViewSet(ModelViewSet):
+class ProductViewSet(EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for viewing and managing products.
     Supports listing, retrieving, creating, updating, and deleting products.
@@ -28,9 +39,11 @@ class ProductViewSet(ModelViewSet):
     serializer_class = ProductSerializer
     authentication_classes = [CompanyCookieJWTAuthentication, UserCookieJWTAuthentication, JWTAuthentication]
     permission_classes = [InventoryPermission]
-    filter_backends = [SearchFilter, OrderingFilter]
-    search_fields = ['name', 'description', 'category__name', 'company__name', 'price']
-    ordering_fields = ['name', 'price', 'stock_quantity', 'created_at', 'company__name', 'category__name']
+    # search runs last so its relevance order replaces the default name ordering
+    filter_backends = [OrderingFilter, ProductSearchFilter]
+    # the fields ProductSearchIndex indexes; the queryset is already scoped to one company
+    search_fields = ['name', 'description', 'product_category__name', 'sku']
+    ordering_fields = ['name', 'unit_price', 'stock', 'created_at', 'company__name', 'product_category__name']
     ordering = ['name']
     pagination_class = StandardResultsSetPagination
 
@@ -120,8 +133,8 @@ class ProductViewSet(ModelViewSet):
     @action(detail=False, methods=['get'], url_path='search')
     def search(self, request):
         """
-        Search products by name or description.
-        GET param: ?q=<search_term>
+        Till product search: exact barcode/SKU first, then ranked name/SKU/description matches.
+        GET params: ?q=<search_term>&branch=<branch_id> (optional)&limit=<n> (default 20)
         """
         query = request.query_params.get('q', '')
         if not query:
@@ -131,39 +144,157 @@ class ProductViewSet(ModelViewSet):
         if not company:
             return Response({"error": "Company information missing"}, status=status.HTTP_400_BAD_REQUEST)
 
-        products = ProductService.search_products(company, query)
+        branch_id = request.query_params.get('branch')
+        branch = Branch.objects.filter(company=company, pk=branch_id).first() if branch_id else None
+        try:
+            limit = min(int(request.query_params.get('limit', 20)), 100)
+        except ValueError:
+            limit = 20
+
+        products = ProductService.search_products(company, query, branch=branch, limit=limit)
         serializer = self.get_serializer(products, many=True)
         return Response(serializer.data)
 
+    @action(detail=False, methods=['get'], url_path=r'lookup/(?P<code>[^/]+)')
+    def lookup(self, request, code=None):
+        """
+        Exact barcode/SKU lookup for scanners.
+        GET param: ?branch=<branch_id> (optional)
+        """
+        company = getattr(request.user, 'company', None) or (request.user if isinstance(request.user, Company) else None)
+        branch_id = request.query_params.get('branch')
+        branch = Branch.objects.filter(company=company, pk=branch_id).first() if branch_id else None
+        product = ProductSearchService.lookup_code(company, code, branch=branch)
+        if product is None:
+            return Response({"error": "Product not found"}, status=status.HTTP_404_NOT_FOUND)
+        return Response(self.get_serializer(product).data)
+
     @action(detail=False, methods=['post'], url_path='bulk-import')
     def bulk_import(self, request):
         """
-        Bulk import products from CSV file.
-        POST: multipart/form-data with 'file' field
+        Bulk import (create or update by SKU) products from a CSV file.
+        POST: multipart/form-data with 'file', optional 'branch' (defaults to the user's branch)
+        and 'create_missing_categories'.
+        Queued imports return 202 with the job; poll bulk-import/<job_id> for progress.
         """
         csv_file = request.FILES.get('file')
         if not csv_file:
             return Response({"error": "CSV file is required"}, status=status.HTTP_400_BAD_REQUEST)
 
         company = getattr(request.user, 'company', None) or (request.user if isinstance(request.user, Company) else None)
-        products, failed_rows = ProductService.bulk_import_products(company, csv_file)
-        serializer = self.get_serializer(products, many=True)
-        return Response({
-            "imported": serializer.data,
-            "failed_rows": failed_rows
-        }, status=status.HTTP_201_CREATED)
+        branch_id = request.data.get('branch')
+        branch = (
+            Branch.objects.filter(company=company, pk=branch_id).first()
+            if branch_id else getattr(request.user, 'branch', None)
+        )
+        if branch is None:
+            return Response({"error": "Branch is required"}, status=status.HTTP_400_BAD_REQUEST)
+
+        job = ProductImportJobService.create_job(
+            company=company,
+            branch=branch,
+            csv_file=csv_file,
+            requested_by=request.user if isinstance(request.user, User) else None,
+            create_missing_categories=str(request.data.get('create_missing_categories', '')).lower() in ('1', 'true', 'yes'),
+        )
+        job = ProductImportJobService.dispatch(job)
+        response_status = (
+            status.HTTP_202_ACCEPTED if job.status == ProductImportJob.Status.PENDING else status.HTTP_201_CREATED
+        )
+        return Response(ProductImportJobSerializer(job).data, status=response_status)
+
+    @action(detail=False, methods=['get'], url_path=r'bulk-import/(?P<job_id>[^/.]+)')
+    def bulk_import_status(self, request, job_id=None):
+        """
+        Progress and per-row failures of a product import job.
+        """
+        company = getattr(request.user, 'company', None) or (request.user if isinstance(request.user, Company) else None)
+        job = ProductImportJob.objects.filter(company=company, pk=job_id).first()
+        if job is None:
+            return Response({"error": "Import job not found"}, status=status.HTTP_404_NOT_FOUND)
+        return Response(ProductImportJobSerializer(job).data)
+
+    # -------------------------
+    # TILL CATALOGUE SYNC
+    # -------------------------
+    def _catalogue_branch(self, request):
+        company = getattr(request.user, 'company', None) or (request.user if isinstance(request.user, Company) else None)
+        branch_id = request.query_params.get('branch')
+        branch = (
+            Branch.objects.filter(company=company, pk=branch_id).first()
+            if branch_id else getattr(request.user, 'branch', None)
+        )
+        return company, branch
+
+    @staticmethod
+    def _gzip_json_response(request, body: bytes, etag: str | None = None) -> HttpResponse:
+        """
+        Send a gzip-compressed JSON body as is, or decompressed for clients that do not accept gzip.
+        """
+        if 'gzip' in request.META.get('HTTP_ACCEPT_ENCODING', ''):
+            response = HttpResponse(body, content_type='application/json')
+            response['Content-Encoding'] = 'gzip'
+        else:
+            response = HttpResponse(gzip.decompress(body), content_type='application/json')
+        response['Vary'] = 'Accept-Encoding'
+        if etag:
+            response['ETag'] = etag
+        return response
+
+    @action(detail=False, methods=['get'], url_path='catalogue')
+    def catalogue(self, request):
+        """
+        Versioned snapshot of a branch catalogue (products, prices, categories, stock) for a till cold start.
+        GET param: ?branch=<branch_id> (defaults to the user's branch). Honours If-None-Match.
+        Keep the returned version and poll catalogue/changes?since=<version> afterwards.
+        """
+        company, branch = self._catalogue_branch(request)
+        if company is None or branch is None:
+            return Response({"error": "Branch is required"}, status=status.HTTP_400_BAD_REQUEST)
+
+        version = CatalogueService.current_version(company)
+        etag = f'"catalogue-{branch.id}-{version}"'
+        if request.META.get('HTTP_IF_NONE_MATCH') == etag:
+            return HttpResponse(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+
+        version, body = CatalogueService.snapshot(company, branch)
+        response = self._gzip_json_response(request, body, etag=f'"catalogue-{branch.id}-{version}"')
+        response['X-Catalogue-Version'] = str(version)
+        return response
+
+    @action(detail=False, methods=['get'], url_path='catalogue/changes')
+    def catalogue_changes(self, request):
+        """
+        Rows changed in a branch catalogue since a version, and the ids deleted since then.
+        GET params: ?since=<version> (required), ?branch=<branch_id>
+        "reset": true means the terminal should fetch a fresh snapshot.
+        """
+        company, branch = self._catalogue_branch(request)
+        if company is None or branch is None:
+            return Response({"error": "Branch is required"}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            since = int(request.query_params.get('since', ''))
+        except ValueError:
+            return Response({"error": "since must be a catalogue version"}, status=status.HTTP_400_BAD_REQUEST)
+
+        payload = CatalogueService.changes_since(company, branch, since)
+        response = self._gzip_json_response(request, CatalogueService.encode(payload))
+        response['X-Catalogue-Version'] = str(payload['version'])
+        return response
 
     @action(detail=False, methods=['get'], url_path='bulk-export')
     def bulk_export(self, request):
         """
-        Bulk export products to CSV.
-        GET param: ?branch=<branch_id> (optional)
+        Bulk export products to CSV, streamed.
+        GET params: ?branch=<branch_id> (optional), ?export_format=csv|ndjson (default csv)
         """
         branch_param = request.query_params.get('branch', None)
+        export_format = request.query_params.get('export_format', 'csv')
+        if export_format not in EXPORT_FORMATS:
+            return Response({"error": f"export_format must be one of: {', '.join(EXPORT_FORMATS)}"}, status=status.HTTP_400_BAD_REQUEST)
         company = getattr(request.user, 'company', None) or (request.user if isinstance(request.user, Company) else None)
-        response = ProductService.bulk_export_products(company, branch_param)
-        response['Content-Disposition'] = 'attachment; filename="products.csv"'
-        return response
+        queryset = ProductService.export_queryset(company, branch_param)
+        return StreamingExport.response(request, queryset, PRODUCT_EXPORT_COLUMNS, 'products', export_format)
     
 
     
@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from rest_framework.filters import SearchFilter, OrderingFilter
 from rest_framework.response import Response
 from rest_framework import status
@@ -15,7 +16,7 @@ from company.models.company_model import Company
 from loguru import logger
 
 
-class StockAdjustmentViewSet(ModelViewSet):
+class StockAdjustmentViewSet(EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for viewing and creating stock adjustments.
     Stock adjustments are immutable once created.
@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from inventory.models.stock_movement_model import StockMovement
 from inventory.serializers.stock_movement_serializer import StockMovementSerializer
 from config.auth.jwt_token_authentication import CompanyCookieJWTAuthentication, UserCookieJWTAuthentication
@@ -9,12 +10,15 @@ from config.pagination.pagination import StandardResultsSetPagination
 from config.utilities.get_queryset import get_company_queryset
 from company.models.company_model import Company
 from loguru import logger
+from config.pagination.keyset_pagination import KeysetOrPageNumberPagination
+from config.export.export_mixin import StreamingExportMixin
 
 
-class StockMovementViewSet(ModelViewSet):
+class StockMovementViewSet(StreamingExportMixin, EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for managing Stock Movements.
     Includes company-level access control, logging, search, ordering, and pagination.
+    GET stock-movements/export/ streams the filtered list as CSV or NDJSON.
     """
     queryset = StockMovement.objects.all()
     serializer_class = StockMovementSerializer
@@ -24,7 +28,23 @@ class StockMovementViewSet(ModelViewSet):
     search_fields = ['reference_number', 'movement_type']
     ordering_fields = ['created_at', 'quantity']
     ordering = ['-created_at']
-    pagination_class = StandardResultsSetPagination
+    pagination_class = KeysetOrPageNumberPagination
+    export_columns = (
+        ('reference_number', 'reference_number'),
+        ('movement_date', 'movement_date'),
+        ('branch', 'branch__name'),
+        ('product_id', 'product_id'),
+        ('sku', 'product__sku'),
+        ('product', 'product__name'),
+        ('movement_type', 'movement_type'),
+        ('quantity', 'quantity'),
+        ('quantity_before', 'quantity_before'),
+        ('quantity_after', 'quantity_after'),
+        ('unit_cost', 'unit_cost'),
+        ('total_cost', 'total_cost'),
+        ('reason', 'reason'),
+    )
+    export_filename = 'stock_movements'
 
     def get_queryset(self):
         try:
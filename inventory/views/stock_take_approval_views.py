@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework import status
@@ -22,7 +23,7 @@ from company.models.company_model import Company
 
 
 
-class StockTakeApprovalViewSet(ModelViewSet):
+class StockTakeApprovalViewSet(EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for managing Stock Take approvals.
     Includes approval lifecycle enforcement and custom actions.
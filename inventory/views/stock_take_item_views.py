@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from inventory.models.stock_take_item_model import StockTakeItem
 from inventory.serializers.stock_take_item_serializer import StockTakeItemSerializer
 from inventory.permissions.inventory_permissions import InventoryPermission
@@ -18,7 +19,7 @@ from loguru import logger
 
 
 
-class StockTakeItemViewSet(ModelViewSet):
+class StockTakeItemViewSet(EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for viewing and managing stock take items.
     Supports listing, retrieving, creating, updating, and deleting stock take items.
@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from inventory.models.stock_take_model import StockTake
 from inventory.serializers.stock_take_serializer import StockTakeSerializer
 from inventory.permissions.inventory_permissions import InventoryPermission
@@ -7,6 +8,9 @@ from config.auth.jwt_token_authentication import CompanyCookieJWTAuthentication,
 from rest_framework.filters import SearchFilter, OrderingFilter
 from config.pagination.pagination import StandardResultsSetPagination
 from inventory.services.stock_take.stock_take_service import StockTakeService
+from inventory.services.stock_take.stock_take_count_service import StockTakeCountService
+from inventory.services.stock_take.stock_take_reconciliation_service import StockTakeReconcialiationService
+from inventory.serializers.stock_take_count_serializer import StockTakeCountSerializer
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework import status
@@ -14,7 +18,7 @@ from django.db.models import Q
 from loguru import logger
 
 
-class StockTakeViewSet(ModelViewSet):
+class StockTakeViewSet(EagerLoadingMixin, ModelViewSet):
     """
     Handles creating, listing, updating, and deleting stocktakes.
     Logs all critical user actions for traceability.
@@ -132,4 +136,33 @@ class StockTakeViewSet(ModelViewSet):
             serializer = self.get_serializer(finalized)
             return Response(serializer.data)
         except Exception as e:
-            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
\ No newline at end of file
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    @action(detail=True, methods=["post"], url_path="counts")
+    def counts(self, request, pk=None):
+        """
+        Bulk count ingestion: {"lines": [{"product_id", "counted_quantity", "expected_quantity"?}], "confirm", "reconcile"}.
+        """
+        stock_take = self.get_object()
+        serializer = StockTakeCountSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            report = StockTakeCountService.ingest_counts(
+                stock_take=stock_take,
+                lines=serializer.validated_data['lines'],
+                confirm=serializer.validated_data['confirm'],
+                reconcile=serializer.validated_data['reconcile'],
+            )
+            logger.info(f"Stock take {stock_take.id} counts ingested by '{request.user.username}'.")
+            return Response(report.as_dict())
+        except Exception as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    @action(detail=True, methods=["post"], url_path="reconcile")
+    def reconcile(self, request, pk=None):
+        stock_take = self.get_object()
+        try:
+            reconciled = StockTakeReconcialiationService.reconcile_stock_take(stock_take)
+            return Response({"reconciled": reconciled})
+        except Exception as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
@@ -5,9 +5,11 @@ from loguru import logger
 from loans.models import Loan
 from users.models import User
 from users.serializers.user_serializer import UserSerializer
+from config.eager_loading.eager_loading import EagerLoadingSerializerMixin
 
 
-class LoanSerializer(CompanyValidationMixin, serializers.ModelSerializer):
+class LoanSerializer(EagerLoadingSerializerMixin, CompanyValidationMixin, serializers.ModelSerializer):
+    select_related_fields = ('borrower__company',)
     borrower_summary = serializers.SerializerMethodField(read_only=True)
     issued_by_summary = serializers.SerializerMethodField(read_only=True)
     company_summary = serializers.SerializerMethodField(read_only=True)
@@ -1,4 +1,5 @@
 from django.contrib import admin
 from notifications.models import *
 
-admin.site.register(Notification)
\ No newline at end of file
+admin.site.register(Notification)
+admin.site.register(NotificationInbox)
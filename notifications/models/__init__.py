@@ -1 +1,2 @@
-from .notification_model import Notification
\ No newline at end of file
+from .notification_model import Notification
+from .notification_inbox_model import NotificationInbox
@@ -0,0 +1,20 @@
+from django.db import models
+
+
+class NotificationInbox(models.Model):
+    # Unread counter and inbox version of a user, kept in step by NotificationService (see NotificationInboxService)
+    user = models.OneToOneField(
+        'users.User', on_delete=models.CASCADE, primary_key=True, related_name='notification_inbox'
+    )
+    unread_count = models.PositiveIntegerField(default=0)
+    # bumped on every change to the user's notifications; cached inbox pages are keyed by it
+    version = models.PositiveBigIntegerField(default=1)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'notification_inboxes'
+        verbose_name = 'Notification Inbox'
+        verbose_name_plural = 'Notification Inboxes'
+
+    def __str__(self):
+        return f"NotificationInbox(user={self.user_id}, unread={self.unread_count}, version={self.version})"
@@ -6,7 +6,7 @@ from django.utils import timezone
 from loguru import logger
 
 
-class NotificationManager(models.Manager):
+class NotificationQuerySet(models.QuerySet):
 
     def unread(self):
         return self.filter(is_read=False)
@@ -18,6 +18,11 @@ class NotificationManager(models.Manager):
         return self.filter(status='PENDING')
 
 
+# queryset methods, so they chain: Notification.objects.for_user(user).unread()
+class NotificationManager(models.Manager.from_queryset(NotificationQuerySet)):
+    pass
+
+
 class Notification(CreateUpdateBaseModel):
     """
     Docstring for Notification
@@ -29,6 +34,12 @@ class Notification(CreateUpdateBaseModel):
         ('FAILED', 'Failed'),
         ('READ', 'Read'),
     ]
+    # delivery channels, see notifications/services/dispatch/channels
+    NOTIFICATION_CHANNELS = [
+        ('in_app', 'In-app'),
+        ('email', 'Email'),
+        ('whatsapp', 'WhatsApp'),
+    ]
     title = models.CharField(max_length=255)
     message = models.TextField()
     notification_from_content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE, null=True, blank=True, related_name='notification_contenttype')
@@ -37,6 +48,14 @@ class Notification(CreateUpdateBaseModel):
     notification_to = models.ForeignKey('users.User', on_delete=models.CASCADE, related_name='notifications')
     is_read = models.BooleanField(default=False)
     status = models.CharField(max_length=50, choices=NOTIFICATION_STATUS, default='PENDING')
+    channel = models.CharField(max_length=20, choices=NOTIFICATION_CHANNELS, default='in_app')
+    # channel specific data, e.g. {"template": ..., "parameters": [...]} for WhatsApp or {"subject": ...} for email
+    payload = models.JSONField(null=True, blank=True)
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(null=True, blank=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    # claimed by a dispatcher, or backing off after a failed send, until then
+    locked_until = models.DateTimeField(null=True, blank=True)
 
     class Meta:
         db_table = 'notifications'
@@ -46,6 +65,11 @@ class Notification(CreateUpdateBaseModel):
         indexes = [
             models.Index(fields=['notification_to', 'is_read']),
             models.Index(fields=['notification_from_content_type', 'notification_from_object_id']),
+            # inbox listings, newest first, optionally unread only
+            models.Index(fields=['notification_to', '-created_at'], name='notif_to_created_idx'),
+            models.Index(fields=['notification_to', 'is_read', '-created_at'], name='notif_to_read_created_idx'),
+            # dispatch queue
+            models.Index(fields=['status', 'created_at'], name='notif_status_created_idx'),
         ]
 
     objects = NotificationManager()
@@ -25,11 +25,16 @@ class NotificationSerializer(serializers.ModelSerializer):
             'notification_to',
             'is_read',
             'status',
+            'channel',
+            'payload',
+            'attempts',
+            'last_error',
+            'sent_at',
             'created_at',
             'updated_at',
         ]
         read_only_fields = [
-            'id', 'created_at', 'updated_at',
+            'id', 'attempts', 'last_error', 'sent_at', 'created_at', 'updated_at',
         ]
 
     def get_notification_from_summary(self, obj):
@@ -0,0 +1,51 @@
+from django.conf import settings
+from loguru import logger
+from notifications.services.dispatch.rate_limiter import RateLimiter
+
+
+# channel name -> channel instance
+_CHANNELS = {}
+
+
+class NotificationChannel:
+    """
+    A delivery channel for Notification rows. send_batch() receives up to batch_size() notifications
+    of its channel (notification_to already loaded) and returns {notification id: error or None}.
+    Settings come from NOTIFICATION_DISPATCH["CHANNELS"][name].
+    """
+    name = None
+    # rate limits are per provider, so channels sharing a provider share its budget
+    provider = None
+
+    def config(self) -> dict:
+        return getattr(settings, 'NOTIFICATION_DISPATCH', {}).get('CHANNELS', {}).get(self.name, {})
+
+    def batch_size(self) -> int:
+        return self.config().get('BATCH_SIZE', 50)
+
+    def throttle(self) -> float:
+        config = self.config()
+        return RateLimiter.acquire(self.provider or self.name, config.get('RATE_PER_SECOND'), config.get('BURST'))
+
+    def send_batch(self, notifications) -> dict:
+        raise NotImplementedError
+
+
+def register_channel(name: str):
+    """
+    Class decorator registering a NotificationChannel under a Notification.channel value.
+    """
+    def decorator(channel_class):
+        channel_class.name = name
+        _CHANNELS[name] = channel_class()
+        logger.debug(f"Notification channel registered | channel={name}")
+        return channel_class
+    return decorator
+
+
+def get_channel(name: str) -> NotificationChannel | None:
+    return _CHANNELS.get(name)
+
+
+def registered_channels() -> list[str]:
+    return list(_CHANNELS)
@@ -0,0 +1,3 @@
+from .in_app_channel import InAppChannel
+from .email_channel import EmailChannel
+from .whatsapp_channel import WhatsAppChannel
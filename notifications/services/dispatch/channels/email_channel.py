@@ -0,0 +1,91 @@
+import smtplib
+import threading
+import time
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from loguru import logger
+from notifications.services.dispatch.channel_registry import NotificationChannel, register_channel
+
+
+@register_channel('email')
+class EmailChannel(NotificationChannel):
+    """
+    Email over one SMTP connection per worker thread, kept open across messages and batches
+    instead of a connect, TLS handshake and login per email. A connection idle for longer than
+    MAX_IDLE_SECONDS, or one that errors, is closed and reopened on the next send.
+    """
+    provider = 'smtp'
+    _local = threading.local()
+
+    @classmethod
+    def _channel_config(cls) -> dict:
+        return getattr(settings, 'NOTIFICATION_DISPATCH', {}).get('CHANNELS', {}).get('email', {})
+
+    @classmethod
+    def connection(cls):
+        config = cls._channel_config()
+        connection = getattr(cls._local, 'connection', None)
+        last_used = getattr(cls._local, 'last_used', 0.0)
+        if connection is not None and time.monotonic() - last_used > config.get('MAX_IDLE_SECONDS', 60):
+            cls.reset()
+            connection = None
+        if connection is None:
+            options = {'fail_silently': False}
+            # HOST/PORT/USE_TLS overrides, for a dedicated relay (or a stub server in tests)
+            for key in ('HOST', 'PORT', 'USE_TLS', 'USERNAME', 'PASSWORD', 'TIMEOUT_SECONDS'):
+                if key in config:
+                    options['timeout' if key == 'TIMEOUT_SECONDS' else key.lower()] = config[key]
+            connection = get_connection(config.get('BACKEND'), **options)
+            connection.open()
+            cls._local.connection = connection
+        cls._local.last_used = time.monotonic()
+        return connection
+
+    @classmethod
+    def reset(cls):
+        connection = getattr(cls._local, 'connection', None)
+        if connection is not None:
+            try:
+                connection.close()
+            except (smtplib.SMTPException, OSError):
+                pass
+            cls._local.connection = None
+
+    @classmethod
+    def send_message(cls, message: EmailMessage) -> str | None:
+        """
+        Send one message on the pooled connection. Returns None when sent, the error otherwise.
+        A dropped connection is reopened and the message tried once more.
+        """
+        for attempt in range(2):
+            try:
+                message.connection = cls.connection()
+                message.send()
+                return None
+            except smtplib.SMTPServerDisconnected as e:
+                cls.reset()
+                error = str(e) or "SMTP server disconnected"
+            except (smtplib.SMTPException, OSError) as e:
+                cls.reset()
+                return str(e) or e.__class__.__name__
+        return error
+
+    def send_batch(self, notifications) -> dict:
+        outcomes = {}
+        for notification in notifications:
+            email = getattr(notification.notification_to, 'email', None)
+            if not email:
+                outcomes[notification.id] = "Recipient has no email address"
+                continue
+            payload = notification.payload or {}
+            message = EmailMessage(
+                subject=payload.get('subject') or notification.title,
+                body=notification.message,
+                from_email=payload.get('from_email') or settings.DEFAULT_FROM_EMAIL,
+                to=[email],
+            )
+            self.throttle()
+            outcomes[notification.id] = self.send_message(message)
+            if outcomes[notification.id]:
+                logger.warning(f"Email not sent | notification={notification.id} | error={outcomes[notification.id]}")
+        return outcomes
@@ -0,0 +1,11 @@
+from notifications.services.dispatch.channel_registry import NotificationChannel, register_channel
+
+
+@register_channel('in_app')
+class InAppChannel(NotificationChannel):
+    """
+    The notification row is the in-app delivery; dispatching only marks it sent.
+    """
+
+    def send_batch(self, notifications) -> dict:
+        return {notification.id: None for notification in notifications}
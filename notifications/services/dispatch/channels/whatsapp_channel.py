@@ -0,0 +1,141 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from django.conf import settings
+from loguru import logger
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from notifications.services.dispatch.channel_registry import NotificationChannel, register_channel
+
+
+def mask_number(number):
+    """Mask phone number for logs (show last 4 digits only)."""
+    if not number:
+        return "N/A"
+    return f"{'*' * (len(number) - 4)}{number[-4:]}"
+
+
+@register_channel('whatsapp')
+class WhatsAppChannel(NotificationChannel):
+    """
+    WhatsApp Cloud API messages over one process-wide pooled requests.Session, so sends reuse
+    keep-alive TLS connections. The API takes one message per request; a batch is fanned out over
+    CONCURRENCY threads sharing the session, each send waiting for the provider's rate limit.
+    Notification.payload {"template": name, "parameters": [...]} sends a template, otherwise
+    the notification message is sent as text.
+    """
+    provider = 'whatsapp'
+    _session = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def _channel_config(cls) -> dict:
+        return getattr(settings, 'NOTIFICATION_DISPATCH', {}).get('CHANNELS', {}).get('whatsapp', {})
+
+    @classmethod
+    def session(cls) -> requests.Session:
+        if cls._session is None:
+            with cls._lock:
+                if cls._session is None:
+                    config = cls._channel_config()
+                    # only connection failures are retried: a message that reached the API and is re-sent
+                    # would be delivered twice, so read errors and error answers go back to the dispatcher
+                    retry = Retry(
+                        total=config.get('HTTP_RETRIES', 2),
+                        connect=config.get('HTTP_RETRIES', 2),
+                        read=0,
+                        status=0,
+                        backoff_factor=0.2,
+                        raise_on_status=False,
+                    )
+                    pool_size = max(config.get('CONCURRENCY', 4), 1)
+                    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+                    session = requests.Session()
+                    session.mount('http://', adapter)
+                    session.mount('https://', adapter)
+                    cls._session = session
+        return cls._session
+
+    @classmethod
+    def reset(cls):
+        with cls._lock:
+            if cls._session is not None:
+                cls._session.close()
+                cls._session = None
+
+    @classmethod
+    def api_url(cls) -> str:
+        base_url = cls._channel_config().get('BASE_URL')
+        if base_url:
+            return base_url.rstrip('/') + '/messages'
+        return f"https://graph.facebook.com/{settings.WHATSAPP_API_VERSION}/{settings.WHATSAPP_PHONE_NUMBER_ID}/messages"
+
+    @staticmethod
+    def build_payload(number: str, template_name: str | None = None, parameters=(), text: str | None = None) -> dict:
+        if template_name is None:
+            return {"messaging_product": "whatsapp", "to": number, "type": "text", "text": {"body": text or ""}}
+        return {
+            "messaging_product": "whatsapp",
+            "to": number,
+            "type": "template",
+            "template": {
+                "name": template_name,
+                "language": {"code": "en_US"},
+                "components": [
+                    {
+                        "type": "body",
+                        "parameters": [{"type": "text", "text": p} for p in parameters]
+                    }
+                ],
+            },
+        }
+
+    @classmethod
+    def post(cls, payload: dict) -> tuple[bool, dict]:
+        """
+        POST one message. Returns (ok, response data); transport errors come back as {"error": ...}.
+        """
+        headers = {
+            "Authorization": f"Bearer {settings.WHATSAPP_ACCESS_TOKEN}",
+            "Content-Type": "application/json",
+        }
+        try:
+            response = cls.session().post(
+                cls.api_url(), json=payload, headers=headers, timeout=cls._channel_config().get('TIMEOUT_SECONDS', 10)
+            )
+        except requests.RequestException as e:
+            return False, {"error": str(e)}
+        try:
+            data = response.json()
+        except ValueError:
+            data = {"error": response.text[:500]}
+        return response.ok, data
+
+    def _send_one(self, notification) -> str | None:
+        user = notification.notification_to
+        if not getattr(user, 'whatsapp_opt_in', False) or not getattr(user, 'whatsapp_number', None):
+            return "User not opted in or missing WhatsApp number"
+        payload = notification.payload or {}
+        message = self.build_payload(
+            user.whatsapp_number,
+            template_name=payload.get('template'),
+            parameters=payload.get('parameters', []),
+            text=notification.message,
+        )
+        self.throttle()
+        ok, data = self.post(message)
+        if ok:
+            return None
+        logger.warning(
+            f"WhatsApp not sent | notification={notification.id} | "
+            f"phone={mask_number(user.whatsapp_number)} | error={data}"
+        )
+        return str(data.get('error', data))[:1000]
+
+    def send_batch(self, notifications) -> dict:
+        concurrency = max(self.config().get('CONCURRENCY', 4), 1)
+        if concurrency == 1 or len(notifications) == 1:
+            return {notification.id: self._send_one(notification) for notification in notifications}
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(notifications))) as executor:
+            errors = executor.map(self._send_one, notifications)
+            return {notification.id: error for notification, error in zip(notifications, errors)}
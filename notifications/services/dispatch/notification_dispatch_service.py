@@ -0,0 +1,238 @@
+import random
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import timedelta
+from django.conf import settings
+from django.db import transaction as db_transaction
+from django.db.models import Count, F, Min, Q
+from django.utils import timezone
+from loguru import logger
+from notifications.models.notification_model import Notification
+from notifications.services.dispatch.channel_registry import get_channel
+from notifications.services.inbox.notification_inbox_service import NotificationInboxService
+# registers the built-in channels
+import notifications.services.dispatch.channels  # noqa: F401
+
+
+FAILED_UPDATE_FIELDS = ['status', 'attempts', 'last_error', 'locked_until', 'updated_at']
+
+
+@dataclass
+class DispatchReport:
+    claimed: int = 0
+    sent: int = 0
+    retried: int = 0
+    failed: int = 0
+    elapsed_seconds: float = 0.0
+    sent_by_channel: dict = field(default_factory=dict)
+
+    @property
+    def notifications_per_second(self) -> float:
+        done = self.sent + self.failed
+        return round(done / self.elapsed_seconds, 2) if self.elapsed_seconds else 0.0
+
+    def add(self, other: 'DispatchReport'):
+        self.claimed += other.claimed
+        self.sent += other.sent
+        self.retried += other.retried
+        self.failed += other.failed
+        self.elapsed_seconds += other.elapsed_seconds
+        for channel, count in other.sent_by_channel.items():
+            self.sent_by_channel[channel] = self.sent_by_channel.get(channel, 0) + count
+
+    def as_dict(self) -> dict:
+        return {
+            'claimed': self.claimed,
+            'sent': self.sent,
+            'retried': self.retried,
+            'failed': self.failed,
+            'sent_by_channel': dict(self.sent_by_channel),
+            'elapsed_seconds': round(self.elapsed_seconds, 3),
+            'notifications_per_second': self.notifications_per_second,
+        }
+
+
+class NotificationDispatchMetrics:
+    """
+    Dispatch counters of this worker process since it started.
+    """
+    _totals = DispatchReport()
+    _lock = threading.Lock()
+
+    @classmethod
+    def record(cls, report: DispatchReport):
+        with cls._lock:
+            cls._totals.add(report)
+
+    @classmethod
+    def snapshot(cls) -> dict:
+        with cls._lock:
+            return cls._totals.as_dict()
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._totals = DispatchReport()
+
+
+class NotificationDispatchService:
+    """
+    Sends pending notifications off the request path.
+    Workers claim a batch, group it by channel and hand each group to its registered channel, which
+    sends over a pooled connection under its provider's rate limit. Outcomes are written back in bulk:
+    one UPDATE for everything sent, one bulk update for failures. Failed sends are retried with
+    exponential backoff (locked_until) and marked FAILED after NOTIFICATION_DISPATCH["MAX_ATTEMPTS"].
+    """
+
+    @staticmethod
+    def _config() -> dict:
+        return getattr(settings, 'NOTIFICATION_DISPATCH', {})
+
+    @staticmethod
+    def _claim(batch_size: int, now) -> list[int]:
+        """
+        Lease up to batch_size due notifications to this worker, skipping rows locked by another one.
+        locked_until is both the lease and the retry backoff: rows are due once it has passed.
+        """
+        lease = timedelta(seconds=NotificationDispatchService._config().get('LEASE_SECONDS', 120))
+        with db_transaction.atomic():
+            ids = list(
+                Notification.objects.select_for_update(skip_locked=True)
+                .filter(status='PENDING', sent_at__isnull=True)
+                .filter(Q(locked_until__isnull=True) | Q(locked_until__lt=now))
+                .order_by('created_at', 'id')
+                .values_list('id', flat=True)[:batch_size]
+            )
+            if ids:
+                Notification.objects.filter(id__in=ids).update(locked_until=now + lease)
+        return ids
+
+    @staticmethod
+    def _backoff(attempts: int) -> timedelta:
+        config = NotificationDispatchService._config()
+        delay = min(config.get('BACKOFF_SECONDS', 30) * 2 ** (attempts - 1), config.get('MAX_BACKOFF_SECONDS', 3600))
+        return timedelta(seconds=delay * random.uniform(0.5, 1.0))
+
+    @staticmethod
+    def _send(channel_name: str, notifications: list) -> dict:
+        channel = get_channel(channel_name)
+        if channel is None:
+            return {notification.id: f"No channel registered for '{channel_name}'" for notification in notifications}
+        outcomes = {}
+        batch_size = max(channel.batch_size(), 1)
+        for start in range(0, len(notifications), batch_size):
+            chunk = notifications[start:start + batch_size]
+            try:
+                outcomes.update(channel.send_batch(chunk))
+            except Exception as e:
+                # a broken channel must not lose the rest of the batch
+                logger.exception(f"Notification channel failed | channel={channel_name} | notifications={len(chunk)}")
+                outcomes.update({notification.id: str(e) or e.__class__.__name__ for notification in chunk})
+        return outcomes
+
+    @staticmethod
+    def dispatch_batch(batch_size: int | None = None) -> DispatchReport:
+        """
+        Claim, send and record one batch of due notifications.
+        """
+        started = time.monotonic()
+        config = NotificationDispatchService._config()
+        batch_size = batch_size or config.get('BATCH_SIZE', 200)
+        report = DispatchReport()
+        ids = NotificationDispatchService._claim(batch_size, timezone.now())
+        if not ids:
+            return report
+        report.claimed = len(ids)
+
+        notifications = list(Notification.objects.filter(id__in=ids).select_related('notification_to').order_by('id'))
+        by_channel = defaultdict(list)
+        for notification in notifications:
+            by_channel[notification.channel].append(notification)
+
+        outcomes = {}
+        for channel_name, group in by_channel.items():
+            outcomes.update(NotificationDispatchService._send(channel_name, group))
+
+        now = timezone.now()
+        sent_ids = []
+        failed = []
+        max_attempts = config.get('MAX_ATTEMPTS', 5)
+        for notification in notifications:
+            error = outcomes.get(notification.id, "No outcome returned by the channel")
+            if error is None:
+                sent_ids.append(notification.id)
+                report.sent_by_channel[notification.channel] = report.sent_by_channel.get(notification.channel, 0) + 1
+                continue
+            notification.attempts += 1
+            notification.last_error = error
+            notification.updated_at = now
+            if notification.attempts >= max_attempts:
+                notification.status = 'FAILED'
+                notification.locked_until = None
+                report.failed += 1
+            else:
+                notification.locked_until = now + NotificationDispatchService._backoff(notification.attempts)
+                report.retried += 1
+            failed.append(notification)
+        report.sent = len(sent_ids)
+
+        with db_transaction.atomic():
+            if sent_ids:
+                Notification.objects.filter(id__in=sent_ids).update(
+                    status='SENT',
+                    sent_at=now,
+                    attempts=F('attempts') + 1,
+                    last_error=None,
+                    locked_until=None,
+                    updated_at=now,
+                )
+            if failed:
+                Notification.objects.bulk_update(failed, FAILED_UPDATE_FIELDS)
+            # cached inbox pages show the delivery status
+            NotificationInboxService.touch(notification.notification_to_id for notification in notifications)
+
+        report.elapsed_seconds = time.monotonic() - started
+        NotificationDispatchMetrics.record(report)
+        logger.info(
+            f"Notification batch dispatched | claimed={report.claimed} | sent={report.sent} "
+            f"| retried={report.retried} | failed={report.failed} | by_channel={report.sent_by_channel} "
+            f"| notifications_per_second={report.notifications_per_second}"
+        )
+        return report
+
+    @staticmethod
+    def run(max_batches: int | None = None, batch_size: int | None = None) -> DispatchReport:
+        """
+        Dispatch batches until no notification is due (or max_batches).
+        """
+        batch_size = batch_size or NotificationDispatchService._config().get('BATCH_SIZE', 200)
+        total = DispatchReport()
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            report = NotificationDispatchService.dispatch_batch(batch_size)
+            total.add(report)
+            batches += 1
+            if report.claimed < batch_size or report.sent == 0:
+                break
+        return total
+
+    @staticmethod
+    def queue_stats() -> dict:
+        """
+        Pending depth per channel, age of the oldest pending notification and failure count, from one aggregate.
+        """
+        pending = Q(status='PENDING', sent_at__isnull=True)
+        stats = Notification.objects.aggregate(
+            pending=Count('id', filter=pending),
+            failed=Count('id', filter=Q(status='FAILED')),
+            oldest_pending=Min('created_at', filter=pending),
+            **{
+                f'pending_{channel}': Count('id', filter=pending & Q(channel=channel))
+                for channel, _ in Notification.NOTIFICATION_CHANNELS
+            },
+        )
+        oldest = stats.pop('oldest_pending')
+        stats['oldest_pending_age_seconds'] = round((timezone.now() - oldest).total_seconds(), 1) if oldest else 0
+        return stats
@@ -0,0 +1,40 @@
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Process-local token buckets by provider: RATE_PER_SECOND sends on average, BURST at once.
+    Each worker process has its own buckets, so set a provider's rate to its limit divided by
+    the number of dispatch workers.
+    """
+    _buckets = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def acquire(cls, provider: str, rate: float | None, burst: int | None = None) -> float:
+        """
+        Take one token for provider, sleeping until one is available. Returns the seconds waited.
+        A falsy rate means no limit.
+        """
+        if not rate:
+            return 0.0
+        burst = burst or max(int(rate), 1)
+        waited = 0.0
+        while True:
+            with cls._lock:
+                now = time.monotonic()
+                tokens, last = cls._buckets.get(provider, (float(burst), now))
+                tokens = min(float(burst), tokens + (now - last) * rate)
+                if tokens >= 1:
+                    cls._buckets[provider] = (tokens - 1, now)
+                    return waited
+                cls._buckets[provider] = (tokens, now)
+                wait = (1 - tokens) / rate
+            time.sleep(wait)
+            waited += wait
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._buckets.clear()
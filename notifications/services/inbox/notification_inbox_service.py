@@ -0,0 +1,211 @@
+import time
+from collections import Counter, defaultdict
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction as db_transaction
+from django.db.models import Count, F, Value
+from django.db.models.functions import Greatest
+from django.utils import timezone
+from loguru import logger
+from notifications.models.notification_inbox_model import NotificationInbox
+from notifications.models.notification_model import Notification
+
+
+STATE_CACHE_KEY = 'notif_inbox:{user_id}'
+PAGE_CACHE_KEY = 'notif_inbox_page:{user_id}:{version}'
+
+
+class NotificationInboxService:
+    """
+    Per-user unread counts and cached inbox pages, so polling clients stop running COUNT(*) and
+    ordered scans on the notifications table.
+    Every write path in NotificationService adjusts the user's NotificationInbox row in its own
+    transaction (unread_count += delta, version += 1); once committed, the fresh state is written
+    to the cache, where readers and long-polls find it. Inbox pages are cached under the version,
+    so a change makes the old page unreachable instead of having to find and delete it.
+    """
+
+    @staticmethod
+    def _config() -> dict:
+        return getattr(settings, 'NOTIFICATION_INBOX', {})
+
+    @staticmethod
+    def _recount(user_id: int) -> int:
+        return Notification.objects.for_user(user_id).unread().count()
+
+    @staticmethod
+    def _create_missing(user_ids) -> None:
+        """
+        Build the inboxes of users who have none yet, counting their unread notifications in one query.
+        """
+        counts = dict(
+            Notification.objects.filter(notification_to_id__in=user_ids).unread()
+            .values_list('notification_to_id').annotate(unread=Count('id'))
+        )
+        NotificationInbox.objects.bulk_create(
+            [NotificationInbox(user_id=user_id, unread_count=counts.get(user_id, 0)) for user_id in user_ids],
+            ignore_conflicts=True,
+        )
+
+    # ==========================================================
+    # WRITES
+    # ==========================================================
+    @staticmethod
+    def adjust(deltas: dict) -> None:
+        """
+        Add unread-count deltas ({user_id: delta}, delta may be 0) and bump each user's version,
+        inside the caller's transaction: one UPDATE per distinct delta, so a broadcast to many
+        users costs one statement.
+        """
+        now = timezone.now()
+        by_delta = defaultdict(list)
+        for user_id, delta in deltas.items():
+            by_delta[delta].append(user_id)
+        missing = []
+        for delta, user_ids in by_delta.items():
+            updated = NotificationInbox.objects.filter(user_id__in=user_ids).update(
+                unread_count=Greatest(F('unread_count') + delta, Value(0)),
+                version=F('version') + 1,
+                updated_at=now,
+            )
+            if updated < len(user_ids):
+                existing = set(NotificationInbox.objects.filter(user_id__in=user_ids).values_list('user_id', flat=True))
+                missing += [user_id for user_id in user_ids if user_id not in existing]
+        if missing:
+            # first change for these users: count what is there, this change included
+            NotificationInboxService._create_missing(missing)
+        NotificationInboxService._publish_on_commit(list(deltas))
+
+    @staticmethod
+    def adjust_for(notifications) -> None:
+        """
+        Count newly created notifications into their recipients' inboxes.
+        """
+        deltas = Counter()
+        for notification in notifications:
+            deltas[notification.notification_to_id] += 0 if notification.is_read else 1
+        if deltas:
+            NotificationInboxService.adjust(dict(deltas))
+
+    @staticmethod
+    def change_deltas(before: tuple, after: tuple) -> dict:
+        """
+        Unread-count deltas for a notification changing from (recipient_id, is_read) before to after:
+        an unread notification leaves its old recipient's count and joins the new one's.
+        """
+        deltas = Counter()
+        deltas[before[0]] -= 0 if before[1] else 1
+        deltas[after[0]] += 0 if after[1] else 1
+        return dict(deltas)
+
+    @staticmethod
+    def touch(user_ids) -> None:
+        """
+        Bump the versions of users whose notifications changed without changing the unread count
+        (e.g. dispatched), in one UPDATE.
+        """
+        user_ids = list(set(user_ids))
+        if not user_ids:
+            return
+        NotificationInbox.objects.filter(user_id__in=user_ids).update(version=F('version') + 1, updated_at=timezone.now())
+        NotificationInboxService._publish_on_commit(user_ids)
+
+    @staticmethod
+    def rebuild(user_ids=None) -> int:
+        """
+        Recount unread notifications from the table (all inboxes, or user_ids), e.g. after rows were
+        changed outside NotificationService. Returns the number of inboxes rebuilt.
+        """
+        inboxes = NotificationInbox.objects.all()
+        if user_ids is not None:
+            inboxes = inboxes.filter(user_id__in=user_ids)
+        with db_transaction.atomic():
+            rebuilt = list(inboxes.values_list('user_id', flat=True))
+            for user_id in rebuilt:
+                NotificationInbox.objects.filter(user_id=user_id).update(
+                    unread_count=NotificationInboxService._recount(user_id),
+                    version=F('version') + 1,
+                    updated_at=timezone.now(),
+                )
+            NotificationInboxService._publish_on_commit(rebuilt)
+        logger.info(f"Notification inboxes rebuilt | inboxes={len(rebuilt)}")
+        return len(rebuilt)
+
+    @staticmethod
+    def _publish_on_commit(user_ids: list) -> None:
+        db_transaction.on_commit(lambda: NotificationInboxService.publish(user_ids))
+
+    @staticmethod
+    def publish(user_ids: list) -> None:
+        """
+        Write the committed state of these inboxes to the cache (one query). Writers overwrite while
+        readers only add, so a reader that loaded an older row can never replace a newer state.
+        """
+        states = {
+            STATE_CACHE_KEY.format(user_id=row['user_id']): {'version': row['version'], 'unread_count': row['unread_count']}
+            for row in NotificationInbox.objects.filter(user_id__in=user_ids).values('user_id', 'version', 'unread_count')
+        }
+        cache.set_many(states, NotificationInboxService._config().get('STATE_CACHE_SECONDS', 3600))
+
+    # ==========================================================
+    # READS
+    # ==========================================================
+    @staticmethod
+    def state(user_id: int) -> dict:
+        """
+        {'version', 'unread_count'} of a user's inbox: from the cache, else one primary key lookup.
+        """
+        key = STATE_CACHE_KEY.format(user_id=user_id)
+        state = cache.get(key)
+        if state is not None:
+            return state
+        row = NotificationInbox.objects.filter(user_id=user_id).values('version', 'unread_count').first()
+        if row is None:
+            # inbox not built yet: count once, later changes keep it up to date
+            NotificationInboxService._create_missing([user_id])
+            row = NotificationInbox.objects.filter(user_id=user_id).values('version', 'unread_count').first()
+        state = {'version': row['version'], 'unread_count': row['unread_count']}
+        cache.add(key, state, NotificationInboxService._config().get('STATE_CACHE_SECONDS', 3600))
+        return state
+
+    @staticmethod
+    def unread_count(user_id: int) -> int:
+        return NotificationInboxService.state(user_id)['unread_count']
+
+    @staticmethod
+    def first_page(user_id: int, serialize) -> dict:
+        """
+        The newest PAGE_SIZE notifications of a user with the inbox state, cached per inbox version.
+        serialize turns the notifications into the cached representation.
+        """
+        state = NotificationInboxService.state(user_id)
+        key = PAGE_CACHE_KEY.format(user_id=user_id, version=state['version'])
+        page = cache.get(key)
+        if page is None:
+            config = NotificationInboxService._config()
+            notifications = list(
+                Notification.objects.for_user(user_id)
+                .select_related('notification_to', 'notification_from_content_type')
+                .order_by('-created_at', '-id')[:config.get('PAGE_SIZE', 20)]
+            )
+            page = {**state, 'results': serialize(notifications)}
+            cache.set(key, page, config.get('PAGE_CACHE_SECONDS', 300))
+        return page
+
+    @staticmethod
+    def wait_for_change(user_id: int, since_version: int | None, timeout: float) -> dict:
+        """
+        Long-poll: the inbox state as soon as its version differs from since_version, or the
+        unchanged state after timeout seconds. Waiting only reads the cache.
+        """
+        state = NotificationInboxService.state(user_id)
+        if since_version is None or state['version'] != since_version:
+            return state
+        interval = NotificationInboxService._config().get('WAIT_POLL_SECONDS', 1)
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            time.sleep(min(interval, max(deadline - time.monotonic(), 0)))
+            state = NotificationInboxService.state(user_id)
+            if state['version'] != since_version:
+                break
+        return state
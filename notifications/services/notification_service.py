@@ -1,4 +1,5 @@
 from notifications.models.notification_model import Notification
+from notifications.services.inbox.notification_inbox_service import NotificationInboxService
 from django.db import transaction as db_transaction
 from loguru import logger
 
@@ -8,6 +9,7 @@ class NotificationService:
     Service layer for Notification domain.
     Handles state changes and lifecycle operations.
     Query logic is delegated to NotificationManager.
+    Every write keeps the recipient's unread counter and inbox version in step (NotificationInboxService).
     """
 
     # -------------------------
@@ -24,12 +26,32 @@ class NotificationService:
 
         try:
             notification = Notification.objects.create(**kwargs)
+            NotificationInboxService.adjust_for([notification])
             logger.success(f"Notification '{notification.id}' created.")
             return notification
         except Exception as e:
             logger.error(f"Error creating notification: {str(e)}")
             raise
 
+    @staticmethod
+    @db_transaction.atomic
+    def create_notifications(notifications: list[dict]) -> list[Notification]:
+        """
+        Create many notifications (e.g. one per recipient of a broadcast) in one bulk insert.
+        """
+        required_fields = {"title", "message", "notification_to"}
+        rows = []
+        for kwargs in notifications:
+            missing = required_fields - kwargs.keys()
+            if missing:
+                raise ValueError(f"Missing required fields: {missing}")
+            rows.append(Notification(**kwargs))
+
+        created = Notification.objects.bulk_create(rows)
+        NotificationInboxService.adjust_for(created)
+        logger.success(f"{len(created)} notifications created.")
+        return created
+
     # -------------------------
     # UPDATE
     # -------------------------
@@ -37,10 +59,14 @@ class NotificationService:
     @db_transaction.atomic
     def update_notification(notification: Notification, **kwargs) -> Notification:
         try:
+            before = (notification.notification_to_id, notification.is_read)
             for key, value in kwargs.items():
                 setattr(notification, key, value)
 
             notification.save(update_fields=kwargs.keys())
+            NotificationInboxService.adjust(
+                NotificationInboxService.change_deltas(before, (notification.notification_to_id, notification.is_read))
+            )
             logger.info(f"Notification '{notification.id}' updated.")
             return notification
         except Exception as e:
@@ -56,6 +82,7 @@ class NotificationService:
         try:
             notification_id = notification.id
             notification.delete()
+            NotificationInboxService.adjust({notification.notification_to_id: 0 if notification.is_read else -1})
             logger.info(f"Notification '{notification_id}' deleted.")
         except Exception as e:
             logger.error(f"Error deleting notification '{notification.id}': {str(e)}")
@@ -67,6 +94,7 @@ class NotificationService:
         try:
             notification = Notification.objects.get(id=notification_id)
             notification.delete()
+            NotificationInboxService.adjust({notification.notification_to_id: 0 if notification.is_read else -1})
             logger.info(f"Notification '{notification_id}' deleted.")
             return True
         except Notification.DoesNotExist:
@@ -83,9 +111,12 @@ class NotificationService:
     @db_transaction.atomic
     def mark_as_read(notification: Notification) -> Notification:
         try:
+            # conditional, so marking twice (or racing another request) only counts once; status is
+            # delivery state and is left to the dispatcher, so reading before dispatch still sends
+            changed = Notification.objects.filter(id=notification.id, is_read=False).update(is_read=True)
             notification.is_read = True
-            notification.status = 'READ'
-            notification.save(update_fields=["is_read", "status"])
+            if changed:
+                NotificationInboxService.adjust({notification.notification_to_id: -1})
             logger.info(f"Notification '{notification.id}' marked as read.")
             return notification
         except Exception as e:
@@ -96,9 +127,10 @@ class NotificationService:
     @db_transaction.atomic
     def mark_as_unread(notification: Notification) -> Notification:
         try:
+            changed = Notification.objects.filter(id=notification.id, is_read=True).update(is_read=False)
             notification.is_read = False
-            notification.status = 'PENDING'
-            notification.save(update_fields=["is_read", "status"])
+            if changed:
+                NotificationInboxService.adjust({notification.notification_to_id: 1})
             logger.info(f"Notification '{notification.id}' marked as unread.")
             return notification
         except Exception as e:
@@ -146,7 +178,8 @@ class NotificationService:
     # -------------------------
     @staticmethod
     def count_unread_notifications_for_user(user_id: int) -> int:
-        return Notification.objects.for_user(user_id).unread().count()
+        # maintained counter, no COUNT(*) on the notifications table
+        return NotificationInboxService.unread_count(user_id)
 
     @staticmethod
     def count_read_notifications_for_user(user_id: int) -> int:
@@ -162,7 +195,11 @@ class NotificationService:
     @staticmethod
     @db_transaction.atomic
     def delete_notifications_for_user(user_id: int) -> int:
-        deleted_count, _ = Notification.objects.for_user(user_id).delete()
+        # unread ones first, so the counter drops by exactly what was deleted
+        unread_count, _ = Notification.objects.for_user(user_id).unread().delete()
+        read_count, _ = Notification.objects.for_user(user_id).delete()
+        deleted_count = unread_count + read_count
+        NotificationInboxService.adjust({user_id: -unread_count})
         logger.info(f"Deleted {deleted_count} notifications for user '{user_id}'.")
         return deleted_count
 
@@ -175,6 +212,7 @@ class NotificationService:
             .filter(is_read=True)
             .delete()
         )
+        NotificationInboxService.adjust({user_id: 0})
         logger.info(f"Deleted {deleted_count} read notifications for user '{user_id}'.")
         return deleted_count
 
@@ -187,5 +225,6 @@ class NotificationService:
             .unread()
             .delete()
         )
+        NotificationInboxService.adjust({user_id: -deleted_count})
         logger.info(f"Deleted {deleted_count} unread notifications for user'{user_id}'.")
         return deleted_count
@@ -0,0 +1,16 @@
+from celery import shared_task
+from loguru import logger
+from notifications.services.dispatch.notification_dispatch_service import NotificationDispatchService
+
+
+@shared_task(ignore_result=True)
+def dispatch_notifications_task():
+    """
+    Send due notifications (scheduled in CELERY_BEAT_SCHEDULE).
+    """
+    report = NotificationDispatchService.run()
+    stats = NotificationDispatchService.queue_stats()
+    logger.info(
+        f"dispatch_notifications_task | {report.as_dict()} | pending={stats['pending']} "
+        f"| oldest_pending_age_seconds={stats['oldest_pending_age_seconds']}"
+    )
@@ -0,0 +1,247 @@
+from fixture_tests import *
+
+
+@pytest.mark.django_db
+def test_dispatcher_batches_channels_over_pooled_connections_and_retries(settings, test_company_fixture, create_branch):
+    """
+    One dispatch sends every channel of the batch: emails share one SMTP connection, WhatsApp
+    messages go over the pooled session, and the outcomes are written back in bulk. A failed send
+    backs off and is marked FAILED after MAX_ATTEMPTS; reading a notification before it goes out
+    does not stop it being sent.
+    """
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    from django.utils import timezone
+    from notifications.models.notification_model import Notification
+    from notifications.services.notification_service import NotificationService
+    from notifications.services.dispatch.notification_dispatch_service import NotificationDispatchService
+    from notifications.services.dispatch.rate_limiter import RateLimiter
+    from notifications.utils.stub_servers import StubSmtpServer, StubWhatsAppServer
+
+    users = [
+        User.objects.create_user(
+            username=f'notify{index}', email=f'notify{index}@example.com', password='notify',
+            company=test_company_fixture, branch=create_branch, role='Manager',
+            whatsapp_number=f'26377000000{index}', whatsapp_opt_in=True,
+        )
+        for index in range(3)
+    ]
+
+    with StubSmtpServer() as smtp, StubWhatsAppServer(fail_numbers={'263770000002'}) as whatsapp:
+        host, port = smtp.address
+        settings.NOTIFICATION_DISPATCH = {
+            'BATCH_SIZE': 50,
+            'MAX_ATTEMPTS': 2,
+            'BACKOFF_SECONDS': 30,
+            'LEASE_SECONDS': 120,
+            'CHANNELS': {
+                'email': {
+                    'BACKEND': 'django.core.mail.backends.smtp.EmailBackend',
+                    'HOST': host, 'PORT': port, 'USE_TLS': False,
+                },
+                'whatsapp': {'BASE_URL': whatsapp.url, 'CONCURRENCY': 2},
+            },
+        }
+        rows = []
+        for user in users:
+            rows += [
+                {'title': 'Stock low', 'message': 'Bread is low', 'notification_to': user},
+                {'title': 'Stock low', 'message': 'Bread is low', 'notification_to': user, 'channel': 'email',
+                 'payload': {'subject': 'Low stock alert'}},
+                {'title': 'Stock low', 'message': 'Bread is low', 'notification_to': user, 'channel': 'whatsapp',
+                 'payload': {'template': 'low_stock', 'parameters': ['Bread']}},
+            ]
+        created = NotificationService.create_notifications(rows)
+        assert len(created) == 9
+        read_in_app, read_email = created[0], created[1]
+        NotificationService.mark_as_read(read_in_app)
+        NotificationService.mark_as_read(read_email)
+
+        with CaptureQueriesContext(connection) as queries:
+            report = NotificationDispatchService.dispatch_batch()
+        statements = [q['sql'] for q in queries.captured_queries if 'SAVEPOINT' not in q['sql']]
+
+        assert report.claimed == 9
+        assert report.sent == 8 and report.retried == 1 and report.failed == 0
+        assert report.sent_by_channel == {'in_app': 3, 'email': 3, 'whatsapp': 2}
+        # claim select + lease update, load with recipients, one UPDATE for sent, one bulk update for the
+        # failure and one inbox version bump
+        assert len(statements) == 6
+
+        assert smtp.connections == 1
+        assert sorted(message['to'][0] for message in smtp.messages) == [user.email for user in users]
+        assert len(whatsapp.received) == 3
+        assert whatsapp.received[0]['template']['name'] == 'low_stock'
+
+        assert Notification.objects.filter(status='SENT', sent_at__isnull=False).count() == 8
+        for read in (read_in_app, read_email):
+            read.refresh_from_db()
+            assert read.is_read and read.status == 'SENT' and read.sent_at is not None
+        NotificationService.mark_as_unread(read_email)
+        assert Notification.objects.get(id=read_email.id).status == 'SENT'
+        failed = Notification.objects.get(notification_to=users[2], channel='whatsapp')
+        assert failed.status == 'PENDING' and failed.attempts == 1
+        assert failed.locked_until > timezone.now()
+        assert 'cannot receive' in failed.last_error
+
+        # nothing is due while the failure backs off; once due, the second failure is final
+        assert NotificationDispatchService.dispatch_batch().claimed == 0
+        Notification.objects.filter(id=failed.id).update(locked_until=None)
+        report = NotificationDispatchService.dispatch_batch()
+        assert report.failed == 1
+        failed.refresh_from_db()
+        assert failed.status == 'FAILED' and failed.attempts == 2
+
+        stats = NotificationDispatchService.queue_stats()
+        assert stats['pending'] == 0 and stats['failed'] == 1
+
+    # a burst of one at 50/s makes the second send wait for its token
+    assert RateLimiter.acquire('test-provider', rate=50, burst=1) == 0
+    assert RateLimiter.acquire('test-provider', rate=50, burst=1) > 0
+
+
+@pytest.mark.django_db
+def test_unread_counter_and_cached_inbox_follow_every_write(
+    settings, test_company_fixture, create_branch, django_capture_on_commit_callbacks
+):
+    """
+    Creates, read/unread transitions and bulk deletes keep the unread counter exact; once published
+    the count and the first inbox page are served without touching the notifications table, and a
+    change moves the inbox to a new version that long-polls and the SSE stream pick up.
+    """
+    import time
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    from rest_framework.test import APIClient
+    from rest_framework_simplejwt.tokens import AccessToken
+    from notifications.services.notification_service import NotificationService
+    from notifications.services.inbox.notification_inbox_service import NotificationInboxService
+
+    settings.NOTIFICATION_INBOX = {'BLOCKING_WAITS': True, 'PAGE_SIZE': 2, 'WAIT_POLL_SECONDS': 0.01,
+                                   'MAX_WAIT_SECONDS': 1, 'STREAM_SECONDS': 0.05, 'STREAM_HEARTBEAT_SECONDS': 0.02}
+    user = User.objects.create_user(
+        username='inbox', email='inbox@example.com', password='inbox', company=test_company_fixture,
+        branch=create_branch, role='Manager',
+    )
+    others = [
+        User.objects.create_user(
+            username=f'broadcast{index}', email=f'broadcast{index}@example.com', password='inbox',
+            company=test_company_fixture, branch=create_branch, role='Manager',
+        )
+        for index in range(3)
+    ]
+    with django_capture_on_commit_callbacks(execute=True):
+        notifications = NotificationService.create_notifications(
+            [{'title': f'Note {index}', 'message': 'Hello', 'notification_to': user} for index in range(4)]
+        )
+    assert NotificationService.count_unread_notifications_for_user(user.id) == 4
+    # a broadcast adjusts every recipient's inbox in one UPDATE once the inboxes exist
+    with django_capture_on_commit_callbacks(execute=True):
+        NotificationService.create_notifications(
+            [{'title': 'Broadcast', 'message': 'Hello', 'notification_to': other} for other in others]
+        )
+    with CaptureQueriesContext(connection) as queries, django_capture_on_commit_callbacks(execute=True):
+        NotificationService.create_notifications(
+            [{'title': 'Broadcast', 'message': 'Hello', 'notification_to': other} for other in others]
+        )
+    assert len([q for q in queries.captured_queries if 'UPDATE "notification_inboxes"' in q['sql']]) == 1
+    assert [NotificationService.count_unread_notifications_for_user(other.id) for other in others] == [2, 2, 2]
+    version = NotificationInboxService.state(user.id)['version']
+
+    with django_capture_on_commit_callbacks(execute=True):
+        NotificationService.mark_as_read(notifications[0])
+        NotificationService.mark_as_read(notifications[0])
+        NotificationService.mark_as_read(notifications[1])
+        NotificationService.mark_as_unread(notifications[1])
+    assert NotificationService.count_unread_notifications_for_user(user.id) == 3
+
+    def serialize(rows):
+        return [row.id for row in rows]
+
+    first = NotificationInboxService.first_page(user.id, serialize)
+    assert first['unread_count'] == 3 and first['version'] > version
+    assert first['results'] == [notifications[3].id, notifications[2].id]
+    with CaptureQueriesContext(connection) as queries:
+        assert NotificationService.count_unread_notifications_for_user(user.id) == 3
+        assert NotificationInboxService.first_page(user.id, serialize) == first
+        # nothing changed since: the long-poll waits out its timeout on the cache alone
+        assert NotificationInboxService.wait_for_change(user.id, first['version'], 0.05) == {
+            'version': first['version'], 'unread_count': 3,
+        }
+    assert len(queries.captured_queries) == 0
+
+    with django_capture_on_commit_callbacks(execute=True):
+        assert NotificationService.delete_unread_notifications_for_user(user.id) == 3
+    changed = NotificationInboxService.wait_for_change(user.id, first['version'], 1)
+    assert changed['version'] > first['version'] and changed['unread_count'] == 0
+    assert NotificationInboxService.first_page(user.id, serialize)['results'] == [notifications[0].id]
+    with django_capture_on_commit_callbacks(execute=True):
+        NotificationService.create_notification(title='New', message='Hello', notification_to=user)
+        assert NotificationService.delete_read_notifications_for_user(user.id) == 1
+    assert NotificationService.count_unread_notifications_for_user(user.id) == 1
+    with django_capture_on_commit_callbacks(execute=True):
+        assert NotificationService.delete_notifications_for_user(user.id) == 1
+    assert NotificationService.count_unread_notifications_for_user(user.id) == 0
+
+    api_client = APIClient()
+    api_client.cookies['user_access_token'] = str(AccessToken.for_user(user))
+    state = NotificationInboxService.state(user.id)
+    response = api_client.get(reverse('notification-unread-count'), {'since': state['version'] - 1})
+    assert response.status_code == 200 and response.json() == state
+    assert api_client.get(reverse('notification-inbox')).json()['results'] == []
+
+    stream = api_client.get(reverse('notification-unread-count-stream'), HTTP_ACCEPT='text/event-stream')
+    assert stream.status_code == 200 and stream['Content-Type'] == 'text/event-stream'
+    body = b''.join(stream.streaming_content).decode()
+    assert body.startswith(f"id: {state['version']}\nevent: unread_count\n")
+    assert ': keep-alive' in body
+
+    # sync worker pools: no request is held open
+    settings.NOTIFICATION_INBOX = {**settings.NOTIFICATION_INBOX, 'BLOCKING_WAITS': False, 'MAX_WAIT_SECONDS': 30}
+    started = time.monotonic()
+    response = api_client.get(reverse('notification-unread-count'), {'since': state['version'], 'wait': 30})
+    assert response.json() == state and time.monotonic() - started < 5
+    stream = api_client.get(reverse('notification-unread-count-stream'), HTTP_ACCEPT='text/event-stream')
+    assert stream.status_code == 204
+
+
+@pytest.mark.django_db
+def test_reassigning_a_notification_moves_it_between_unread_counters(
+    test_company_fixture, create_branch, django_capture_on_commit_callbacks
+):
+    """
+    Changing notification_to moves an unread notification out of the old recipient's count and into
+    the new one's, through the service and through the viewset's update.
+    """
+    from types import SimpleNamespace
+    from notifications.serializers.notification_serializer import NotificationSerializer
+    from notifications.services.notification_service import NotificationService
+    from notifications.views.notification_views import NotificationViewSet
+
+    alice, bob = [
+        User.objects.create_user(
+            username=name, email=f'{name}@example.com', password=name, company=test_company_fixture,
+            branch=create_branch, role='Manager',
+        )
+        for name in ('alice', 'bob')
+    ]
+    with django_capture_on_commit_callbacks(execute=True):
+        notification = NotificationService.create_notification(title='Note', message='Hello', notification_to=alice)
+    with django_capture_on_commit_callbacks(execute=True):
+        NotificationService.update_notification(notification, notification_to=bob)
+    assert NotificationService.count_unread_notifications_for_user(alice.id) == 0
+    assert NotificationService.count_unread_notifications_for_user(bob.id) == 1
+
+    view = NotificationViewSet()
+    view.request = SimpleNamespace(user=bob)
+    serializer = NotificationSerializer(notification, data={'notification_to': alice.id, 'is_read': True}, partial=True)
+    assert serializer.is_valid(), serializer.errors
+    with django_capture_on_commit_callbacks(execute=True):
+        view.perform_update(serializer)
+    assert NotificationService.count_unread_notifications_for_user(alice.id) == 0
+    assert NotificationService.count_unread_notifications_for_user(bob.id) == 0
+
+    with django_capture_on_commit_callbacks(execute=True):
+        NotificationService.update_notification(notification, notification_to=bob, is_read=False)
+    assert NotificationService.count_unread_notifications_for_user(alice.id) == 0
+    assert NotificationService.count_unread_notifications_for_user(bob.id) == 1
@@ -1,4 +1,4 @@
 from .notification_urls import urlpatterns as notification_urlpatterns
 
 
-url_patterns = notification_urlpatterns
\ No newline at end of file
+urlpatterns = notification_urlpatterns
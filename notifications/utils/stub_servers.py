@@ -0,0 +1,178 @@
+import argparse
+import json
+import socketserver
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from loguru import logger
+
+
+class _StubServer:
+    def __init__(self, server):
+        self._server = server
+        self._thread = None
+
+    @property
+    def address(self) -> tuple[str, int]:
+        return self._server.server_address[:2]
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+class StubWhatsAppServer(_StubServer):
+    """
+    Local stand-in for the WhatsApp Cloud API, for tests and load runs.
+    Serves POST messages/ and records each message; numbers in fail_numbers get a 400.
+
+        with StubWhatsAppServer() as server:
+            settings.NOTIFICATION_DISPATCH["CHANNELS"]["whatsapp"]["BASE_URL"] = server.url
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, fail_numbers=()):
+        self.fail_numbers = set(fail_numbers)
+        self.received = []
+        self.connections = set()
+        self._lock = threading.Lock()
+        super().__init__(ThreadingHTTPServer((host, port), self._handler()))
+
+    @property
+    def url(self) -> str:
+        host, port = self.address
+        return f"http://{host}:{port}/"
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # keep-alive, so pooled clients can reuse their connection
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, format, *args):
+                logger.debug(f"Stub WhatsApp server | {format % args}")
+
+            def _send(self, status: int, body: dict):
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+                if self.path.rstrip('/') != '/messages':
+                    return self._send(404, {'error': 'Not found'})
+                with stub._lock:
+                    stub.connections.add(self.client_address)
+                    stub.received.append(body)
+                    index = len(stub.received)
+                if body.get('to') in stub.fail_numbers:
+                    return self._send(400, {'error': 'Recipient cannot receive messages'})
+                self._send(200, {'messages': [{'id': f"wamid.stub{index}"}]})
+
+        return Handler
+
+
+class StubSmtpServer(_StubServer):
+    """
+    Minimal SMTP server that accepts every message (recipients in reject get a 550) and records
+    the connections it saw, so tests can check that a batch reused one connection.
+
+        with StubSmtpServer() as server:
+            host, port = server.address
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, reject=()):
+        self.reject = set(reject)
+        self.messages = []
+        self.connections = 0
+        self._lock = threading.Lock()
+        server = socketserver.ThreadingTCPServer((host, port), self._handler())
+        server.daemon_threads = True
+        super().__init__(server)
+
+    def _handler(self):
+        stub = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def _reply(self, line: str):
+                self.wfile.write(f"{line}\r\n".encode())
+
+            def handle(self):
+                with stub._lock:
+                    stub.connections += 1
+                self._reply("220 stub ESMTP")
+                sender, recipients = None, []
+                while True:
+                    line = self.rfile.readline()
+                    if not line:
+                        return
+                    command = line.decode(errors='replace').strip()
+                    verb = command[:4].upper()
+                    if verb == 'EHLO':
+                        self._reply("250-stub")
+                        self._reply("250 8BITMIME")
+                    elif verb in ('HELO', 'NOOP'):
+                        self._reply("250 OK")
+                    elif verb == 'RSET':
+                        sender, recipients = None, []
+                        self._reply("250 OK")
+                    elif verb == 'MAIL':
+                        sender, recipients = command.split(':', 1)[1].strip(), []
+                        self._reply("250 OK")
+                    elif verb == 'RCPT':
+                        recipient = command.split(':', 1)[1].strip().strip('<>')
+                        if recipient in stub.reject:
+                            self._reply("550 Mailbox unavailable")
+                        else:
+                            recipients.append(recipient)
+                            self._reply("250 OK")
+                    elif verb == 'DATA':
+                        self._reply("354 End data with <CR><LF>.<CR><LF>")
+                        data = []
+                        while True:
+                            data_line = self.rfile.readline()
+                            if not data_line or data_line in (b'.\r\n', b'.\n'):
+                                break
+                            data.append(data_line)
+                        with stub._lock:
+                            stub.messages.append({'from': sender, 'to': recipients, 'data': b''.join(data)})
+                        self._reply("250 OK queued")
+                    elif verb == 'QUIT':
+                        self._reply("221 Bye")
+                        return
+                    else:
+                        self._reply("502 Command not implemented")
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run local stub WhatsApp and SMTP servers.")
+    parser.add_argument('--whatsapp-port', type=int, default=8766)
+    parser.add_argument('--smtp-port', type=int, default=8025)
+    options = parser.parse_args()
+    whatsapp = StubWhatsAppServer(port=options.whatsapp_port).start()
+    smtp = StubSmtpServer(port=options.smtp_port).start()
+    logger.info(f"Stub WhatsApp API on {whatsapp.url}, stub SMTP on {smtp.address[0]}:{smtp.address[1]}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        whatsapp.stop()
+        smtp.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,11 @@
+import json
+import time
+from django.conf import settings
+from django.db import transaction as db_transaction
+from django.http import StreamingHttpResponse
 from rest_framework.viewsets import ModelViewSet
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from rest_framework.filters import SearchFilter, OrderingFilter
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from config.auth.jwt_token_authentication import CompanyCookieJWTAuthentication, UserCookieJWTAuthentication
@@ -12,11 +19,24 @@ from django.db.models import Q
 from notifications.models.notification_model import Notification
 from notifications.serializers.notification_serializer import NotificationSerializer
 from notifications.services.notification_service import NotificationService  # optional service layer
+from notifications.services.inbox.notification_inbox_service import NotificationInboxService
 from users.models import User
 from notifications.permissions.notification_permissions import NotificationPermission  # create as needed
 
 
-class NotificationViewSet(ModelViewSet):
+class EventStreamRenderer(BaseRenderer):
+    """
+    Lets EventSource clients (Accept: text/event-stream) through content negotiation;
+    the stream itself is written by the view.
+    """
+    media_type = 'text/event-stream'
+    format = 'sse'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return data
+
+
+class NotificationViewSet(EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for managing Notifications.
     Supports listing, retrieving, creating, updating, and deleting notifications.
@@ -65,10 +85,13 @@ class NotificationViewSet(ModelViewSet):
         PERFORM_CREATE()
         -------------------
         Saves a new Notification instance and logs the event.
+        The save and the recipient's unread counter commit together.
         -------------------
         """
         user = self.request.user
-        notification = serializer.save()
+        with db_transaction.atomic():
+            notification = serializer.save()
+            NotificationInboxService.adjust_for([notification])
         actor = getattr(user, 'username', 'Unknown')
 
         logger.success(
@@ -81,10 +104,16 @@ class NotificationViewSet(ModelViewSet):
         PERFORM_UPDATE()
         -------------------
         Saves an updated Notification instance and logs the event.
+        The save and the unread counters of the old and new recipient commit together.
         -------------------
         """
         user = self.request.user
-        notification = serializer.save()
+        before = (serializer.instance.notification_to_id, serializer.instance.is_read)
+        with db_transaction.atomic():
+            notification = serializer.save()
+            NotificationInboxService.adjust(
+                NotificationInboxService.change_deltas(before, (notification.notification_to_id, notification.is_read))
+            )
         actor = getattr(user, 'username', 'Unknown')
 
         logger.info(
@@ -92,6 +121,15 @@ class NotificationViewSet(ModelViewSet):
             f"for user '{notification.notification_to.username}'."
         )
 
+    def perform_destroy(self, instance):
+        """
+        PERFORM_DESTROY()
+        -------------------
+        Deletes a Notification through the service, so the unread counter follows.
+        -------------------
+        """
+        NotificationService.delete_notification(instance)
+
     # -------------------------
     # Custom action methods
     # -------------------------
@@ -102,9 +140,7 @@ class NotificationViewSet(ModelViewSet):
         Marks a notification as read.
         """
         notification = self.get_object()
-        notification.is_read = True
-        notification.status = 'READ'
-        notification.save()
+        NotificationService.mark_as_read(notification)
         logger.info(f"Notification '{notification.id}' marked as READ by '{request.user.username}'.")
         return Response({'status': 'Notification marked as read'}, status=status.HTTP_200_OK)
 
@@ -114,8 +150,78 @@ class NotificationViewSet(ModelViewSet):
         Marks a notification as unread.
         """
         notification = self.get_object()
-        notification.is_read = False
-        notification.status = 'PENDING'
-        notification.save()
+        NotificationService.mark_as_unread(notification)
         logger.info(f"Notification '{notification.id}' marked as UNREAD by '{request.user.username}'.")
         return Response({'status': 'Notification marked as unread'}, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=['get'], url_path='inbox')
+    def inbox(self, request):
+        """
+        The newest notifications with the unread count and inbox version, served from the
+        per-version cache until the user's notifications change.
+        """
+        page = NotificationInboxService.first_page(
+            request.user.id,
+            lambda notifications: NotificationSerializer(notifications, many=True, context={'request': request}).data,
+        )
+        return Response(page, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=['get'], url_path='unread-count')
+    def unread_count(self, request):
+        """
+        Unread count and inbox version. With ?since=<version>&wait=<seconds> this is a long-poll:
+        it answers as soon as the version changes, or with the same version after the wait.
+        Without NOTIFICATION_INBOX["BLOCKING_WAITS"] (sync workers) it never waits.
+        """
+        config = getattr(settings, 'NOTIFICATION_INBOX', {})
+        try:
+            since = int(request.query_params['since']) if 'since' in request.query_params else None
+            wait = min(float(request.query_params.get('wait', config.get('MAX_WAIT_SECONDS', 25))), config.get('MAX_WAIT_SECONDS', 25))
+        except ValueError:
+            return Response({'detail': "'since' and 'wait' must be numbers."}, status=status.HTTP_400_BAD_REQUEST)
+        if not config.get('BLOCKING_WAITS', False):
+            wait = 0
+        state = NotificationInboxService.wait_for_change(request.user.id, since, max(wait, 0))
+        return Response(state, status=status.HTTP_200_OK)
+
+    @action(
+        detail=False,
+        methods=['get'],
+        url_path='unread-count/stream',
+        renderer_classes=[EventStreamRenderer, JSONRenderer],
+    )
+    def unread_count_stream(self, request):
+        """
+        Server-sent events: an 'unread_count' event with the current state, then one per change,
+        with keep-alive comments in between. The stream ends after STREAM_SECONDS and EventSource
+        reconnects, sending the last version back as Last-Event-ID.
+        Without NOTIFICATION_INBOX["BLOCKING_WAITS"] (sync workers) it answers 204, which stops
+        EventSource from reconnecting; clients then poll unread-count.
+        """
+        config = getattr(settings, 'NOTIFICATION_INBOX', {})
+        if not config.get('BLOCKING_WAITS', False):
+            return Response(status=status.HTTP_204_NO_CONTENT)
+        user_id = request.user.id
+        last_event_id = request.META.get('HTTP_LAST_EVENT_ID')
+        since = int(last_event_id) if last_event_id and last_event_id.isdigit() else None
+
+        def events():
+            nonlocal since
+            deadline = time.monotonic() + config.get('STREAM_SECONDS', 55)
+            heartbeat = config.get('STREAM_HEARTBEAT_SECONDS', 15)
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                state = NotificationInboxService.wait_for_change(user_id, since, min(heartbeat, remaining))
+                if state['version'] != since:
+                    since = state['version']
+                    yield f"id: {since}\nevent: unread_count\ndata: {json.dumps(state)}\n\n"
+                else:
+                    yield ": keep-alive\n\n"
+
+        response = StreamingHttpResponse(events(), content_type='text/event-stream')
+        response['Cache-Control'] = 'no-cache'
+        # nginx would otherwise buffer the stream
+        response['X-Accel-Buffering'] = 'no'
+        return response
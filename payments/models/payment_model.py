@@ -61,4 +61,10 @@ class Payment(CreateUpdateBaseModel):
     class Meta:
         ordering = ['-payment_date']
         verbose_name = "Payment"
-        verbose_name_plural = "Payments"
\ No newline at end of file
+        verbose_name_plural = "Payments"
+        indexes = [
+            models.Index(fields=['company', '-payment_date'], name='payment_co_date_idx'),
+            models.Index(fields=['company', 'branch', '-payment_date'], name='payment_co_br_date_idx'),
+            models.Index(fields=['company', 'status', '-payment_date'], name='payment_co_status_date_idx'),
+            models.Index(fields=['reference_model', 'reference_id'], name='payment_reference_idx'),
+        ]
\ No newline at end of file
@@ -18,7 +18,7 @@ class SalesPaymentService:
     # A Service class for sales payment
 
     @staticmethod
-    @db_transaction
+    @db_transaction.atomic
     def create_sales_payment(*,
                             company: Company,
                             branch: Branch,
@@ -57,7 +57,7 @@ class SalesPaymentService:
 
     
     @staticmethod
-    @db_transaction
+    @db_transaction.atomic
     def update_sales_payment(*,
             company: Company,
             branch: Branch,
@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from rest_framework.filters import SearchFilter, OrderingFilter
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from config.auth.jwt_token_authentication import CompanyCookieJWTAuthentication, UserCookieJWTAuthentication
@@ -15,7 +16,7 @@ from rest_framework import status
 from loguru import logger
 
 
-class PaymentReceiptViewSet(ModelViewSet):
+class PaymentReceiptViewSet(EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for managing PaymentReceipts.
     Supports listing, retrieving, creating, updating, and deleting receipts.
@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from rest_framework.filters import SearchFilter, OrderingFilter
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from config.auth.jwt_token_authentication import CompanyCookieJWTAuthentication, UserCookieJWTAuthentication
@@ -11,7 +12,7 @@ from payments.permissions.payment_permissions import PaymentsPermissions
 from loguru import logger
 
 
-class RefundPaymentViewSet(ModelViewSet):
+class RefundPaymentViewSet(EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for managing RefundPayments.
     Supports listing, retrieving, creating, updating, and deleting refund payments.
@@ -83,6 +83,176 @@ CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 
+# Activity log pipeline: "sync", "buffered" or "celery" (see config/activity_log/activity_log_pipeline.py)
+ACTIVITY_LOG_PIPELINE = {
+    "MODE": os.getenv("ACTIVITY_LOG_MODE", "buffered"),
+    "BATCH_SIZE": 500,
+    "MAX_BUFFERED": 5000,
+    "OVERFLOW_POLICY": os.getenv("ACTIVITY_LOG_OVERFLOW_POLICY", "flush"),
+}
+
+# Product search: "postgres" (GIN tsvector/trigram indexes) or "memory" (in-process trie/n-gram index);
+# unset picks by database vendor. BUDGET_MS bounds the in-process search per keystroke.
+PRODUCT_SEARCH = {
+    "BACKEND": os.getenv("PRODUCT_SEARCH_BACKEND"),
+    "BUDGET_MS": 20,
+    "MAX_RESULTS": 200,
+}
+
+# Product CSV imports: "sync" runs the import inside the request, "celery" queues run_product_import_task
+PRODUCT_IMPORT = {
+    "MODE": os.getenv("PRODUCT_IMPORT_MODE", "celery"),
+    "CHUNK_SIZE": 1000,
+}
+
+
+# Report rollups: refreshed incrementally every REFRESH_SECONDS by reports.tasks.refresh_report_rollups_task;
+# fact rows younger than SETTLE_SECONDS are re-read on the next run in case an older write commits late
+REPORT_ROLLUPS = {
+    "REFRESH_SECONDS": 300,
+    "SETTLE_SECONDS": 60,
+    "LOCK_SECONDS": 600,
+}
+
+# Fiscalisation outbox: with ENABLED, checkouts queue a pending FiscalInvoice; submit_fiscal_invoices_task signs
+# due invoices with the key at PRIVATE_KEY_PATH and posts them BATCH_SIZE at a time over a pooled session,
+# retrying unreachable-API batches after BACKOFF_SECONDS * 2^attempt (capped) up to MAX_ATTEMPTS
+FISCALISATION = {
+    "ENABLED": os.getenv("FISCALISATION_ENABLED", "false").lower() == "true",
+    "BASE_URL": os.getenv("FISCAL_API_URL", "https://api.zimra.co.zw/v1/"),
+    "PRIVATE_KEY_PATH": os.getenv("PRIVATE_KEY_PATH"),
+    "PRIVATE_KEY_PASSWORD": os.getenv("PRIVATE_KEY_PASSWORD"),
+    "BATCH_SIZE": 50,
+    "POLL_SECONDS": 15,
+    "TIMEOUT_SECONDS": 10,
+    "POOL_SIZE": 10,
+    "HTTP_RETRIES": 2,
+    "MAX_ATTEMPTS": 8,
+    "BACKOFF_SECONDS": 30,
+    "MAX_BACKOFF_SECONDS": 3600,
+    "LEASE_SECONDS": 120,
+}
+
+# Outbound notifications: dispatch_notifications_task claims BATCH_SIZE pending notifications, sends them per
+# channel over pooled connections (one SMTP connection / HTTP session per worker) under each provider's
+# RATE_PER_SECOND, and retries failed sends after BACKOFF_SECONDS * 2^attempt (capped) up to MAX_ATTEMPTS
+NOTIFICATION_DISPATCH = {
+    "BATCH_SIZE": 200,
+    "POLL_SECONDS": 10,
+    "MAX_ATTEMPTS": 5,
+    "BACKOFF_SECONDS": 30,
+    "MAX_BACKOFF_SECONDS": 3600,
+    "LEASE_SECONDS": 120,
+    "CHANNELS": {
+        "email": {
+            "BATCH_SIZE": 100,
+            "RATE_PER_SECOND": 10,
+            "BURST": 20,
+            "TIMEOUT_SECONDS": 10,
+            # a pooled SMTP connection idle for longer is reopened rather than trusted
+            "MAX_IDLE_SECONDS": 60,
+        },
+        "whatsapp": {
+            "BATCH_SIZE": 50,
+            "RATE_PER_SECOND": 20,
+            "BURST": 40,
+            "TIMEOUT_SECONDS": 10,
+            "CONCURRENCY": 4,
+            "HTTP_RETRIES": 2,
+        },
+    },
+}
+
+# Notification inboxes: unread counts and versions are kept per user and cached for STATE_CACHE_SECONDS;
+# the first PAGE_SIZE notifications are cached per version. unread-count long-polls (and the SSE stream)
+# hold their worker for up to MAX_WAIT_SECONDS (STREAM_SECONDS), checking the cache every WAIT_POLL_SECONDS.
+# A sync WSGI pool would run out of workers with many clients waiting, so BLOCKING_WAITS is only turned on
+# (NOTIFICATION_BLOCKING_WAITS=true) for ASGI or async-worker deployments; otherwise unread-count answers at
+# once and the stream answers 204, which tells EventSource clients to stop reconnecting and poll instead
+NOTIFICATION_INBOX = {
+    "BLOCKING_WAITS": os.getenv("NOTIFICATION_BLOCKING_WAITS", "false").lower() == "true",
+    "PAGE_SIZE": 20,
+    "PAGE_CACHE_SECONDS": 300,
+    "STATE_CACHE_SECONDS": 3600,
+    "WAIT_POLL_SECONDS": 1,
+    "MAX_WAIT_SECONDS": 25,
+    "STREAM_SECONDS": 55,
+    "STREAM_HEARTBEAT_SECONDS": 15,
+}
+
+CELERY_BEAT_SCHEDULE = {
+    "refresh-report-rollups": {
+        "task": "reports.tasks.refresh_report_rollups_task",
+        "schedule": REPORT_ROLLUPS["REFRESH_SECONDS"],
+    },
+    "submit-fiscal-invoices": {
+        "task": "taxes.tasks.submit_fiscal_invoices_task",
+        "schedule": FISCALISATION["POLL_SECONDS"],
+    },
+    "dispatch-notifications": {
+        "task": "notifications.tasks.dispatch_notifications_task",
+        "schedule": NOTIFICATION_DISPATCH["POLL_SECONDS"],
+    },
+}
+
+# Till catalogue sync: deltas larger than MAX_DELTA_CHANGES ask the terminal to re-snapshot;
+# changes younger than SETTLE_SECONDS are re-sent by the next delta in case an older write commits late
+CATALOGUE_SYNC = {
+    "MAX_DELTA_CHANGES": 5000,
+    "SETTLE_SECONDS": 2,
+    "SNAPSHOT_CACHE_SECONDS": 300,
+}
+
+# Stock posting: "locking" locks and rewrites the stock rows; "delta" applies each change as one
+# conditional UPDATE (quantity = quantity + delta WHERE quantity + delta >= 0), which queues less on hot SKUs
+STOCK_POSTING = {
+    "MODE": "locking",
+}
+
+# Authenticated principals (User / Company) cached per process by the cookie JWT classes;
+# saves and deletes drop the entry at once in the saving process, other processes within TTL_SECONDS
+AUTH_PRINCIPAL_CACHE = {
+    "TTL_SECONDS": 30,
+    "MAX_ENTRIES": 10000,
+}
+
+# Currency conversion: each process keeps the rate table in memory and checks the shared
+# version (bumped on Currency / ExchangeRate saves) at most every CHECK_SECONDS
+CURRENCY_RATES = {
+    "CHECK_SECONDS": 5,
+}
+
+# Document numbers (SO-<company>-000042): each process reserves BLOCK_SIZE numbers per company and document
+# type in one UPDATE; GAPLESS document types take one number per document under the sequence row lock instead
+DOCUMENT_NUMBERING = {
+    "BLOCK_SIZE": 50,
+    "GAPLESS": [],
+}
+
+# Loguru: an empty MODE keeps loguru's default stderr sink; "per_app" writes posflow.log plus one filtered,
+# synchronous file sink per app; "production" uses a single enqueued sink that routes each record to posflow.log
+# and its app's file, and keeps 1 in N records below WARNING from the SAMPLE_EVERY modules; any other MODE fails start-up
+LOGURU = {
+    "MODE": os.getenv("LOG_MODE", ""),
+    "LEVEL": os.getenv("LOG_LEVEL", "INFO"),
+    "ENQUEUE": True,
+    "MAX_BYTES": 10 * 1024 * 1024,
+    "BACKUP_COUNT": 10,
+    "SAMPLE_EVERY": {
+        "inventory.services.product_stock": 10,
+        "inventory.services.stock_movement": 10,
+        "sales.services.sales_receipt_item_service": 10,
+        "transactions.utilities": 10,
+    },
+}
+
+# Streaming CSV/NDJSON exports: rows fetched per cursor round trip, bytes buffered per streamed chunk
+STREAMING_EXPORT = {
+    "CHUNK_SIZE": 2000,
+    "FLUSH_BYTES": 64 * 1024,
+    "GZIP_LEVEL": 6,
+}
+
 
 # SECURITY WARNING: don't run with debug turned on in production!
 DEBUG = True
@@ -97,6 +267,7 @@ DJANGO_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
 ]
 
 
@@ -149,6 +320,7 @@ MIDDLEWARE = [
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'config.middleware.get_current_user_middleware.CurrentUserMiddleware',
+    'config.middleware.activity_log_buffer_middleware.ActivityLogBufferMiddleware',
 ]
 
 ROOT_URLCONF = 'posflow.urls'
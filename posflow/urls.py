@@ -51,13 +51,13 @@ urlpatterns = [
     path('posflow/', include('payments.urls')),
 
     # Notifications app endpoints
-    #path('posflow/', include('notifications.urls')),
+    path('posflow/', include('notifications.urls')),
 
     # Promotions app endpoints
     # path('posflow/', include('promotions.urls')), # 'PROMOTIONS DOES NOT HAVE ANYTHING'
 
     # Reports app endpoints
-    # path('posflow/', include('reports.urls')), # 'REPORTS DOES NOT HAVE ANYTHING'
+    path('posflow/', include('reports.urls')),
 
     # Sales app endpoints
     path('posflow/', include('sales.urls')),
@@ -0,0 +1,4 @@
+from .daily_sales_rollup_model import DailySalesRollup
+from .daily_stock_rollup_model import DailyStockRollup
+from .daily_account_rollup_model import DailyAccountRollup
+from .rollup_checkpoint_model import RollupCheckpoint
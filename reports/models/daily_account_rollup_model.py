@@ -0,0 +1,30 @@
+from django.db import models
+from config.models.create_update_base_model import CreateUpdateBaseModel
+
+
+class DailyAccountRollup(CreateUpdateBaseModel):
+    """
+    Debit and credit totals posted to one account on one day, from the journal.
+    net_change is the signed effect on the balance (the sum of JournalEntry.balance_delta).
+    """
+    company = models.ForeignKey('company.Company', on_delete=models.CASCADE, related_name='daily_account_rollups')
+    branch = models.ForeignKey('branch.Branch', on_delete=models.CASCADE, null=True, blank=True, related_name='daily_account_rollups')
+    account = models.ForeignKey('accounts.Account', on_delete=models.CASCADE, related_name='daily_rollups')
+    day = models.DateField()
+    debit_total = models.DecimalField(max_digits=15, decimal_places=2, default=0)
+    credit_total = models.DecimalField(max_digits=15, decimal_places=2, default=0)
+    net_change = models.DecimalField(max_digits=15, decimal_places=2, default=0)
+    entry_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ['day', 'account']
+        constraints = [
+            models.UniqueConstraint(fields=['company', 'day', 'branch', 'account'], name='unique_daily_account_rollup'),
+        ]
+        indexes = [
+            models.Index(fields=['company', 'day'], name='account_rollup_co_day_idx'),
+            models.Index(fields=['account', 'day'], name='account_rollup_acct_day_idx'),
+        ]
+
+    def __str__(self):
+        return f"Account {self.account_id} {self.day} | Dr {self.debit_total} | Cr {self.credit_total}"
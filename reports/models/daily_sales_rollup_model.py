@@ -0,0 +1,33 @@
+from django.db import models
+from config.models.create_update_base_model import CreateUpdateBaseModel
+
+
+class DailySalesRollup(CreateUpdateBaseModel):
+    """
+    Sales and sales returns of one product in one branch on one day.
+    Maintained by ReportRollupService from receipt and return lines; never edited by hand.
+    Voided receipts and cancelled return lines are left out.
+    """
+    company = models.ForeignKey('company.Company', on_delete=models.CASCADE, related_name='daily_sales_rollups')
+    branch = models.ForeignKey('branch.Branch', on_delete=models.CASCADE, related_name='daily_sales_rollups')
+    product = models.ForeignKey('inventory.Product', on_delete=models.CASCADE, related_name='daily_sales_rollups')
+    day = models.DateField()
+    quantity_sold = models.IntegerField(default=0)
+    revenue = models.DecimalField(max_digits=15, decimal_places=2, default=0, help_text="Net of tax")
+    tax = models.DecimalField(max_digits=15, decimal_places=2, default=0)
+    receipt_lines = models.PositiveIntegerField(default=0)
+    quantity_returned = models.IntegerField(default=0)
+    returns_value = models.DecimalField(max_digits=15, decimal_places=2, default=0, help_text="Net of tax")
+
+    class Meta:
+        ordering = ['day', 'branch', 'product']
+        constraints = [
+            models.UniqueConstraint(fields=['company', 'day', 'branch', 'product'], name='unique_daily_sales_rollup'),
+        ]
+        indexes = [
+            models.Index(fields=['company', 'branch', 'day'], name='sales_rollup_co_br_day_idx'),
+            models.Index(fields=['company', 'product', 'day'], name='sales_rollup_co_prod_day_idx'),
+        ]
+
+    def __str__(self):
+        return f"Sales {self.day} | branch {self.branch_id} | product {self.product_id} | {self.quantity_sold} sold"
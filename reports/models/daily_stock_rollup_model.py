@@ -0,0 +1,33 @@
+from django.db import models
+from config.models.create_update_base_model import CreateUpdateBaseModel
+
+
+class DailyStockRollup(CreateUpdateBaseModel):
+    """
+    Stock moved in and out of one branch for one product, per day and StockMovement.MovementType.
+    Maintained by ReportRollupService from StockMovement rows.
+    """
+    company = models.ForeignKey('company.Company', on_delete=models.CASCADE, related_name='daily_stock_rollups')
+    branch = models.ForeignKey('branch.Branch', on_delete=models.CASCADE, related_name='daily_stock_rollups')
+    product = models.ForeignKey('inventory.Product', on_delete=models.CASCADE, related_name='daily_stock_rollups')
+    day = models.DateField()
+    movement_type = models.CharField(max_length=32)
+    quantity_in = models.IntegerField(default=0)
+    quantity_out = models.IntegerField(default=0)
+    total_cost = models.DecimalField(max_digits=15, decimal_places=2, default=0)
+    movement_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ['day', 'branch', 'product', 'movement_type']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['company', 'day', 'branch', 'product', 'movement_type'], name='unique_daily_stock_rollup'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['company', 'branch', 'day'], name='stock_rollup_co_br_day_idx'),
+            models.Index(fields=['company', 'product', 'day'], name='stock_rollup_co_prod_day_idx'),
+        ]
+
+    def __str__(self):
+        return f"Stock {self.day} | {self.movement_type} | product {self.product_id} | +{self.quantity_in}/-{self.quantity_out}"
@@ -0,0 +1,15 @@
+from django.db import models
+from config.models.create_update_base_model import CreateUpdateBaseModel
+
+
+class RollupCheckpoint(CreateUpdateBaseModel):
+    """
+    How far the incremental rollup refresh has read one fact source:
+    the last id seen for append-only rows, or the last updated_at for rows that change (voids).
+    """
+    source = models.CharField(max_length=50, unique=True)
+    last_id = models.BigIntegerField(default=0)
+    last_updated_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"{self.source}: id {self.last_id}, updated {self.last_updated_at}"
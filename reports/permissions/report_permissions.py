@@ -0,0 +1,7 @@
+from config.permissions.company_role_base_permission import CompanyRolePermission
+
+
+class ReportPermission(CompanyRolePermission):
+    # Reports are read-only; only managers, accountants and admins may view them.
+    VIEW_ROLES = ['Manager', 'Accountant', 'Admin']
+    EDIT_ROLES = []
@@ -0,0 +1,41 @@
+from datetime import timedelta
+from django.utils import timezone
+from rest_framework import serializers
+from reports.services.report.report_service import ReportService
+
+
+# the widest date range one report request may cover
+MAX_REPORT_DAYS = 366
+
+
+class ReportQuerySerializer(serializers.Serializer):
+    """
+    Validates report query parameters. Dates default to the last 30 days.
+    """
+    date_from = serializers.DateField(required=False)
+    date_to = serializers.DateField(required=False)
+    branch = serializers.IntegerField(required=False)
+    product = serializers.IntegerField(required=False)
+    account = serializers.IntegerField(required=False)
+    group_by = serializers.CharField(required=False)
+
+    def __init__(self, *args, group_choices=None, default_group=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.group_choices = group_choices or {}
+        self.default_group = default_group
+
+    def validate_group_by(self, value):
+        if value not in self.group_choices:
+            raise serializers.ValidationError(f"group_by must be one of {sorted(self.group_choices)}")
+        return value
+
+    def validate(self, attrs):
+        today = timezone.localdate()
+        attrs['date_to'] = attrs.get('date_to') or today
+        attrs['date_from'] = attrs.get('date_from') or attrs['date_to'] - timedelta(days=29)
+        attrs.setdefault('group_by', self.default_group)
+        if attrs['date_from'] > attrs['date_to']:
+            raise serializers.ValidationError("date_from must be on or before date_to")
+        if (attrs['date_to'] - attrs['date_from']).days >= MAX_REPORT_DAYS:
+            raise serializers.ValidationError(f"A report may cover at most {MAX_REPORT_DAYS} days")
+        return attrs
@@ -0,0 +1,91 @@
+from datetime import date
+from django.db.models import Sum
+from reports.models.daily_account_rollup_model import DailyAccountRollup
+from reports.models.daily_sales_rollup_model import DailySalesRollup
+from reports.models.daily_stock_rollup_model import DailyStockRollup
+from reports.models.rollup_checkpoint_model import RollupCheckpoint
+
+
+class ReportService:
+    """
+    Report queries. Everything here reads the daily rollup tables only, never receipts,
+    stock movements or journal entries, so a report costs the same whatever the sales volume.
+    """
+
+    SALES_GROUPS = {
+        'day': ['day'],
+        'branch': ['branch_id', 'branch__name'],
+        'product': ['product_id', 'product__name'],
+        'day_product': ['day', 'product_id', 'product__name'],
+    }
+    STOCK_GROUPS = {
+        'day': ['day'],
+        'product': ['product_id', 'product__name'],
+        'movement_type': ['movement_type'],
+        'day_movement_type': ['day', 'movement_type'],
+    }
+    ACCOUNT_GROUPS = {
+        'day': ['day'],
+        'account': ['account_id', 'account__name'],
+        'day_account': ['day', 'account_id', 'account__name'],
+    }
+
+    @staticmethod
+    def _filtered(model, company, start: date, end: date, **filters):
+        queryset = model.objects.filter(company=company, day__gte=start, day__lte=end)
+        return queryset.filter(**{field: value for field, value in filters.items() if value is not None})
+
+    @staticmethod
+    def _grouped(queryset, group_fields, totals: dict) -> list[dict]:
+        return list(
+            queryset.values(*group_fields)
+            .annotate(**{name: Sum(field) for name, field in totals.items()})
+            .order_by(*group_fields)
+        )
+
+    @staticmethod
+    def sales_summary(company, start: date, end: date, group_by: str = 'day', branch=None, product=None) -> list[dict]:
+        """
+        Quantities and net revenue sold and returned, grouped by day, branch, product or day and product.
+        """
+        queryset = ReportService._filtered(DailySalesRollup, company, start, end, branch=branch, product=product)
+        return ReportService._grouped(queryset, ReportService.SALES_GROUPS[group_by], {
+            'quantity_sold': 'quantity_sold',
+            'revenue': 'revenue',
+            'tax': 'tax',
+            'quantity_returned': 'quantity_returned',
+            'returns_value': 'returns_value',
+        })
+
+    @staticmethod
+    def stock_movement_summary(company, start: date, end: date, group_by: str = 'day_movement_type', branch=None, product=None) -> list[dict]:
+        """
+        Stock in and out by StockMovement.MovementType, grouped by day, product or movement type.
+        """
+        queryset = ReportService._filtered(DailyStockRollup, company, start, end, branch=branch, product=product)
+        return ReportService._grouped(queryset, ReportService.STOCK_GROUPS[group_by], {
+            'quantity_in': 'quantity_in',
+            'quantity_out': 'quantity_out',
+            'total_cost': 'total_cost',
+            'movement_count': 'movement_count',
+        })
+
+    @staticmethod
+    def account_activity(company, start: date, end: date, group_by: str = 'day_account', branch=None, account=None) -> list[dict]:
+        """
+        Debit and credit totals posted per account and day.
+        """
+        queryset = ReportService._filtered(DailyAccountRollup, company, start, end, branch=branch, account=account)
+        return ReportService._grouped(queryset, ReportService.ACCOUNT_GROUPS[group_by], {
+            'debit_total': 'debit_total',
+            'credit_total': 'credit_total',
+            'net_change': 'net_change',
+            'entry_count': 'entry_count',
+        })
+
+    @staticmethod
+    def refreshed_at():
+        """
+        When the incremental refresh last finished (None before the first run).
+        """
+        return RollupCheckpoint.objects.order_by('-updated_at').values_list('updated_at', flat=True).first()
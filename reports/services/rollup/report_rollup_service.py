@@ -0,0 +1,280 @@
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction as db_transaction
+from django.db.models import Count, DecimalField, F, Max, Q, Sum
+from django.db.models.functions import Abs, TruncDate
+from django.utils import timezone
+from loguru import logger
+from company.models.company_model import Company
+from inventory.models.stock_movement_model import StockMovement
+from reports.models.daily_account_rollup_model import DailyAccountRollup
+from reports.models.daily_sales_rollup_model import DailySalesRollup
+from reports.models.daily_stock_rollup_model import DailyStockRollup
+from reports.models.rollup_checkpoint_model import RollupCheckpoint
+from sales.models.sales_receipt_item_model import SalesReceiptItem
+from sales.models.sales_receipt_model import SalesReceipt
+from sales.models.sales_return_item_model import SalesReturnItem
+from sales.models.sales_return_model import SalesReturn
+from transactions.models.journal_entry_model import JournalEntry
+
+
+_MONEY = DecimalField(max_digits=15, decimal_places=2)
+_CENT = Decimal('0.01')
+_ZERO = Decimal('0.00')
+
+# movement types that add stock to the branch; every other type takes stock out
+STOCK_IN_TYPES = {
+    StockMovement.MovementType.PURCHASE,
+    StockMovement.MovementType.VOIDED_SALE,
+    StockMovement.MovementType.TRANSFER_IN,
+    StockMovement.MovementType.SALE_RETURN,
+    StockMovement.MovementType.MANUAL_INCREASE,
+}
+
+# fact source -> (queryset, company field, day expression, how new rows are found)
+# "id": append-only rows, read past the last id; "updated_at": rows that change later (voids, edits)
+FACT_SOURCES = {
+    'stock_movement': (lambda: StockMovement.objects.all(), 'company_id', TruncDate('movement_date'), 'id'),
+    'journal_entry': (lambda: JournalEntry.objects.all(), 'company_id', TruncDate('posted_at'), 'id'),
+    'sales_receipt_item': (
+        lambda: SalesReceiptItem.objects.all(), 'sales_receipt__company_id', TruncDate('sales_receipt__receipt_date'), 'id'
+    ),
+    'sales_receipt': (lambda: SalesReceipt.objects.all(), 'company_id', TruncDate('receipt_date'), 'updated_at'),
+    'sales_return_item': (
+        lambda: SalesReturnItem.objects.all(), 'sales_return__company_id', F('sales_return__return_date'), 'id'
+    ),
+    'sales_return': (lambda: SalesReturn.objects.all(), 'company_id', F('return_date'), 'updated_at'),
+}
+
+
+class ReportRollupService:
+    """
+    Maintains the daily report rollups (DailySalesRollup, DailyStockRollup, DailyAccountRollup).
+    A (company, day) is refreshed by re-aggregating that day's fact rows and replacing its rollup rows,
+    so refreshes are idempotent and safe to repeat.
+    refresh_changed() finds the days touched since the last run through RollupCheckpoint watermarks
+    (run it every few minutes, see reports.tasks); refresh_range() backfills.
+    """
+
+    @staticmethod
+    def _config() -> dict:
+        return getattr(settings, 'REPORT_ROLLUPS', {})
+
+    @staticmethod
+    def day_bounds(day: date) -> tuple[datetime, datetime]:
+        """
+        [start, end) of a calendar day in the current time zone.
+        """
+        start = timezone.make_aware(datetime.combine(day, time.min))
+        end = timezone.make_aware(datetime.combine(day + timedelta(days=1), time.min))
+        return start, end
+
+    # -------------------------
+    # ONE DAY
+    # -------------------------
+    @staticmethod
+    def _sales_rows(company_id, day, start, end) -> list[DailySalesRollup]:
+        rows = {}
+        sold = (
+            SalesReceiptItem.objects
+            .filter(sales_receipt__company_id=company_id, sales_receipt__receipt_date__gte=start, sales_receipt__receipt_date__lt=end)
+            .exclude(sales_receipt__is_voided=True)
+            .exclude(sales_receipt__status='VOIDED')
+            .values('sales_receipt__branch_id', 'product_id')
+            .annotate(
+                total_quantity=Sum('quantity'),
+                revenue=Sum(F('quantity') * F('unit_price'), output_field=_MONEY),
+                tax=Sum(F('quantity') * F('unit_price') * F('tax_rate') / 100, output_field=_MONEY),
+                lines=Count('id'),
+            )
+            .order_by()
+        )
+        for row in sold:
+            rows[(row['sales_receipt__branch_id'], row['product_id'])] = DailySalesRollup(
+                company_id=company_id,
+                branch_id=row['sales_receipt__branch_id'],
+                product_id=row['product_id'],
+                day=day,
+                quantity_sold=row['total_quantity'] or 0,
+                revenue=Decimal(row['revenue'] or _ZERO).quantize(_CENT),
+                tax=Decimal(row['tax'] or _ZERO).quantize(_CENT),
+                receipt_lines=row['lines'],
+            )
+
+        returned = (
+            SalesReturnItem.objects
+            .filter(sales_return__company_id=company_id, sales_return__return_date=day)
+            .exclude(status='CANCELLED')
+            .values('sales_return__branch_id', 'product_id')
+            .annotate(total_quantity=Sum('quantity'), value=Sum(F('quantity') * F('unit_price'), output_field=_MONEY))
+            .order_by()
+        )
+        for row in returned:
+            key = (row['sales_return__branch_id'], row['product_id'])
+            rollup = rows.setdefault(key, DailySalesRollup(
+                company_id=company_id, branch_id=key[0], product_id=key[1], day=day
+            ))
+            rollup.quantity_returned = row['total_quantity'] or 0
+            rollup.returns_value = Decimal(row['value'] or _ZERO).quantize(_CENT)
+        return list(rows.values())
+
+    @staticmethod
+    def _stock_rows(company_id, day, start, end) -> list[DailyStockRollup]:
+        moved = (
+            StockMovement.objects
+            .filter(company_id=company_id, movement_date__gte=start, movement_date__lt=end)
+            .values('branch_id', 'product_id', 'movement_type')
+            .annotate(total_quantity=Sum(Abs('quantity')), cost=Sum('total_cost'), movements=Count('id'))
+            .order_by()
+        )
+        rows = []
+        for row in moved:
+            stock_in = row['movement_type'] in STOCK_IN_TYPES
+            rows.append(DailyStockRollup(
+                company_id=company_id,
+                branch_id=row['branch_id'],
+                product_id=row['product_id'],
+                day=day,
+                movement_type=row['movement_type'],
+                quantity_in=row['total_quantity'] if stock_in else 0,
+                quantity_out=0 if stock_in else row['total_quantity'],
+                total_cost=Decimal(row['cost'] or _ZERO).quantize(_CENT),
+                movement_count=row['movements'],
+            ))
+        return rows
+
+    @staticmethod
+    def _account_rows(company_id, day, start, end) -> list[DailyAccountRollup]:
+        posted = (
+            JournalEntry.objects
+            .filter(company_id=company_id, posted_at__gte=start, posted_at__lt=end)
+            .values('branch_id', 'account_id')
+            .annotate(
+                debit=Sum('amount', filter=Q(entry_type='DEBIT')),
+                credit=Sum('amount', filter=Q(entry_type='CREDIT')),
+                net=Sum('balance_delta'),
+                entries=Count('id'),
+            )
+            .order_by()
+        )
+        return [
+            DailyAccountRollup(
+                company_id=company_id,
+                branch_id=row['branch_id'],
+                account_id=row['account_id'],
+                day=day,
+                debit_total=row['debit'] or _ZERO,
+                credit_total=row['credit'] or _ZERO,
+                net_change=row['net'] or _ZERO,
+                entry_count=row['entries'],
+            )
+            for row in posted
+        ]
+
+    @staticmethod
+    @db_transaction.atomic
+    def refresh_day(company_id: int, day: date) -> dict:
+        """
+        Rebuild every rollup row of one company and day from the fact tables.
+        """
+        start, end = ReportRollupService.day_bounds(day)
+        counts = {}
+        for model, build in (
+            (DailySalesRollup, ReportRollupService._sales_rows),
+            (DailyStockRollup, ReportRollupService._stock_rows),
+            (DailyAccountRollup, ReportRollupService._account_rows),
+        ):
+            rows = build(company_id, day, start, end)
+            model.objects.filter(company_id=company_id, day=day).delete()
+            model.objects.bulk_create(rows, batch_size=1000)
+            counts[model.__name__] = len(rows)
+        logger.debug(f"Report rollups refreshed | company={company_id} | day={day} | rows={counts}")
+        return counts
+
+    # -------------------------
+    # INCREMENTAL
+    # -------------------------
+    @staticmethod
+    def _touched_days(source: str, checkpoint: RollupCheckpoint, started_at: datetime) -> set[tuple[int, date]]:
+        """
+        (company_id, day) pairs with rows in a fact source since its checkpoint; moves the checkpoint on.
+        Rows younger than SETTLE_SECONDS stay behind the watermark and are read again next run,
+        so a transaction that commits late is not skipped.
+        """
+        queryset_factory, company_field, day_expression, mode = FACT_SOURCES[source]
+        settle = timedelta(seconds=ReportRollupService._config().get('SETTLE_SECONDS', 60))
+        queryset = queryset_factory()
+        if mode == 'id':
+            queryset = queryset.filter(id__gt=checkpoint.last_id)
+        elif checkpoint.last_updated_at is not None:
+            queryset = queryset.filter(updated_at__gt=checkpoint.last_updated_at - settle)
+
+        pairs = {
+            (company_id, day)
+            for company_id, day in (
+                queryset.annotate(rollup_day=day_expression)
+                .values_list(company_field, 'rollup_day')
+                .distinct()
+                .order_by()
+            )
+            if day is not None
+        }
+
+        if mode == 'id':
+            settled = queryset.filter(created_at__lte=started_at - settle).aggregate(last=Max('id'))['last']
+            if settled is not None:
+                checkpoint.last_id = settled
+        else:
+            checkpoint.last_updated_at = started_at
+        return pairs
+
+    @staticmethod
+    def refresh_changed() -> int:
+        """
+        Refresh every (company, day) touched since the last run. Returns the number of days refreshed.
+        Only one refresh runs at a time; an overlapping call returns 0.
+        """
+        lock_key = 'report_rollups:refresh_lock'
+        if not cache.add(lock_key, 1, ReportRollupService._config().get('LOCK_SECONDS', 600)):
+            logger.info("Report rollup refresh already running; skipped")
+            return 0
+        try:
+            started_at = timezone.now()
+            checkpoints = {
+                source: RollupCheckpoint.objects.get_or_create(source=source)[0] for source in FACT_SOURCES
+            }
+            touched = set()
+            for source, checkpoint in checkpoints.items():
+                touched |= ReportRollupService._touched_days(source, checkpoint, started_at)
+
+            for company_id, day in sorted(touched):
+                ReportRollupService.refresh_day(company_id, day)
+
+            # watermarks only move once the days they cover are rebuilt
+            for checkpoint in checkpoints.values():
+                checkpoint.save(update_fields=['last_id', 'last_updated_at', 'updated_at'])
+            logger.info(f"Report rollups refreshed | days={len(touched)}")
+            return len(touched)
+        finally:
+            cache.delete(lock_key)
+
+    # -------------------------
+    # BACKFILL
+    # -------------------------
+    @staticmethod
+    def refresh_range(start: date, end: date, company=None) -> int:
+        """
+        Rebuild the rollups of every day in [start, end] for one or all companies.
+        """
+        companies = [company.id] if company is not None else list(Company.objects.values_list('id', flat=True))
+        refreshed = 0
+        day = start
+        while day <= end:
+            for company_id in companies:
+                ReportRollupService.refresh_day(company_id, day)
+                refreshed += 1
+            day += timedelta(days=1)
+        logger.info(f"Report rollups backfilled | from={start} | to={end} | company_days={refreshed}")
+        return refreshed
@@ -0,0 +1,13 @@
+from celery import shared_task
+from loguru import logger
+from reports.services.rollup.report_rollup_service import ReportRollupService
+
+
+@shared_task
+def refresh_report_rollups_task():
+    """
+    Rebuild the report rollups of every day touched since the previous run (scheduled in CELERY_BEAT_SCHEDULE).
+    """
+    refreshed = ReportRollupService.refresh_changed()
+    logger.info(f"refresh_report_rollups_task refreshed {refreshed} company days")
+    return refreshed
@@ -0,0 +1,89 @@
+from fixture_tests import *
+
+
+# ==========================================
+# REPORT ROLLUPS
+# ==========================================
+
+@pytest.mark.django_db
+def test_report_rollups_refresh_incrementally_and_serve_reports(settings, test_company_fixture, create_branch, test_customer_fixture, test_stocked_products_fixture):
+    """
+    Test that a checkout lands in the daily sales, stock and account rollups, that a void
+    is picked up by the next incremental refresh, that a backfill rebuilds the same rows,
+    and that the report endpoints never read the fact tables.
+    """
+    from decimal import Decimal
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    from django.utils import timezone
+    from rest_framework.test import APIClient
+    from accounts.models.account_model import Account
+    from accounts.models.cash_account_model import CashAccount
+    from accounts.models.sales_account_model import SalesAccount
+    from payments.models.payment_method_model import PaymentMethod
+    from sales.services.checkout.pos_fast_checkout_service import PosFastCheckOutService
+    from reports.models import DailyAccountRollup, DailySalesRollup, DailyStockRollup
+    from reports.services.rollup.report_rollup_service import ReportRollupService
+
+    settings.REPORT_ROLLUPS = {**settings.REPORT_ROLLUPS, 'SETTLE_SECONDS': 0}
+    bread, milk, _ = test_stocked_products_fixture
+    cash = Account.objects.create(company=test_company_fixture, branch=create_branch, name='Cash', account_type='CASH')
+    sales = Account.objects.create(company=test_company_fixture, branch=create_branch, name='Sales', account_type='SALE')
+    CashAccount.objects.create(account=cash, branch=create_branch)
+    SalesAccount.objects.create(account=sales, company=test_company_fixture, branch=create_branch)
+    PaymentMethod.objects.create(company=test_company_fixture, branch=create_branch, payment_method_name='cash')
+
+    order = SalesOrder.objects.create(
+        company=test_company_fixture, branch=create_branch, customer=test_customer_fixture, customer_name='Magiv'
+    )
+    for product, quantity in [(bread, 2), (milk, 3)]:
+        SalesOrderItem.objects.create(
+            sales_order=order, product=product, product_name=product.name,
+            quantity=quantity, unit_price=Decimal('2.00'), tax_rate=Decimal('0')
+        )
+    result = PosFastCheckOutService.process_checkout(
+        company=test_company_fixture, branch=create_branch, customer=test_customer_fixture,
+        payment_method='cash', sales_order=SalesOrder.objects.get(pk=order.pk), received_by=None,
+    )
+
+    today = timezone.localdate()
+    assert ReportRollupService.refresh_changed() == 1
+    bread_sales = DailySalesRollup.objects.get(company=test_company_fixture, day=today, product=bread)
+    assert (bread_sales.quantity_sold, bread_sales.revenue) == (2, Decimal('4.00'))
+    milk_stock = DailyStockRollup.objects.get(product=milk, day=today, movement_type='SALE')
+    assert (milk_stock.quantity_in, milk_stock.quantity_out) == (0, 3)
+    cash_day = DailyAccountRollup.objects.get(account=cash, day=today)
+    assert (cash_day.debit_total, cash_day.credit_total, cash_day.net_change) == (Decimal('10.00'), Decimal('0.00'), Decimal('10.00'))
+
+    user = User.objects.create_user(
+        username='manager', email='manager@example.com', password='manager', company=test_company_fixture,
+        branch=create_branch, role='Manager', first_name='Manager'
+    )
+    api_client = APIClient()
+    api_client.force_authenticate(user=user)
+    with CaptureQueriesContext(connection) as queries:
+        response = api_client.get(reverse('report-sales'), {'group_by': 'product'})
+    assert response.status_code == 200
+    assert [(row['product__name'], row['quantity_sold']) for row in response.data['results']] == [('Bread', 2), ('Milk', 3)]
+    assert not any(
+        table in query['sql']
+        for query in queries.captured_queries
+        for table in ('sales_salesreceipt', 'inventory_stockmovement', 'transactions_journalentry')
+    )
+    response = api_client.get(reverse('report-stock-movements'), {'group_by': 'movement_type'})
+    assert response.data['results'] == [
+        {'movement_type': 'SALE', 'quantity_in': 0, 'quantity_out': 5, 'total_cost': Decimal('0.00'), 'movement_count': 2}
+    ]
+    assert api_client.get(reverse('report-sales'), {'group_by': 'nope'}).status_code == 400
+
+    # nothing new: no day is refreshed
+    assert ReportRollupService.refresh_changed() == 0
+
+    result.receipt.is_voided = True
+    result.receipt.save()
+    assert ReportRollupService.refresh_changed() == 1
+    assert not DailySalesRollup.objects.filter(company=test_company_fixture, day=today).exists()
+
+    DailyStockRollup.objects.all().delete()
+    ReportRollupService.refresh_range(today, today, company=test_company_fixture)
+    assert DailyStockRollup.objects.get(product=milk, day=today, movement_type='SALE').quantity_out == 3
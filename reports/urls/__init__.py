@@ -0,0 +1,3 @@
+from .report_urls import urlpatterns as report_urls
+
+urlpatterns = report_urls
@@ -0,0 +1,7 @@
+from rest_framework.routers import DefaultRouter
+from reports.views.report_views import ReportViewSet
+
+router = DefaultRouter()
+router.register(r'reports', ReportViewSet, basename='report')
+
+urlpatterns = router.urls
@@ -0,0 +1,73 @@
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from rest_framework.viewsets import ViewSet
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from loguru import logger
+from company.models.company_model import Company
+from config.auth.jwt_token_authentication import CompanyCookieJWTAuthentication, UserCookieJWTAuthentication
+from reports.permissions.report_permissions import ReportPermission
+from reports.serializers.report_query_serializer import ReportQuerySerializer
+from reports.services.report.report_service import ReportService
+
+
+class ReportViewSet(ViewSet):
+    """
+    Sales, stock and account reports served from the daily rollup tables.
+    Common GET params: ?date_from=YYYY-MM-DD&date_to=YYYY-MM-DD (default: last 30 days),
+    ?branch=<id>, ?group_by=<grouping>.
+    Figures include everything up to the last rollup refresh (see "refreshed_at").
+    """
+    authentication_classes = [CompanyCookieJWTAuthentication, UserCookieJWTAuthentication, JWTAuthentication]
+    permission_classes = [ReportPermission]
+
+    def _report(self, request, groups: dict, default_group: str, build):
+        company = getattr(request.user, 'company', None) or (request.user if isinstance(request.user, Company) else None)
+        if company is None:
+            return Response({"error": "Company information missing"}, status=status.HTTP_400_BAD_REQUEST)
+
+        query = ReportQuerySerializer(data=request.query_params, group_choices=groups, default_group=default_group)
+        query.is_valid(raise_exception=True)
+        params = query.validated_data
+        rows = build(company, params)
+        logger.info(
+            f"Report {self.action} for company {company.id} | {params['date_from']}..{params['date_to']} "
+            f"| group_by={params['group_by']} | rows={len(rows)}"
+        )
+        return Response({
+            'date_from': params['date_from'],
+            'date_to': params['date_to'],
+            'group_by': params['group_by'],
+            'refreshed_at': ReportService.refreshed_at(),
+            'results': rows,
+        })
+
+    @action(detail=False, methods=['get'], url_path='sales')
+    def sales(self, request):
+        """
+        Quantity sold, net revenue, tax and returns. group_by: day, branch, product, day_product. ?product=<id>
+        """
+        return self._report(request, ReportService.SALES_GROUPS, 'day', lambda company, params: ReportService.sales_summary(
+            company, params['date_from'], params['date_to'], params['group_by'],
+            branch=params.get('branch'), product=params.get('product'),
+        ))
+
+    @action(detail=False, methods=['get'], url_path='stock-movements')
+    def stock_movements(self, request):
+        """
+        Stock in and out per movement type. group_by: day, product, movement_type, day_movement_type. ?product=<id>
+        """
+        return self._report(request, ReportService.STOCK_GROUPS, 'day_movement_type', lambda company, params: ReportService.stock_movement_summary(
+            company, params['date_from'], params['date_to'], params['group_by'],
+            branch=params.get('branch'), product=params.get('product'),
+        ))
+
+    @action(detail=False, methods=['get'], url_path='account-activity')
+    def account_activity(self, request):
+        """
+        Debit/credit totals per account. group_by: day, account, day_account. ?account=<id>
+        """
+        return self._report(request, ReportService.ACCOUNT_GROUPS, 'day_account', lambda company, params: ReportService.account_activity(
+            company, params['date_from'], params['date_to'], params['group_by'],
+            branch=params.get('branch'), account=params.get('account'),
+        ))
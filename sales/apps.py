@@ -20,4 +20,5 @@ class SalesConfig(AppConfig):
         import sales.signals.delivery_note_item_activity_logs_signal
         import sales.signals.sales_order_activity_logs_signal
         import sales.signals.sales_order_item_activity_logs_signal
+        import sales.signals.document_totals_signal
         
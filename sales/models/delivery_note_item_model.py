@@ -23,17 +23,7 @@ class DeliveryNoteItem(CreateUpdateBaseModel):
     def total_price(self):
         return self.subtotal + self.tax_amount
 
-    def save(self, *args, **kwargs):
-        super().save(*args, **kwargs)
-        if self.delivery_note:
-            self.delivery_note.update_total_amount()
-
-    def delete(self, *args, **kwargs):
-        note = self.delivery_note
-        super().delete(*args, **kwargs)
-        if note:
-            note.update_total_amount()
-            logger.info(f"Deleted DeliveryNoteItem '{self.product_name}' and updated total for note '{note.delivery_number}'.")
+    # The delivery note total is kept in step by sales.signals.document_totals_signal
 
     def __str__(self):
         return f"{self.product_name} (x{self.quantity}) - {self.total_price}"
@@ -1,7 +1,7 @@
 from django.db import models
 from config.models.create_update_base_model import CreateUpdateBaseModel
 from loguru import logger
-import uuid
+from core.services.document_numbering.document_number_service import DocumentNumberService
 
 
 
@@ -42,7 +42,7 @@ class Sale(CreateUpdateBaseModel):
     total_amount = models.DecimalField(max_digits=10, decimal_places=2, default=0)
     tax_amount = models.DecimalField(max_digits=10, decimal_places=2, default=0)
     sale_type = models.CharField(max_length=10, choices=SALE_TYPE, default='CASH')
-    sale_number = models.CharField(max_length=20, unique=True)
+    sale_number = models.CharField(max_length=40, unique=True)
     issued_by = models.ForeignKey(
         'users.User', on_delete=models.SET_NULL, null=True, related_name='issued_sales'
     )
@@ -52,6 +52,9 @@ class Sale(CreateUpdateBaseModel):
         indexes = [
             models.Index(fields=["company", "branch", "sale_date"]),
             models.Index(fields=["customer"]),
+            models.Index(fields=["company", "-sale_date"], name="sale_co_date_idx"),
+            models.Index(fields=["company", "branch", "payment_status", "-sale_date"], name="sale_co_br_status_date_idx"),
+            models.Index(fields=["customer", "-sale_date"], name="sale_customer_date_idx"),
         ]
 
     def __str__(self):
@@ -59,12 +62,13 @@ class Sale(CreateUpdateBaseModel):
 
     def generate_sale_number(self):
         """Generate a unique sale number."""
-        self.sale_number = f"{self.PREFIX}-{uuid.uuid4().hex[:6].upper()}"
-        logger.info(f"Generated sale number: {self.sale_number}")
+        sale_number = DocumentNumberService.next_number('sale', self)
+        logger.info(f"Generated sale number: {sale_number}")
+        return sale_number
 
     def save(self, *args, **kwargs):
         """Override save to ensure sale_number is set."""
         if not self.sale_number:
-            self.generate_sale_number()
+            self.sale_number = self.generate_sale_number()
         super().save(*args, **kwargs)
         logger.info(f"Saved sale with sale number: {self.sale_number}")
@@ -23,17 +23,7 @@ class SalesInvoiceItem(CreateUpdateBaseModel):
     def total_price(self):
         return self.subtotal + self.tax_amount
 
-    def save(self, *args, **kwargs):
-        super().save(*args, **kwargs)
-        if self.sales_invoice:
-            self.sales_invoice.update_total_amount()
-
-    def delete(self, *args, **kwargs):
-        sales_invoice = self.sales_invoice
-        super().delete(*args, **kwargs)
-        if sales_invoice:
-            sales_invoice.update_total_amount()
-            logger.info(f"Deleted SalesInvoiceItem '{self.product_name}' and updated total for invoice '{sales_invoice.invoice_number}'.")
+    # The invoice total is kept in step by sales.signals.document_totals_signal
 
     def __str__(self):
         return f"{self.product_name} (x{self.quantity}) - {self.total_price}"
@@ -22,19 +22,7 @@ class SalesOrderItem(CreateUpdateBaseModel):
     def total_price(self):
         return self.subtotal + self.tax_amount
 
-    @transaction.atomic
-    def save(self, *args, **kwargs):
-        super().save(*args, **kwargs)
-        if self.sales_order:
-            self.sales_order.update_total_amount()
-
-    @transaction.atomic
-    def delete(self, *args, **kwargs):
-        sales_order = self.sales_order
-        super().delete(*args, **kwargs)
-        if sales_order:
-            self.sales_order.update_total_amount()
-            logger.info(f"Deleted SalesOrderItem '{self.product_name}' and updated total for order '{sales_order.order_number}'.")
+    # The order total is kept in step by sales.signals.document_totals_signal
 
     def __str__(self):
         return f"{self.product_name} (x{self.quantity}) - {self.total_price}"
@@ -1,7 +1,7 @@
 from django.db import models
 from config.models.create_update_base_model import CreateUpdateBaseModel
 from loguru import logger
-import uuid
+from core.services.document_numbering.document_number_service import DocumentNumberService
 
 
 class SalesOrder(CreateUpdateBaseModel):
@@ -20,7 +20,7 @@ class SalesOrder(CreateUpdateBaseModel):
     company = models.ForeignKey('company.Company', on_delete=models.CASCADE, related_name='sales_orders')
     branch = models.ForeignKey('branch.Branch', on_delete=models.CASCADE, related_name='sales_orders')
     customer = models.ForeignKey('customers.Customer', on_delete=models.CASCADE, related_name='sales_orders')
-    order_number = models.CharField(max_length=20, unique=True)
+    order_number = models.CharField(max_length=40, unique=True)
     customer_name = models.CharField(max_length=100)
     order_date = models.DateField(auto_now_add=True)
     paid_at = models.DateTimeField(null=True, blank=True)
@@ -36,10 +36,7 @@ class SalesOrder(CreateUpdateBaseModel):
     notes = models.TextField(blank=True, null=True)
 
     def generate_unique_order_number(self):
-        while True:
-            number = f"{self.PREFIX}-{uuid.uuid4().hex[:6].upper()}"
-            if not SalesOrder.objects.filter(order_number=number).exists():
-                return number
+        return DocumentNumberService.next_number('sales_order', self)
 
     def update_total_amount(self):
         total = sum(item.total_price for item in self.items.all())
@@ -1,7 +1,7 @@
 from django.db import models
 from config.models.create_update_base_model import CreateUpdateBaseModel
 from loguru import logger
-import uuid
+from core.services.document_numbering.document_number_service import DocumentNumberService
 
 
 class SalesReceipt(CreateUpdateBaseModel):
@@ -13,7 +13,7 @@ class SalesReceipt(CreateUpdateBaseModel):
     customer = models.ForeignKey('customers.Customer', on_delete=models.CASCADE, related_name='sales_receipts')
     sale = models.ForeignKey('sales.Sale', on_delete=models.SET_NULL, null=True, blank=True, related_name='sales_receipts')
     sales_order = models.ForeignKey('sales.SalesOrder', on_delete=models.SET_NULL, null=True, blank=True, related_name='sales_receipts')
-    receipt_number = models.CharField(max_length=20, unique=True)
+    receipt_number = models.CharField(max_length=40, unique=True)
     receipt_date = models.DateTimeField(auto_now_add=True)
     currency = models.ForeignKey('currency.Currency', on_delete=models.PROTECT, default=1, related_name='sales_receipts')
     total_amount = models.DecimalField(max_digits=10, decimal_places=2, default=0)
@@ -25,7 +25,7 @@ class SalesReceipt(CreateUpdateBaseModel):
     notes = models.TextField(blank=True, null=True)
 
     def generate_receipt_number(self):
-        return f"{self.PREFIX}-{uuid.uuid4().hex[:6].upper()}"
+        return DocumentNumberService.next_number('sales_receipt', self)
 
     def update_total_amount(self):
         total = sum(item.unit_price * item.quantity for item in self.items.all())
@@ -44,4 +44,9 @@ class SalesReceipt(CreateUpdateBaseModel):
         indexes = [
             models.Index(fields=["company", "branch", "receipt_date"]),
             models.Index(fields=["issued_by"]),
+            models.Index(fields=["company", "-receipt_date"], name="receipt_co_date_idx"),
+            models.Index(fields=["company", "branch", "status", "-receipt_date"], name="receipt_co_br_st_date_idx"),
+            models.Index(fields=["customer", "-created_at"], name="receipt_customer_created_idx"),
+            # the report rollup refresh finds voided/edited receipts by updated_at
+            models.Index(fields=["updated_at"], name="receipt_updated_idx"),
         ]
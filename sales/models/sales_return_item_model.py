@@ -57,23 +57,7 @@ class SalesReturnItem(CreateUpdateBaseModel):
         if self.status not in dict(self.STATUS_CHOICES):
             raise ValidationError(f"Invalid status: {self.status}")
 
-    @transaction.atomic
-    def save(self, *args, **kwargs):
-        """Override save to ensure total updates on the parent sales return."""
-        super().save(*args, **kwargs)
-        if self.sales_return:
-            self.sales_return.update_total_amount()
-
-    @transaction.atomic
-    def delete(self, *args, **kwargs):
-        """Override delete to update total on parent sales return."""
-        sales_return = self.sales_return
-        super().delete(*args, **kwargs)
-        if sales_return:
-            sales_return.update_total_amount()
-            logger.info(
-                f"Deleted SalesReturnItem '{self.product_name}' and updated total for return '{sales_return.return_number}'."
-            )
+    # The return total is kept in step by sales.signals.document_totals_signal
 
     def __str__(self):
         return f"{self.product_name} (x{self.quantity}) - {self.total_price} [{self.status}]"
@@ -52,6 +52,8 @@ class SalesReturn(CreateUpdateBaseModel):
             models.Index(fields=["company", "branch", "return_date"]),
             models.Index(fields=["sales_order"]),
             models.Index(fields=["processed_by"]),
+            # the report rollup refresh finds edited returns by updated_at
+            models.Index(fields=["updated_at"], name="sales_return_updated_idx"),
         ]
 
     
\ No newline at end of file
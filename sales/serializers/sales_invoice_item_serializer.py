@@ -4,9 +4,11 @@ from config.utilities.get_company_or_user_company import get_expected_company
 from loguru import logger
 from sales.models.sales_invoice_item_model import SalesInvoiceItem
 from inventory.models import Product
+from config.eager_loading.eager_loading import EagerLoadingSerializerMixin
 
 
-class SalesInvoiceItemSerializer(CompanyValidationMixin, serializers.ModelSerializer):
+class SalesInvoiceItemSerializer(EagerLoadingSerializerMixin, CompanyValidationMixin, serializers.ModelSerializer):
+    select_related_fields = ('product__branch', 'product__company')
     product_summary = serializers.SerializerMethodField(read_only=True)
     company_summary = serializers.SerializerMethodField(read_only=True)
     branch_summary = serializers.SerializerMethodField(read_only=True)
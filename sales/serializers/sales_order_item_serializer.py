@@ -5,9 +5,11 @@ from loguru import logger
 from inventory.models import Product
 from sales.models.sales_order_item_model import SalesOrderItem
 from sales.models.sales_order_model import SalesOrder
+from config.eager_loading.eager_loading import EagerLoadingSerializerMixin
 
 
-class SalesOrderItemSerializer(CompanyValidationMixin, serializers.ModelSerializer):
+class SalesOrderItemSerializer(EagerLoadingSerializerMixin, CompanyValidationMixin, serializers.ModelSerializer):
+    select_related_fields = ('product__branch', 'product__company')
     product_summary = serializers.SerializerMethodField(read_only=True)
     company_summary = serializers.SerializerMethodField(read_only=True)
     branch_summary = serializers.SerializerMethodField(read_only=True)
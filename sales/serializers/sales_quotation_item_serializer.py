@@ -5,9 +5,11 @@ from loguru import logger
 from inventory.models import Product
 from sales.models.sales_quotation_model import SalesQuotation
 from sales.models.sales_quotation_item_model import SalesQuotationItem
+from config.eager_loading.eager_loading import EagerLoadingSerializerMixin
 
 
-class SalesQuotationItemSerializer(CompanyValidationMixin, serializers.ModelSerializer):
+class SalesQuotationItemSerializer(EagerLoadingSerializerMixin, CompanyValidationMixin, serializers.ModelSerializer):
+    select_related_fields = ('sales_quotation__branch', 'sales_quotation__company')
     product_summary = serializers.SerializerMethodField(read_only=True)
     product = serializers.PrimaryKeyRelatedField(queryset=Product.objects.all())
     company_summary = serializers.SerializerMethodField(read_only=True)
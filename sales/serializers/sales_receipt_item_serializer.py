@@ -2,9 +2,11 @@ from rest_framework import serializers
 from inventory.models import Product
 from sales.models.sales_receipt_item_model import SalesReceiptItem
 from loguru import logger
+from config.eager_loading.eager_loading import EagerLoadingSerializerMixin
 
 
-class SalesReceiptItemSerializer(serializers.ModelSerializer):
+class SalesReceiptItemSerializer(EagerLoadingSerializerMixin, serializers.ModelSerializer):
+    select_related_fields = ('sales_receipt__branch', 'sales_receipt__company')
     company_summary = serializers.SerializerMethodField(read_only=True)
     branch_summary = serializers.SerializerMethodField(read_only=True)
     product_summary = serializers.SerializerMethodField(read_only=True)
@@ -4,9 +4,11 @@ from sales.models.sales_return_item_model import SalesReturnItem
 from sales.models.sales_return_model import SalesReturn
 from loguru import logger
 from decimal import Decimal, ROUND_HALF_UP
+from config.eager_loading.eager_loading import EagerLoadingSerializerMixin
 
 
-class SalesReturnItemSerializer(serializers.ModelSerializer): 
+class SalesReturnItemSerializer(EagerLoadingSerializerMixin, serializers.ModelSerializer):
+    select_related_fields = ('product__branch', 'product__company')
     company_summary = serializers.SerializerMethodField(read_only=True)
     branch_summary = serializers.SerializerMethodField(read_only=True)
     product_summary = serializers.SerializerMethodField(read_only=True)
@@ -0,0 +1,274 @@
+from decimal import Decimal, ROUND_HALF_UP
+from django.conf import settings
+from django.db import transaction as db_transaction
+from django.db.models.signals import post_save
+from loguru import logger
+from company.models.company_model import Company
+from branch.models.branch_model import Branch
+from customers.models.customer_model import Customer
+from users.models.user_model import User
+from accounts.models.account_model import Account
+from accounts.services.cash_account_service import CashAccountService
+from accounts.services.sales_account_service import SalesAccountService
+from inventory.models.stock_movement_model import StockMovement
+from inventory.services.product_stock.product_stock_service import ProductStockService, StockPostingLine
+from payments.models.payment_model import Payment
+from payments.models.payment_method_model import PaymentMethod
+from payments.models.sales_payment_model import SalesPayment
+from sales.models.sale_model import Sale
+from sales.models.sales_invoice_model import SalesInvoice
+from sales.models.sales_order_model import SalesOrder
+from sales.models.sales_receipt_model import SalesReceipt
+from sales.models.sales_receipt_item_model import SalesReceiptItem
+from sales.services.checkout.pos_checkout_service import CheckoutResult
+from transactions.models.transaction_model import Transaction
+from transactions.models.transaction_item_model import TransactionItem
+from transactions.services.journal_service import JournalService
+from config.totals.totals_registry import get_registration_for_document
+from taxes.services.fiscalisation.fiscalisation_outbox_service import FiscalisationOutboxService
+
+
+_TWO_PLACES = Decimal('0.01')
+
+# PaymentMethod.payment_method_name -> Transaction.payment_method
+TRANSACTION_PAYMENT_METHODS = {
+    'cash': 'CASH',
+    'bank_transfer': 'BANK',
+    'credit_card': 'BANK',
+    'debit_card': 'BANK',
+    'ecocash': 'ECOCASH',
+    'mobile_payment': 'MOBILE MONEY',
+}
+
+
+class PosFastCheckOutService:
+    """
+    High-throughput POS checkout.
+    Produces the same CheckoutResult as PosCheckOutService.process_checkout but
+    loads everything it needs up front and writes every row set in bulk, so the
+    number of SQL statements is constant regardless of basket size.
+    """
+
+    @staticmethod
+    @db_transaction.atomic
+    def process_checkout(*,
+                         company: Company,
+                         branch: Branch,
+                         customer: Customer,
+                         payment_method: PaymentMethod | str,
+                         sales_order: SalesOrder,
+                         received_by: User,
+                         sales_invoice: SalesInvoice = None,
+                         ) -> CheckoutResult:
+        """
+        Check out a sales order in a bounded number of statements:
+        1. Load the basket (order items + products); ledger accounts come from the resolver cache
+        2. Lock, validate and post stock for every line (lock, bulk update, bulk movements)
+        3. Insert sale, payment, receipt and sales payment
+        4. Insert the completed transaction and its items
+        5. Post the journal legs and move both account balances with a single UPDATE
+        6. Bulk insert the receipt items
+        7. With FISCALISATION["ENABLED"], queue the fiscal invoice (submitted later by the outbox worker)
+        """
+        try:
+            items = list(sales_order.items.select_related('product'))
+            if not items:
+                raise ValueError(f"Sales order {sales_order.id} has no items to check out.")
+
+            payment_method = PosFastCheckOutService._resolve_payment_method(
+                company=company, branch=branch, payment_method=payment_method
+            )
+            debit_account, credit_account = PosFastCheckOutService._resolve_ledger_accounts(
+                company=company, branch=branch
+            )
+
+            total_amount = sum(
+                (Decimal(item.total_price).quantize(_TWO_PLACES, rounding=ROUND_HALF_UP) for item in items),
+                Decimal('0.00')
+            )
+
+            # Stock first: an insufficient line aborts before anything else is written
+            ProductStockService._post_stock_lines(
+                company=company,
+                lines=[
+                    StockPostingLine(
+                        product=item.product,
+                        branch=branch,
+                        quantity_change=-item.quantity,
+                        movement_type=StockMovement.MovementType.SALE,
+                        sales_order=sales_order,
+                        sales_invoice=sales_invoice,
+                        reason='SALES'
+                    )
+                    for item in items
+                ]
+            )
+
+            sale = Sale.objects.create(
+                company=company,
+                branch=branch,
+                customer=customer,
+                sale_type='CASH',
+                sales_invoice=sales_invoice,
+                issued_by=received_by,
+                total_amount=total_amount,
+                payment_status='FULLY_PAID',
+            )
+
+            payment = Payment.objects.create(
+                company=company,
+                branch=branch,
+                total_amount=total_amount,
+                payment_method=payment_method.payment_method_name,
+                payment_direction='incoming',
+                status='completed',
+                reference_model='Sale',
+                reference_id=sale.id,
+            )
+
+            receipt_registration = get_registration_for_document(SalesReceipt)
+            receipt_items = [
+                SalesReceiptItem(
+                    product=item.product,
+                    sale=sale,
+                    sales_order=sales_order,
+                    product_name=item.product_name,
+                    quantity=item.quantity,
+                    unit_price=item.unit_price,
+                    tax_rate=item.tax_rate,
+                )
+                for item in items
+            ]
+            sales_receipt = SalesReceipt.objects.create(
+                sale=sale,
+                sales_order=sales_order,
+                customer=customer,
+                branch=branch,
+                company=company,
+                issued_by=received_by,
+                status='ISSUED',
+                # bulk_create below skips the totals signals, so the receipt is inserted with its final total
+                total_amount=sum(
+                    (receipt_registration.line_total(item) for item in receipt_items), Decimal('0.00')
+                ),
+                notes="Receipt generated upon successful payment."
+            )
+
+            sales_payment = SalesPayment.objects.create(
+                company=company,
+                branch=branch,
+                sales_order=sales_order,
+                sales_invoice=sales_invoice,
+                sales_receipt=sales_receipt,
+                payment=payment,
+                payment_method=payment_method,
+                received_by=received_by,
+            )
+
+            PosFastCheckOutService._record_transaction(
+                company=company,
+                branch=branch,
+                customer=customer,
+                items=items,
+                total_amount=total_amount,
+                debit_account=debit_account,
+                credit_account=credit_account,
+                payment_method=payment_method,
+                sale=sale,
+            )
+
+            for receipt_item in receipt_items:
+                receipt_item.sales_receipt = sales_receipt
+            SalesReceiptItem.objects.bulk_create(receipt_items)
+
+            if getattr(settings, 'FISCALISATION', {}).get('ENABLED'):
+                FiscalisationOutboxService.enqueue_sale(
+                    sale=sale, order_items=items, invoice_number=sales_receipt.receipt_number
+                )
+
+            logger.info(
+                "Fast checkout processed | sale={} | receipt={} | lines={} | total={}",
+                sale.sale_number, sales_receipt.receipt_number, len(items), total_amount,
+            )
+            return CheckoutResult(
+                sale=sale,
+                payment=payment,
+                sales_payment=sales_payment,
+                receipt=sales_receipt
+            )
+        except Exception as e:
+            logger.error(f"Error during fast checkout process: {e}")
+            raise
+
+    @staticmethod
+    def _resolve_payment_method(*, company: Company, branch: Branch, payment_method: PaymentMethod | str) -> PaymentMethod:
+        if isinstance(payment_method, PaymentMethod):
+            return payment_method
+        resolved = PaymentMethod.objects.filter(
+            company=company,
+            branch=branch,
+            payment_method_name=payment_method,
+            is_active=True
+        ).first()
+        if resolved is None:
+            raise ValueError(f"No active payment method '{payment_method}' for branch '{branch.id}'.")
+        return resolved
+
+    @staticmethod
+    def _resolve_ledger_accounts(*, company: Company, branch: Branch) -> tuple[Account, Account]:
+        """
+        The branch cash (debit) and sales (credit) ledger accounts. Both services
+        resolve through LedgerAccountResolver, so a warm checkout issues no query here.
+        """
+        cash_account = CashAccountService.get_or_create_cash_account(company=company, branch=branch).account
+        sales_account = SalesAccountService.get_or_create_sales_account(company=company, branch=branch).account
+        return cash_account, sales_account
+
+    @staticmethod
+    def _record_transaction(*, company, branch, customer, items, total_amount, debit_account, credit_account, payment_method, sale) -> Transaction:
+        """
+        Insert the already-applied cash sale transaction with one row per basket line,
+        then post it to the journal, which moves both balances in a single UPDATE.
+        """
+        transaction = Transaction(
+            company=company,
+            branch=branch,
+            customer=customer,
+            debit_account=debit_account,
+            credit_account=credit_account,
+            transaction_type='CASH',
+            transaction_direction='INCOMING',
+            transaction_category='CASH SALE',
+            payment_method=TRANSACTION_PAYMENT_METHODS.get(payment_method.payment_method_name, 'OTHER'),
+            status='COMPLETED',
+            reference_model='Sale',
+            reference_id=sale.id,
+            total_amount=total_amount,
+        )
+        transaction.transaction_number = transaction.generate_transaction_number()
+        # save() would run full_clean(), which probes every foreign key with its own query;
+        # the instances here were just loaded, so only the model rules in clean() are checked.
+        transaction.clean()
+        Transaction.objects.bulk_create([transaction])
+        # bulk_create sends no signals; keep the transaction's audit entry
+        post_save.send(sender=Transaction, instance=transaction, created=True, update_fields=None, raw=False, using=Transaction.objects.db)
+
+        transaction_items = []
+        for item in items:
+            transaction_item = TransactionItem(
+                transaction=transaction,
+                product=item.product,
+                product_name=item.product_name,
+                quantity=item.quantity,
+                unit_price=item.unit_price,
+                tax_rate=item.tax_rate,
+            )
+            transaction_item.total_price = (transaction_item.subtotal + transaction_item.tax_amount).quantize(
+                _TWO_PLACES, rounding=ROUND_HALF_UP
+            )
+            transaction_items.append(transaction_item)
+        TransactionItem.objects.bulk_create(transaction_items)
+
+        JournalService.post_transaction(transaction, debit_account=debit_account, credit_account=credit_account)
+        logger.info("Transaction {} recorded and applied | amount={}", transaction.transaction_number, total_amount)
+        return transaction
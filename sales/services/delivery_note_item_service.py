@@ -93,9 +93,6 @@ class DeliveryNoteItemService:
         previous_note = item.delivery_note
         item.delivery_note = note
         item.save(update_fields=['delivery_note'])
-        if previous_note and previous_note != note:
-            previous_note.update_total_amount()
-        note.update_total_amount()
         logger.info(
             f"Delivery Note Item '{item.product_name}' attached to note '{note.delivery_number}' "
             f"(previous note: '{previous_note.delivery_number if previous_note else 'None'}')."
@@ -109,8 +106,6 @@ class DeliveryNoteItemService:
         previous_note = item.delivery_note
         item.delivery_note = None
         item.save(update_fields=['delivery_note'])
-        if previous_note:
-            previous_note.update_total_amount()
         logger.info(
             f"Delivery Note Item '{item.product_name}' detached from note "
             f"'{previous_note.delivery_number if previous_note else 'None'}'."
@@ -47,9 +47,6 @@ class SalesInvoiceItemService:
             # Decrease stock for the sold item
             ProductStockService.decrease_stock_for_sale_item(item)
 
-            # Update invoice totals
-            sales_invoice.update_total_amount()
-
             return item
         
         except Exception as e:
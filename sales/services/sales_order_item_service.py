@@ -50,9 +50,6 @@ class SalesOrderItemService:
                 item=item,
                 sales_order=sales_order
             )
-
-            # Update total amount on the order
-            sales_order.update_total_amount()
             return item
         
         except Exception as e:
@@ -87,9 +84,6 @@ class SalesOrderItemService:
             item.save(update_fields=[k for k in ['quantity', 'unit_price', 'tax_rate'] if getattr(item, k) is not None])
             logger.info(f"Sales Order Item '{item.id}' updated.")
 
-            # Update total amount on the order
-            item.sales_order.update_total_amount()
-
             return item
         except Exception as e:
             logger.error(f"Error updating sales order item '{item.id}': {str(e)}")
@@ -109,9 +103,6 @@ class SalesOrderItemService:
             item_id = item.id
             item.delete()
             logger.info(f"Sales Order Item '{item_id}' deleted.")
-
-            # Update total amount on the order
-            item.sales_order.update_total_amount()
         except Exception as e:
             logger.error(f"Error deleting sales order item '{item.id}': {str(e)}")
             raise
@@ -151,14 +142,9 @@ class SalesOrderItemService:
         3. Return the updated item
         """
         try:
-            previous_order = item.sales_order
-
             item.sales_order = sales_order
             item.save(update_fields=["sales_order"])
 
-            if previous_order and previous_order != sales_order:
-                previous_order.update_total_amount()
-
             logger.info(
                 f"Sales Order Item '{item.id}' attached to Sales Order '{sales_order.order_number}'."
             )
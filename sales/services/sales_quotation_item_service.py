@@ -42,9 +42,6 @@ class SalesQuotationItemService:
                 sales_quotation=sales_quotation,
                 item=item
             )
-
-            # Update total amount on the quotation
-            sales_quotation.update_total_amount()
             return item
         except Exception as e:
             logger.error(f"Error creating sales quotation item: {str(e)}")
@@ -91,10 +88,6 @@ class SalesQuotationItemService:
                 item.save(update_fields=update_fields)
                 logger.info(f"Sales Quotation Item '{item.id}' updated: {update_fields}")
 
-                # Recalculate total ONCE, after persistence
-                if item.sales_quotation:
-                    item.sales_quotation.update_total_amount()
-
             return item
 
         except Exception as e:
@@ -120,8 +113,6 @@ class SalesQuotationItemService:
             quotation_number = util_quotation_item.sales_quotation.quotation_number if util_quotation_item.sales_quotation else "N/A"
             util_quotation_item.delete()
             logger.info(f"Sales Quotation Item '{util_quotation_item.id}' deleted from quotation '{quotation_number}'.")
-            if util_quotation_item.sales_quotation:
-                util_quotation_item.sales_quotation.update_total_amount()
         except Exception as e:
             logger.error(f"Error deleting sales quotation item '{util_quotation_item.id}': {str(e)}")
             raise
@@ -140,7 +131,6 @@ class SalesQuotationItemService:
             for item in items:
                 item.sales_quotation = sales_quotation
                 item.save(update_fields=["sales_quotation"])
-            sales_quotation.update_total_amount()
             logger.info(f"Added {len(items)} items to Sales Quotation '{sales_quotation.quotation_number}'.")
         except Exception as e:
             logger.error(f"Error adding items to sales quotation '{sales_quotation.quotation_number}': {str(e)}")
@@ -160,7 +150,6 @@ class SalesQuotationItemService:
         try:
             item.sales_quotation = sales_quotation
             item.save(update_fields=["sales_quotation"])
-            sales_quotation.update_total_amount()
             logger.info(f"Added item '{item.id}' to Sales Quotation '{sales_quotation.quotation_number}'.")
         except Exception as e:
             logger.error(f"Error adding item '{item.id}' to sales quotation '{sales_quotation.quotation_number}': {str(e)}")
@@ -186,9 +175,6 @@ class SalesQuotationItemService:
             item.sales_quotation = None
             item.save(update_fields=["sales_quotation"])
 
-            # Update quotation total
-            sales_quotation.update_total_amount()
-
             logger.info(f"Removed item '{item.id}' from Sales Quotation '{sales_quotation.quotation_number}'.")
 
         except Exception as e:
@@ -6,6 +6,7 @@ from django.db import transaction as db_transaction
 from sales.models.sales_invoice_model import SalesInvoice
 from inventory.services.product_stock.product_stock_service import ProductStockService
 from django.db.models import QuerySet
+from config.totals.totals_registry import recompute_totals
 from loguru import logger
 
 
@@ -42,7 +43,8 @@ class SalesReceiptItemService:
             )
             
             logger.info(
-                f"Sales Receipt Item '{item.id}' created for receipt '{sales_receipt.receipt_number}'."
+                "Sales Receipt Item '{}' created for receipt '{}'.",
+                item.id, sales_receipt.receipt_number,
             )
             
             # add/attach to sales receipt
@@ -54,9 +56,6 @@ class SalesReceiptItemService:
             # Deduct stock for the sold item
             ProductStockService.decrease_stock_for_sale(item)
 
-            # Update total amount on the receipt
-            sales_receipt.update_total_amount()
-            
             return item
         except Exception as e:
             logger.error(f"Error creating sales receipt item: {str(e)}")
@@ -104,7 +103,8 @@ class SalesReceiptItemService:
                     tax_rate=item.tax_rate
                 )
                 logger.info(
-                    f"Sales Receipt Item '{item_obj.id}' created for receipt '{sales_receipt.receipt_number}'."
+                    "Sales Receipt Item '{}' created for receipt '{}'.",
+                    item_obj.id, sales_receipt.receipt_number,
                 )
 
                 # Attach item to receipt
@@ -118,9 +118,6 @@ class SalesReceiptItemService:
 
                 created_items.append(item_obj)
 
-            # Update total amount once after all items are added
-            sales_receipt.update_total_amount()
-
             return created_items
 
         except Exception as e:
@@ -165,7 +162,7 @@ class SalesReceiptItemService:
                     reason=f"Adjustment due to update of Sales Receipt Item '{item.id}'"
                     )
             item.save(update_fields=[k for k in ['quantity', 'unit_price', 'tax_rate'] if k])
-            logger.info(f"Sales Receipt Item '{item.id}' updated.")
+            logger.info("Sales Receipt Item '{}' updated.", item.id)
             return item
         except Exception as e:
             logger.error(f"Error updating sales receipt item '{item.id}': {str(e)}")
@@ -187,7 +184,7 @@ class SalesReceiptItemService:
             # decrease stock for the sold item
             ProductStockService.increase_stock_for_voided_sale_item(item)
             item.delete()
-            logger.info(f"Sales Receipt Item '{item_id}' deleted.")
+            logger.info("Sales Receipt Item '{}' deleted.", item_id)
         except Exception as e:
             logger.error(f"Error deleting sales receipt item '{item.id}': {str(e)}")
             raise
@@ -208,7 +205,8 @@ class SalesReceiptItemService:
             item.sales_receipt = receipt
             item.save(update_fields=["sales_receipt"])
             logger.info(
-                f"Sales Receipt Item '{item.id}' added to receipt '{receipt.receipt_number}'."
+                "Sales Receipt Item '{}' added to receipt '{}'.",
+                item.id, receipt.receipt_number,
             )
             return item
         except Exception as e:
@@ -236,7 +234,8 @@ class SalesReceiptItemService:
             item.sales_receipt = None
             item.save(update_fields=["sales_receipt"])
             logger.info(
-                f"Sales Receipt Item '{item.id}' removed from receipt '{receipt.receipt_number}'."
+                "Sales Receipt Item '{}' removed from receipt '{}'.",
+                item.id, receipt.receipt_number,
             )
             return item
         except Exception as e:
@@ -261,9 +260,9 @@ class SalesReceiptItemService:
         for item in items:
             # Deduct stock for each sold item
             ProductStockService.decrease_stock_for_sale(item)
-        # Update total amount on the receipt
-        receipt.update_total_amount()
-        logger.info(f"Bulk created {len(items)} items for receipt '{receipt.receipt_number}'.")
+        # bulk_create skips the totals signals, so repair the receipt total once
+        recompute_totals(receipt)
+        logger.info("Bulk created {} items for receipt '{}'.", len(items), receipt.receipt_number)
         return items
 
 
@@ -290,8 +289,8 @@ class SalesReceiptItemService:
             items_created.append(item)
 
         logger.info(
-            f"Added {len(items_created)} items from Order '{order.order_number}' "
-            f"to Receipt '{receipt.receipt_number}'."
+            "Added {} items from Order '{}' to Receipt '{}'.",
+            len(items_created), order.order_number, receipt.receipt_number,
         )
         return items_created
 
@@ -320,7 +319,7 @@ class SalesReceiptItemService:
             items_created.append(item)
 
         logger.info(
-            f"Added {len(items_created)} items from Invoice '{invoice.invoice_number}' "
-            f"to Receipt '{receipt.receipt_number}'."
+            "Added {} items from Invoice '{}' to Receipt '{}'.",
+            len(items_created), invoice.invoice_number, receipt.receipt_number,
         )
         return items_created
@@ -51,9 +51,6 @@ class SalesReturnItemService:
             # Increase stock for the returned item
             ProductStockService.increase_stock_for_sales_return_item(item)
 
-            # Update parent return total
-            sales_return.update_total_amount()
-
             return item
         except Exception as e:
             logger.error(f"Error creating sales return item: {str(e)}")
@@ -116,10 +113,6 @@ class SalesReturnItemService:
                     reason="Adjusted due to updated sales return item",
                 )
 
-            # Update parent return total if quantity or unit_price changed
-            if quantity is not None or unit_price is not None:
-                item.sales_return.update_total_amount()
-
             return item
         except Exception as e:
             logger.error(f"Error updating sales return item '{item.id}': {str(e)}")
@@ -142,9 +135,6 @@ class SalesReturnItemService:
             ProductStockService.decrease_stock_for_sales_return_item(item)
             item.delete()
             logger.info(f"Sales Return Item '{item_id}' deleted.")
-
-            # Update parent return total
-            sales_return.update_total_amount()
         except Exception as e:
             logger.error(f"Error deleting sales return item '{item.id}': {str(e)}")
             raise
@@ -172,9 +162,6 @@ class SalesReturnItemService:
             item.sales_return = sales_return
             item.save(update_fields=["sales_return"])
 
-            # Update parent return total
-            sales_return.update_total_amount()
-
             logger.info(
                 f"Sales Return Item '{item.id}' attached to Sales Return '{sales_return.return_number}'."
             )
@@ -207,9 +194,6 @@ class SalesReturnItemService:
             item.sales_return = None
             item.save(update_fields=["sales_return"])
 
-            # Update parent return total
-            sales_return.update_total_amount()
-
             logger.info(
                 f"Sales Return Item '{item.id}' detached from Sales Return '{sales_return.return_number}'."
             )
@@ -0,0 +1,56 @@
+# sales/signals/document_totals_signal.py
+from config.totals.totals_registry import register_document_totals
+from sales.models.sales_order_item_model import SalesOrderItem
+from sales.models.sales_receipt_item_model import SalesReceiptItem
+from sales.models.sales_invoice_item_model import SalesInvoiceItem
+from sales.models.sales_quotation_item_model import SalesQuotationItem
+from sales.models.sales_return_item_model import SalesReturnItem
+from sales.models.delivery_note_item_model import DeliveryNoteItem
+
+
+register_document_totals(
+    SalesOrderItem,
+    document_field='sales_order',
+    quantity_field='quantity',
+    price_field='unit_price',
+    tax_rate_field='tax_rate'
+)
+
+# Receipts and invoices are totalled before tax
+register_document_totals(
+    SalesReceiptItem,
+    document_field='sales_receipt',
+    quantity_field='quantity',
+    price_field='unit_price'
+)
+
+register_document_totals(
+    SalesInvoiceItem,
+    document_field='sales_invoice',
+    quantity_field='quantity',
+    price_field='unit_price'
+)
+
+register_document_totals(
+    SalesQuotationItem,
+    document_field='sales_quotation',
+    quantity_field='quantity',
+    price_field='unit_price',
+    tax_rate_field='tax_rate'
+)
+
+register_document_totals(
+    SalesReturnItem,
+    document_field='sales_return',
+    quantity_field='quantity',
+    price_field='unit_price',
+    tax_rate_field='tax_rate'
+)
+
+register_document_totals(
+    DeliveryNoteItem,
+    document_field='delivery_note',
+    quantity_field='quantity',
+    price_field='unit_price',
+    tax_rate_field='tax_rate'
+)
@@ -846,4 +846,316 @@ def test_delivery_note_item_urls(client, test_user_token, test_delivery_note_fix
 
 #     # Update Status
 #     url_status = reverse('sales-return-item-update-status', kwargs={'pk': 1})
-#     client.post(url_status, data, content_type='application/json', HTTP_AUTHORIZATION=f'Bearer {test_user_token}')
\ No newline at end of file
+#     client.post(url_status, data, content_type='application/json', HTTP_AUTHORIZATION=f'Bearer {test_user_token}')
+
+# ==========================================
+# DOCUMENT TOTALS
+# ==========================================
+
+@pytest.mark.django_db
+def test_sales_order_total_follows_line_deltas(test_company_fixture, create_branch, test_customer_fixture, test_stocked_products_fixture):
+    """
+    Test SalesOrder.total_amount is maintained incrementally on line create, update and delete.
+    """
+    from decimal import Decimal
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    bread, milk, _ = test_stocked_products_fixture
+    order = SalesOrder.objects.create(
+        company=test_company_fixture,
+        branch=create_branch,
+        customer=test_customer_fixture,
+        customer_name='Magiv'
+    )
+
+    first = SalesOrderItem.objects.create(
+        sales_order=order, product=bread, product_name='Bread', quantity=2, unit_price=Decimal('1.50'), tax_rate=Decimal('10')
+    )
+    with CaptureQueriesContext(connection) as queries:
+        second = SalesOrderItem.objects.create(
+            sales_order=order, product=milk, product_name='Milk', quantity=1, unit_price=Decimal('2.00'), tax_rate=Decimal('0')
+        )
+    # INSERT line + UPDATE total, no re-read of the other lines (activity logging is not counted)
+    totals_queries = [
+        q for q in queries.captured_queries
+        if 'SAVEPOINT' not in q['sql'] and 'activity_log' not in q['sql']
+    ]
+    assert len(totals_queries) == 2
+
+    order.refresh_from_db()
+    assert order.total_amount == Decimal('5.30')
+
+    first = SalesOrderItem.objects.get(pk=first.pk)
+    first.quantity = 4
+    first.save()
+    order.refresh_from_db()
+    assert order.total_amount == Decimal('8.60')
+
+    second.delete()
+    order.refresh_from_db()
+    assert order.total_amount == Decimal('6.60')
+
+
+@pytest.mark.django_db
+def test_recompute_and_find_drifted_totals(test_company_fixture, create_branch, test_customer_fixture, test_stocked_products_fixture):
+    """
+    Test the repair path and the drift finder command for totals written behind the signals' back.
+    """
+    from decimal import Decimal
+    from io import StringIO
+    from django.core.management import call_command
+    from config.totals.totals_registry import recompute_totals
+
+    bread = test_stocked_products_fixture[0]
+    order = SalesOrder.objects.create(
+        company=test_company_fixture,
+        branch=create_branch,
+        customer=test_customer_fixture,
+        customer_name='Magiv'
+    )
+    SalesOrderItem.objects.bulk_create([
+        SalesOrderItem(sales_order=order, product=bread, product_name='Bread', quantity=3, unit_price=Decimal('2.00'), tax_rate=Decimal('0'))
+    ])
+
+    out = StringIO()
+    call_command('find_drifted_totals', '--model', 'SalesOrder', stdout=out)
+    assert f'SalesOrder {order.pk}: stored=0.00 computed=6.00' in out.getvalue()
+
+    call_command('find_drifted_totals', '--model', 'SalesOrder', '--fix', stdout=StringIO())
+    order.refresh_from_db()
+    assert order.total_amount == Decimal('6.00')
+
+    SalesOrder.objects.filter(pk=order.pk).update(total_amount=0)
+    assert recompute_totals(order) == Decimal('6.00')
+
+
+@pytest.mark.django_db
+def test_fast_checkout_statement_count_is_independent_of_basket_size(test_company_fixture, create_branch, test_customer_fixture, test_stocked_products_fixture):
+    """
+    Regression test: the fast checkout issues the same bounded number of statements for any basket size.
+    """
+    from decimal import Decimal
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    from accounts.models.account_model import Account
+    from accounts.models.cash_account_model import CashAccount
+    from accounts.models.sales_account_model import SalesAccount
+    from payments.models.payment_method_model import PaymentMethod
+    from sales.models.sales_receipt_item_model import SalesReceiptItem
+    from sales.services.checkout.pos_fast_checkout_service import PosFastCheckOutService
+    from inventory.models.product_stock_model import ProductStock
+
+    # includes the journal legs and catalogue change feed inserts
+    MAX_CHECKOUT_STATEMENTS = 15
+
+    cash = Account.objects.create(company=test_company_fixture, branch=create_branch, name='Cash', account_type='CASH')
+    sales = Account.objects.create(company=test_company_fixture, branch=create_branch, name='Sales', account_type='SALE')
+    CashAccount.objects.create(account=cash, branch=create_branch)
+    SalesAccount.objects.create(account=sales, company=test_company_fixture, branch=create_branch)
+    PaymentMethod.objects.create(company=test_company_fixture, branch=create_branch, payment_method_name='cash')
+
+    def checkout(basket):
+        order = SalesOrder.objects.create(
+            company=test_company_fixture, branch=create_branch, customer=test_customer_fixture, customer_name='Magiv'
+        )
+        for product, quantity in basket:
+            SalesOrderItem.objects.create(
+                sales_order=order, product=product, product_name=product.name,
+                quantity=quantity, unit_price=Decimal('2.00'), tax_rate=Decimal('0')
+            )
+        order = SalesOrder.objects.get(pk=order.pk)
+        with CaptureQueriesContext(connection) as queries:
+            result = PosFastCheckOutService.process_checkout(
+                company=test_company_fixture,
+                branch=create_branch,
+                customer=test_customer_fixture,
+                payment_method='cash',
+                sales_order=order,
+                received_by=None,
+            )
+        statements = [q for q in queries.captured_queries if 'SAVEPOINT' not in q['sql']]
+        return result, len(statements)
+
+    bread, milk, airtime = test_stocked_products_fixture
+    # warm the ContentType and ledger account caches
+    checkout([(airtime, 1)])
+    small, small_count = checkout([(bread, 1)])
+    large, large_count = checkout([(bread, 2), (milk, 3), (airtime, 1), (milk, 1)])
+
+    assert small_count == large_count
+    assert large_count <= MAX_CHECKOUT_STATEMENTS
+
+    assert large.receipt.total_amount == Decimal('14.00')
+    assert large.sale.total_amount == Decimal('14.00')
+    assert SalesReceiptItem.objects.filter(sales_receipt=large.receipt).count() == 4
+    assert ProductStock.objects.get(product=milk).quantity == 6
+    cash.refresh_from_db()
+    sales.refresh_from_db()
+    assert cash.balance == Decimal('18.00')
+    assert sales.balance == Decimal('-18.00')
+
+
+@pytest.mark.django_db
+def test_seeded_benchmarks_report_and_compare_against_baseline(tmp_path):
+    """
+    Seed a small dataset, run the hot-path benchmarks, store a baseline and compare a second run against it.
+    """
+    import json
+    from io import StringIO
+    from django.core.management import call_command
+    from sales.models.sale_model import Sale
+    from transactions.models.journal_entry_model import JournalEntry
+
+    call_command(
+        'seed_benchmark_data', '--branches', '2', '--products', '12', '--customers', '3',
+        '--days', '2', '--sales-per-day', '4', stdout=StringIO()
+    )
+    assert Sale.objects.count() == 2 * 2 * 4
+    sales_before = Sale.objects.count()
+
+    baseline = tmp_path / 'baseline.json'
+    out = StringIO()
+    call_command(
+        'run_benchmarks', '--iterations', '3', '--warmup', '1', '--json',
+        '--save-baseline', str(baseline), stdout=out
+    )
+    results = {r['name']: r for r in json.loads(out.getvalue().split('\nBaseline written')[0])}
+    logger.info(results)
+
+    for name in ['checkout', 'stock_posting', 'product_transfer', 'stock_take_reconciliation',
+                 'transaction_listing', 'product_csv_export', 'product_csv_import', 'authenticated_listing',
+                 'checkout_logging_per_app', 'checkout_logging_production']:
+        assert results[name]['error'] is None, results[name]['error']
+        assert results[name]['iterations'] == 3
+        assert results[name]['p50_ms'] <= results[name]['p95_ms'] <= results[name]['max_ms']
+        assert results[name]['peak_memory_kb'] > 0
+    assert 0 < results['checkout']['sql_statements'] <= 14
+    # principal served from the cache after warmup: the request costs only its page query
+    assert results['authenticated_listing']['sql_statements'] == 1
+
+    # scenarios roll back: the seeded dataset is unchanged
+    assert Sale.objects.count() == sales_before
+    stored = json.loads(baseline.read_text())
+    assert 'checkout' in stored['scenarios']
+
+    call_command(
+        'run_benchmarks', '--iterations', '3', '--warmup', '1', '--scenario', 'checkout',
+        '--scenario', 'transaction_listing', '--baseline', str(baseline), '--tolerance', '100', stdout=StringIO()
+    )
+    assert JournalEntry.objects.filter(reason='TRANSACTION').count() == 2 * 2 * 4 * 2
+
+
+@pytest.mark.django_db
+def test_document_numbers_fit_their_fields_at_the_length_boundary(settings):
+    """
+    Test a receipt number with a 13-digit company id and an 18-digit sequence number fills the
+    widened receipt_number field exactly, and one more digit is refused before anything is saved.
+    """
+    from core.models import DocumentSequence
+    from core.services.document_numbering.document_number_service import DocumentNumberService
+
+    settings.DOCUMENT_NUMBERING = {"BLOCK_SIZE": 10, "GAPLESS": ["sales_receipt"]}
+    company = Company.objects.create(
+        id=10 ** 12, name='Large Id', email='large@example.com', address='1 Long Road', phone_number='+263700000002'
+    )
+    max_length = SalesReceipt._meta.get_field('receipt_number').max_length
+    # a six-digit company id with a seven-digit counter, which overflowed the old 20 characters
+    assert len(f"RECEIPT-{10 ** 5}-{10 ** 6}") <= max_length
+
+    DocumentSequence.objects.create(company=company, document_type='sales_receipt', next_value=10 ** 17)
+    number = DocumentNumberService.next_numbers('sales_receipt', company.id)[0]
+    assert number == f"RECEIPT-{10 ** 12}-{10 ** 17}" and len(number) == max_length
+
+    DocumentSequence.objects.filter(company=company, document_type='sales_receipt').update(next_value=10 ** 18)
+    with pytest.raises(ValueError, match='longer than sales.SalesReceipt.receipt_number'):
+        DocumentNumberService.next_numbers('sales_receipt', company.id)
+
+
+def test_production_logging_routes_one_enqueued_sink_and_samples_info(settings, tmp_path):
+    """
+    Production logging: one enqueued sink writes every record to posflow.log and its app's file,
+    INFO from sampled modules is thinned to one in N, warnings always pass, DEBUG is dropped and
+    lazy arguments are never evaluated for it. An unknown mode is rejected.
+    """
+    from config.utilities.logger import restore_loguru, setup_loguru
+
+    settings.LOGURU = {"LEVEL": "INFO", "ENQUEUE": True, "SAMPLE_EVERY": {"sales.tests": 4, "inventory": 0}}
+    evaluated = []
+    setup_loguru(mode="production", log_dir=str(tmp_path))
+    try:
+        for index in range(8):
+            logger.info("Checkout line {}", index)
+        logger.warning("Stock running low")
+        logger.opt(lazy=True).debug("Expensive {}", lambda: evaluated.append(True))
+        logger.complete()
+    finally:
+        restore_loguru()
+
+    app_log = (tmp_path / "sales.log").read_text()
+    assert "Checkout line 0" in app_log and "Checkout line 4" in app_log
+    assert "Checkout line 1" not in app_log and app_log.count("Checkout line") == 2
+    assert "Stock running low" in app_log and "Expensive" not in app_log
+    assert evaluated == []
+    general_log = (tmp_path / "posflow.log").read_text()
+    assert "Loguru production logging initialized" in general_log and "Stock running low" in general_log
+    assert not (tmp_path / "inventory.log").exists()
+    # every record once in posflow.log and once in its app's file (config logged the start-up line)
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["config.log", "posflow.log", "sales.log"]
+    assert general_log.count("Checkout line") == 2
+    assert "sampled=['inventory', 'sales.tests']" in general_log
+
+    # an unknown mode is refused instead of quietly falling back to per_app
+    settings.LOGURU = {**settings.LOGURU, "MODE": "prod"}
+    with pytest.raises(ValueError, match="Unknown Loguru mode 'prod'"):
+        setup_loguru(log_dir=str(tmp_path))
+
+
+@pytest.mark.django_db
+def test_document_numbers_come_from_blocked_company_sequences(test_company_fixture, create_branch, test_customer_fixture, test_currency_fixture, settings):
+    """
+    Test document numbers are per-company sequences reserved a block at a time, that a rolled-back
+    reservation is never reused, that gapless types take one number per document and that syncing
+    moves a sequence past numbers already issued.
+    """
+    from django.db import connection, transaction as db_transaction
+    from django.test.utils import CaptureQueriesContext
+    from core.models import DocumentSequence
+    from core.services.document_numbering.document_number_service import DocumentNumberService
+
+    settings.DOCUMENT_NUMBERING = {"BLOCK_SIZE": 10, "GAPLESS": ["sales_receipt"]}
+    company_id = test_company_fixture.id
+
+    def order():
+        return SalesOrder.objects.create(
+            company=test_company_fixture, branch=create_branch, customer=test_customer_fixture, customer_name='Magiv'
+        )
+
+    first = order()
+    assert first.order_number == f"SO-{company_id}-000001"
+    with CaptureQueriesContext(connection) as queries:
+        orders = [order() for _ in range(5)]
+    assert [o.order_number for o in orders] == [f"SO-{company_id}-{n:06d}" for n in range(2, 7)]
+    assert not [q for q in queries.captured_queries if 'core_documentsequence' in q['sql']]
+    assert DocumentSequence.objects.get(company=test_company_fixture, document_type='sales_order').next_value == 11
+
+    # a block reserved in a rolled-back savepoint is dropped with it
+    with pytest.raises(RuntimeError):
+        with db_transaction.atomic():
+            DocumentNumberService.allocate('sale', company_id, 3)
+            raise RuntimeError("checkout failed")
+    assert DocumentNumberService.allocate('sale', company_id, 2) == [1, 2]
+
+    # gapless: one sequence UPDATE per number, no block held in memory
+    assert DocumentNumberService.next_numbers('sales_receipt', company_id, 2) == [
+        f"RECEIPT-{company_id}-000001", f"RECEIPT-{company_id}-000002"
+    ]
+    assert DocumentSequence.objects.get(company=test_company_fixture, document_type='sales_receipt').next_value == 3
+
+    # migration path: older random numbers stay, restored sequence numbers move the sequence on
+    SalesOrder.objects.filter(pk=orders[0].pk).update(order_number='SO-A1B2C3')
+    SalesOrder.objects.filter(pk=orders[1].pk).update(order_number=f"SO-{company_id}-000042")
+    changes = DocumentNumberService.sync_sequences(['sales_order'])
+    assert changes == [{'document_type': 'sales_order', 'company_id': company_id, 'next_value': 11, 'new_next_value': 43}]
+    assert DocumentSequence.objects.get(company=test_company_fixture, document_type='sales_order').next_value == 43
+    assert DocumentNumberService.sync_sequences(['sales_order']) == []
@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from rest_framework.filters import SearchFilter, OrderingFilter
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from config.auth.jwt_token_authentication import CompanyCookieJWTAuthentication, UserCookieJWTAuthentication
@@ -17,7 +18,7 @@ from rest_framework.decorators import action
 from loguru import logger
 
 
-class SalesOrderItemViewSet(ModelViewSet):
+class SalesOrderItemViewSet(EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for managing Sales Order Items.
     Supports listing, retrieving, creating, updating, and deleting sales order items.
@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from rest_framework.filters import SearchFilter, OrderingFilter
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from config.auth.jwt_token_authentication import CompanyCookieJWTAuthentication, UserCookieJWTAuthentication
@@ -19,7 +20,7 @@ from loguru import logger
 
 
 
-class SalesOrderViewSet(ModelViewSet):
+class SalesOrderViewSet(EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for managing Sales Orders.
     Supports listing, retrieving, creating, updating, and deleting sales orders.
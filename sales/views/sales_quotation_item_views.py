@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from rest_framework.filters import SearchFilter, OrderingFilter
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from config.auth.jwt_token_authentication import CompanyCookieJWTAuthentication, UserCookieJWTAuthentication
@@ -18,7 +19,7 @@ from rest_framework.decorators import action
 from loguru import logger
 
 
-class SalesQuotationItemViewSet(ModelViewSet):
+class SalesQuotationItemViewSet(EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for managing Sales Quotation Items.
     Supports listing, retrieving, creating, updating, and deleting quotation items.
@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from rest_framework.filters import SearchFilter, OrderingFilter
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from config.auth.jwt_token_authentication import (
@@ -20,7 +21,7 @@ from rest_framework.decorators import action
 from loguru import logger
 
 
-class SalesReturnItemViewSet(ModelViewSet):
+class SalesReturnItemViewSet(EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for managing Sales Return Items.
     Supports listing, retrieving, creating, updating, and deleting items.
@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from rest_framework.filters import SearchFilter, OrderingFilter
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from config.auth.jwt_token_authentication import CompanyCookieJWTAuthentication, UserCookieJWTAuthentication
@@ -16,7 +17,7 @@ from rest_framework.decorators import action
 from loguru import logger
 
 
-class SalesReturnViewSet(ModelViewSet):
+class SalesReturnViewSet(EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for managing Sales Returns.
     Supports listing, retrieving, creating, updating, and deleting sales returns.
@@ -22,4 +22,5 @@ class SuppliersConfig(AppConfig):
         import suppliers.signals.purchase_return_item_activity_logs_signal
         import suppliers.signals.purchase_item_activity_logs_signal
         import suppliers.signals.purchase_invoice_activity_logs_signal
-        import suppliers.signals.purchase_invoice_item_activity_logs_signal
\ No newline at end of file
+        import suppliers.signals.purchase_invoice_item_activity_logs_signal
+        import suppliers.signals.document_totals_signal
\ No newline at end of file
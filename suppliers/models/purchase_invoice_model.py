@@ -1,7 +1,7 @@
 from django.db import models
 from config.models.create_update_base_model import CreateUpdateBaseModel
 from loguru import logger
-import uuid
+from core.services.document_numbering.document_number_service import DocumentNumberService
 
 
 
@@ -40,7 +40,7 @@ class PurchaseInvoice(CreateUpdateBaseModel):
         null=True,
         blank=True
     )
-    invoice_number = models.CharField(max_length=20, unique=True, editable=False)
+    invoice_number = models.CharField(max_length=40, unique=True, editable=False)
     invoice_date = models.DateTimeField(auto_now_add=True)
     balance = models.DecimalField(max_digits=12, decimal_places=2, default=0)
     currency = models.ForeignKey('currency.Currency', on_delete=models.PROTECT, default=1, related_name='purchase_invoices')
@@ -53,7 +53,7 @@ class PurchaseInvoice(CreateUpdateBaseModel):
     )
 
     def generate_invoice_number(self):
-        number = f"{self.PREFIX}-{uuid.uuid4().hex[:8].upper()}"
+        number = DocumentNumberService.next_number('purchase_invoice', self)
         logger.info(f"Generated PurchaseInvoice number: {number}")
         return number
     
@@ -6,9 +6,11 @@ from suppliers.models.purchase_invoice_item_model import PurchaseInvoiceItem
 from suppliers.models.purchase_invoice_model import PurchaseInvoice
 from inventory.models.product_model import Product
 from company.models.company_model import Company
+from config.eager_loading.eager_loading import EagerLoadingSerializerMixin
 
 
-class PurchaseInvoiceItemSerializer(CompanyValidationMixin, serializers.ModelSerializer):
+class PurchaseInvoiceItemSerializer(EagerLoadingSerializerMixin, CompanyValidationMixin, serializers.ModelSerializer):
+    select_related_fields = ('purchase_invoice__branch', 'purchase_invoice__company')
     company_summary = serializers.SerializerMethodField(read_only=True)
     branch_summary = serializers.SerializerMethodField(read_only=True)
     purchase_invoice_summary = serializers.SerializerMethodField(read_only=True)
@@ -6,8 +6,10 @@ from inventory.serializers.product_category_serializer import ProductCategorySer
 from config.utilities.get_company_or_user_company import get_expected_company
 from inventory.models.product_model import Product
 from loguru import logger
+from config.eager_loading.eager_loading import EagerLoadingSerializerMixin
 
-class PurchaseOrderItemSerializer(serializers.ModelSerializer):
+class PurchaseOrderItemSerializer(EagerLoadingSerializerMixin, serializers.ModelSerializer):
+    select_related_fields = ('product__company',)
     # Serializer class of the PurchaseOrderItem model fields
     product = serializers.PrimaryKeyRelatedField(queryset=Product.objects.all(), write_only=True)
     product_detail = ProductSummarySerializer(source='product', read_only=True)
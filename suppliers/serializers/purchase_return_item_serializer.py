@@ -3,9 +3,11 @@ from inventory.models import Product
 from suppliers.models.purchase_return_item_model import PurchaseReturnItem
 from loguru import logger
 from decimal import Decimal, ROUND_HALF_UP
+from config.eager_loading.eager_loading import EagerLoadingSerializerMixin
 
 
-class PurchaseReturnItemSerializer(serializers.ModelSerializer):
+class PurchaseReturnItemSerializer(EagerLoadingSerializerMixin, serializers.ModelSerializer):
+    select_related_fields = ('product__branch', 'product__company')
     company_summary = serializers.SerializerMethodField(read_only=True)
     branch_summary = serializers.SerializerMethodField(read_only=True)
     product_summary = serializers.SerializerMethodField(read_only=True)
@@ -7,9 +7,11 @@ from suppliers.models.supplier_credit_note_item_model import SupplierCreditNoteI
 from company.models.company_model import Company
 from users.models import User
 from suppliers.models.supplier_model import Supplier
+from config.eager_loading.eager_loading import EagerLoadingSerializerMixin
 
 
-class SupplierCreditNoteItemSerializer(CompanyValidationMixin, serializers.ModelSerializer):
+class SupplierCreditNoteItemSerializer(EagerLoadingSerializerMixin, CompanyValidationMixin, serializers.ModelSerializer):
+    select_related_fields = ('supplier_credit_note__company',)
     company_summary = serializers.SerializerMethodField(read_only=True)
     branch_summary = serializers.SerializerMethodField(read_only=True)
     supplier_credit_note_summary = serializers.SerializerMethodField(read_only=True)
@@ -7,10 +7,12 @@ from suppliers.models.supplier_debit_note_item_model import SupplierDebitNoteIte
 from company.models.company_model import Company
 from users.models import User
 from suppliers.models.supplier_model import Supplier
+from config.eager_loading.eager_loading import EagerLoadingSerializerMixin
 
 
 
-class SupplierDebitNoteItemSerializer(CompanyValidationMixin, serializers.ModelSerializer):
+class SupplierDebitNoteItemSerializer(EagerLoadingSerializerMixin, CompanyValidationMixin, serializers.ModelSerializer):
+    select_related_fields = ('supplier_debit_note__company',)
     company_summary = serializers.SerializerMethodField(read_only=True)
     branch_summary = serializers.SerializerMethodField(read_only=True)
     supplier_debit_note_summary = serializers.SerializerMethodField(read_only=True)
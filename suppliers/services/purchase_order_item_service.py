@@ -67,9 +67,6 @@ class PurchaseOrderItemService:
         if updated:
             item.save(update_fields=['quantity', 'unit_price', 'total_amount'])
             logger.info(f"Purchase Order Item '{item.product.name}' updated.")
-
-            if item.purchase_order:
-                item.purchase_order.update_total_amount()
         return item
 
     # -------------------------
@@ -78,14 +75,10 @@ class PurchaseOrderItemService:
     @staticmethod
     @db_transaction.atomic
     def delete_item(item: PurchaseOrderItem) -> None:
-        order = item.purchase_order
         name = item.product.name
         item.delete()
         logger.info(f"Purchase Order Item '{name}' deleted.")
 
-        if order:
-            order.update_total_amount()
-
     # -------------------------
     # ATTACH / DETACH
     # -------------------------
@@ -100,9 +93,6 @@ class PurchaseOrderItemService:
             f"'{order.reference_number}' (previous: "
             f"'{previous_order.reference_number if previous_order else 'None'}')."
         )
-        if previous_order:
-            previous_order.update_total_amount()
-        order.update_total_amount()
         return item
 
     @staticmethod
@@ -115,8 +105,6 @@ class PurchaseOrderItemService:
             f"Purchase Order Item '{item.product.name}' detached from order "
             f"'{previous_order.reference_number if previous_order else 'None'}'."
         )
-        if previous_order:
-            previous_order.update_total_amount()
         return item
 
     # -------------------------
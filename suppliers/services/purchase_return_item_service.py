@@ -122,10 +122,6 @@ class PurchaseReturnItemService:
         item.purchase_return = purchase_return
         item.save(update_fields=['purchase_return'])
 
-        if previous_return and previous_return != purchase_return:
-            previous_return.update_total_amount()
-        purchase_return.update_total_amount()
-
         logger.info(
             f"Purchase Return Item '{item.product.name}' attached to return '{purchase_return.id}' "
             f"(previous return: '{previous_return.id if previous_return else 'None'}')."
@@ -139,9 +135,6 @@ class PurchaseReturnItemService:
         item.purchase_return = None
         item.save(update_fields=['purchase_return'])
 
-        if previous_return:
-            previous_return.update_total_amount()
-
         logger.info(
             f"Purchase Return Item '{item.product.name}' detached from return "
             f"'{previous_return.id if previous_return else 'None'}'."
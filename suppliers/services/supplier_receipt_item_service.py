@@ -37,7 +37,6 @@ class SupplierReceiptItemService:
             tax_rate=tax_rate
         )
         logger.info(f"Supplier receipt item created | id={item.id} | receipt_id={receipt.id}")
-        receipt.update_total_amount()  # Update total on receipt
         return item
 
     # -------------------------
@@ -71,7 +70,6 @@ class SupplierReceiptItemService:
         if updated:
             item.save()
             logger.info(f"Supplier receipt item updated | id={item.id}")
-            item.receipt.update_total_amount()  # Update receipt total
         else:
             logger.info(f"No changes applied to supplier receipt item | id={item.id}")
 
@@ -90,8 +88,6 @@ class SupplierReceiptItemService:
         item_id = item.id
         item.delete()
         logger.info(f"Supplier receipt item deleted | id={item_id} | receipt_id={receipt_id}")
-        # Update receipt total
-        SupplierReceipt.objects.get(id=receipt_id).update_total_amount()
 
     # -------------------------
     # QUERY METHODS
@@ -0,0 +1,29 @@
+# suppliers/signals/document_totals_signal.py
+from config.totals.totals_registry import register_document_totals
+from suppliers.models.purchase_order_item_model import PurchaseOrderItem
+from suppliers.models.purchase_return_item_model import PurchaseReturnItem
+from suppliers.models.supplier_receipt_item_model import SupplierReceiptItem
+
+
+register_document_totals(
+    PurchaseOrderItem,
+    document_field='purchase_order',
+    quantity_field='quantity',
+    price_field='unit_price'
+)
+
+register_document_totals(
+    PurchaseReturnItem,
+    document_field='purchase_return',
+    quantity_field='quantity',
+    price_field='unit_price',
+    tax_rate_field='tax_rate'
+)
+
+# Supplier receipts are totalled on received quantity before tax
+register_document_totals(
+    SupplierReceiptItem,
+    document_field='receipt',
+    quantity_field='quantity_received',
+    price_field='unit_price'
+)
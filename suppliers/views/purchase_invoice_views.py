@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from rest_framework.filters import SearchFilter, OrderingFilter
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from company.models.company_model import Company
@@ -17,7 +18,7 @@ from rest_framework import status
 from loguru import logger
 
 
-class PurchaseInvoiceViewSet(ModelViewSet):
+class PurchaseInvoiceViewSet(EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for managing Purchase Invoices.
     Supports listing, retrieving, creating, updating, and deleting invoices.
@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from rest_framework.filters import SearchFilter, OrderingFilter
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework.response import Response
@@ -19,7 +20,7 @@ from loguru import logger
 
 
 
-class PurchaseOrderViewSet(ModelViewSet):
+class PurchaseOrderViewSet(EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for managing Purchase Orders.
     Supports listing, retrieving, creating, updating, and deleting purchase orders.
@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from rest_framework.filters import SearchFilter, OrderingFilter
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from config.auth.jwt_token_authentication import CompanyCookieJWTAuthentication, UserCookieJWTAuthentication
@@ -12,7 +13,7 @@ from rest_framework import status
 from loguru import logger
 
 
-class PurchasePaymentAllocationViewSet(ModelViewSet):
+class PurchasePaymentAllocationViewSet(EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for managing PurchasePaymentAllocations.
     Company-scoped, with detailed logging for create, update, and delete.
@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from rest_framework.filters import SearchFilter, OrderingFilter
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework.decorators import action
@@ -18,7 +19,7 @@ from suppliers.permissions.supplier_debit_note_premissions import SupplierDebitN
 from loguru import logger
 
 
-class SupplierDebitNoteItemViewSet(ModelViewSet):
+class SupplierDebitNoteItemViewSet(EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for managing SupplierDebitNoteItems.
     Supports listing, retrieving, creating, updating, and deleting debit note items.
@@ -1,5 +1,6 @@
 from rest_framework import serializers, status
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from rest_framework.filters import SearchFilter, OrderingFilter
 from rest_framework.response import Response
 from company.models.company_model import Company
@@ -24,7 +25,7 @@ from branch.models.branch_model import Branch  # adjust import if needed
 
 
 
-class SupplierViewSet(ModelViewSet):
+class SupplierViewSet(EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for managing suppliers.
     Supports listing, retrieving, creating, updating, and deleting suppliers.
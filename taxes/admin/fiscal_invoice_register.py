@@ -12,11 +12,15 @@ class FiscalInvoiceAdmin(admin.ModelAdmin):
         "invoice_number",
         "total_amount",
         "total_tax",
-        "is_fiscalized"
+        "is_fiscalized",
+        "status",
+        "attempts",
+        "next_attempt_at"
     ]
 
     list_filter = [
         "company",
-        "branch"
+        "branch",
+        "status"
     ]
 admin.site.register(FiscalInvoice, FiscalInvoiceAdmin)
\ No newline at end of file
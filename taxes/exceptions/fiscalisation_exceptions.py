@@ -0,0 +1,21 @@
+class FiscalisationError(Exception):
+    """Raised when fiscal invoices cannot be signed or submitted."""
+    default_message = "An error occurred while fiscalising invoices."
+
+    def __init__(self, message=None):
+        self.message = message or self.default_message
+        super().__init__(self.message)
+
+
+class FiscalSigningKeyError(FiscalisationError):
+    default_message = "The fiscal signing key could not be loaded."
+
+
+class FiscalApiError(FiscalisationError):
+    """The fiscal API could not be reached or answered with a server error; the batch is retried."""
+    default_message = "The fiscal API did not accept the batch."
+
+
+class FiscalBatchRejectedError(FiscalApiError):
+    """The fiscal API refused the batch request itself (4xx); resending it unchanged cannot succeed."""
+    default_message = "The fiscal API refused the batch."
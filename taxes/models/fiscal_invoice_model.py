@@ -1,10 +1,18 @@
 from django.db import models
+from django.utils import timezone
 from config.models.create_update_base_model import CreateUpdateBaseModel
 
 class FiscalInvoice(CreateUpdateBaseModel):
     """
     This links directly with your POS Sale (e.g. Sale model in sales app).
+    Pending invoices are the fiscalisation outbox, submitted by FiscalisationOutboxService.
     """
+
+    class Status(models.TextChoices):
+        PENDING = 'pending', 'Pending'
+        FISCALISED = 'fiscalised', 'Fiscalised'
+        FAILED = 'failed', 'Failed'
+
     company = models.ForeignKey('company.Company', on_delete=models.CASCADE)
     branch = models.ForeignKey('branch.Branch', on_delete=models.CASCADE)
     device = models.ForeignKey('taxes.FiscalDevice', on_delete=models.SET_NULL, null=True)
@@ -21,5 +29,19 @@ class FiscalInvoice(CreateUpdateBaseModel):
     
     is_fiscalized = models.BooleanField(default=False)
 
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    # a worker's claim on the invoice while it is being submitted
+    locked_until = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(null=True, blank=True)
+    fiscalised_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # workers pick due pending invoices oldest first
+            models.Index(fields=['status', 'next_attempt_at'], name='fiscinv_status_due_idx'),
+        ]
+
     def __str__(self):
-        return self.invoice_number
\ No newline at end of file
+        return self.invoice_number
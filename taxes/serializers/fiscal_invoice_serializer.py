@@ -29,6 +29,11 @@ class FiscalInvoiceSerializer(CompanyValidationMixin, serializers.ModelSerialize
             'total_amount',
             'total_tax',
             'is_fiscalized',
+            'status',
+            'attempts',
+            'next_attempt_at',
+            'last_error',
+            'fiscalised_at',
             'created_at',
             'updated_at',
         ]
@@ -38,6 +43,11 @@ class FiscalInvoiceSerializer(CompanyValidationMixin, serializers.ModelSerialize
             'branch_summary',
             'device_summary',
             'sales_invoice_summary',
+            'status',
+            'attempts',
+            'next_attempt_at',
+            'last_error',
+            'fiscalised_at',
             'created_at',
             'updated_at',
         ]
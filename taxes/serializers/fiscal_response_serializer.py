@@ -5,8 +5,10 @@ from loguru import logger
 from taxes.models.fiscal_invoice_model import FiscalInvoice
 from taxes.models.fiscalisation_response_model import FiscalisationResponse
 from company.models.company_model import Company
+from config.eager_loading.eager_loading import EagerLoadingSerializerMixin
 
-class FiscalisationResponseSerializer(CompanyValidationMixin, serializers.ModelSerializer):
+class FiscalisationResponseSerializer(EagerLoadingSerializerMixin, CompanyValidationMixin, serializers.ModelSerializer):
+    select_related_fields = ('fiscal_invoice__company',)
     fiscal_invoice_summary = serializers.SerializerMethodField(read_only=True)
     company_summary = serializers.SerializerMethodField(read_only=True)
 
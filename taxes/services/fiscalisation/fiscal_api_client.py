@@ -0,0 +1,91 @@
+import threading
+import requests
+from django.conf import settings
+from loguru import logger
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from taxes.exceptions.fiscalisation_exceptions import FiscalApiError, FiscalBatchRejectedError
+
+
+class FiscalApiClient:
+    """
+    Client for the fiscal API over one pooled requests.Session per thread, so a worker reuses its
+    TLS connections across batches instead of opening one per call.
+    Connection failures and 502/503/504 answers are retried by the adapter with a short backoff;
+    anything still failing raises FiscalApiError and the outbox retries the batch later. A batch the
+    API refuses as invalid raises FiscalBatchRejectedError, which the outbox does not retry.
+    """
+    _local = threading.local()
+
+    @staticmethod
+    def _config() -> dict:
+        return getattr(settings, 'FISCALISATION', {})
+
+    @classmethod
+    def session(cls) -> requests.Session:
+        session = getattr(cls._local, 'session', None)
+        if session is None:
+            config = cls._config()
+            retry = Retry(
+                total=config.get('HTTP_RETRIES', 2),
+                backoff_factor=0.2,
+                status_forcelist=(502, 503, 504),
+                # the API de-duplicates on invoice reference, so a re-sent batch is safe
+                allowed_methods=frozenset({'GET', 'POST'}),
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(
+                pool_connections=config.get('POOL_SIZE', 10),
+                pool_maxsize=config.get('POOL_SIZE', 10),
+                max_retries=retry,
+            )
+            session = requests.Session()
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            cls._local.session = session
+        return session
+
+    @classmethod
+    def reset(cls):
+        session = getattr(cls._local, 'session', None)
+        if session is not None:
+            session.close()
+            cls._local.session = None
+
+    @classmethod
+    def url(cls, path: str) -> str:
+        return cls._config().get('BASE_URL', '').rstrip('/') + '/' + path.lstrip('/')
+
+    @classmethod
+    def post(cls, path: str, payload: dict) -> requests.Response:
+        try:
+            return cls.session().post(cls.url(path), json=payload, timeout=cls._config().get('TIMEOUT_SECONDS', 10))
+        except requests.RequestException as e:
+            raise FiscalApiError(f"Fiscal API request failed: {e}")
+
+    @classmethod
+    def get(cls, path: str) -> requests.Response:
+        try:
+            return cls.session().get(cls.url(path), timeout=cls._config().get('TIMEOUT_SECONDS', 10))
+        except requests.RequestException as e:
+            raise FiscalApiError(f"Fiscal API request failed: {e}")
+
+    @classmethod
+    def submit_invoices(cls, invoices: list[dict]) -> list[dict]:
+        """
+        POST a batch of signed invoices; one result per invoice:
+        {reference, status: accepted | rejected, response_code, response_message, fiscal_code, qr_code}.
+        """
+        response = cls.post('invoices/batch/', {'invoices': invoices})
+        # 401/403: credentials or device registration, which can be fixed without touching the invoices
+        if response.status_code >= 500 or response.status_code in (401, 403, 408, 429):
+            raise FiscalApiError(f"Fiscal API answered {response.status_code}")
+        if response.status_code >= 400:
+            # the whole batch was refused (malformed request): resending it unchanged cannot succeed
+            logger.error(f"Fiscal API refused a batch | status={response.status_code} | body={response.text[:500]}")
+            raise FiscalBatchRejectedError(f"Fiscal API refused the batch with {response.status_code}")
+        try:
+            return response.json().get('results', [])
+        except (ValueError, AttributeError):
+            # e.g. a proxy's HTML error page answered with 200
+            raise FiscalApiError(f"Fiscal API answered {response.status_code} without a JSON result: {response.text[:200]!r}")
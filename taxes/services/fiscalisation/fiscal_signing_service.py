@@ -0,0 +1,104 @@
+import base64
+import json
+import os
+import threading
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec, padding, rsa
+from django.conf import settings
+from loguru import logger
+from taxes.exceptions.fiscalisation_exceptions import FiscalSigningKeyError
+
+
+class FiscalSigningKeyCache:
+    """
+    Process-local cache of fiscal private keys and certificate files, keyed by path.
+    A file is read and parsed once and re-read only when its modification time changes
+    (a rotated key), instead of on every signature or registration call.
+    """
+    _keys = {}
+    _files = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _mtime(path: str) -> float:
+        try:
+            return os.stat(path).st_mtime
+        except OSError:
+            logger.error(f"Fiscal key file not found: {path}")
+            raise FiscalSigningKeyError(f"Fiscal key file not found: {path}")
+
+    @classmethod
+    def read_bytes(cls, path: str) -> bytes:
+        mtime = cls._mtime(path)
+        entry = cls._files.get(path)
+        if entry is None or entry[0] != mtime:
+            with open(path, 'rb') as key_file:
+                entry = (mtime, key_file.read())
+            with cls._lock:
+                cls._files[path] = entry
+        return entry[1]
+
+    @classmethod
+    def private_key(cls, path: str, password: str | None = None):
+        """
+        (private key, "ECC" | "RSA") from a PEM or DER file.
+        """
+        mtime = cls._mtime(path)
+        entry = cls._keys.get(path)
+        if entry is not None and entry[0] == mtime:
+            return entry[1]
+
+        data = cls.read_bytes(path)
+        secret = password.encode() if password else None
+        try:
+            key = serialization.load_pem_private_key(data, password=secret)
+        except (ValueError, TypeError):
+            try:
+                key = serialization.load_der_private_key(data, password=secret)
+            except (ValueError, TypeError) as e:
+                logger.error(f"Failed to load fiscal private key as PEM or DER: {e}")
+                raise FiscalSigningKeyError("Unable to load private key. Check format and password.")
+
+        if isinstance(key, ec.EllipticCurvePrivateKey):
+            key_type = "ECC"
+        elif isinstance(key, rsa.RSAPrivateKey):
+            key_type = "RSA"
+        else:
+            raise FiscalSigningKeyError(f"Unsupported fiscal key type: {type(key).__name__}")
+        logger.info(f"Loaded fiscal {key_type} private key from {path}")
+
+        with cls._lock:
+            cls._keys[path] = (mtime, (key, key_type))
+        return key, key_type
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._keys.clear()
+            cls._files.clear()
+
+
+class FiscalSigningService:
+    """
+    Signs fiscal invoice payloads with the configured key (FISCALISATION["PRIVATE_KEY_PATH"]).
+    The signature covers the canonical JSON of the payload: sorted keys, no whitespace.
+    """
+
+    @staticmethod
+    def canonical(payload: dict) -> bytes:
+        return json.dumps(payload, sort_keys=True, separators=(',', ':'), default=str).encode()
+
+    @staticmethod
+    def sign(payload: dict, key_path: str | None = None, password: str | None = None) -> str:
+        config = getattr(settings, 'FISCALISATION', {})
+        key_path = key_path or config.get('PRIVATE_KEY_PATH')
+        if not key_path:
+            raise FiscalSigningKeyError("FISCALISATION['PRIVATE_KEY_PATH'] is not set.")
+        key, key_type = FiscalSigningKeyCache.private_key(key_path, password or config.get('PRIVATE_KEY_PASSWORD'))
+
+        data = FiscalSigningService.canonical(payload)
+        if key_type == "ECC":
+            signature = key.sign(data, ec.ECDSA(hashes.SHA256()))
+        else:
+            signature = key.sign(data, padding.PKCS1v15(), hashes.SHA256())
+        return base64.b64encode(signature).decode()
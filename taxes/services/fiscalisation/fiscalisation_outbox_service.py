@@ -0,0 +1,330 @@
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+from decimal import Decimal, ROUND_HALF_UP
+from django.conf import settings
+from django.db import transaction as db_transaction
+from django.db.models import Count, Min, Q
+from django.utils import timezone
+from loguru import logger
+from taxes.exceptions.fiscalisation_exceptions import FiscalApiError, FiscalBatchRejectedError, FiscalSigningKeyError
+from taxes.models.fiscal_device_model import FiscalDevice
+from taxes.models.fiscal_invoice_item_model import FiscalInvoiceItem
+from taxes.models.fiscal_invoice_model import FiscalInvoice
+from taxes.models.fiscalisation_response_model import FiscalisationResponse
+from taxes.services.fiscalisation.fiscal_api_client import FiscalApiClient
+from taxes.services.fiscalisation.fiscal_signing_service import FiscalSigningService
+
+
+_TWO_PLACES = Decimal('0.01')
+
+INVOICE_UPDATE_FIELDS = [
+    'status', 'is_fiscalized', 'attempts', 'next_attempt_at', 'locked_until',
+    'last_error', 'fiscalised_at', 'device', 'updated_at',
+]
+RESPONSE_UPDATE_FIELDS = ['response_code', 'response_message', 'fiscal_code', 'qr_code', 'raw_response', 'updated_at']
+
+
+@dataclass
+class SubmissionReport:
+    claimed: int = 0
+    fiscalised: int = 0
+    rejected: int = 0
+    retried: int = 0
+    failed: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def invoices_per_second(self) -> float:
+        done = self.fiscalised + self.rejected
+        return round(done / self.elapsed_seconds, 2) if self.elapsed_seconds else 0.0
+
+    def add(self, other: 'SubmissionReport'):
+        self.claimed += other.claimed
+        self.fiscalised += other.fiscalised
+        self.rejected += other.rejected
+        self.retried += other.retried
+        self.failed += other.failed
+        self.elapsed_seconds += other.elapsed_seconds
+
+    def as_dict(self) -> dict:
+        return {
+            'claimed': self.claimed,
+            'fiscalised': self.fiscalised,
+            'rejected': self.rejected,
+            'retried': self.retried,
+            'failed': self.failed,
+            'elapsed_seconds': round(self.elapsed_seconds, 3),
+            'invoices_per_second': self.invoices_per_second,
+        }
+
+
+class FiscalisationMetrics:
+    """
+    Submission counters of this worker process since it started.
+    """
+    _totals = SubmissionReport()
+    _lock = threading.Lock()
+
+    @classmethod
+    def record(cls, report: SubmissionReport):
+        with cls._lock:
+            cls._totals.add(report)
+
+    @classmethod
+    def snapshot(cls) -> dict:
+        with cls._lock:
+            return cls._totals.as_dict()
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._totals = SubmissionReport()
+
+
+class FiscalisationOutboxService:
+    """
+    Fiscalisation off the checkout path.
+    Checkout only inserts a pending FiscalInvoice and its items, in its own transaction (the outbox).
+    Workers claim due invoices in batches, sign them with the cached key, submit each batch in one
+    request over a pooled session and write the outcome back in bulk: accepted invoices are fiscalised,
+    rejected ones fail with the API's response, and unreachable-API batches are retried with
+    exponential backoff until FISCALISATION["MAX_ATTEMPTS"]. A batch the API refuses outright (4xx)
+    fails its invoices at once, since resending it unchanged cannot succeed.
+    """
+
+    @staticmethod
+    def _config() -> dict:
+        return getattr(settings, 'FISCALISATION', {})
+
+    # ==========================================================
+    # ENQUEUE
+    # ==========================================================
+    @staticmethod
+    def enqueue_sale(*, sale, order_items, invoice_number: str, device: FiscalDevice = None) -> FiscalInvoice:
+        """
+        Queue a sale for fiscalisation: one invoice insert and one bulk insert of its lines.
+        order_items are the SalesOrderItems that were sold.
+        """
+        lines = []
+        total_amount = Decimal('0.00')
+        total_tax = Decimal('0.00')
+        for item in order_items:
+            subtotal = Decimal(item.quantity) * item.unit_price
+            tax = (subtotal * item.tax_rate / 100).quantize(_TWO_PLACES, rounding=ROUND_HALF_UP)
+            total_amount += subtotal + tax
+            total_tax += tax
+            lines.append(FiscalInvoiceItem(
+                sale_item=item,
+                description=item.product_name,
+                quantity=item.quantity,
+                unit_price=item.unit_price,
+                tax_rate=item.tax_rate,
+            ))
+
+        invoice = FiscalInvoice.objects.create(
+            company_id=sale.company_id,
+            branch_id=sale.branch_id,
+            device=device,
+            sale=sale,
+            invoice_number=invoice_number,
+            total_amount=total_amount.quantize(_TWO_PLACES, rounding=ROUND_HALF_UP),
+            total_tax=total_tax,
+        )
+        for line in lines:
+            line.fiscal_invoice = invoice
+        FiscalInvoiceItem.objects.bulk_create(lines)
+        logger.info(f"Fiscal invoice queued | invoice={invoice_number} | sale={sale.id} | lines={len(lines)}")
+        return invoice
+
+    # ==========================================================
+    # SUBMIT
+    # ==========================================================
+    @staticmethod
+    def _claim(batch_size: int, now) -> list[int]:
+        """
+        Lease up to batch_size due invoices to this worker. Rows locked by another worker are skipped
+        where the database supports it; a worker that dies loses its lease after LEASE_SECONDS.
+        """
+        lease = timedelta(seconds=FiscalisationOutboxService._config().get('LEASE_SECONDS', 120))
+        with db_transaction.atomic():
+            ids = list(
+                FiscalInvoice.objects.select_for_update(skip_locked=True)
+                .filter(status=FiscalInvoice.Status.PENDING, is_fiscalized=False, next_attempt_at__lte=now)
+                .filter(Q(locked_until__isnull=True) | Q(locked_until__lt=now))
+                .order_by('next_attempt_at', 'id')
+                .values_list('id', flat=True)[:batch_size]
+            )
+            if ids:
+                FiscalInvoice.objects.filter(id__in=ids).update(locked_until=now + lease)
+        return ids
+
+    @staticmethod
+    def _payload(invoice: FiscalInvoice, device: FiscalDevice | None) -> dict:
+        return {
+            'reference': invoice.id,
+            'invoice_number': invoice.invoice_number,
+            'device_id': device.device_id if device else None,
+            'device_serial_number': device.device_serial_number if device else None,
+            'issued_at': invoice.created_at.isoformat(),
+            'total_amount': str(invoice.total_amount),
+            'total_tax': str(invoice.total_tax),
+            'lines': [
+                {
+                    'description': item.description,
+                    'quantity': str(item.quantity),
+                    'unit_price': str(item.unit_price),
+                    'tax_rate': str(item.tax_rate),
+                }
+                for item in invoice.items.all()
+            ],
+        }
+
+    @staticmethod
+    def _backoff(attempts: int) -> timedelta:
+        config = FiscalisationOutboxService._config()
+        delay = min(config.get('BACKOFF_SECONDS', 30) * 2 ** (attempts - 1), config.get('MAX_BACKOFF_SECONDS', 3600))
+        # jitter spreads the retries of a failed batch
+        return timedelta(seconds=delay * random.uniform(0.5, 1.0))
+
+    @staticmethod
+    def _retry(invoice: FiscalInvoice, error: str, now, report: SubmissionReport, final: bool = False):
+        invoice.attempts += 1
+        invoice.last_error = error
+        invoice.locked_until = None
+        if final or invoice.attempts >= FiscalisationOutboxService._config().get('MAX_ATTEMPTS', 8):
+            invoice.status = FiscalInvoice.Status.FAILED
+            report.failed += 1
+        else:
+            invoice.next_attempt_at = now + FiscalisationOutboxService._backoff(invoice.attempts)
+            report.retried += 1
+
+    @staticmethod
+    def process_batch(batch_size: int | None = None) -> SubmissionReport:
+        """
+        Claim, sign, submit and record one batch of due invoices.
+        """
+        started = time.monotonic()
+        batch_size = batch_size or FiscalisationOutboxService._config().get('BATCH_SIZE', 50)
+        report = SubmissionReport()
+        now = timezone.now()
+        ids = FiscalisationOutboxService._claim(batch_size, now)
+        if not ids:
+            return report
+        report.claimed = len(ids)
+
+        invoices = list(FiscalInvoice.objects.filter(id__in=ids).select_related('device').prefetch_related('items').order_by('id'))
+        devices = {}
+        for device in FiscalDevice.objects.filter(company_id__in={invoice.company_id for invoice in invoices}, is_active=True).order_by('id'):
+            devices.setdefault(device.company_id, device)
+
+        results = {}
+        error = None
+        refused = False
+        try:
+            payloads = []
+            for invoice in invoices:
+                if invoice.device is None:
+                    invoice.device = devices.get(invoice.company_id)
+                payload = FiscalisationOutboxService._payload(invoice, invoice.device)
+                payload['signature'] = FiscalSigningService.sign(payload)
+                payloads.append(payload)
+            results = {str(result.get('reference')): result for result in FiscalApiClient.submit_invoices(payloads)}
+        except FiscalBatchRejectedError as e:
+            error = e.message
+            refused = True
+        except (FiscalApiError, FiscalSigningKeyError) as e:
+            error = e.message
+            logger.warning(f"Fiscal batch not submitted | invoices={len(invoices)} | error={error}")
+
+        now = timezone.now()
+        responses = []
+        for invoice in invoices:
+            invoice.updated_at = now
+            result = results.get(str(invoice.id))
+            if result is None:
+                FiscalisationOutboxService._retry(
+                    invoice, error or "No result returned for this invoice", now, report, final=refused
+                )
+                continue
+            invoice.attempts += 1
+            invoice.locked_until = None
+            responses.append(FiscalisationResponse(
+                fiscal_invoice=invoice,
+                response_code=str(result.get('response_code', '')),
+                response_message=result.get('response_message', ''),
+                fiscal_code=result.get('fiscal_code'),
+                qr_code=result.get('qr_code'),
+                raw_response=result,
+                updated_at=now,
+            ))
+            if result.get('status') == 'accepted':
+                invoice.status = FiscalInvoice.Status.FISCALISED
+                invoice.is_fiscalized = True
+                invoice.fiscalised_at = now
+                invoice.last_error = None
+                report.fiscalised += 1
+            else:
+                invoice.status = FiscalInvoice.Status.FAILED
+                invoice.last_error = result.get('response_message') or "Rejected by the fiscal API"
+                report.rejected += 1
+
+        with db_transaction.atomic():
+            if responses:
+                FiscalisationResponse.objects.bulk_create(
+                    responses,
+                    update_conflicts=True,
+                    unique_fields=['fiscal_invoice'],
+                    update_fields=RESPONSE_UPDATE_FIELDS,
+                )
+            FiscalInvoice.objects.bulk_update(invoices, INVOICE_UPDATE_FIELDS)
+
+        report.elapsed_seconds = time.monotonic() - started
+        FiscalisationMetrics.record(report)
+        logger.info(
+            f"Fiscal batch processed | claimed={report.claimed} | fiscalised={report.fiscalised} "
+            f"| rejected={report.rejected} | retried={report.retried} | failed={report.failed} "
+            f"| invoices_per_second={report.invoices_per_second}"
+        )
+        return report
+
+    @staticmethod
+    def run(max_batches: int | None = None, batch_size: int | None = None) -> SubmissionReport:
+        """
+        Process batches until no invoice is due (or max_batches).
+        """
+        batch_size = batch_size or FiscalisationOutboxService._config().get('BATCH_SIZE', 50)
+        total = SubmissionReport()
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            report = FiscalisationOutboxService.process_batch(batch_size)
+            total.add(report)
+            batches += 1
+            # a short batch means the queue is drained; a fully failed one means the API is down
+            if report.claimed < batch_size or report.retried + report.failed == report.claimed:
+                break
+        return total
+
+    # ==========================================================
+    # METRICS
+    # ==========================================================
+    @staticmethod
+    def queue_stats(company=None) -> dict:
+        """
+        Queue depth, age of the oldest pending invoice and failure count, from one aggregate.
+        """
+        queryset = FiscalInvoice.objects.all()
+        if company is not None:
+            queryset = queryset.filter(company=company)
+        pending = Q(status=FiscalInvoice.Status.PENDING, is_fiscalized=False)
+        stats = queryset.aggregate(
+            pending=Count('id', filter=pending),
+            due=Count('id', filter=pending & Q(next_attempt_at__lte=timezone.now())),
+            failed=Count('id', filter=Q(status=FiscalInvoice.Status.FAILED)),
+            oldest_pending=Min('created_at', filter=pending),
+        )
+        oldest = stats.pop('oldest_pending')
+        stats['oldest_pending_age_seconds'] = round((timezone.now() - oldest).total_seconds(), 1) if oldest else 0
+        return stats
@@ -0,0 +1,16 @@
+from celery import shared_task
+from loguru import logger
+from taxes.services.fiscalisation.fiscalisation_outbox_service import FiscalisationOutboxService
+
+
+@shared_task(ignore_result=True)
+def submit_fiscal_invoices_task():
+    """
+    Submit due fiscal invoices from the outbox (scheduled in CELERY_BEAT_SCHEDULE).
+    """
+    report = FiscalisationOutboxService.run()
+    stats = FiscalisationOutboxService.queue_stats()
+    logger.info(
+        f"submit_fiscal_invoices_task | {report.as_dict()} | pending={stats['pending']} "
+        f"| oldest_pending_age_seconds={stats['oldest_pending_age_seconds']}"
+    )
@@ -1,4 +1,4 @@
-# from fixture_tests import *
+from fixture_tests import *
 
 # @pytest.mark.django_db
 # def test_fiscal_device_urls(client, test_user_token):
@@ -217,3 +217,146 @@
     
 #     url_resp_detail = reverse('fiscal-response-detail', kwargs={'pk': 1})
 #     client.get(url_resp_detail, HTTP_AUTHORIZATION=f'Bearer {test_user_token}')
+
+
+@pytest.mark.django_db
+def test_fiscal_outbox_signs_batches_and_retries_with_backoff(test_company_fixture, create_branch, test_customer_fixture, test_currency_fixture, test_stocked_products_fixture, settings, tmp_path):
+    """
+    Test queued sales are signed and submitted in batches to the stub fiscal server, that a batch the
+    server cannot take is retried after a backoff, and that responses and metrics are recorded.
+    """
+    from decimal import Decimal
+    from datetime import timedelta
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    from django.utils import timezone
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from sales.models.sale_model import Sale
+    from sales.models.sales_order_model import SalesOrder
+    from sales.models.sales_order_item_model import SalesOrderItem
+    from taxes.models.fiscal_device_model import FiscalDevice
+    from taxes.models.fiscal_invoice_model import FiscalInvoice
+    from taxes.models.fiscalisation_response_model import FiscalisationResponse
+    from taxes.services.fiscalisation.fiscal_api_client import FiscalApiClient
+    from taxes.services.fiscalisation.fiscalisation_outbox_service import FiscalisationMetrics, FiscalisationOutboxService
+    from taxes.utils.stub_fiscal_server import StubFiscalServer
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    key_path = tmp_path / 'device.key'
+    key_path.write_bytes(key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ))
+    device = FiscalDevice.objects.create(
+        company=test_company_fixture, device_name='Till 1', device_id='42', device_serial_number='SN0001', device_type='POS'
+    )
+
+    bread, milk, _ = test_stocked_products_fixture
+    invoices = []
+    for number in range(3):
+        order = SalesOrder.objects.create(
+            company=test_company_fixture, branch=create_branch, customer=test_customer_fixture, customer_name='Magiv'
+        )
+        items = [
+            SalesOrderItem.objects.create(sales_order=order, product=bread, product_name='Bread', quantity=2, unit_price=Decimal('1.50'), tax_rate=Decimal('10')),
+            SalesOrderItem.objects.create(sales_order=order, product=milk, product_name='Milk', quantity=1, unit_price=Decimal('2.00'), tax_rate=Decimal('0')),
+        ]
+        sale = Sale.objects.create(company=test_company_fixture, branch=create_branch, customer=test_customer_fixture)
+        invoices.append(FiscalisationOutboxService.enqueue_sale(sale=sale, order_items=items, invoice_number=f"FI-{number}"))
+    assert invoices[0].total_amount == Decimal('5.30')
+    assert invoices[0].total_tax == Decimal('0.30')
+    assert FiscalisationOutboxService.queue_stats()['pending'] == 3
+
+    with StubFiscalServer(fail_first=1, reject={'FI-2'}, public_key=key.public_key()) as server:
+        settings.FISCALISATION = {
+            **settings.FISCALISATION,
+            'BASE_URL': server.url,
+            'PRIVATE_KEY_PATH': str(key_path),
+            'BATCH_SIZE': 2,
+            'HTTP_RETRIES': 0,
+            'BACKOFF_SECONDS': 30,
+        }
+        FiscalApiClient.reset()
+
+        # the server is down for the first batch: both invoices back off, nothing else is due yet
+        report = FiscalisationOutboxService.process_batch()
+        assert (report.claimed, report.retried) == (2, 2)
+        retried = FiscalInvoice.objects.filter(attempts=1)
+        assert retried.count() == 2
+        assert all(invoice.next_attempt_at > timezone.now() + timedelta(seconds=10) for invoice in retried)
+        assert not FiscalisationResponse.objects.exists()
+
+        FiscalInvoice.objects.update(next_attempt_at=timezone.now())
+        with CaptureQueriesContext(connection) as queries:
+            report = FiscalisationOutboxService.process_batch()
+        # claim (select + lease), invoices, their items, devices, bulk responses, bulk invoice update
+        assert len([q for q in queries.captured_queries if 'SAVEPOINT' not in q['sql']]) == 7
+        report.add(FiscalisationOutboxService.run())
+        FiscalApiClient.reset()
+
+    assert (report.fiscalised, report.rejected) == (2, 1)
+    assert sorted(server.received) == ['FI-0', 'FI-1', 'FI-2']
+    fiscalised = FiscalInvoice.objects.filter(status=FiscalInvoice.Status.FISCALISED)
+    assert sorted(fiscalised.values_list('invoice_number', flat=True)) == ['FI-0', 'FI-1']
+    assert all(invoice.is_fiscalized and invoice.device_id == device.id for invoice in fiscalised)
+    rejected = FiscalInvoice.objects.get(invoice_number='FI-2')
+    assert rejected.status == FiscalInvoice.Status.FAILED
+    assert FiscalisationResponse.objects.count() == 3
+    assert FiscalisationResponse.objects.get(fiscal_invoice=invoices[0]).fiscal_code
+
+    stats = FiscalisationOutboxService.queue_stats(company=test_company_fixture)
+    assert (stats['pending'], stats['failed'], stats['oldest_pending_age_seconds']) == (0, 1, 0)
+    assert FiscalisationMetrics.snapshot()['fiscalised'] == 2
+
+
+@pytest.mark.django_db
+def test_fiscal_outbox_retries_unreadable_answers_and_fails_refused_batches(test_company_fixture, create_branch, test_customer_fixture, test_currency_fixture, test_stocked_products_fixture, settings, tmp_path):
+    """
+    Test a 200 answer that is not JSON releases the lease and retries the batch, while a batch the
+    API refuses with a 4xx fails its invoices at once instead of retrying until MAX_ATTEMPTS.
+    """
+    from decimal import Decimal
+    from django.utils import timezone
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from sales.models.sale_model import Sale
+    from sales.models.sales_order_model import SalesOrder
+    from sales.models.sales_order_item_model import SalesOrderItem
+    from taxes.models.fiscal_invoice_model import FiscalInvoice
+    from taxes.services.fiscalisation.fiscal_api_client import FiscalApiClient
+    from taxes.services.fiscalisation.fiscalisation_outbox_service import FiscalisationOutboxService
+    from taxes.utils.stub_fiscal_server import StubFiscalServer
+
+    key_path = tmp_path / 'device.key'
+    key_path.write_bytes(ec.generate_private_key(ec.SECP256R1()).private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ))
+    bread, _, _ = test_stocked_products_fixture
+    order = SalesOrder.objects.create(
+        company=test_company_fixture, branch=create_branch, customer=test_customer_fixture, customer_name='Magiv'
+    )
+    items = [SalesOrderItem.objects.create(sales_order=order, product=bread, product_name='Bread', quantity=1, unit_price=Decimal('1.50'), tax_rate=Decimal('0'))]
+    sale = Sale.objects.create(company=test_company_fixture, branch=create_branch, customer=test_customer_fixture)
+    invoice = FiscalisationOutboxService.enqueue_sale(sale=sale, order_items=items, invoice_number='FI-9')
+
+    canned = [(200, b'<html>Down for maintenance</html>'), (400, b'{"detail": "Malformed batch"}')]
+    with StubFiscalServer(canned=canned) as server:
+        settings.FISCALISATION = {
+            **settings.FISCALISATION, 'BASE_URL': server.url, 'PRIVATE_KEY_PATH': str(key_path), 'HTTP_RETRIES': 0,
+        }
+        FiscalApiClient.reset()
+
+        report = FiscalisationOutboxService.process_batch()
+        invoice.refresh_from_db()
+        assert (report.retried, report.failed) == (1, 0)
+        assert invoice.status == FiscalInvoice.Status.PENDING and invoice.attempts == 1
+        assert invoice.locked_until is None and 'without a JSON result' in invoice.last_error
+
+        FiscalInvoice.objects.update(next_attempt_at=timezone.now())
+        report = FiscalisationOutboxService.process_batch()
+        FiscalApiClient.reset()
+
+    invoice.refresh_from_db()
+    assert (report.retried, report.failed) == (0, 1)
+    assert invoice.status == FiscalInvoice.Status.FAILED and invoice.attempts == 2
+    assert 'refused the batch with 400' in invoice.last_error
@@ -1,5 +1,4 @@
 import os
-import requests
 from loguru import logger
 from dotenv import load_dotenv
 from loguru import logger
@@ -11,6 +10,9 @@ from cryptography.hazmat.primitives.serialization import load_pem_private_key
 import os
 import sys
 from dotenv import load_dotenv  # You may need to install: pip install python-dotenv
+from taxes.services.fiscalisation.fiscal_api_client import FiscalApiClient
+from taxes.exceptions.fiscalisation_exceptions import FiscalSigningKeyError
+from taxes.services.fiscalisation.fiscal_signing_service import FiscalSigningKeyCache
 
 
 
@@ -26,12 +28,9 @@ class DeviceRegistraion:
         self.base_url = "https://api.zimra.co.zw/v1/devices/"  # Example URL, replace with actual
     
     def register_device(self):
-        # Load the certificate and key
-        with open(self.certificate_path, 'rb') as cert_file:
-            cert_data = cert_file.read()
-        
-        with open(self.certificate_key_path, 'rb') as key_file:
-            key_data = key_file.read()
+        # Load the certificate and key (read once per process, see FiscalSigningKeyCache)
+        cert_data = FiscalSigningKeyCache.read_bytes(self.certificate_path)
+        key_data = FiscalSigningKeyCache.read_bytes(self.certificate_key_path)
         
         # Prepare the registration payload
         payload = {
@@ -41,7 +40,7 @@ class DeviceRegistraion:
         }
         
         # Send the registration request to ZIMRA API
-        response = requests.post(self.base_url + "register/", json=payload)
+        response = FiscalApiClient.session().post(self.base_url + "register/", json=payload, timeout=30)
         
         if response.status_code == 201:
             print("Device registered successfully.")
@@ -55,7 +54,7 @@ class DeviceRegistraion:
 
     def get_device_status(self):
         # This method can be used to check the status of the registered device.
-        response = requests.get(self.base_url + f"status/{self.serial_number}/")
+        response = FiscalApiClient.session().get(self.base_url + f"status/{self.serial_number}/", timeout=30)
         
         if response.status_code == 200:
             print("Device status retrieved successfully.")
@@ -143,46 +142,15 @@ class DeviceRegistraion:
         return cn_value
 
     def load_private_key(self, private_key_path, key_password=None):
-        """Load private key from file"""
-        logger.info(f"Loading private key from: {private_key_path}")
-        
+        """Load private key from file (parsed once per process, see FiscalSigningKeyCache)"""
         if not os.path.exists(private_key_path):
             logger.error(f"Private key file not found: {private_key_path}")
             raise FileNotFoundError(f"Private key file not found: {private_key_path}")
-        
-        with open(private_key_path, 'rb') as key_file:
-            private_key_data = key_file.read()
-        
-        # Try to load as PEM
+
         try:
-            password = key_password.encode() if key_password else None
-            private_key = load_pem_private_key(private_key_data, password=password)
-            logger.debug("Successfully loaded PEM private key")
-        except Exception as pem_error:
-            logger.debug(f"Failed to load as PEM: {pem_error}")
-            # Try as DER
-            try:
-                password = key_password.encode() if key_password else None
-                private_key = serialization.load_der_private_key(private_key_data, password=password)
-                logger.debug("Successfully loaded DER private key")
-            except Exception as der_error:
-                logger.error(f"Failed to load private key as PEM or DER: {der_error}")
-                raise ValueError("Unable to load private key. Check format and password.")
-        
-        # Determine key type
-        if isinstance(private_key, ec.EllipticCurvePrivateKey):
-            key_type = "ECC"
-            curve_name = private_key.curve.name
-            logger.info(f"Loaded {key_type} private key (curve: {curve_name})")
-        elif isinstance(private_key, rsa.RSAPrivateKey):
-            key_type = "RSA"
-            key_size = private_key.key_size
-            logger.info(f"Loaded {key_type} private key (size: {key_size} bits)")
-        else:
-            key_type = "Unknown"
-            logger.warning(f"Loaded private key of unknown type: {type(private_key)}")
-        
-        return private_key, key_type
+            return FiscalSigningKeyCache.private_key(private_key_path, key_password)
+        except FiscalSigningKeyError as e:
+            raise ValueError(e.message)
 
     def create_zimra_csr(self, private_key_path, device_serial, device_id, key_password=None):
         """
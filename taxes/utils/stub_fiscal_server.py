@@ -0,0 +1,135 @@
+import argparse
+import base64
+import hashlib
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec, padding
+from loguru import logger
+
+
+class StubFiscalServer:
+    """
+    Local stand-in for the fiscal API, for tests and load runs.
+    Serves POST invoices/batch/ with the same result shape as the real API.
+
+    fail_first: answer the first N batches with 503 (exercises retries)
+    canned: (status, raw body) answers for the batches after those, e.g. (200, b'<html>') or (400, b'{}')
+    reject: invoice numbers to reject
+    public_key: when given, invoices whose signature does not verify are rejected
+
+        with StubFiscalServer() as server:
+            settings.FISCALISATION["BASE_URL"] = server.url
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, fail_first: int = 0, reject=(), public_key=None, canned=()):
+        self.fail_first = fail_first
+        self.canned = list(canned)
+        self.reject = set(reject)
+        self.public_key = public_key
+        self.batches = 0
+        self.received = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def _verify(self, invoice: dict) -> bool:
+        if self.public_key is None:
+            return True
+        unsigned = {key: value for key, value in invoice.items() if key != 'signature'}
+        data = json.dumps(unsigned, sort_keys=True, separators=(',', ':')).encode()
+        try:
+            signature = base64.b64decode(invoice.get('signature', ''))
+            if isinstance(self.public_key, ec.EllipticCurvePublicKey):
+                self.public_key.verify(signature, data, ec.ECDSA(hashes.SHA256()))
+            else:
+                self.public_key.verify(signature, data, padding.PKCS1v15(), hashes.SHA256())
+            return True
+        except (InvalidSignature, ValueError):
+            return False
+
+    def _result(self, invoice: dict) -> dict:
+        number = invoice.get('invoice_number')
+        if number in self.reject or not self._verify(invoice):
+            return {
+                'reference': invoice.get('reference'),
+                'status': 'rejected',
+                'response_code': '400',
+                'response_message': 'Invoice rejected',
+            }
+        fiscal_code = hashlib.sha256(f"{invoice.get('device_id')}:{number}".encode()).hexdigest()[:16].upper()
+        return {
+            'reference': invoice.get('reference'),
+            'status': 'accepted',
+            'response_code': '200',
+            'response_message': 'Fiscalised',
+            'fiscal_code': fiscal_code,
+            'qr_code': f"https://fiscal.stub/verify/{fiscal_code}",
+        }
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                logger.debug(f"Stub fiscal server | {format % args}")
+
+            def _send(self, status: int, body):
+                data = body if isinstance(body, bytes) else json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_POST(self):
+                if self.path.rstrip('/') != '/invoices/batch':
+                    return self._send(404, {'detail': 'Not found'})
+                body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+                with stub._lock:
+                    stub.batches += 1
+                    if stub.batches <= stub.fail_first:
+                        return self._send(503, {'detail': 'Unavailable'})
+                    if stub.canned:
+                        return self._send(*stub.canned.pop(0))
+                    invoices = body.get('invoices', [])
+                    stub.received += [invoice.get('invoice_number') for invoice in invoices]
+                self._send(200, {'results': [stub._result(invoice) for invoice in invoices]})
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a local stub fiscal API.")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--fail-first', type=int, default=0)
+    options = parser.parse_args()
+    server = StubFiscalServer(port=options.port, fail_first=options.fail_first)
+    logger.info(f"Stub fiscal server listening on {server.url}")
+    server._server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from rest_framework.filters import SearchFilter, OrderingFilter
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from config.auth.jwt_token_authentication import CompanyCookieJWTAuthentication, UserCookieJWTAuthentication
@@ -8,10 +9,14 @@ from config.pagination.pagination import StandardResultsSetPagination
 from taxes.models.fiscal_invoice_model import FiscalInvoice
 from taxes.serializers.fiscal_invoice_serializer import FiscalInvoiceSerializer
 from taxes.permissions.fiscalisation_permissions import FiscalisationPermissions
+from taxes.services.fiscalisation.fiscalisation_outbox_service import FiscalisationOutboxService
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.decorators import action
 from loguru import logger
 
 
-class FiscalInvoiceViewSet(ModelViewSet):
+class FiscalInvoiceViewSet(EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for managing Fiscal Invoices.
     Supports listing, retrieving, creating, updating, and deleting invoices.
@@ -106,3 +111,13 @@ class FiscalInvoiceViewSet(ModelViewSet):
             f"FiscalInvoice '{invoice_number}' deleted by '{actor}' "
             f"from company '{company.name}'."
         )
+
+    @action(detail=False, methods=['get'], url_path='outbox-stats')
+    def outbox_stats(self, request):
+        """
+        Fiscalisation queue depth, due and failed invoices and the age of the oldest pending one.
+        """
+        company = get_logged_in_company(request)
+        if company is None:
+            return Response({"detail": "Company not found."}, status=status.HTTP_404_NOT_FOUND)
+        return Response(FiscalisationOutboxService.queue_stats(company=company), status=status.HTTP_200_OK)
@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from rest_framework.filters import SearchFilter, OrderingFilter
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
@@ -17,7 +18,7 @@ from taxes.permissions.fiscalisation_invoice_item_permissions import Fiscalisati
 from loguru import logger
 
 
-class FiscalisationResponseViewSet(ModelViewSet):
+class FiscalisationResponseViewSet(EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for managing Fiscalisation Responses.
     Supports listing, retrieving, creating, updating, and deleting responses.
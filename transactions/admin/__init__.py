@@ -1,2 +1,3 @@
 from transactions.admin import transaction_item_register
-from transactions.admin import transaction_register
\ No newline at end of file
+from transactions.admin import transaction_register
+from transactions.admin import journal_entry_register
\ No newline at end of file
@@ -0,0 +1,31 @@
+from django.contrib import admin
+from transactions.models.journal_entry_model import JournalEntry
+
+class JournalEntryAdmin(admin.ModelAdmin):
+    model = JournalEntry
+
+    list_display = [
+        "company",
+        "branch",
+        "account",
+        "transaction",
+        "entry_type",
+        "reason",
+        "amount",
+        "balance_delta",
+        "posted_at",
+        "reference"
+    ]
+
+    list_filter = [
+        "company",
+        "entry_type",
+        "reason"
+    ]
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+admin.site.register(JournalEntry, JournalEntryAdmin)
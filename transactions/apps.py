@@ -10,3 +10,4 @@ class TransactionsConfig(AppConfig):
         # Import signal handlers to ensure they are registered
         import transactions.signals.transaction_activity_logs_signal
         import transactions.signals.transaction_item_activity_logs_signal
+        import transactions.signals.document_totals_signal
\ No newline at end of file
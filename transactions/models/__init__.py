@@ -1,2 +1,4 @@
 from .transaction_model import Transaction
-from .transaction_item_model import TransactionItem
\ No newline at end of file
+from .transaction_item_model import TransactionItem
+from .journal_entry_model import JournalEntry
+from .account_balance_snapshot_model import AccountBalanceSnapshot
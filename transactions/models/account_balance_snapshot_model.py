@@ -0,0 +1,33 @@
+from django.db import models
+from config.models.create_update_base_model import CreateUpdateBaseModel
+
+
+class AccountBalanceSnapshot(CreateUpdateBaseModel):
+    """
+    Balance of an account from every journal entry posted before as_of.
+    Taken periodically (end of day) so historical balances only need to scan
+    the journal entries posted after the nearest snapshot.
+    """
+
+    account = models.ForeignKey(
+        'accounts.Account',
+        on_delete=models.CASCADE,
+        related_name='balance_snapshots'
+    )
+    as_of = models.DateTimeField()
+    balance = models.DecimalField(max_digits=15, decimal_places=2)
+    entry_count = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"Account {self.account_id} balance {self.balance} as of {self.as_of}"
+
+    class Meta:
+        ordering = ['-as_of']
+        verbose_name = "Account Balance Snapshot"
+        verbose_name_plural = "Account Balance Snapshots"
+        constraints = [
+            models.UniqueConstraint(fields=['account', 'as_of'], name='unique_account_balance_snapshot'),
+        ]
+        indexes = [
+            models.Index(fields=['account', 'as_of']),
+        ]
@@ -0,0 +1,78 @@
+from django.db import models
+from django.core.exceptions import ValidationError
+from django.utils import timezone
+from config.models.create_update_base_model import CreateUpdateBaseModel
+
+
+class JournalEntry(CreateUpdateBaseModel):
+    """
+    One leg of a double-entry posting. Append-only: rows are never updated or
+    deleted; corrections are posted as new, opposite legs.
+    balance_delta is the signed effect on the account balance
+    (debits add, credits subtract, matching Account.balance).
+    """
+
+    ENTRY_TYPES = [
+        ('DEBIT', 'Debit'),
+        ('CREDIT', 'Credit'),
+    ]
+
+    REASONS = [
+        ('TRANSACTION', 'Transaction'),
+        ('REVERSAL', 'Reversal'),
+        ('CASH_TRANSFER', 'Cash Transfer'),
+        ('OPENING', 'Opening Balance'),
+        ('ADJUSTMENT', 'Adjustment'),
+    ]
+
+    company = models.ForeignKey(
+        'company.Company',
+        on_delete=models.CASCADE,
+        related_name='journal_entries'
+    )
+    branch = models.ForeignKey(
+        'branch.Branch',
+        on_delete=models.CASCADE,
+        related_name='journal_entries',
+        null=True,
+        blank=True
+    )
+    account = models.ForeignKey(
+        'accounts.Account',
+        on_delete=models.PROTECT,
+        related_name='journal_entries'
+    )
+    transaction = models.ForeignKey(
+        'transactions.Transaction',
+        on_delete=models.PROTECT,
+        related_name='journal_entries',
+        null=True,
+        blank=True
+    )
+    entry_type = models.CharField(max_length=10, choices=ENTRY_TYPES)
+    reason = models.CharField(max_length=20, choices=REASONS, default='TRANSACTION')
+    amount = models.DecimalField(max_digits=15, decimal_places=2)
+    balance_delta = models.DecimalField(max_digits=15, decimal_places=2)
+    posted_at = models.DateTimeField(default=timezone.now)
+    reference = models.CharField(max_length=100, blank=True, default='')
+
+    def save(self, *args, **kwargs):
+        if self.pk and not self._state.adding:
+            raise ValidationError("Journal entries are append-only and cannot be modified.")
+        super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        raise ValidationError("Journal entries are append-only and cannot be deleted.")
+
+    def __str__(self):
+        return f"{self.entry_type} {self.amount} on account {self.account_id} at {self.posted_at}"
+
+    class Meta:
+        ordering = ['posted_at', 'id']
+        verbose_name = "Journal Entry"
+        verbose_name_plural = "Journal Entries"
+        indexes = [
+            models.Index(fields=['account', 'posted_at']),
+            models.Index(fields=['transaction']),
+            models.Index(fields=['company', 'posted_at'], name='journal_co_posted_idx'),
+        ]
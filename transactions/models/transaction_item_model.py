@@ -47,10 +47,7 @@ class TransactionItem(CreateUpdateBaseModel):
         self.total_price = (self.subtotal + self.tax_amount).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
         super().save(*args, **kwargs)
 
-    def delete(self, *args, **kwargs):
-        transaction: Transaction = self.transaction
-        super().delete(*args, **kwargs)
-        transaction.update_total_amount()
+    # The transaction total is kept in step by transactions.signals.document_totals_signal
 
     def __str__(self):
         return f"{self.product_name} (x{self.quantity}) - {self.unit_price}"
@@ -4,7 +4,7 @@ from config.models.create_update_base_model import CreateUpdateBaseModel
 from decimal import Decimal, ROUND_HALF_UP
 from django.db.models import Sum
 from loguru import logger
-import uuid
+from core.services.document_numbering.document_number_service import DocumentNumberService
 
 
 class Transaction(CreateUpdateBaseModel):
@@ -97,7 +97,7 @@ class Transaction(CreateUpdateBaseModel):
     transaction_type = models.CharField(max_length=20, choices=TRANSACTION_TYPE)
     transaction_direction = models.CharField(max_length=20, choices=TRANSACTION_DIRECTION)
     transaction_category = models.CharField(max_length=20, choices=TRANSACTION_CATEGORIES)
-    transaction_number = models.CharField(max_length=20, unique=True, editable=False)
+    transaction_number = models.CharField(max_length=40, unique=True, editable=False)
     payment_method = models.CharField(max_length=20, choices=TRANSACTION_PAYMENT_METHOD, default='CASH')
     reversal_applied = models.BooleanField(default=False, blank=True, null=True)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='DRAFT')
@@ -108,7 +108,7 @@ class Transaction(CreateUpdateBaseModel):
     total_amount = models.DecimalField(max_digits=12, decimal_places=2, default=0)
 
     def generate_transaction_number(self):
-        number = f"TRX-{uuid.uuid4().hex[:8].upper()}"
+        number = DocumentNumberService.next_number('transaction', self)
         logger.info(f"Generated Transaction number: {number}")
         return number
 
@@ -118,29 +118,105 @@ class Transaction(CreateUpdateBaseModel):
             self.total_amount = total
             super().save(update_fields=['total_amount'])
     
-    def clean(self):
+    # ------------------------------------------------------------------
+    # State tracking: remember the values loaded from (or last written to)
+    # the database so validation can compare against them without a re-fetch.
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._take_snapshot()
+        return instance
+
+    def refresh_from_db(self, *args, **kwargs):
+        super().refresh_from_db(*args, **kwargs)
+        self._take_snapshot()
+
+    def _take_snapshot(self):
+        deferred = self.get_deferred_fields()
+        self._loaded_values = {
+            field.attname: getattr(self, field.attname)
+            for field in self._meta.concrete_fields
+            if field.attname not in deferred
+        }
+
+    def get_changed_fields(self) -> dict:
         """
-        Validates that total_amount is non-negative.
+        Return {field: (old, new)} for loaded fields whose value has changed since the snapshot.
         """
+        loaded = getattr(self, '_loaded_values', {})
+        return {
+            attname: (old, getattr(self, attname))
+            for attname, old in loaded.items()
+            if getattr(self, attname) != old
+        }
+
+    def _previous_status(self):
+        loaded = getattr(self, '_loaded_values', {})
+        if 'status' in loaded:
+            return loaded['status']
+        # built by hand or loaded without status: fall back to a single-column read
+        return Transaction.objects.filter(pk=self.pk).values_list('status', flat=True).first()
+
+    def _validate_total_amount(self):
         if self.total_amount < Decimal('0.00'):
             logger.error(f"Transaction {self.transaction_number} has negative total amount: {self.total_amount}")
             raise ValidationError("Total amount cannot be negative.")
-        if self.pk:
-            previous = Transaction.objects.get(pk=self.pk)
-            # Example rule: VOIDED transactions cannot be changed back
-            if previous.status == 'VOIDED' and self.status != 'VOIDED':
-                raise ValidationError("Cannot change the status of a VOIDED transaction.")
-            
-            # Example rule: COMPLETED transactions cannot go back to PENDING
-            if previous.status == 'COMPLETED' and self.status in ['PENDING', 'DRAFT']:
-                raise ValidationError("Cannot move a COMPLETED transaction back to PENDING or DRAFT.")
+
+    def _validate_status_transition(self):
+        if not self.pk:
+            return
+        previous_status = self._previous_status()
+        if previous_status is None or previous_status == self.status:
+            return
+        # Example rule: VOIDED transactions cannot be changed back
+        if previous_status == 'VOIDED' and self.status != 'VOIDED':
+            raise ValidationError("Cannot change the status of a VOIDED transaction.")
+
+        # Example rule: COMPLETED transactions cannot go back to PENDING
+        if previous_status == 'COMPLETED' and self.status in ['PENDING', 'DRAFT']:
+            raise ValidationError("Cannot move a COMPLETED transaction back to PENDING or DRAFT.")
+
+    def clean(self):
+        """
+        Validates that total_amount is non-negative and that the status change
+        from the loaded snapshot is allowed.
+        """
+        self._validate_total_amount()
+        self._validate_status_transition()
+
+    def _validate_update_fields(self, update_fields):
+        """
+        Cheaper validation for save(update_fields=...): only the written fields
+        are checked, and only the rules that depend on them run.
+        """
+        update_fields = set(update_fields)
+        exclude = [
+            field.name for field in self._meta.concrete_fields
+            if field.name not in update_fields and field.attname not in update_fields
+        ]
+        self.clean_fields(exclude=exclude)
+        if 'total_amount' in update_fields:
+            self._validate_total_amount()
+        if 'status' in update_fields:
+            self._validate_status_transition()
 
     def save(self, *args, **kwargs):
         # Auto-generate transaction number if not provided
         if not self.transaction_number:
             self.transaction_number = self.generate_transaction_number()
-        self.full_clean()  # clean method to enforce validations
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and self.pk:
+            self._validate_update_fields(update_fields)
+        else:
+            self.full_clean()  # clean method to enforce validations
         super().save(*args, **kwargs)
+        if update_fields is not None and hasattr(self, '_loaded_values'):
+            for field_name in update_fields:
+                attname = self._meta.get_field(field_name).attname
+                self._loaded_values[attname] = getattr(self, attname)
+        else:
+            self._take_snapshot()
 
 
     def __str__(self):
@@ -156,4 +232,12 @@ class Transaction(CreateUpdateBaseModel):
             models.Index(fields=['transaction_type']),
             models.Index(fields=['transaction_number']),
             models.Index(fields=['status']),
+            # tenant listings: filtered by company (+ branch / type / category), newest first
+            models.Index(fields=['company', '-transaction_date'], name='trx_co_date_idx'),
+            models.Index(fields=['company', 'branch', '-transaction_date'], name='trx_co_br_date_idx'),
+            models.Index(fields=['company', 'branch', 'transaction_type', '-transaction_date'], name='trx_co_br_type_date_idx'),
+            models.Index(fields=['company', 'branch', 'transaction_category', '-transaction_date'], name='trx_co_br_cat_date_idx'),
+            # account statements
+            models.Index(fields=['debit_account', '-transaction_date'], name='trx_debit_date_idx'),
+            models.Index(fields=['credit_account', '-transaction_date'], name='trx_credit_date_idx'),
         ]
\ No newline at end of file
@@ -0,0 +1,300 @@
+from datetime import datetime, date as date_type, time
+from decimal import Decimal
+from django.db import transaction as db_transaction
+from django.db.models import Case, When, F, Q, Sum, Count, Value, DecimalField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from loguru import logger
+from accounts.models.account_model import Account
+from transactions.models.journal_entry_model import JournalEntry
+from transactions.models.account_balance_snapshot_model import AccountBalanceSnapshot
+
+
+# Postings for these reasons must balance to zero across their legs
+BALANCED_REASONS = {'TRANSACTION', 'REVERSAL', 'CASH_TRANSFER'}
+
+_MONEY = DecimalField(max_digits=15, decimal_places=2)
+_ZERO = Decimal('0.00')
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.get_fixed_timezone(0))
+
+
+class JournalService:
+    """
+    Append-only double-entry journal behind Account.balance.
+    Every balance change is posted as journal legs; Account.balance is the
+    materialised sum of its legs and can be rebuilt from them at any time.
+    Historical balances are answered from the nearest AccountBalanceSnapshot
+    plus the legs posted after it.
+    """
+
+    # -------------------------
+    # POSTING
+    # -------------------------
+    @staticmethod
+    @db_transaction.atomic
+    def post_legs(*,
+                  company,
+                  branch,
+                  legs: list[tuple[Account, Decimal]],
+                  transaction=None,
+                  reason: str = 'TRANSACTION',
+                  reference: str = '',
+                  ) -> list[JournalEntry]:
+        """
+        Append one journal row per (account, balance_delta) leg and move the
+        materialised balances of every account involved with a single UPDATE.
+        """
+        legs = [(account, Decimal(delta)) for account, delta in legs if Decimal(delta)]
+        if not legs:
+            return []
+        if reason in BALANCED_REASONS and sum(delta for _, delta in legs) != _ZERO:
+            raise ValueError(f"Unbalanced {reason} posting: legs must sum to zero.")
+
+        posted_at = timezone.now()
+        entries = [
+            JournalEntry(
+                company=company,
+                branch=branch,
+                account=account,
+                transaction=transaction,
+                entry_type='DEBIT' if delta > 0 else 'CREDIT',
+                reason=reason,
+                amount=abs(delta),
+                balance_delta=delta,
+                posted_at=posted_at,
+                reference=reference,
+            )
+            for account, delta in legs
+        ]
+        JournalEntry.objects.bulk_create(entries)
+
+        deltas = {}
+        for account, delta in legs:
+            deltas[account.pk] = deltas.get(account.pk, _ZERO) + delta
+        Account.objects.filter(pk__in=deltas).update(
+            balance=Case(
+                *[When(pk=pk, then=F('balance') + delta) for pk, delta in deltas.items()],
+                output_field=_MONEY
+            )
+        )
+
+        # keep loaded instances in step with the rows just updated
+        seen = set()
+        for account, _ in legs:
+            if id(account) in seen or 'balance' in account.get_deferred_fields():
+                continue
+            seen.add(id(account))
+            account.balance = Decimal(account.balance) + deltas[account.pk]
+
+        logger.info(f"Journal posted | reason={reason} | legs={len(entries)} | accounts={len(deltas)}")
+        return entries
+
+    @staticmethod
+    def post_transaction(transaction, *, debit_account: Account, credit_account: Account, reverse: bool = False) -> list[JournalEntry]:
+        """
+        Post (or reverse) a transaction: debit leg adds, credit leg subtracts.
+        """
+        amount = Decimal(transaction.total_amount)
+        if reverse:
+            amount = -amount
+        return JournalService.post_legs(
+            company=transaction.company,
+            branch=transaction.branch,
+            legs=[(debit_account, amount), (credit_account, -amount)],
+            transaction=transaction,
+            reason='REVERSAL' if reverse else 'TRANSACTION',
+            reference=transaction.transaction_number,
+        )
+
+    # -------------------------
+    # HISTORICAL BALANCES
+    # -------------------------
+    @staticmethod
+    def to_boundary(value) -> datetime:
+        """
+        Normalise a date, datetime or ISO string to an aware datetime.
+        A bare date means the start of that day.
+        """
+        if value is None:
+            return timezone.now()
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value) if 'T' in value or ' ' in value else date_type.fromisoformat(value)
+        if not isinstance(value, datetime):
+            value = datetime.combine(value, time.min)
+        if timezone.is_naive(value):
+            value = timezone.make_aware(value)
+        return value
+
+    @staticmethod
+    def balance_as_of(account: Account, as_of) -> Decimal:
+        """
+        Balance from every leg posted before as_of: nearest snapshot plus the
+        legs after it. Cost is bounded by the snapshot interval, not account age.
+        """
+        as_of = JournalService.to_boundary(as_of)
+        snapshot = (
+            AccountBalanceSnapshot.objects
+            .filter(account=account, as_of__lte=as_of)
+            .order_by('-as_of')
+            .values_list('as_of', 'balance')
+            .first()
+        )
+        entries = JournalEntry.objects.filter(account=account, posted_at__lt=as_of)
+        balance = _ZERO
+        if snapshot:
+            snapshot_as_of, balance = snapshot
+            entries = entries.filter(posted_at__gte=snapshot_as_of)
+        delta = entries.aggregate(total=Sum('balance_delta'))['total'] or _ZERO
+        return Decimal(balance) + delta
+
+    # -------------------------
+    # SNAPSHOTS
+    # -------------------------
+    @staticmethod
+    @db_transaction.atomic
+    def take_snapshots(as_of=None, company=None) -> int:
+        """
+        Snapshot every account with journal activity at as_of (default: start of today)
+        from its previous snapshot plus the legs since, in one set-based query.
+        Re-running for the same as_of overwrites that snapshot.
+        """
+        if as_of is None:
+            as_of = timezone.localdate()
+        as_of = JournalService.to_boundary(as_of)
+
+        previous = AccountBalanceSnapshot.objects.filter(
+            account=OuterRef('pk'), as_of__lt=as_of
+        ).order_by('-as_of')
+        since_previous = JournalEntry.objects.filter(
+            account=OuterRef('pk'),
+            posted_at__lt=as_of,
+            posted_at__gte=Coalesce(OuterRef('previous_as_of'), Value(_EPOCH)),
+        ).order_by().values('account')
+
+        accounts = Account.objects.all()
+        if company is not None:
+            accounts = accounts.filter(company=company)
+        rows = accounts.annotate(
+            previous_as_of=Subquery(previous.values('as_of')[:1]),
+            previous_balance=Coalesce(Subquery(previous.values('balance')[:1]), Value(_ZERO), output_field=_MONEY),
+            delta=Coalesce(
+                Subquery(since_previous.annotate(total=Sum('balance_delta')).values('total'), output_field=_MONEY),
+                Value(_ZERO),
+                output_field=_MONEY
+            ),
+            entry_count=Coalesce(Subquery(since_previous.annotate(n=Count('id')).values('n')), Value(0)),
+        ).filter(
+            Q(previous_as_of__isnull=False) | Q(entry_count__gt=0)
+        ).values_list('pk', 'previous_balance', 'delta', 'entry_count')
+
+        snapshots = [
+            AccountBalanceSnapshot(
+                account_id=account_id,
+                as_of=as_of,
+                balance=Decimal(previous_balance) + Decimal(delta),
+                entry_count=entry_count,
+            )
+            for account_id, previous_balance, delta, entry_count in rows.iterator(chunk_size=2000)
+        ]
+        AccountBalanceSnapshot.objects.bulk_create(
+            snapshots,
+            batch_size=1000,
+            update_conflicts=True,
+            unique_fields=['account', 'as_of'],
+            update_fields=['balance', 'entry_count', 'updated_at'],
+        )
+        logger.info(f"Account balance snapshots taken | as_of={as_of.isoformat()} | accounts={len(snapshots)}")
+        return len(snapshots)
+
+    # -------------------------
+    # REPAIR
+    # -------------------------
+    @staticmethod
+    def _journal_totals(accounts):
+        journal_total = JournalEntry.objects.filter(
+            account=OuterRef('pk')
+        ).order_by().values('account').annotate(total=Sum('balance_delta')).values('total')
+        return accounts.annotate(
+            journal_balance=Coalesce(Subquery(journal_total, output_field=_MONEY), Value(_ZERO), output_field=_MONEY)
+        )
+
+    @staticmethod
+    def find_balance_drift(company=None):
+        """
+        Yield (account_id, materialised_balance, journal_balance) for accounts whose
+        Account.balance disagrees with the sum of their journal legs.
+        """
+        accounts = Account.objects.all()
+        if company is not None:
+            accounts = accounts.filter(company=company)
+        rows = JournalService._journal_totals(accounts).exclude(
+            balance=F('journal_balance')
+        ).values_list('pk', 'balance', 'journal_balance')
+        yield from rows.iterator(chunk_size=2000)
+
+    @staticmethod
+    @db_transaction.atomic
+    def rebuild_balances(company=None, account_ids=None) -> int:
+        """
+        Overwrite Account.balance with the sum of each account's journal legs (one UPDATE).
+        """
+        accounts = Account.objects.all()
+        if company is not None:
+            accounts = accounts.filter(company=company)
+        if account_ids is not None:
+            accounts = accounts.filter(pk__in=account_ids)
+        journal_total = JournalEntry.objects.filter(
+            account=OuterRef('pk')
+        ).order_by().values('account').annotate(total=Sum('balance_delta')).values('total')
+        updated = accounts.update(
+            balance=Coalesce(Subquery(journal_total, output_field=_MONEY), Value(_ZERO), output_field=_MONEY)
+        )
+        logger.info(f"Rebuilt {updated} account balances from the journal")
+        return updated
+
+    @staticmethod
+    @db_transaction.atomic
+    def seed_opening_entries(company=None) -> int:
+        """
+        One-off migration: post an OPENING leg for every account that has a balance
+        but no journal history yet, so rebuilds keep pre-journal balances.
+        """
+        accounts = Account.objects.exclude(balance=_ZERO).filter(journal_entries__isnull=True)
+        if company is not None:
+            accounts = accounts.filter(company=company)
+        entries = [
+            JournalEntry(
+                company_id=company_id,
+                branch_id=branch_id,
+                account_id=account_id,
+                entry_type='DEBIT' if balance > 0 else 'CREDIT',
+                reason='OPENING',
+                amount=abs(balance),
+                balance_delta=balance,
+                reference='opening balance',
+            )
+            for account_id, company_id, branch_id, balance in accounts.values_list('pk', 'company_id', 'branch_id', 'balance')
+        ]
+        JournalEntry.objects.bulk_create(entries, batch_size=1000)
+        logger.info(f"Seeded {len(entries)} opening journal entries")
+        return len(entries)
+
+    @staticmethod
+    def reconcile_account(account: Account, fix: bool = False) -> dict:
+        """
+        Compare an account's materialised balance with its journal and optionally repair it.
+        """
+        row = JournalService._journal_totals(
+            Account.objects.filter(pk=account.pk)
+        ).values_list('balance', 'journal_balance').get()
+        materialised, journal = Decimal(row[0]), Decimal(row[1])
+        if fix and materialised != journal:
+            JournalService.rebuild_balances(account_ids=[account.pk])
+            account.balance = journal
+        return {
+            'account_id': account.pk,
+            'materialised_balance': materialised,
+            'journal_balance': journal,
+            'difference': materialised - journal,
+            'reconciled': materialised == journal or fix,
+        }
@@ -42,7 +42,6 @@ class TransactionItemService:
         )
         logger.info(f"Transaction item created | id={item.id}")
         TransactionItemService.add_to_transaction(item, transaction)
-        transaction.update_total_amount()
         return item
 
 
@@ -74,7 +73,6 @@ class TransactionItemService:
 
         item.save()
         logger.info(f"Transaction item updated | id={item.id}")
-        item.transaction.update_total_amount()
         return item
 
 
@@ -85,11 +83,9 @@ class TransactionItemService:
     @transaction.atomic
     def delete_transaction_item(item: TransactionItem) -> None:
         """Delete the specified Transaction Item."""
-        transaction_ref = item.transaction
         item_id = item.id
         item.delete()
         logger.info(f"Transaction item deleted | id={item_id}")
-        transaction_ref.update_total_amount()
 
 
     # -------------------------
@@ -103,18 +99,12 @@ class TransactionItemService:
     ) -> TransactionItem:
         """Adds the TransactionItem to the specified Transaction."""
 
-        old_transaction = item.transaction
-
         if transaction.transaction_type not in [t[0] for t in Transaction.TRANSACTION_TYPE] and item.product is not None:
             raise ValidationError("Cannot add a product item to a cash transfer or credit transaction.")
 
         item.transaction = transaction
         item.save(update_fields=['transaction'])
         logger.info(f"Transaction item '{item.id}' added to transaction '{transaction.id}'.")
-
-        transaction.update_total_amount()
-        if old_transaction:
-            old_transaction.update_total_amount()
         return item
 
 
@@ -13,6 +13,27 @@ from decimal import Decimal
 from django.db import transaction as db_transaction
 from config.pagination.pagination import StandardResultsSetPagination
 from transactions.services.transaction_service import TransactionService
+from config.export.streaming_export import StreamingExport
+from currency.services.currency_conversion_service import CurrencyConversionService
+
+
+# (header, lookup) columns of a transaction export; shared by the export action and customer statements
+TRANSACTION_EXPORT_COLUMNS = (
+    ('transaction_number', 'transaction_number'),
+    ('transaction_date', 'transaction_date'),
+    ('branch', 'branch__name'),
+    ('transaction_type', 'transaction_type'),
+    ('transaction_category', 'transaction_category'),
+    ('direction', 'transaction_direction'),
+    ('status', 'status'),
+    ('payment_method', 'payment_method'),
+    ('customer_id', 'customer_id'),
+    ('supplier_id', 'supplier_id'),
+    ('debit_account', 'debit_account__name'),
+    ('credit_account', 'credit_account__name'),
+    ('currency', 'currency__code'),
+    ('total_amount', 'total_amount'),
+)
 
 
 
@@ -24,7 +45,6 @@ class TransactionQueryService:
         transactions = Transaction.objects.filter(
             models.Q(debit_account=account) | models.Q(credit_account=account)
         ).order_by('-transaction_date')
-        logger.info(f"Found {transactions.count()} transactions for Account {account.id}")
         return transactions
     
     @staticmethod
@@ -33,7 +53,6 @@ class TransactionQueryService:
         transactions = Transaction.objects.filter(
             transaction_date__range=(start_date, end_date)
         ).order_by('-transaction_date')
-        logger.info(f"Found {transactions.count()} transactions in date range")
         return transactions
     
     @staticmethod
@@ -44,7 +63,6 @@ class TransactionQueryService:
             branch=branch,
             transaction_type=transaction_type
         ).order_by('-transaction_date')
-        logger.info(f"Found {transactions.count()} transactions of type {transaction_type}")
         return transactions
     
     @staticmethod
@@ -57,8 +75,6 @@ class TransactionQueryService:
             branch=branch
         ).order_by('-transaction_date')
 
-        logger.info(f"Found {transactions.count()} transactions of category {transaction_category} for company {company.id}, branch {branch.id}")
-
         return transactions
 
     
@@ -68,7 +84,6 @@ class TransactionQueryService:
         transactions = Transaction.objects.filter(
             company=company
         ).order_by('-transaction_date')
-        logger.info(f"Found {transactions.count()} transactions for company {company.id}")
         return transactions
     
     @staticmethod
@@ -78,7 +93,6 @@ class TransactionQueryService:
             company=company,
             branch=branch
         ).order_by('-transaction_date')
-        logger.info(f"Found {transactions.count()} transactions for branch {branch.id}")
         return transactions
     
     @staticmethod
@@ -88,7 +102,6 @@ class TransactionQueryService:
             branch=branch,
             id=id,
         ).order_by('-transaction_date')
-        logger.info(f"Found {transactions.count()} transactions for id {id} in branch {branch.id}")
         return transactions
 
     @staticmethod
@@ -114,7 +127,6 @@ class TransactionQueryService:
             models.Q(debit_account__name__icontains=query) |
             models.Q(credit_account__name__icontains=query)
         ).order_by('-transaction_date')
-        logger.info(f"Found {transactions.count()} transactions matching query '{query}'")
         return transactions
     
     @staticmethod
@@ -155,6 +167,27 @@ class TransactionQueryService:
         
 
     @staticmethod
-    def export_transactions_to_csv(transactions):
-        # return CSV file path or response
-        pass
\ No newline at end of file
+    def get_branch_totals(company, to_code=None, start_date=None, end_date=None, status='COMPLETED'):
+        """
+        {branch_id: total_amount converted to to_code (default: base currency)} over a company's transactions.
+        One grouped query by branch, currency and day; each day converts at the rate in force that day.
+        """
+        transactions = Transaction.objects.filter(company=company)
+        if status:
+            transactions = transactions.filter(status=status)
+        if start_date:
+            transactions = transactions.filter(transaction_date__date__gte=start_date)
+        if end_date:
+            transactions = transactions.filter(transaction_date__date__lte=end_date)
+        return CurrencyConversionService.grouped_totals(
+            transactions, 'total_amount', 'branch_id', to_code=to_code, date_field='transaction_date'
+        )
+
+    @staticmethod
+    def export_transactions_to_csv(transactions, export_format='csv'):
+        """
+        Encoded CSV (or NDJSON) chunks for a transaction queryset, streamed from the database.
+        Wrap in StreamingExport.response() to serve over HTTP.
+        """
+        logger.info(f"Exporting transactions as {export_format}")
+        return StreamingExport.chunks(transactions.order_by('-transaction_date', '-id'), TRANSACTION_EXPORT_COLUMNS, export_format)
\ No newline at end of file
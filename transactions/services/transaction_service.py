@@ -11,21 +11,22 @@ from loguru import logger
 from decimal import Decimal
 from django.db import transaction as db_transaction
 from transactions.services.transaction_item_service import TransactionItemService
+from transactions.services.journal_service import JournalService
 
 
 
 class TransactionService:
     @staticmethod
     def validate_transaction(transaction):
-        logger.info(transaction)
-        logger.debug(f"Validating transaction {transaction.transaction_number}")
+        # lazy: Transaction.__str__ only runs when DEBUG is logged
+        logger.opt(lazy=True).debug("Validating transaction {}", lambda: transaction)
         if transaction.total_amount <= 0:
             raise ValueError("Transaction amount must be greater than zero.")
         if transaction.debit_account == transaction.credit_account:
             raise ValueError("Debit and credit accounts cannot be the same.")
         if transaction.debit_account.is_frozen or transaction.credit_account.is_frozen:
             raise ValueError("Cannot apply transaction: one of the accounts is frozen.")
-        logger.debug(f"Transaction {transaction.transaction_number} passed validation")
+        logger.debug("Transaction {} passed validation", transaction.transaction_number)
         
     def create_transaction(
                     company: Company,
@@ -58,7 +59,7 @@ class TransactionService:
                 # transaction_number is auto-generated in save()
                 # transaction_date is auto_now_add
             )
-            logger.info(f"Transaction {transaction.transaction_number} created with status {transaction.status}")
+            logger.info("Transaction {} created with status {}", transaction.transaction_number, transaction.status)
             if transaction.transaction_type in [t[0] for t in Transaction.TRANSACTION_TYPE]:
                 transaction_item = TransactionItemService.create_transaction_item(
                         transaction=transaction,
@@ -85,31 +86,24 @@ class TransactionService:
         :param transaction: Description
 
         """
-        logger.info(f"Applying transaction {transaction.transaction_number}")
+        logger.info("Applying transaction {}", transaction.transaction_number)
         TransactionService.validate_transaction(transaction)
         try:
             # account retrieval with select_for_update to prevent race (row locking)
             debit_account = Account.objects.select_for_update().get(id=transaction.debit_account.id)
             credit_account = Account.objects.select_for_update().get(id=transaction.credit_account.id)
 
-            amount = transaction.total_amount
-
-            debit_balance = AccountsService.get_account_balance(debit_account)
-            logger.info(f'debit_bal:{debit_balance} + amount:{amount}')
-            debit_account.balance = Decimal(debit_balance) + amount
-            debit_account.save(update_fields=['balance'])
-            logger.info(f"Debited Account {debit_account.id}: {debit_balance} → {debit_account.balance}")
-
-            credit_balance = AccountsService.get_account_balance(credit_account)
-            logger.info(f'debit_bal:{credit_balance} + amount:{amount}')
-            credit_account.balance = Decimal(credit_balance) - amount
-            credit_account.save(update_fields=['balance'])
-            logger.info(f"Credited Account {credit_account.id}: {credit_balance} → {credit_account.balance}")
+            # one journal leg per side; both balances move in a single UPDATE
+            JournalService.post_transaction(
+                transaction, debit_account=debit_account, credit_account=credit_account
+            )
+            logger.info("Debited Account {} → {}", debit_account.id, debit_account.balance)
+            logger.info("Credited Account {} → {}", credit_account.id, credit_account.balance)
 
             #Mark transaction as completed
             transaction.status = "COMPLETED"
             transaction.save(update_fields=["status"])
-            logger.info(f"Transaction {transaction.transaction_number} marked as COMPLETED")
+            logger.info("Transaction {} marked as COMPLETED", transaction.transaction_number)
 
 
         except Exception as e:
@@ -122,32 +116,52 @@ class TransactionService:
     @staticmethod
     @db_transaction.atomic
     def reverse_transaction(transaction):
-        logger.info(f"Reversing transaction {transaction.transaction_number}")
+        logger.info("Reversing transaction {}", transaction.transaction_number)
         try:
             debit_account = Account.objects.select_for_update().get(id=transaction.debit_account.id) # row locked for update
             credit_account = Account.objects.select_for_update().get(id=transaction.credit_account.id) # row locked for update                       
-            amount = transaction.total_amount
-
-            debit_balance = AccountsService.get_account_balance(debit_account)
-            debit_account.balance = debit_balance - amount
-            debit_account.save(update_fields=['balance'])
-            logger.info(f"Reversed Debit Account {debit_account.id}: {debit_balance} → {debit_account.balance}")
-
-            credit_balance = AccountsService.get_account_balance(credit_account)
-            credit_account.balance = credit_balance + amount
-            credit_account.save(update_fields=['balance'])
-            logger.info(f"Reversed Credit Account {credit_account.id}: {credit_balance} → {credit_account.balance}")
+            JournalService.post_transaction(
+                transaction, debit_account=debit_account, credit_account=credit_account, reverse=True
+            )
+            logger.info("Reversed Debit Account {} → {}", debit_account.id, debit_account.balance)
+            logger.info("Reversed Credit Account {} → {}", credit_account.id, credit_account.balance)
             
             # return the reversed transaction
             return transaction
         except Exception as e:
             logger.error(f"Transaction reversal {transaction.transaction_number} failed: {e}")
             raise
-    
+
+
+    @staticmethod
+    def get_opening_balance(account, date=None):
+        """
+        Balance of the account at the start of the given day (or now when no date is given),
+        read from the nearest balance snapshot plus the journal legs posted after it.
+        """
+        as_of = JournalService.to_boundary(date)
+        balance = JournalService.balance_as_of(account, as_of)
+        logger.debug("Opening balance for account {} as of {}: {}", account.id, as_of.isoformat(), balance)
+        return balance
+
+
+    @staticmethod
+    def reconcile_transactions(account):
+        """
+        Bring the account's stored balance back in line with its journal.
+        """
+        result = JournalService.reconcile_account(account, fix=True)
+        if result['difference']:
+            logger.warning(
+                f"Account {account.id} balance drifted by {result['difference']}; "
+                f"reset to journal balance {result['journal_balance']}"
+            )
+        return result
+
 
     @staticmethod
     def get_transaction_summary(transaction):
-        logger.debug(f"Generating summary for transaction {transaction.transaction_number}")
+        logger.debug("Generating summary for transaction {}", transaction.transaction_number)
         summary = {
             'transaction_number': transaction.transaction_number,
             'transaction_type': transaction.transaction_type,
@@ -163,7 +177,7 @@ class TransactionService:
                 'name': transaction.credit_account.name,
             },
         }
-        logger.debug(f"Transaction summary generated for {transaction.transaction_number}")
+        logger.debug("Transaction summary generated for {}", transaction.transaction_number)
         return summary
     
 
@@ -173,7 +187,7 @@ class TransactionService:
         try:
             transaction_number = transaction.transaction_number
             transaction.delete()
-            logger.info(f"Transaction {transaction_number} deleted successfully")
+            logger.info("Transaction {} deleted successfully", transaction_number)
         except Exception as e:
             logger.error(f"Failed to delete transaction {transaction.transaction_number}: {e}")
             raise
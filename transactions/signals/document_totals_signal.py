@@ -0,0 +1,10 @@
+# transactions/signals/document_totals_signal.py
+from config.totals.totals_registry import register_document_totals
+from transactions.models.transaction_item_model import TransactionItem
+
+
+register_document_totals(
+    TransactionItem,
+    document_field='transaction',
+    total_field='total_price'
+)
@@ -100,4 +100,227 @@ def test_transaction_item_endpoints(client, test_user_token):
 
     # Detail
     url_detail = reverse('transactionitem-detail', kwargs={'pk': 1})
-    client.get(url_detail, HTTP_AUTHORIZATION=f'Bearer {test_user_token}')
\ No newline at end of file
+    client.get(url_detail, HTTP_AUTHORIZATION=f'Bearer {test_user_token}')
+
+@pytest.mark.django_db
+def test_transaction_state_snapshot_statement_counts(test_company_fixture, create_branch, test_currency_fixture, test_dc_fixture):
+    """
+    Benchmark the statements issued by create -> apply -> reverse and check that
+    status validation uses the loaded snapshot instead of re-fetching the row.
+    """
+    from decimal import Decimal
+    from django.core.exceptions import ValidationError
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    from transactions.services.transaction_service import TransactionService
+
+    def statements(queries):
+        return [q['sql'] for q in queries.captured_queries if 'SAVEPOINT' not in q['sql']]
+
+    with CaptureQueriesContext(connection) as create_queries:
+        transaction = Transaction.objects.create(
+            company=test_company_fixture,
+            branch=create_branch,
+            debit_account=test_dc_fixture['debit'],
+            credit_account=test_dc_fixture['credit'],
+            transaction_type='CASH',
+            transaction_direction='INCOMING',
+            transaction_category='CASH SALE',
+            total_amount=Decimal('50.00'),
+        )
+    with CaptureQueriesContext(connection) as apply_queries:
+        TransactionService.apply_transaction_to_accounts(transaction)
+    with CaptureQueriesContext(connection) as reverse_queries:
+        TransactionService.reverse_transaction(transaction)
+
+    counts = {
+        'create': len(statements(create_queries)),
+        'apply': len(statements(apply_queries)),
+        'reverse': len(statements(reverse_queries)),
+    }
+    logger.info(f"Transaction statement counts: {counts}")
+
+    # apply: lock debit, lock credit, insert journal legs, update both balances, update status
+    assert counts['apply'] == 5
+    assert counts['reverse'] == 4
+    assert not [sql for sql in statements(apply_queries) if sql.startswith('SELECT') and 'transactions_transaction' in sql]
+
+    # the status rules still hold, checked against the snapshot
+    transaction = Transaction.objects.get(pk=transaction.pk)
+    assert transaction.status == 'COMPLETED'
+    transaction.status = 'DRAFT'
+    with CaptureQueriesContext(connection) as validate_queries:
+        with pytest.raises(ValidationError):
+            transaction.save(update_fields=['status'])
+    assert statements(validate_queries) == []
+
+
+@pytest.mark.django_db
+def test_journal_opening_balance_from_snapshot_and_rebuild(test_company_fixture, create_branch, test_currency_fixture, test_dc_fixture):
+    """
+    Postings append journal legs, historical balances come from the nearest
+    snapshot plus later legs, and drifted balances rebuild from the journal.
+    """
+    from datetime import timedelta
+    from decimal import Decimal
+    from django.core.exceptions import ValidationError
+    from django.core.management import call_command
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    from django.utils import timezone
+    from accounts.models.account_model import Account
+    from transactions.models.journal_entry_model import JournalEntry
+    from transactions.services.journal_service import JournalService
+    from transactions.services.transaction_service import TransactionService
+
+    debit, credit = test_dc_fixture['debit'], test_dc_fixture['credit']
+    debit_start = Account.objects.get(pk=debit.pk).balance
+    # pre-journal balances become OPENING legs so a rebuild keeps them
+    call_command('rebuild_account_balances', '--seed-opening')
+
+    def post(amount):
+        transaction = Transaction.objects.create(
+            company=test_company_fixture,
+            branch=create_branch,
+            debit_account=debit,
+            credit_account=credit,
+            transaction_type='CASH',
+            transaction_direction='INCOMING',
+            transaction_category='CASH SALE',
+            total_amount=Decimal(amount),
+        )
+        TransactionService.apply_transaction_to_accounts(transaction)
+        return transaction
+
+    first = post('30.00')
+    post('20.00')
+    TransactionService.reverse_transaction(first)
+
+    legs = JournalEntry.objects.filter(account__in=[debit, credit]).exclude(reason='OPENING')
+    assert legs.count() == 6
+    assert sum(leg.balance_delta for leg in legs) == Decimal('0.00')
+    with pytest.raises(ValidationError):
+        legs.first().save()
+
+    # snapshot taken after the postings, then one more posting after the snapshot
+    tomorrow = timezone.localdate() + timedelta(days=1)
+    JournalEntry.objects.update(posted_at=timezone.now() - timedelta(days=1))
+    assert JournalService.take_snapshots(as_of=timezone.localdate()) >= 2
+    post('5.00')
+
+    with CaptureQueriesContext(connection) as queries:
+        opening = TransactionService.get_opening_balance(debit, tomorrow.isoformat())
+    assert opening == debit_start + Decimal('25.00')
+    assert len(queries.captured_queries) == 2
+    assert TransactionService.get_opening_balance(debit, timezone.localdate()) == debit_start + Decimal('20.00')
+
+    # drift the stored balance, then rebuild it from the journal
+    Account.objects.filter(pk=debit.pk).update(balance=Decimal('999.00'))
+    call_command('rebuild_account_balances', '--apply')
+    assert Account.objects.get(pk=debit.pk).balance == debit_start + Decimal('25.00')
+    assert TransactionService.reconcile_transactions(debit)['difference'] == Decimal('0.00')
+
+
+
+@pytest.mark.django_db
+def test_index_advisor_finds_covering_tenant_indexes(test_company_fixture, create_branch, test_currency_fixture, test_dc_fixture):
+    """
+    Every registered tenant query has a composite index that serves both its
+    filter and its ordering, and the advisor reads the EXPLAIN output.
+    """
+    import json
+    from io import StringIO
+    from decimal import Decimal
+    from django.core.management import call_command
+
+    Transaction.objects.create(
+        company=test_company_fixture,
+        branch=create_branch,
+        debit_account=test_dc_fixture['debit'],
+        credit_account=test_dc_fixture['credit'],
+        transaction_type='CASH',
+        transaction_direction='INCOMING',
+        transaction_category='CASH SALE',
+        total_amount=Decimal('10.00'),
+    )
+
+    out = StringIO()
+    call_command('index_advisor', '--company', str(test_company_fixture.pk), '--json', stdout=out)
+    findings = {finding['name']: finding for finding in json.loads(out.getvalue())}
+    logger.info({name: (f['covering_index'], f['sequential_scans']) for name, f in findings.items()})
+
+    assert findings['transactions.by_type']['covering_index'] == 'trx_co_br_type_date_idx'
+    assert findings['stock_movements.by_branch']['covering_index'] == 'stockmove_co_br_date_idx'
+    assert findings['transactions.by_debit_account']['covering_index'] == 'trx_debit_date_idx'
+    assert all(finding['covering_index'] for finding in findings.values())
+    assert all(finding['plan'] for finding in findings.values())
+
+
+@pytest.mark.django_db
+def test_transaction_list_keyset_pagination(test_company_fixture, create_branch, test_currency_fixture, test_dc_fixture):
+    """
+    Keyset pages walk (transaction_date, id) without OFFSET or COUNT, break ties on id,
+    and page back with the previous cursor; page numbers stay the default.
+    """
+    from datetime import timedelta
+    from decimal import Decimal
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    from django.utils import timezone
+    from rest_framework.test import APIClient
+
+    transactions = [
+        Transaction.objects.create(
+            company=test_company_fixture,
+            branch=create_branch,
+            debit_account=test_dc_fixture['debit'],
+            credit_account=test_dc_fixture['credit'],
+            transaction_type='CASH',
+            transaction_direction='INCOMING',
+            transaction_category='CASH SALE',
+            total_amount=Decimal('10.00'),
+        )
+        for _ in range(5)
+    ]
+    now = timezone.now()
+    for index, transaction in enumerate(transactions):
+        # the last three share a timestamp, so only the id orders them
+        Transaction.objects.filter(pk=transaction.pk).update(transaction_date=now - timedelta(minutes=min(index, 2)))
+    expected = [transactions[index].pk for index in (0, 1, 4, 3, 2)]
+
+    user = User.objects.create_user(
+        username='keyset', email='keyset@example.com', password='keyset', company=test_company_fixture,
+        branch=create_branch, role='Manager', first_name='Keyset'
+    )
+    api_client = APIClient()
+    api_client.force_authenticate(user=user)
+
+    url = reverse('transaction-list') + '?pagination=keyset&page_size=2'
+    seen, pages = [], []
+    while url:
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(url)
+        assert response.status_code == 200
+        assert not any('COUNT(' in q['sql'] or 'OFFSET' in q['sql'] for q in queries.captured_queries)
+        assert response.data['count'] is None
+        seen += [row['id'] for row in response.data['results']]
+        pages.append(response.data)
+        url = response.data['next']
+    assert seen == expected
+
+    back = api_client.get(pages[2]['previous'])
+    assert [row['id'] for row in back.data['results']] == expected[2:4]
+
+    counted = api_client.get(reverse('transaction-list') + '?pagination=keyset&count=estimate')
+    assert counted.data['count'] == 5
+
+    assert 'count' in api_client.get(reverse('transaction-list')).data
+
+    # the list APIViews let the paginator's 404 for a tampered cursor through instead of answering 500
+    from rest_framework.test import APIRequestFactory, force_authenticate
+    from transactions.views.get_transactions_by_branch_views import GetTransactionsByBranch
+
+    for cursor, expected_status in ((pages[0]['next'].split('cursor=')[1].split('&')[0], 200), ('not-a-cursor', 404)):
+        request = APIRequestFactory().get('/transactions/branch/', {'cursor': cursor})
+        force_authenticate(request, user=user)
+        assert GetTransactionsByBranch.as_view()(request).status_code == expected_status
@@ -18,13 +18,13 @@ def apply_transaction_to_accounts(transaction):
         debit_balance = AccountsService.get_account_balance(debit_account)
         debit_account.balance = debit_balance + amount
         debit_account.save(update_fields=['balance'])
-        logger.info(f"Debited Account {debit_account.id}: {debit_balance} → {debit_account.balance}")
+        logger.info("Debited Account {}: {} → {}", debit_account.id, debit_balance, debit_account.balance)
 
         # Update credit account
         credit_balance = AccountsService.get_account_balance(credit_account)
         credit_account.balance = credit_balance - amount
         credit_account.save(update_fields=['balance'])
-        logger.info(f"Credited Account {credit_account.id}: {credit_balance} → {credit_account.balance}")
+        logger.info("Credited Account {}: {} → {}", credit_account.id, credit_balance, credit_account.balance)
 
     except Exception as e:
         logger.error(f"Transaction failed: {e}")
@@ -15,6 +15,8 @@ from rest_framework.response import Response
 from rest_framework import status
 from transactions.services.transaction_service import TransactionService
 from loguru import logger
+from transactions.services.transaction_query_service import TransactionQueryService
+from config.pagination.keyset_pagination import TransactionPagination
 
 
 
@@ -26,14 +28,14 @@ class GetPaginatedTransactionsView(APIView):
         UserCookieJWTAuthentication,
         JWTAuthentication
     ]
-    pagination_class = StandardResultsSetPagination
+    pagination_class = TransactionPagination
 
     def get(self, request, account_id):
         company = get_logged_in_company(request)
 
         try:
             account = Account.objects.get(id=account_id, company=company)
-            qs = TransactionService.get_transactions(account=account, company=company)
+            qs = TransactionQueryService.get_transactions(account=account, company=company)
 
             # DRF pagination
             paginator = self.pagination_class()
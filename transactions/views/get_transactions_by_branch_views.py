@@ -12,14 +12,17 @@ from transactions.models import Transaction
 from transactions.serializers.transaction_serializer import TransactionSerializer
 from accounts.models.account_model import Account
 from rest_framework.views import APIView
+from rest_framework.exceptions import APIException
 from rest_framework.response import Response
 from rest_framework import status
 from transactions.services.transaction_service import TransactionService
 from loguru import logger
+from transactions.services.transaction_query_service import TransactionQueryService
+from transactions.views.transaction_list_response_mixin import TransactionListResponseMixin
 
 
 
-class GetTransactionsByBranch(APIView):
+class GetTransactionsByBranch(TransactionListResponseMixin, APIView):
     permission_classes = [TransactionPermissions]
     authentication_classes = [
         CompanyCookieJWTAuthentication,
@@ -38,10 +41,12 @@ class GetTransactionsByBranch(APIView):
         branch = user.branch
         branch_id = request.query_params.get('branch_id')
         try:
-            transactions = TransactionService.get_transaction_by_branch(company, branch)
-            serializer = TransactionSerializer(transactions, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            transactions = TransactionQueryService.get_transaction_by_branch(company, branch)
+            return self._paginate_keyset_or_default(transactions)
 
+        except APIException:
+            # e.g. a bad keyset cursor (404), answered by DRF
+            raise
         except Exception as e:
             logger.exception("Error retrieving transactions by branch")
             return Response({"status":"Failure", "message":"An error occurred while retrieving transactions."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
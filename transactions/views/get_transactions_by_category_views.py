@@ -12,15 +12,18 @@ from transactions.models import Transaction
 from transactions.serializers.transaction_serializer import TransactionSerializer
 from accounts.models.account_model import Account
 from rest_framework.views import APIView
+from rest_framework.exceptions import APIException
 from rest_framework.response import Response
 from rest_framework import status
 from transactions.services.transaction_service import TransactionService
 from loguru import logger
+from transactions.services.transaction_query_service import TransactionQueryService
+from transactions.views.transaction_list_response_mixin import TransactionListResponseMixin
 
 
 
 
-class GetTransactionsByCategory(APIView):
+class GetTransactionsByCategory(TransactionListResponseMixin, APIView):
     permission_classes = [TransactionPermissions]
     authentication_classes = [
         CompanyCookieJWTAuthentication,
@@ -37,10 +40,12 @@ class GetTransactionsByCategory(APIView):
         branch = user.branch
         category = request.query_params.get('category')
         try:
-            transactions = TransactionService.get_transactions_by_category(category, company, branch)
-            serializer = TransactionSerializer(transactions, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            transactions = TransactionQueryService.get_transactions_by_category(category, company, branch)
+            return self._paginate_keyset_or_default(transactions)
 
+        except APIException:
+            # e.g. a bad keyset cursor (404), answered by DRF
+            raise
         except Exception as e:
             logger.exception("Error retrieving transactions by category")
             return Response({"status":"Failure", "message":"An error occurred while retrieving transactions."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -12,13 +12,16 @@ from transactions.models import Transaction
 from transactions.serializers.transaction_serializer import TransactionSerializer
 from accounts.models.account_model import Account
 from rest_framework.views import APIView
+from rest_framework.exceptions import APIException
 from rest_framework.response import Response
 from rest_framework import status
 from transactions.services.transaction_service import TransactionService
 from loguru import logger
+from transactions.services.transaction_query_service import TransactionQueryService
+from transactions.views.transaction_list_response_mixin import TransactionListResponseMixin
 
 
-class ListTransactionsByAccount(APIView):
+class ListTransactionsByAccount(TransactionListResponseMixin, APIView):
     permission_classes = [TransactionPermissions]
     authentication_classes = [
         CompanyCookieJWTAuthentication,
@@ -35,14 +38,16 @@ class ListTransactionsByAccount(APIView):
         branch = user.branch
         try:
             account = Account.objects.get(id=account_id, branch=branch, company=company)
-            transactions = TransactionService.list_transactions_by_account(account)
-            serializer = TransactionSerializer(transactions, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            transactions = TransactionQueryService.get_transactions_by_account(account)
+            return self._paginate_keyset_or_default(transactions)
         
 
         except Account.DoesNotExist:
             logger.exception(f"Account with id {account_id} was not found")
             return Response({"status":"Failure", "message":"Account not found."}, status=status.HTTP_404_NOT_FOUND)
+        except APIException:
+            # e.g. a bad keyset cursor (404), answered by DRF
+            raise
         except Exception as e:
             logger.exception(f"Error listing transactions for account {account_id}")
             return Response({"status":"Failure", "message":"An error occurred while retrieving transactions."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
\ No newline at end of file
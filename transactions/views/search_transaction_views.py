@@ -15,6 +15,8 @@ from rest_framework.response import Response
 from rest_framework import status
 from transactions.services.transaction_service import TransactionService
 from loguru import logger
+from transactions.services.transaction_query_service import TransactionQueryService
+from config.pagination.keyset_pagination import TransactionPagination
 
 
 
@@ -31,8 +33,7 @@ class SearchTransactionView(APIView):
         UserCookieJWTAuthentication,
         JWTAuthentication
     ]
-    pagination_class = StandardResultsSetPagination
-    serializer_class = TransactionSerializer
+    pagination_class = TransactionPagination
 
     def get(self, request):
         """
@@ -42,16 +43,14 @@ class SearchTransactionView(APIView):
         -------------------
         """
         query = request.query_params.get('query', '')
-        page = int(request.query_params.get('page', 1))
-        page_size = int(request.query_params.get('page_size', 10))
+        company = get_logged_in_company(request)
 
-        transactions = TransactionService.search_transactions(query)
-        paginator = StandardResultsSetPagination()
-        paginator.page_size = page_size
-        paginated_transactions = paginator.paginate_queryset(transactions, request)
+        transactions = TransactionQueryService.search_transactions(query).filter(company=company)
+        paginator = self.pagination_class()
+        paginated_transactions = paginator.paginate_queryset(transactions, request, view=self)
 
         serializer = TransactionSerializer(paginated_transactions, many=True)
-        logger.info(f"Search for Transactions with query '{query}' returned {len(paginated_transactions)} results on page {page}.")
+        logger.info(f"Search for Transactions with query '{query}' returned {len(paginated_transactions)} results.")
         return paginator.get_paginated_response(serializer.data)
     
     
\ No newline at end of file
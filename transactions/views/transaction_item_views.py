@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from rest_framework.filters import SearchFilter, OrderingFilter
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from config.auth.jwt_token_authentication import CompanyCookieJWTAuthentication, UserCookieJWTAuthentication
@@ -10,7 +11,7 @@ from transactions.serializers.transaction_item_serializer import TransactionItem
 from loguru import logger
 
 
-class TransactionItemViewSet(ModelViewSet):
+class TransactionItemViewSet(EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for managing Transaction Items.
     Supports listing, retrieving, creating, updating, and deleting transaction items.
@@ -0,0 +1,19 @@
+from rest_framework.response import Response
+from rest_framework import status
+from config.pagination.keyset_pagination import TransactionKeysetPagination, uses_keyset
+from transactions.serializers.transaction_serializer import TransactionSerializer
+
+
+class TransactionListResponseMixin:
+    """
+    Response for the transaction list APIViews: keyset pages when the client opts in
+    (?pagination=keyset or ?cursor=), otherwise the full list as before.
+    """
+
+    def _paginate_keyset_or_default(self, transactions):
+        if uses_keyset(self.request):
+            paginator = TransactionKeysetPagination()
+            page = paginator.paginate_queryset(transactions, self.request, view=self)
+            return paginator.get_paginated_response(TransactionSerializer(page, many=True).data)
+        serializer = TransactionSerializer(transactions, many=True)
+        return Response(serializer.data, status=status.HTTP_200_OK)
@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from rest_framework.filters import SearchFilter, OrderingFilter
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from config.auth.jwt_token_authentication import CompanyCookieJWTAuthentication, UserCookieJWTAuthentication
@@ -15,13 +16,17 @@ from rest_framework.response import Response
 from rest_framework import status
 from transactions.services.transaction_service import TransactionService
 from loguru import logger
+from config.pagination.keyset_pagination import TransactionPagination
+from config.export.export_mixin import StreamingExportMixin
+from transactions.services.transaction_query_service import TRANSACTION_EXPORT_COLUMNS
 
 
-class TransactionViewSet(ModelViewSet):
+class TransactionViewSet(StreamingExportMixin, EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for managing Transactions.
     Supports listing, retrieving, creating, updating, and deleting transactions.
     Includes filtering, searching, ordering, and detailed logging.
+    GET transactions/export/ streams the filtered list as CSV or NDJSON.
     """
     queryset = Transaction.objects.all()
     serializer_class = TransactionSerializer
@@ -42,7 +47,9 @@ class TransactionViewSet(ModelViewSet):
     ]
     ordering_fields = ['created_at', 'updated_at', 'transaction_date', 'total_amount']
     ordering = ['-created_at']
-    pagination_class = StandardResultsSetPagination
+    pagination_class = TransactionPagination
+    export_columns = TRANSACTION_EXPORT_COLUMNS
+    export_filename = 'transactions'
 
     def get_queryset(self):
         try:
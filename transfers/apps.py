@@ -11,4 +11,5 @@ class TransfersConfig(AppConfig):
         import transfers.signals.cash_transfer_activity_logs_signal
         import transfers.signals.product_transfer_item_activity_logs_signal
         import transfers.signals.product_transfer_activity_logs_signal
+        import transfers.signals.document_totals_signal
         
\ No newline at end of file
@@ -27,16 +27,7 @@ class ProductTransferItem(CreateUpdateBaseModel):
         branch: Branch = transfer.source_branch
         self.branch = branch
         super().save(*args, **kwargs)
-        # update total
-        transfer: Transfer = self.transfer
-        transfer.update_total_amount()
-
-
-    def delete(self, *args, **kwargs):
-        super().delete(*args, **kwargs)
-        # update total on the transfer immediately
-        transfer: Transfer = self.transfer
-        transfer.update_total_amount()
+        # the transfer total is kept in step by transfers.signals.document_totals_signal
 
     
     class Meta:
@@ -6,9 +6,11 @@ from company.models.company_model import Company
 from config.utilities.get_logged_in_company import get_logged_in_company
 from loguru import logger
 from transfers.models.transfer_model import Transfer
+from config.eager_loading.eager_loading import EagerLoadingSerializerMixin
 
 
-class ProductTransferItemSerializer(serializers.ModelSerializer):
+class ProductTransferItemSerializer(EagerLoadingSerializerMixin, serializers.ModelSerializer):
+    select_related_fields = ('product_transfer__company', 'transfer__transferred_by')
     product = serializers.PrimaryKeyRelatedField(
         queryset=Product.objects.all(),   
     )
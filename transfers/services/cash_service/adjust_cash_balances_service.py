@@ -7,6 +7,7 @@ from django.db import transaction as db_transaction
 from loguru import logger
 from decimal import Decimal
 from transfers.models.cash_transfer_model import CashTransfer
+from transactions.services.journal_service import JournalService
 
 
 
@@ -29,8 +30,8 @@ class AdjustCashBalancesService:
 
         Steps:
         1. Ensures cash accounts exist for both branches.
-        2. Validates sufficient balance in source account.
-        3. Deducts from source and adds to destination atomically.
+        2. Locks both accounts and validates sufficient balance in source account.
+        3. Posts the transfer to the journal, moving both balances atomically.
         4. Logs all operations.
         """
 
@@ -47,6 +48,17 @@ class AdjustCashBalancesService:
             branch=destination_account.branch,
         ).account
 
+        # Lock both rows in primary key order so concurrent transfers cannot deadlock
+        # and the balance check below reads the committed value
+        locked = {
+            account.pk: account
+            for account in Account.objects.select_for_update().filter(
+                pk__in=[source_cash_account.pk, destination_cash_account.pk]
+            ).order_by('pk')
+        }
+        source_cash_account = locked[source_cash_account.pk]
+        destination_cash_account = locked[destination_cash_account.pk]
+
         # Check for sufficient balance
         if source_cash_account.balance < amount:
             raise ValueError(
@@ -54,17 +66,18 @@ class AdjustCashBalancesService:
                 f"| Available: {source_cash_account.balance} | Requested: {amount}"
             )
 
-        # Adjust balances atomically
-        source_cash_account.balance -= amount
-        source_cash_account.save(update_fields=["balance"])
+        # Post both legs to the journal; balances move in a single UPDATE
+        JournalService.post_legs(
+            company=cash_transfer.company,
+            branch=source_account.branch,
+            legs=[(source_cash_account, -amount), (destination_cash_account, amount)],
+            reason='CASH_TRANSFER',
+            reference=f"CashTransfer {cash_transfer.pk}",
+        )
         logger.info(
             f"Deducted amount '{amount}' from Source Account '{source_cash_account.pk}' "
             f"| New balance: {source_cash_account.balance}"
         )
-
-        destination_cash_account.balance += amount
-        destination_cash_account.save(update_fields=["balance"])
-        
         logger.info(
             f"Added amount '{amount}' to Destination Account '{destination_cash_account.pk}' "
             f"| New balance: {destination_cash_account.balance}"
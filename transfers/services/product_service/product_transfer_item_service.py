@@ -126,10 +126,6 @@ class ProductTransferItemService:
                     "fields": updated_fields,
                 },
             )
-            
-        if item.transfer:
-            transfer: Transfer = item.transfer
-            transfer.update_total_amount()
 
         return item
     
@@ -190,12 +186,9 @@ class ProductTransferItemService:
     @staticmethod
     @db_transaction.atomic
     def delete_product_transfer_item(item: ProductTransferItem) -> None:
-        transfer: Transfer = item.transfer
         item_name = item.product.name
         item.delete()
         logger.info(f"Product Transfer Item '{item_name}' deleted.")
-        if transfer:
-            transfer.update_total_amount()
 
     # -------------------------
     # ATTACH / DETACH
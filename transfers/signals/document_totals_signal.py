@@ -0,0 +1,11 @@
+# transfers/signals/document_totals_signal.py
+from config.totals.totals_registry import register_document_totals
+from transfers.models.product_transfer_item_model import ProductTransferItem
+
+
+register_document_totals(
+    ProductTransferItem,
+    document_field='transfer',
+    quantity_field='quantity',
+    price_field='unit_price'
+)
@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from rest_framework.filters import SearchFilter, OrderingFilter
 from rest_framework import status
 from rest_framework.response import Response
@@ -15,7 +16,7 @@ from loguru import logger
 
 
 
-class CashTransferViewSet(ModelViewSet):
+class CashTransferViewSet(EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for managing Cash Transfers within a company.
     Provides CRUD operations with approopriate permissions and filtering.
@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from rest_framework.filters import SearchFilter, OrderingFilter
 from rest_framework import status
 from rest_framework.response import Response
@@ -14,7 +15,7 @@ from rest_framework.decorators import action
 from transfers.services.product_service.product_transfer_item_service import ProductTransferItemService, ProductTransferItemError
 from loguru import logger
 
-class ProductTransferItemViewSet(ModelViewSet):
+class ProductTransferItemViewSet(EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for managing Product Transfer Items within a company.
     Provides CRUD operations with appropriate permissions and filtering.
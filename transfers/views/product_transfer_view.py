@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from transfers.models.product_transfer_model import ProductTransfer
 from transfers.serializers.product_transfer_serializer import ProductTransferSerializer
 from config.permissions.company_role_base_permission import CompanyRolePermission
@@ -17,7 +18,7 @@ from transfers.services.product_service.product_transfer_service import ProductT
 from loguru import logger
 
 
-class ProductTransferViewSet(ModelViewSet):
+class ProductTransferViewSet(EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for managing Product Transfers within a company.
     Provides CRUD operations with appropriate permissions and filtering.
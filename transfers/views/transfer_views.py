@@ -1,4 +1,5 @@
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from transfers.models.transfer_model import Transfer
 from transfers.serializers.transfer_serializer import TransferSerializer
 from config.permissions.company_role_base_permission import CompanyRolePermission
@@ -16,7 +17,7 @@ from loguru import logger
 
 
 
-class TransferViewSet(ModelViewSet):
+class TransferViewSet(EagerLoadingMixin, ModelViewSet):
     """
     ViewSet for managing Transfers (Cash & Product) within a company.
     Provides CRUD operations with strict company-based permissions.
@@ -6,4 +6,5 @@ class UsersConfig(AppConfig):
     name = 'users'
 
     def ready(self):
-        import users.signals.user_activity_logs_signal
\ No newline at end of file
+        import users.signals.user_activity_logs_signal
+        import users.signals.user_principal_cache_signal
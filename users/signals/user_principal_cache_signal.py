@@ -0,0 +1,11 @@
+# users/signals/user_principal_cache_signal.py
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from config.auth.principal_cache import PrincipalCache
+from users.models.user_model import User
+
+
+@receiver(post_save, sender=User, dispatch_uid='principal_cache_user_saved')
+@receiver(post_delete, sender=User, dispatch_uid='principal_cache_user_deleted')
+def user_changed(sender, instance, **kwargs):
+    PrincipalCache.invalidate(User, instance.pk)
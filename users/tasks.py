@@ -1,13 +1,37 @@
 # users/auth/services/otp_service.py
 from celery import shared_task
-from django.core.mail import send_mail
+from django.contrib.auth.tokens import default_token_generator
+from django.core.mail import EmailMessage
 from django.conf import settings
+from notifications.services.dispatch.channels.email_channel import EmailChannel
+from users.models.user_model import User
+from users.services.whatsapp.send_message import send_whatsapp_message_to_user
 
 @shared_task
 def send_otp_email_task(user_email, otp):
-    send_mail(
+    message = EmailMessage(
         subject="Your Password Reset OTP",
-        message=f"Your OTP is {otp}. It expires in 10 minutes.",
+        body=f"Your OTP is {otp}. It expires in 10 minutes.",
         from_email=settings.DEFAULT_FROM_EMAIL,  # uses default from settings
-        recipient_list=[user_email],
-    )
\ No newline at end of file
+        to=[user_email],
+    )
+    # the worker's pooled SMTP connection rather than a new one per OTP
+    error = EmailChannel.send_message(message)
+    if error:
+        raise RuntimeError(f"OTP email not sent: {error}")
+
+
+@shared_task
+def send_password_reset_whatsapp_task(user_id):
+    """
+    The reset link (uid and token) is built here, in the worker, and only handed to WhatsApp:
+    it is never stored, neither in a notification nor in the task's arguments.
+    """
+    user = User.objects.filter(pk=user_id).first()
+    if user is None:
+        return
+    token = default_token_generator.make_token(user)
+    reset_link = f"https://posflow.com/reset-password/{user.pk}/{token}/"
+    response_data = send_whatsapp_message_to_user(user, "password_reset", [user.username, reset_link])
+    if "error" in response_data:
+        raise RuntimeError(f"Password reset WhatsApp not sent: {response_data['error']}")
@@ -391,4 +391,77 @@ def test_token_refresh_failure(client):
 #         HTTP_AUTHORIZATION=f'Bearer {test_company_token_fixture}'
 #     )
 #     logger.info(response.json())
-#     assert response.status_code in [201, 404, 403]
\ No newline at end of file
+#     assert response.status_code in [201, 404, 403]
+
+@pytest.mark.django_db
+def test_cookie_authentication_caches_principal_and_resolves_tenant_once(test_company_fixture, create_branch):
+    """
+    Per-request query count for a cookie-authenticated listing: the principal is loaded once
+    (with its company and branch), later requests authenticate from the cache, no exists()
+    probe runs, and deactivating the user takes effect on the next request.
+    """
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    from rest_framework.test import APIClient
+    from rest_framework_simplejwt.tokens import AccessToken
+
+    user = User.objects.create_user(
+        username='cookie', email='cookie@example.com', password='cookie', company=test_company_fixture,
+        branch=create_branch, role='Manager', first_name='Cookie'
+    )
+    api_client = APIClient()
+    api_client.cookies['user_access_token'] = str(AccessToken.for_user(user))
+    url = reverse('stock-movement-list')
+
+    with CaptureQueriesContext(connection) as first:
+        assert api_client.get(url).status_code == 200
+    with CaptureQueriesContext(connection) as second:
+        response = api_client.get(url)
+    assert response.status_code == 200
+    assert response.wsgi_request.company == test_company_fixture
+    assert response.wsgi_request.branch == create_branch
+
+    # first request: user (joined with company and branch) + the empty listing's count; afterwards only the count
+    assert len(first.captured_queries) == 2
+    assert len(second.captured_queries) == 1
+    assert not any('EXISTS' in q['sql'].upper() or 'LIMIT 1' in q['sql'].upper() for q in second.captured_queries)
+
+    user.is_active = False
+    user.save()
+    assert api_client.get(url).status_code in (401, 403)
+
+
+@pytest.mark.django_db
+def test_password_reset_link_is_built_at_send_time_and_never_stored(settings, monkeypatch, test_company_fixture, create_branch):
+    """
+    The reset view only queues the user id; the worker builds the link and hands it to WhatsApp,
+    so no notification (returned by the listing, inbox and stream endpoints) ever holds the token.
+    """
+    from django.contrib.auth.tokens import default_token_generator
+    from rest_framework.test import APIRequestFactory, force_authenticate
+    from notifications.models.notification_model import Notification
+    from notifications.utils.stub_servers import StubWhatsAppServer
+    from users.tasks import send_password_reset_whatsapp_task
+    from users.views.user_views import PasswordResetAPIView
+
+    user = User.objects.create_user(
+        username='forgetful', email='forgetful@example.com', password='forgetful', company=test_company_fixture,
+        branch=create_branch, role='Manager', whatsapp_number='263770000009', whatsapp_opt_in=True,
+    )
+    queued = []
+    monkeypatch.setattr(send_password_reset_whatsapp_task, 'delay', queued.append)
+    request = APIRequestFactory().post('/reset/', {'email': user.email}, format='json')
+    force_authenticate(request, user=user)
+    assert PasswordResetAPIView.as_view()(request).status_code == 200
+    assert queued == [user.pk]
+    assert not Notification.objects.exists()
+
+    with StubWhatsAppServer() as whatsapp:
+        settings.NOTIFICATION_DISPATCH = {'CHANNELS': {'whatsapp': {'BASE_URL': whatsapp.url}}}
+        send_password_reset_whatsapp_task(user.pk)
+
+    template = whatsapp.received[0]['template']
+    assert template['name'] == 'password_reset'
+    link = template['components'][0]['parameters'][1]['text']
+    assert link.startswith(f"https://posflow.com/reset-password/{user.pk}/")
+    assert default_token_generator.check_token(user, link.rstrip('/').rsplit('/', 1)[1])
@@ -3,6 +3,7 @@ from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.viewsets import ModelViewSet
+from config.eager_loading.eager_loading import EagerLoadingMixin
 from rest_framework.filters import SearchFilter, OrderingFilter
 from django.contrib.auth import authenticate
 from rest_framework_simplejwt.tokens import RefreshToken
@@ -10,8 +11,7 @@ from rest_framework_simplejwt.exceptions import TokenError
 from django.conf import settings
 from django.shortcuts import get_object_or_404
 # password reset imports
-from users.services.whatsapp.send_message import send_whatsapp_message_to_user
-from django.contrib.auth.tokens import default_token_generator
+from users.tasks import send_password_reset_whatsapp_task
 
 from company.models.company_model import Company
 from users.models.user_model import User
@@ -31,7 +31,7 @@ from activity_log.services.activity_log_service import ActivityLogService
 from django.contrib.contenttypes.models import ContentType
 from loguru import logger
 
-class UserViewSet(ModelViewSet):
+class UserViewSet(EagerLoadingMixin, ModelViewSet):
     """
     Full CRUD + extra actions for User management.
     Includes: activate/deactivate, role management, password reset, bulk operations, and search.
@@ -446,15 +446,9 @@ class PasswordResetAPIView(APIView):
         email = request.data.get('email')
         user = get_object_or_404(User, email=email)
 
-        # Generate password reset link
-        token = default_token_generator.make_token(user)
-        uid = user.pk
-        reset_link = f"https://posflow.com/reset-password/{uid}/{token}/"
-
-        # Send WhatsApp if opted in
+        # Send the reset link over WhatsApp if opted in, off the request thread. The worker builds the
+        # link, so the token is never stored in a notification that listings and the inbox return.
         if user.whatsapp_opt_in and user.whatsapp_number:
-            template_name = "password_reset"  # approved template name
-            parameters = [user.username, reset_link]
-            send_whatsapp_message_to_user(user.whatsapp_number, template_name, parameters)
+            send_password_reset_whatsapp_task.delay(user.pk)
 
         return Response({'detail': 'Password reset link sent'}, status=status.HTTP_200_OK)
\ No newline at end of file